@@ -0,0 +1,194 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark for building the lineage graph (DAG) of large pipeline runs.
+
+Creates a synthetic pipeline run with many steps in a temporary local store
+and compares building the graph through the post-execution views with the
+dedicated `get_run_dag` store method.
+
+Usage:
+    python scripts/benchmark_run_dag.py --steps 1000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List
+from uuid import UUID, uuid4
+
+
+def _create_synthetic_run(num_steps: int, fan_in: int) -> UUID:
+    """Creates a finished pipeline run with the given number of steps.
+
+    Each step consumes the outputs of up to `fan_in` previous steps and
+    produces a single output artifact with some metadata.
+
+    Args:
+        num_steps: Number of steps of the run.
+        fan_in: Maximum number of inputs of each step.
+
+    Returns:
+        The ID of the pipeline run.
+    """
+    from zenml.client import Client
+    from zenml.config.step_configurations import (
+        Step,
+        StepConfiguration,
+        StepSpec,
+    )
+    from zenml.enums import ArtifactType, ExecutionStatus
+    from zenml.metadata.metadata_types import MetadataTypeEnum
+    from zenml.models import (
+        ArtifactRequestModel,
+        PipelineRunRequestModel,
+        RunMetadataRequestModel,
+        StepRunRequestModel,
+    )
+    from zenml.models.step_run_models import StepRunFinalizeModel
+
+    client = Client()
+    store = client.zen_store
+    user_id = client.active_user.id
+    workspace_id = client.active_workspace.id
+
+    run = store.create_run(
+        PipelineRunRequestModel(
+            id=uuid4(),
+            name=f"benchmark-{uuid4()}",
+            user=user_id,
+            workspace=workspace_id,
+            status=ExecutionStatus.COMPLETED,
+            pipeline_configuration={"name": "benchmark"},
+            num_steps=num_steps,
+        )
+    )
+
+    step_ids: List[UUID] = []
+    artifact_ids: List[UUID] = []
+    for i in range(num_steps):
+        upstream = list(range(max(i - fan_in, 0), i))
+        step_name = f"step_{i}"
+        step_run = store.create_run_step(
+            StepRunRequestModel(
+                name=step_name,
+                step=Step(
+                    spec=StepSpec(
+                        source="benchmark.step",
+                        upstream_steps=[f"step_{j}" for j in upstream],
+                    ),
+                    config=StepConfiguration(
+                        name=step_name, parameters={"index": i}
+                    ),
+                ),
+                pipeline_run_id=run.id,
+                status=ExecutionStatus.RUNNING,
+                parent_step_ids=[step_ids[j] for j in upstream],
+                input_artifacts={
+                    f"input_{j}": artifact_ids[j] for j in upstream
+                },
+                user=user_id,
+                workspace=workspace_id,
+            )
+        )
+        step_run = store.finalize_run_step(
+            step_run.id,
+            StepRunFinalizeModel(
+                output_artifacts={
+                    "output": ArtifactRequestModel(
+                        name="output",
+                        type=ArtifactType.DATA,
+                        uri=f"/tmp/benchmark/{step_run.id}",
+                        materializer="benchmark.Materializer",
+                        data_type="builtins.int",
+                        user=user_id,
+                        workspace=workspace_id,
+                    )
+                },
+                output_artifact_metadata={
+                    "output": [
+                        RunMetadataRequestModel(
+                            key="storage_size",
+                            value=i,
+                            type=MetadataTypeEnum.INT,
+                            user=user_id,
+                            workspace=workspace_id,
+                        )
+                    ]
+                },
+            ),
+        )
+        step_ids.append(step_run.id)
+        artifact_ids.append(step_run.output_artifacts["output"].id)
+
+    return run.id
+
+
+def _time(func: Callable[[], object], repetitions: int) -> float:
+    """Measures the average duration of a function call.
+
+    Args:
+        func: The function to call.
+        repetitions: How often to call the function.
+
+    Returns:
+        The average duration in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    return (time.perf_counter() - start) / repetitions
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    # Use an isolated global configuration with a fresh SQLite store.
+    os.environ["ZENML_CONFIG_PATH"] = tempfile.mkdtemp()
+    os.environ["ZENML_ANALYTICS_OPT_IN"] = "false"
+
+    from zenml.client import Client
+    from zenml.post_execution.lineage.lineage_graph import LineageGraph
+    from zenml.post_execution.pipeline_run import PipelineRunView
+
+    print(f"Creating a synthetic run with {args.steps} steps...")
+    run_id = _create_synthetic_run(num_steps=args.steps, fan_in=args.fan_in)
+    store = Client().zen_store
+
+    def _build_with_views() -> LineageGraph:
+        graph = LineageGraph()
+        graph.generate_run_nodes_and_edges(
+            PipelineRunView(store.get_run(run_id))
+        )
+        return graph
+
+    def _build_with_store() -> LineageGraph:
+        return store.get_run_dag(run_id)
+
+    assert _build_with_views() == _build_with_store()
+
+    views_duration = _time(_build_with_views, args.repetitions)
+    store_duration = _time(_build_with_store, args.repetitions)
+    print(f"Post-execution views: {views_duration:.3f}s")
+    print(f"Store `get_run_dag`:  {store_duration:.3f}s")
+    print(f"Speedup: {views_duration / store_duration:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Load test for the ZenML server with different numbers of workers.
+
+Seeds a local store with a synthetic pipeline run, then starts the ZenML
+server with each requested number of uvicorn workers and measures the
+throughput of the hot read endpoints (runs, run status, steps, artifacts and
+the run DAG) under concurrent load.
+
+A SQLite store is used by default. Pass a MySQL URL with `--store-url` to
+test with a setup closer to a production deployment.
+
+Usage:
+    python scripts/load_test_server.py --workers 1 2 4 --duration 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+from uuid import UUID
+
+import requests
+from benchmark_run_dag import _create_synthetic_run
+
+API_PREFIX = "/api/v1"
+
+
+def _wait_for_server(url: str, timeout: float = 60) -> None:
+    """Waits until the server responds to health checks.
+
+    Args:
+        url: The base URL of the server.
+        timeout: Maximum time to wait in seconds.
+
+    Raises:
+        RuntimeError: If the server didn't start in time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{url}/health", timeout=1).ok:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} didn't start in {timeout}s.")
+
+
+def _run_load(
+    url: str, run_id: UUID, concurrency: int, duration: float
+) -> Dict[str, float]:
+    """Sends requests to the hot read endpoints from concurrent clients.
+
+    Args:
+        url: The base URL of the server.
+        run_id: ID of the pipeline run to query.
+        concurrency: Number of concurrent clients.
+        duration: Duration of the load test in seconds.
+
+    Returns:
+        The throughput, error count and latency percentiles.
+    """
+    token = requests.post(
+        f"{url}{API_PREFIX}/login",
+        data={"username": "default", "password": ""},
+    ).json()["access_token"]
+    paths = [
+        f"{API_PREFIX}/runs?size=20",
+        f"{API_PREFIX}/runs/{run_id}/status",
+        f"{API_PREFIX}/steps?pipeline_run_id={run_id}&size=20",
+        f"{API_PREFIX}/artifacts?size=20",
+        f"{API_PREFIX}/runs/{run_id}/graph",
+    ]
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def _client(index: int) -> None:
+        nonlocal errors
+        session = requests.Session()
+        session.headers["Authorization"] = f"Bearer {token}"
+        request_count = index
+        while time.monotonic() < deadline:
+            path = paths[request_count % len(paths)]
+            request_count += 1
+            start = time.perf_counter()
+            response = session.get(f"{url}{path}")
+            latency = time.perf_counter() - start
+            with lock:
+                if response.ok:
+                    latencies.append(latency)
+                else:
+                    errors += 1
+
+    threads = [
+        threading.Thread(target=_client, args=(i,)) for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "throughput": count / duration,
+        "errors": errors,
+        "p50": latencies[count // 2] if count else 0.0,
+        "p95": latencies[int(count * 0.95)] if count else 0.0,
+    }
+
+
+def main() -> None:
+    """Runs the load test."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8237)
+    parser.add_argument(
+        "--store-url",
+        help="URL of the SQL database. Defaults to a temporary SQLite file.",
+    )
+    args = parser.parse_args()
+
+    # Use an isolated global configuration and store for the client that
+    # seeds the store as well as for all server workers.
+    config_path = tempfile.mkdtemp()
+    store_url = args.store_url or (
+        f"sqlite:///{os.path.join(config_path, 'zenml.db')}"
+    )
+    env = dict(
+        os.environ,
+        ZENML_CONFIG_PATH=config_path,
+        ZENML_ANALYTICS_OPT_IN="false",
+        ZENML_STORE_TYPE="sql",
+        ZENML_STORE_URL=store_url,
+    )
+    os.environ.update(env)
+
+    print(f"Seeding the store with a run with {args.steps} steps...")
+    run_id = _create_synthetic_run(num_steps=args.steps, fan_in=2)
+
+    # The store is already initialized, so the workers must not migrate it
+    # concurrently.
+    env["DISABLE_DATABASE_MIGRATION"] = "True"
+    url = f"http://127.0.0.1:{args.port}"
+    print(f"{'workers':>8} {'req/s':>10} {'p50 [ms]':>10} {'p95 [ms]':>10}")
+    for workers in args.workers:
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "zenml.zen_server.zen_server_api:app",
+                "--port",
+                str(args.port),
+                "--log-level",
+                "warning",
+            ],
+            env=dict(env, WEB_CONCURRENCY=str(workers)),
+        )
+        try:
+            _wait_for_server(url)
+            result = _run_load(
+                url,
+                run_id=run_id,
+                concurrency=args.concurrency,
+                duration=args.duration,
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+        print(
+            f"{workers:>8} {result['throughput']:>10.1f} "
+            f"{result['p50'] * 1000:>10.1f} {result['p95'] * 1000:>10.1f}"
+            + (
+                f"  ({result['errors']:.0f} errors)"
+                if result["errors"]
+                else ""
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local read-through disk cache for files of remote artifact stores."""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Collection,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from zenml.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+logger = get_logger(__name__)
+
+LOCK_FILE_SUFFIX = ".lock"
+TEMPORARY_FILE_SUFFIX = ".tmp"
+EVICTION_LOCK_FILE = "eviction" + LOCK_FILE_SUFFIX
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Holds an exclusive lock on a file, shared across processes.
+
+    Args:
+        path: Path of the lock file. The file is created if it doesn't exist.
+
+    Yields:
+        None.
+    """
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:  # pragma: no cover
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # `LK_LOCK` only retries for ~10 seconds
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ArtifactCacheStatistics(BaseModel):
+    """Hit and miss counters of a local artifact cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of reads that were served from the cache.
+
+        Returns:
+            The hit rate or `0` if nothing was read yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LocalArtifactCache:
+    """Size-bounded LRU cache of remote files on the local disk.
+
+    Entries are identified by a key which needs to change whenever the
+    content of the cached file changes, e.g. a hash of the file URI and its
+    ETag. Entries are populated by downloading into a temporary file which is
+    then atomically renamed, so readers never see partially written files.
+    Per-entry lock files make sure that concurrent processes on the same
+    machine only download each file once.
+
+    The least recently used entries are evicted once the total size of the
+    cache exceeds its maximum size. The modification time of the cached files
+    is updated on each access and serves as the LRU order shared by all
+    processes.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            cache_dir: The local directory in which to store the cached files.
+            max_size: Maximum total size of the cached files in bytes.
+
+        Raises:
+            ValueError: If the maximum size is not positive.
+        """
+        if max_size < 1:
+            raise ValueError(
+                f"Invalid cache size `{max_size}`, the value needs to be a "
+                "positive integer."
+            )
+
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._statistics = ArtifactCacheStatistics()
+        self._statistics_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(uri: str, version: str) -> str:
+        """Builds the cache key of a file.
+
+        Args:
+            uri: The URI of the file.
+            version: A string that changes whenever the file content changes,
+                e.g. its ETag.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.sha256(f"{uri}\n{version}".encode()).hexdigest()
+
+    @property
+    def statistics(self) -> ArtifactCacheStatistics:
+        """The hit and miss counters of this process.
+
+        Returns:
+            A copy of the current counters.
+        """
+        with self._statistics_lock:
+            return self._statistics.copy()
+
+    def _record(self, **increments: int) -> None:
+        """Increments the statistics counters.
+
+        Args:
+            **increments: The increment for each counter.
+        """
+        with self._statistics_lock:
+            for name, increment in increments.items():
+                setattr(
+                    self._statistics,
+                    name,
+                    getattr(self._statistics, name) + increment,
+                )
+
+    def get_path(self, key: str) -> str:
+        """Gets the local path of a cache entry.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The local path at which the entry is (or would be) stored.
+        """
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def open(
+        self, key: str, fetch: Callable[[str], None], mode: str = "rb"
+    ) -> IO[Any]:
+        """Opens a cache entry, populating it if necessary.
+
+        The entry is opened before other entries get evicted, so it stays
+        readable even if it gets evicted right away. Files that are larger
+        than the maximum size of the cache are fetched, but not cached.
+
+        Args:
+            key: The cache key.
+            fetch: Function that writes the file content to the local path
+                it gets called with. Only called on a cache miss.
+            mode: The mode to open the file, either `r` or `rb`.
+
+        Returns:
+            The opened file.
+        """
+        path = self.get_path(key)
+        file = self._open_entry(path, mode)
+        if file is not None:
+            self._record(hits=1)
+            return file
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _file_lock(path + LOCK_FILE_SUFFIX):
+            # Another process might have populated the entry while we were
+            # waiting for the lock.
+            file = self._open_entry(path, mode)
+            if file is not None:
+                self._record(hits=1)
+                return file
+
+            self._record(misses=1)
+            fd, temporary_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), suffix=TEMPORARY_FILE_SUFFIX
+            )
+            os.close(fd)
+            try:
+                fetch(temporary_path)
+            except BaseException:
+                os.remove(temporary_path)
+                raise
+
+            if os.path.getsize(temporary_path) > self.max_size:
+                file = open(temporary_path, mode)
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    # Files that are opened can't be removed on Windows.
+                    logger.debug(
+                        "Unable to remove temporary file `%s`.",
+                        temporary_path,
+                    )
+                return file
+
+            os.replace(temporary_path, path)
+            file = open(path, mode)
+
+        self.evict(exclude=[path])
+        return file
+
+    def evict(self, exclude: Collection[str] = ()) -> None:
+        """Evicts the least recently used entries if the cache is too big.
+
+        Args:
+            exclude: Paths of entries that should not be evicted.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        with _file_lock(os.path.join(self.cache_dir, EVICTION_LOCK_FILE)):
+            entries = self._list_entries()
+            total_size = sum(size for _, _, size in entries)
+            evictions = 0
+            for _, path, size in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                if path in exclude:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    # Files that are opened by another process can't be
+                    # removed on Windows.
+                    continue
+                # Removing the lock file can result in two processes fetching
+                # the same entry, which is safe due to the atomic rename.
+                try:
+                    os.remove(path + LOCK_FILE_SUFFIX)
+                except OSError:
+                    pass
+                total_size -= size
+                evictions += 1
+
+        if evictions:
+            logger.debug(
+                "Evicted %d entries from the artifact cache at `%s`.",
+                evictions,
+                self.cache_dir,
+            )
+            self._record(evictions=evictions)
+
+    def _list_entries(self) -> List[Tuple[float, str, int]]:
+        """Lists all entries of the cache.
+
+        Returns:
+            List of the last access time, path and size of each entry.
+        """
+        entries = []
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(
+                    (LOCK_FILE_SUFFIX, TEMPORARY_FILE_SUFFIX)
+                ):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    @staticmethod
+    def _open_entry(path: str, mode: str) -> Optional[IO[Any]]:
+        """Opens a cache entry and marks it as recently used.
+
+        Args:
+            path: The local path of the entry.
+            mode: The mode to open the file.
+
+        Returns:
+            The opened file or `None` if the entry doesn't exist.
+        """
+        try:
+            file = open(path, mode)
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # The entry was evicted after it was opened, but the opened file
+            # can still be read.
+            pass
+        return file
@@ -12,7 +12,11 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """The base interface to extend the ZenML artifact store."""
+import contextlib
+import os
+import shutil
 import textwrap
+import time
 from abc import abstractmethod
 from typing import (
     Any,
@@ -22,26 +26,56 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
     Union,
     cast,
 )
+from uuid import uuid4
 
-from pydantic import root_validator
+from pydantic import PositiveInt, root_validator
 
+from zenml.artifact_stores.artifact_cache import LocalArtifactCache
+from zenml.constants import (
+    DEFAULT_ARTIFACT_CACHE_MAX_SIZE,
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    FILEIO_MAX_CONCURRENCY,
+)
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.stack import Flavor, StackComponent, StackComponentConfig
-from zenml.utils import io_utils
+from zenml.utils import io_utils, yaml_utils
+from zenml.utils.concurrency_utils import map_concurrently
 
 logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
+CONTENT_ADDRESSED_DIRECTORY = "content"
+CONTENT_INDEX_FILE_SUFFIX = ".json"
+CONTENT_STAGING_SUFFIX = ".staging-"
+ARTIFACT_CACHE_DIRECTORY = "artifact_cache"
+
+# Keys of the stat info of fsspec-based filesystems that identify the version
+# of a file, e.g. the ETag of S3/Azure objects or the MD5 hash of GCS objects.
+FILE_VERSION_KEYS = ("ETag", "etag", "md5Hash", "generation")
+
+# Optional methods that artifact stores can implement to speed up operations
+# on many or large files.
+BULK_OPERATIONS = (
+    "copy_many",
+    "remove_many",
+    "exists_many",
+    "upload_dir",
+    "download_dir",
+    "upload_file",
+    "download_file",
+)
+
 
 def _sanitize_potential_path(potential_path: Any) -> Any:
     """Sanitizes the input if it is a path.
@@ -56,7 +90,12 @@ def _sanitize_potential_path(potential_path: Any) -> Any:
         The original input or a sanitized version of it in case of a remote
         path.
     """
-    if isinstance(potential_path, bytes):
+    if isinstance(potential_path, (list, tuple)):
+        # Paths of bulk operations
+        return type(potential_path)(
+            _sanitize_potential_path(item) for item in potential_path
+        )
+    elif isinstance(potential_path, bytes):
         path = fileio.convert_to_str(potential_path)
     elif isinstance(potential_path, str):
         path = potential_path
@@ -107,9 +146,26 @@ def _sanitize_paths(_func: Callable[..., Any]) -> Callable[..., Any]:
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
-    """Config class for `BaseArtifactStore`."""
+    """Config class for `BaseArtifactStore`.
+
+    Attributes:
+        path: The root path of the artifact store.
+        content_addressed: If `True`, artifacts are stored under the digest
+            of their content instead of a path derived from the step run that
+            created them. Artifacts with identical content are then only
+            stored and uploaded once.
+        local_cache: If `True`, files that are read from a remote artifact
+            store are cached on the local disk. Subsequent reads of the same
+            unchanged file on the same machine are then served from the disk
+            instead of being downloaded again.
+        local_cache_max_size: Maximum size in bytes of the local cache. Once
+            this size is exceeded, the least recently used files are evicted.
+    """
 
     path: str
+    content_addressed: bool = False
+    local_cache: bool = False
+    local_cache_max_size: PositiveInt = DEFAULT_ARTIFACT_CACHE_MAX_SIZE
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]]
 
@@ -345,6 +401,269 @@ class BaseArtifactStore(StackComponent):
             The iterator that walks the contents of the given directory.
         """
 
+    # --- Optional bulk operations ---
+    # Artifact stores that don't override these methods fall back to
+    # running the single file operations concurrently.
+    def copy_many(
+        self,
+        pairs: Sequence[Tuple[PathType, PathType]],
+        overwrite: bool = False,
+    ) -> None:
+        """Copies multiple files within the artifact store.
+
+        Args:
+            pairs: Tuples of source and destination paths.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    def remove_many(self, paths: Sequence[PathType]) -> None:
+        """Removes multiple files or directories. Dangerous operation.
+
+        Args:
+            paths: The paths to remove. Directories are removed recursively.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    def exists_many(self, paths: Sequence[PathType]) -> List[bool]:
+        """Checks whether multiple paths exist.
+
+        Args:
+            paths: The paths to check.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    def upload_dir(
+        self, local_dir: str, dir_path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies all files of a local directory into the artifact store.
+
+        Args:
+            local_dir: The local directory to copy.
+            dir_path: The directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    def download_dir(
+        self, dir_path: PathType, local_dir: str, overwrite: bool = False
+    ) -> None:
+        """Copies all files of an artifact store directory to a local one.
+
+        Args:
+            dir_path: The directory to copy.
+            local_dir: The local directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    def upload_file(
+        self, local_path: str, path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies a local file into the artifact store.
+
+        Args:
+            local_path: The local file to copy.
+            path: The path to copy the file to.
+            overwrite: Whether to overwrite the destination file if it exists.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    def download_file(
+        self, path: PathType, local_path: str, overwrite: bool = False
+    ) -> None:
+        """Copies a file of the artifact store to a local path.
+
+        Args:
+            path: The file to copy.
+            local_path: The local path to copy the file to.
+            overwrite: Whether to overwrite the destination file if it exists.
+
+        Raises:
+            NotImplementedError: If the artifact store does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    # --- Content-addressed storage ---
+    @property
+    def content_addressed_path(self) -> str:
+        """The root path of the content-addressed artifacts.
+
+        Returns:
+            The root path of the content-addressed artifacts.
+        """
+        return os.path.join(self.path, CONTENT_ADDRESSED_DIRECTORY)
+
+    def get_content_addressed_uri(self, digest: str) -> str:
+        """Gets the URI of the artifact with the given content digest.
+
+        Args:
+            digest: The digest of the artifact content.
+
+        Returns:
+            The artifact URI.
+        """
+        return os.path.join(self.content_addressed_path, digest[:2], digest)
+
+    def get_content_digest(self, uri: str) -> Optional[str]:
+        """Gets the content digest of a content-addressed artifact.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Returns:
+            The content digest or `None` if the artifact is not stored in the
+            content-addressed layout of this artifact store.
+        """
+        digest = os.path.basename(uri)
+        if digest and uri == self.get_content_addressed_uri(digest):
+            return digest
+        return None
+
+    def store_content_addressed(self, source_dir: str) -> str:
+        """Stores the contents of a directory under their digest.
+
+        The files are only copied to the artifact store if there is no
+        artifact with the same content yet. An index file next to the artifact
+        directory marks that all files were copied successfully and contains
+        the time at which the content was last stored. This time is refreshed
+        when existing content is reused, so that pruning doesn't delete it
+        before the artifact that reuses it is registered.
+
+        Multiple steps can store the same content concurrently: each of them
+        uploads the files to a unique staging directory and then moves them
+        into place, overwriting the identical files of the other steps. The
+        index is only written once all files are in place.
+
+        Args:
+            source_dir: The (local) directory that contains the artifact files.
+
+        Returns:
+            The URI of the content-addressed artifact.
+        """
+        digest = io_utils.compute_directory_digest(source_dir)
+        uri = self.get_content_addressed_uri(digest)
+        index_path = uri + CONTENT_INDEX_FILE_SUFFIX
+        if fileio.exists(index_path):
+            logger.debug("Reusing existing artifact content at `%s`.", uri)
+        else:
+            staging_uri = f"{uri}{CONTENT_STAGING_SUFFIX}{uuid4().hex}"
+            fileio.makedirs(staging_uri)
+            try:
+                io_utils.copy_dir(source_dir, staging_uri, overwrite=True)
+                self._move_content_into_place(source_dir, staging_uri, uri)
+            finally:
+                fileio.rmtree(staging_uri)
+
+        yaml_utils.write_json(
+            index_path, {"digest": digest, "created": time.time()}
+        )
+        return uri
+
+    @staticmethod
+    def _move_content_into_place(
+        source_dir: str, staging_uri: str, uri: str
+    ) -> None:
+        """Moves the staged files of a content-addressed artifact into place.
+
+        Args:
+            source_dir: The (local) directory that contains the artifact files.
+            staging_uri: The staging directory the files were uploaded to.
+            uri: The URI of the content-addressed artifact.
+        """
+        relative_paths: List[str] = []
+        for root, _, files in os.walk(source_dir):
+            relative_root = os.path.relpath(root, source_dir)
+            fileio.makedirs(os.path.normpath(os.path.join(uri, relative_root)))
+            relative_paths.extend(
+                os.path.normpath(os.path.join(relative_root, file))
+                for file in files
+            )
+
+        map_concurrently(
+            lambda relative_path: fileio.rename(
+                os.path.join(staging_uri, relative_path),
+                os.path.join(uri, relative_path),
+                overwrite=True,
+            ),
+            relative_paths,
+            max_workers=FILEIO_MAX_CONCURRENCY,
+            thread_name_prefix="zenml-fileio",
+        )
+
+    def delete_content_addressed(self, uri: str) -> None:
+        """Deletes a content-addressed artifact.
+
+        Files that were already deleted concurrently, e.g. by another prune
+        run, are skipped.
+
+        Args:
+            uri: The URI of the artifact.
+        """
+        # Remove the index first so the content is never considered complete
+        # while it is being deleted.
+        with contextlib.suppress(FileNotFoundError):
+            self.remove(uri + CONTENT_INDEX_FILE_SUFFIX)
+        with contextlib.suppress(FileNotFoundError):
+            self.rmtree(uri)
+
+    def get_content_addressed_timestamp(self, uri: str) -> Optional[float]:
+        """Gets the time at which a content-addressed artifact was last stored.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Returns:
+            The time at which the artifact content was last stored or reused,
+            or `None` if the artifact doesn't exist.
+        """
+        index_path = uri + CONTENT_INDEX_FILE_SUFFIX
+        if not fileio.exists(index_path):
+            return None
+        return float(yaml_utils.read_json(index_path)["created"])
+
+    def list_content_addressed(self) -> Dict[str, float]:
+        """Lists all content-addressed artifacts.
+
+        Returns:
+            Mapping of artifact URIs to the time at which they were last
+            stored or reused.
+        """
+        pattern = os.path.join(
+            self.content_addressed_path, "*", "*" + CONTENT_INDEX_FILE_SUFFIX
+        )
+        artifacts = {}
+        for index_path in fileio.glob(pattern):
+            index_path = fileio.convert_to_str(index_path)
+            uri = index_path[: -len(CONTENT_INDEX_FILE_SUFFIX)]
+            artifacts[uri] = yaml_utils.read_json(index_path)["created"]
+        return artifacts
+
     # --- Internal interface ---
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initiate the Pydantic object and register the corresponding filesystem.
@@ -354,8 +673,144 @@ class BaseArtifactStore(StackComponent):
             **kwargs: The keyword arguments to pass to the Pydantic object.
         """
         super(BaseArtifactStore, self).__init__(*args, **kwargs)
+        self._artifact_cache: Optional[LocalArtifactCache] = None
         self._register()
 
+    @property
+    def artifact_cache(self) -> Optional[LocalArtifactCache]:
+        """The local cache for files read from this artifact store.
+
+        The cache is stored in the global config directory unless the
+        `ZENML_ARTIFACT_CACHE_PATH` environment variable is set.
+
+        Returns:
+            The local cache or `None` if caching is disabled or the artifact
+            store is local.
+        """
+        if not self.config.local_cache or self.config.is_local:
+            return None
+
+        if self._artifact_cache is None:
+            cache_root = os.getenv(
+                ENV_ZENML_ARTIFACT_CACHE_PATH,
+                os.path.join(
+                    io_utils.get_global_config_directory(),
+                    ARTIFACT_CACHE_DIRECTORY,
+                ),
+            )
+            self._artifact_cache = LocalArtifactCache(
+                cache_dir=os.path.join(cache_root, str(self.id)),
+                max_size=self.config.local_cache_max_size,
+            )
+        return self._artifact_cache
+
+    def _get_file_version(self, path: str) -> Optional[str]:
+        """Gets a string that changes whenever the content of a file changes.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The file version or `None` if it can't be determined.
+        """
+        content_prefix = self.content_addressed_path + "/"
+        if path.startswith(content_prefix):
+            # The files inside content-addressed artifact directories can
+            # never change. The index files next to these directories are
+            # rewritten whenever the content is reused, so they are versioned
+            # like all other files.
+            parts = path[len(content_prefix) :].split("/")
+            if len(parts) > 2 and CONTENT_STAGING_SUFFIX not in parts[1]:
+                return ""
+
+        stat = self.stat(path)
+        if isinstance(stat, dict):
+            for key in FILE_VERSION_KEYS:
+                if stat.get(key):
+                    return str(stat[key])
+        return None
+
+    def _implements(self, method_name: str) -> bool:
+        """Checks whether the artifact store implements an optional method.
+
+        Args:
+            method_name: The name of the method.
+
+        Returns:
+            Whether the artifact store overrides the default implementation.
+        """
+        from zenml.io.filesystem import BaseFilesystem
+
+        method = getattr(type(self), method_name)
+        return method not in (
+            getattr(BaseArtifactStore, method_name),
+            getattr(BaseFilesystem, method_name, None),
+        )
+
+    def _get_bulk_operations(self) -> List[str]:
+        """Gets the bulk operations to register for the artifact store.
+
+        Returns:
+            The names of the bulk operations that the artifact store
+            implements. Downloads are excluded if the local cache is enabled,
+            so that files are copied using `open` and served from the cache.
+        """
+        skipped_operations: Tuple[str, ...] = ()
+        if self.artifact_cache is not None:
+            skipped_operations = ("download_dir", "download_file")
+
+        return [
+            method_name
+            for method_name in BULK_OPERATIONS
+            if method_name not in skipped_operations
+            and self._implements(method_name)
+        ]
+
+    def _open_with_cache(self, name: PathType, mode: str = "r") -> Any:
+        """Opens a file, serving reads from the local cache if possible.
+
+        Copying files from the artifact store to the local filesystem is
+        covered as well, as the bulk download operations are not registered
+        if the cache is enabled and `fileio` opens the source files instead.
+
+        Args:
+            name: The path of the file to open.
+            mode: The mode to open the file.
+
+        Returns:
+            The file object.
+        """
+        cache = self.artifact_cache
+        if cache is None or mode not in ("r", "rb"):
+            return self.open(name, mode)
+
+        path = fileio.convert_to_str(name)
+        try:
+            version = self._get_file_version(path)
+        except FileNotFoundError:
+            version = None
+        if version is None:
+            return self.open(name, mode)
+
+        def _download(local_path: str) -> None:
+            """Downloads the file to the local path.
+
+            Args:
+                local_path: The local path to download the file to.
+            """
+            if self._implements("download_file"):
+                self.download_file(name, local_path, overwrite=True)
+                return
+
+            with self.open(name, "rb") as source, open(
+                local_path, "wb"
+            ) as destination:
+                shutil.copyfileobj(source, destination)
+
+        return cache.open(
+            cache.make_key(path, version), fetch=_download, mode=mode
+        )
+
     def _register(self) -> None:
         """Create and register a filesystem within the filesystem registry."""
         from zenml.io.filesystem import BaseFilesystem
@@ -366,12 +821,19 @@ class BaseArtifactStore(StackComponent):
         if isinstance(self, LocalFilesystem):
             return
 
+        methods = {
+            method_name: staticmethod(
+                _sanitize_paths(getattr(self, method_name))
+            )
+            for method_name in self._get_bulk_operations()
+        }
         filesystem_class = type(
             self.__class__.__name__,
             (BaseFilesystem,),
             {
+                **methods,
                 "SUPPORTED_SCHEMES": self.config.SUPPORTED_SCHEMES,
-                "open": staticmethod(_sanitize_paths(self.open)),
+                "open": staticmethod(_sanitize_paths(self._open_with_cache)),
                 "copyfile": staticmethod(_sanitize_paths(self.copyfile)),
                 "exists": staticmethod(_sanitize_paths(self.exists)),
                 "glob": staticmethod(_sanitize_paths(self.glob)),
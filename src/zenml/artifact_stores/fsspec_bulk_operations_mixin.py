@@ -0,0 +1,359 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Bulk operations for artifact stores based on fsspec filesystems."""
+
+import os
+from abc import abstractmethod
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from pydantic import PositiveInt
+
+from zenml.artifact_stores.base_artifact_store import (
+    BaseArtifactStore,
+    PathType,
+)
+from zenml.constants import FILEIO_MAX_CONCURRENCY
+from zenml.io import fileio
+from zenml.stack import StackComponentConfig
+from zenml.utils import transfer_utils
+
+DEFAULT_MULTIPART_THRESHOLD = 64 * 1024**2
+DEFAULT_PART_SIZE = 16 * 1024**2
+DEFAULT_TRANSFER_CONCURRENCY = 8
+
+
+class ChunkedTransferConfigMixin(StackComponentConfig):
+    """Config options for transferring large files in concurrent parts.
+
+    Attributes:
+        block_size: Buffer size in bytes of files opened for reading or
+            writing. Writes of files larger than this are split into parts of
+            this size. If not set, the default of the filesystem is used.
+        multipart_threshold: Files of at least this size in bytes are
+            uploaded and downloaded in concurrently transferred parts.
+        part_size: Size in bytes of the parts of large files.
+        upload_concurrency: Maximum number of parts of a single file that
+            are uploaded concurrently.
+        download_concurrency: Maximum number of parts of a single file that
+            are downloaded concurrently.
+    """
+
+    block_size: Optional[PositiveInt] = None
+    multipart_threshold: PositiveInt = DEFAULT_MULTIPART_THRESHOLD
+    part_size: PositiveInt = DEFAULT_PART_SIZE
+    upload_concurrency: PositiveInt = DEFAULT_TRANSFER_CONCURRENCY
+    download_concurrency: PositiveInt = DEFAULT_TRANSFER_CONCURRENCY
+
+
+class FsspecBulkOperationsMixin(BaseArtifactStore):
+    """Artifact store mixin for bulk operations of async fsspec filesystems.
+
+    Async fsspec filesystems (e.g. `s3fs`, `gcsfs` or `adlfs`) accept lists
+    of paths for their `copy`, `rm`, `put` and `get` methods. They then send
+    the requests concurrently in batches of `FILEIO_MAX_CONCURRENCY`
+    requests, and use the bulk delete APIs of the object stores if
+    available.
+
+    Files that are larger than the multipart threshold of the
+    `ChunkedTransferConfigMixin` are downloaded using concurrent ranged reads.
+    Artifact stores can implement `_upload_file_in_parts` to upload these
+    files using the concurrent multipart API of their storage backend.
+    """
+
+    @property
+    @abstractmethod
+    def filesystem(self) -> Any:
+        """The fsspec filesystem to access this artifact store.
+
+        Returns:
+            The fsspec filesystem.
+        """
+
+    @property
+    def transfer_config(self) -> ChunkedTransferConfigMixin:
+        """The config options for transferring large files.
+
+        Returns:
+            The transfer config options.
+        """
+        return cast(ChunkedTransferConfigMixin, self.config)
+
+    def _upload_file_in_parts(self, local_path: str, path: str) -> None:
+        """Uploads a large local file to the artifact store.
+
+        Subclasses should override this method to upload the file in
+        concurrently uploaded parts.
+
+        Args:
+            local_path: The local file to upload.
+            path: The remote path to upload the file to.
+        """
+        self.filesystem.put_file(local_path, path)
+
+    def upload_file(
+        self, local_path: str, path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies a local file into the artifact store.
+
+        Args:
+            local_path: The local file to copy.
+            path: The path to copy the file to.
+            overwrite: Whether to overwrite the destination file if it exists.
+        """
+        path = fileio.convert_to_str(path)
+        if not overwrite:
+            self._raise_if_any_exists([path])
+
+        size = os.path.getsize(local_path)
+        if size < self.transfer_config.multipart_threshold:
+            self.filesystem.put_file(local_path, path)
+            return
+
+        with transfer_utils.log_throughput("Uploaded", path, size):
+            self._upload_file_in_parts(local_path, path)
+        self.filesystem.invalidate_cache(path)
+
+    def download_file(
+        self, path: PathType, local_path: str, overwrite: bool = False
+    ) -> None:
+        """Copies a file of the artifact store to a local path.
+
+        Args:
+            path: The file to copy.
+            local_path: The local path to copy the file to.
+            overwrite: Whether to overwrite the destination file if it exists.
+        """
+        path = fileio.convert_to_str(path)
+        if not overwrite:
+            self._raise_if_any_exists([local_path])
+
+        size = self.filesystem.size(path)
+        if size < self.transfer_config.multipart_threshold:
+            self.filesystem.get_file(path, local_path)
+            return
+
+        with transfer_utils.log_throughput("Downloaded", path, size):
+            try:
+                transfer_utils.download_in_parts(
+                    partial(self._read_range, path),
+                    size=size,
+                    local_path=local_path,
+                    part_size=self.transfer_config.part_size,
+                    max_concurrency=self.transfer_config.download_concurrency,
+                )
+            except BaseException:
+                if os.path.exists(local_path):
+                    os.remove(local_path)
+                raise
+
+    def _read_range(self, path: str, start: int, end: int) -> bytes:
+        """Reads a byte range of a file of the artifact store.
+
+        Args:
+            path: The file to read.
+            start: The offset of the first byte to read.
+            end: The offset after the last byte to read.
+
+        Returns:
+            The bytes of the range.
+        """
+        return cast(
+            bytes, self.filesystem.cat_file(path, start=start, end=end)
+        )
+
+    def _is_large(self, local_path: str) -> bool:
+        """Checks whether a local file needs to be transferred in parts.
+
+        Args:
+            local_path: The local file.
+
+        Returns:
+            Whether the file is at least as large as the multipart threshold.
+        """
+        return bool(
+            os.path.getsize(local_path)
+            >= self.transfer_config.multipart_threshold
+        )
+
+    @staticmethod
+    def _raise_if_any_exists(paths: Sequence[PathType]) -> None:
+        """Raises an error if any of the given paths exists.
+
+        Args:
+            paths: The paths to check.
+
+        Raises:
+            FileExistsError: If any of the paths exists.
+        """
+        for path, exists in zip(paths, fileio.exists_many(paths)):
+            if exists:
+                raise FileExistsError(
+                    f"Unable to copy to destination "
+                    f"'{fileio.convert_to_str(path)}', file already exists. "
+                    f"Set `overwrite=True` to copy anyway."
+                )
+
+    @staticmethod
+    def _sorted_lists(
+        pairs: Sequence[Tuple[PathType, PathType]]
+    ) -> Tuple[List[str], List[str]]:
+        """Converts path pairs to lists of sources and destinations.
+
+        Older fsspec versions sort the source paths before pairing them with
+        the destination paths, so the pairs are sorted by their source.
+
+        Args:
+            pairs: Tuples of source and destination paths.
+
+        Returns:
+            The source and destination paths.
+        """
+        sorted_pairs = sorted(
+            (fileio.convert_to_str(src), fileio.convert_to_str(dst))
+            for src, dst in pairs
+        )
+        return [src for src, _ in sorted_pairs], [
+            dst for _, dst in sorted_pairs
+        ]
+
+    def copy_many(
+        self,
+        pairs: Sequence[Tuple[PathType, PathType]],
+        overwrite: bool = False,
+    ) -> None:
+        """Copies multiple files within the artifact store.
+
+        Args:
+            pairs: Tuples of source and destination paths.
+            overwrite: Whether to overwrite destination files that exist.
+        """
+        if not pairs:
+            return
+        sources, destinations = self._sorted_lists(pairs)
+        if not overwrite:
+            self._raise_if_any_exists(destinations)
+        self.filesystem.copy(
+            sources, destinations, batch_size=FILEIO_MAX_CONCURRENCY
+        )
+
+    def remove_many(self, paths: Sequence[PathType]) -> None:
+        """Removes multiple files or directories. Dangerous operation.
+
+        Args:
+            paths: The paths to remove. Directories are removed recursively.
+        """
+        if not paths:
+            return
+        self.filesystem.rm(
+            [fileio.convert_to_str(path) for path in paths], recursive=True
+        )
+
+    def upload_dir(
+        self, local_dir: str, dir_path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies all files of a local directory into the artifact store.
+
+        Args:
+            local_dir: The local directory to copy.
+            dir_path: The directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+        """
+        dir_path = fileio.convert_to_str(dir_path).rstrip("/")
+        pairs = []
+        for root, _, files in os.walk(local_dir):
+            relative_root = os.path.relpath(root, local_dir)
+            for file in files:
+                relative_path = os.path.normpath(
+                    os.path.join(relative_root, file)
+                )
+                pairs.append(
+                    (
+                        os.path.join(root, file),
+                        dir_path + "/" + relative_path.replace(os.sep, "/"),
+                    )
+                )
+        if not pairs:
+            return
+
+        local_paths, remote_paths = self._sorted_lists(pairs)
+        if not overwrite:
+            self._raise_if_any_exists(remote_paths)
+
+        small_files = [
+            (local_path, remote_path)
+            for local_path, remote_path in zip(local_paths, remote_paths)
+            if not self._is_large(local_path)
+        ]
+        if small_files:
+            self.filesystem.put(
+                [local_path for local_path, _ in small_files],
+                [remote_path for _, remote_path in small_files],
+                batch_size=FILEIO_MAX_CONCURRENCY,
+            )
+        for local_path, remote_path in zip(local_paths, remote_paths):
+            if self._is_large(local_path):
+                self.upload_file(local_path, remote_path, overwrite=True)
+
+    def download_dir(
+        self, dir_path: PathType, local_dir: str, overwrite: bool = False
+    ) -> None:
+        """Copies all files of an artifact store directory to a local one.
+
+        Args:
+            dir_path: The directory to copy.
+            local_dir: The local directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+        """
+        root = self.filesystem._strip_protocol(
+            fileio.convert_to_str(dir_path)
+        ).rstrip("/")
+        pairs = []
+        sizes: Dict[str, int] = {}
+        for remote_path, info in self.filesystem.find(
+            root, detail=True
+        ).items():
+            sizes[remote_path] = info["size"]
+            relative_path = remote_path[len(root) :].lstrip("/")
+            pairs.append(
+                (
+                    remote_path,
+                    os.path.join(local_dir, *relative_path.split("/")),
+                )
+            )
+
+        os.makedirs(local_dir, exist_ok=True)
+        if not pairs:
+            return
+
+        remote_paths, local_paths = self._sorted_lists(pairs)
+        if not overwrite:
+            self._raise_if_any_exists(local_paths)
+        for local_parent_dir in {os.path.dirname(p) for p in local_paths}:
+            os.makedirs(local_parent_dir, exist_ok=True)
+
+        small_files, large_files = [], []
+        for remote_path, local_path in zip(remote_paths, local_paths):
+            if sizes[remote_path] < self.transfer_config.multipart_threshold:
+                small_files.append((remote_path, local_path))
+            else:
+                large_files.append((remote_path, local_path))
+        if small_files:
+            self.filesystem.get(
+                [remote_path for remote_path, _ in small_files],
+                [local_path for _, local_path in small_files],
+                batch_size=FILEIO_MAX_CONCURRENCY,
+            )
+        for remote_path, local_path in large_files:
+            self.download_file(remote_path, local_path, overwrite=True)
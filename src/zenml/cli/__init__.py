@@ -1289,21 +1289,4 @@ zenml stack recipe clean
 This deletes all the recipes from the default path where they were downloaded.
 """
 
-from zenml.cli.annotator import *  # noqa
-from zenml.cli.artifact import *  # noqa
-from zenml.cli.base import *  # noqa
-from zenml.cli.config import *  # noqa
-from zenml.cli.example import *  # noqa
-from zenml.cli.feature import *  # noqa
-from zenml.cli.integration import *  # noqa
-from zenml.cli.model import *  # noqa
-from zenml.cli.pipeline import *  # noqa
-from zenml.cli.workspace import *  # noqa
-from zenml.cli.role import *  # noqa
-from zenml.cli.secret import *  # noqa
-from zenml.cli.server import *  # noqa
-from zenml.cli.stack import *  # noqa
-from zenml.cli.stack_components import *  # noqa
-from zenml.cli.stack_recipes import *  # noqa
-from zenml.cli.user_management import *  # noqa
-from zenml.cli.version import *  # noqa
+from zenml.cli.cli import cli  # noqa
@@ -21,6 +21,7 @@ import click
 from zenml.cli import utils as cli_utils
 from zenml.cli.cli import TagGroup, cli
 from zenml.client import Client
+from zenml.constants import DEFAULT_ARTIFACT_CONTENT_MIN_AGE
 from zenml.enums import CliCategories
 from zenml.logger import get_logger
 from zenml.models.artifact_models import ArtifactFilterModel
@@ -175,3 +176,46 @@ def prune_artifacts(
         except Exception as e:
             cli_utils.error(str(e))
     cli_utils.declare("All unused artifacts deleted.")
+
+
+@artifact.command(
+    "prune-content",
+    help="Delete unreferenced content-addressed artifact data.",
+)
+@click.option(
+    "--min-age-hours",
+    type=float,
+    default=DEFAULT_ARTIFACT_CONTENT_MIN_AGE / 3600,
+    show_default=True,
+    help="Only delete content that was stored at least this many hours ago.",
+)
+@click.option(
+    "--yes",
+    "-y",
+    is_flag=True,
+    help="Don't ask for confirmation.",
+)
+def prune_artifact_content(min_age_hours: float, yes: bool = False) -> None:
+    """Delete unreferenced content-addressed artifact data.
+
+    Args:
+        min_age_hours: Minimum age in hours of the content to delete.
+        yes: If set, don't ask for confirmation.
+    """
+    cli_utils.print_active_config()
+
+    if not yes:
+        confirmation = cli_utils.confirmation(
+            "Do you want to delete all content of the active artifact store "
+            "that is not referenced by any artifact?"
+        )
+        if not confirmation:
+            cli_utils.declare("Artifact content deletion canceled.")
+            return
+
+    deleted_uris = Client().prune_artifact_content(
+        min_age=min_age_hours * 3600
+    )
+    cli_utils.declare(
+        f"Deleted {len(deleted_uris)} unreferenced artifact contents."
+    )
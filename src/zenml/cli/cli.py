@@ -14,7 +14,17 @@
 """Core CLI functionality."""
 
 import os
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from importlib import import_module
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import click
 import rich
@@ -22,10 +32,48 @@ from click import Command, Context, formatting
 
 from zenml import __version__
 from zenml.cli.formatter import ZenFormatter
-from zenml.client import Client
-from zenml.enums import CliCategories
+from zenml.enums import CliCategories, StackComponentType
 from zenml.logger import set_root_verbosity
-from zenml.utils import source_utils
+
+# Maps the names of all top-level commands to the modules that define them or
+# register subcommands for them. Importing all CLI modules takes multiple
+# seconds, so these modules only get imported once one of their commands is
+# actually invoked.
+LAZY_COMMANDS: Dict[str, Tuple[str, ...]] = {
+    "analytics": ("zenml.cli.config",),
+    "artifact": ("zenml.cli.artifact",),
+    "clean": ("zenml.cli.base",),
+    "connect": ("zenml.cli.server",),
+    "deploy": ("zenml.cli.server",),
+    "destroy": ("zenml.cli.server",),
+    "disconnect": ("zenml.cli.server",),
+    "down": ("zenml.cli.server",),
+    "example": ("zenml.cli.example",),
+    "go": ("zenml.cli.base",),
+    "info": ("zenml.cli.base",),
+    "init": ("zenml.cli.base",),
+    "integration": ("zenml.cli.integration",),
+    "logging": ("zenml.cli.config",),
+    "logs": ("zenml.cli.server",),
+    "permission": ("zenml.cli.role",),
+    "pipeline": ("zenml.cli.pipeline",),
+    "project": ("zenml.cli.workspace",),
+    "role": ("zenml.cli.role",),
+    "secret": ("zenml.cli.secret",),
+    "stack": ("zenml.cli.stack", "zenml.cli.stack_recipes"),
+    "status": ("zenml.cli.server",),
+    "team": ("zenml.cli.user_management",),
+    "up": ("zenml.cli.server",),
+    "user": ("zenml.cli.user_management",),
+    "version": ("zenml.cli.version",),
+    "workspace": ("zenml.cli.workspace",),
+}
+LAZY_COMMANDS.update(
+    {
+        component_type.value.replace("_", "-"): ("zenml.cli.stack_components",)
+        for component_type in StackComponentType
+    }
+)
 
 
 class TagGroup(click.Group):
@@ -62,11 +110,117 @@ class ZenContext(click.Context):
     formatter_class = ZenFormatter
 
 
+class LazyCommands(Dict[str, click.Command]):
+    """Command dictionary that imports the modules of missing commands.
+
+    Accessing a command that is not registered yet imports the modules that
+    define it, which in turn register the command when they get imported.
+    """
+
+    def __init__(
+        self,
+        commands: Mapping[str, click.Command],
+        lazy_commands: Mapping[str, Sequence[str]],
+    ) -> None:
+        """Initializes the command dictionary.
+
+        Args:
+            commands: The already registered commands.
+            lazy_commands: Mapping of command names to the modules that need
+                to be imported to register the command.
+        """
+        super().__init__(commands)
+        self.lazy_commands = lazy_commands
+
+    def load(self, name: str) -> None:
+        """Imports the modules that define a command.
+
+        Args:
+            name: The name of the command.
+        """
+        for module in self.lazy_commands.get(name, ()):
+            import_module(module)
+
+    def load_all(self) -> None:
+        """Imports the modules that define all lazy commands."""
+        for name in self.lazy_commands:
+            self.load(name)
+
+    def __missing__(self, name: str) -> click.Command:
+        """Imports the modules that define a missing command.
+
+        Args:
+            name: The name of the command.
+
+        Returns:
+            The command.
+
+        Raises:
+            KeyError: If no module registered the command.
+        """
+        self.load(name)
+        if name in self:
+            return super().__getitem__(name)
+
+        raise KeyError(name)
+
+    def get(  # type: ignore[override]
+        self, name: str, default: Optional[click.Command] = None
+    ) -> Optional[click.Command]:
+        """Gets a command, importing its modules if necessary.
+
+        Args:
+            name: The name of the command.
+            default: Value to return if the command doesn't exist.
+
+        Returns:
+            The command or the default value.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
 class ZenMLCLI(click.Group):
-    """Custom click Group to create a custom format command help output."""
+    """Custom click Group to create a custom format command help output.
+
+    Top-level commands are registered lazily: their modules only get imported
+    once the command gets invoked or the help output is shown.
+    """
 
     context_class = ZenContext
 
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Mapping[str, Sequence[str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initializes the CLI group.
+
+        Args:
+            *args: Positional arguments of the click group.
+            lazy_commands: Mapping of command names to the modules that need
+                to be imported to register the command.
+            **kwargs: Keyword arguments of the click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.commands: LazyCommands = LazyCommands(
+            self.commands, lazy_commands=lazy_commands or {}
+        )
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Lists the names of all commands without importing them.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The sorted command names.
+        """
+        return sorted(set(self.commands) | set(self.commands.lazy_commands))
+
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
@@ -143,10 +297,13 @@ class ZenMLCLI(click.Group):
                     formatter.write_dl(rows)  # type: ignore[arg-type]
 
 
-@click.group(cls=ZenMLCLI)
+@click.group(cls=ZenMLCLI, lazy_commands=LAZY_COMMANDS)
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
+    from zenml.client import Client
+    from zenml.utils import source_utils
+
     set_root_verbosity()
     repo_root = Client.find_repository()
     if not repo_root:
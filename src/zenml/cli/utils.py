@@ -53,9 +53,6 @@ from zenml.models.filter_models import (
     UUIDFilter,
 )
 from zenml.models.page_model import Page
-from zenml.secret import BaseSecretSchema
-from zenml.services import BaseService, ServiceState
-from zenml.zen_server.deploy import ServerDeployment
 
 logger = get_logger(__name__)
 
@@ -74,7 +71,10 @@ if TYPE_CHECKING:
         PipelineRunResponseModel,
         StackResponseModel,
     )
+    from zenml.secret import BaseSecretSchema
+    from zenml.services import BaseService, ServiceState
     from zenml.stack import Stack
+    from zenml.zen_server.deploy import ServerDeployment
 
 MAX_ARGUMENT_VALUE_SIZE = 10240
 
@@ -644,6 +644,8 @@ def pretty_print_secret(
         hide_secret: boolean that configures if the secret values are shown
             on the CLI
     """
+    from zenml.secret import BaseSecretSchema
+
     if isinstance(secret, BaseSecretSchema):
         secret = secret.content
 
@@ -1072,6 +1074,14 @@ def print_page_info(page: Page[T]) -> None:
     Args:
         page: The page to print the information for.
     """
+    if page.total is None:
+        # Counting was skipped, so only the items of this page are known.
+        declare(
+            f"Page `{page.page}`, `{len(page)}` items found for the applied "
+            "filters."
+        )
+        return
+
     declare(
         f"Page `({page.page}/{page.total_pages})`, `{page.total}` items "
         f"found for the applied filters."
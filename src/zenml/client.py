@@ -12,10 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Client implementation."""
-import json
 import os
+import time
 from abc import ABCMeta
-from datetime import datetime
+from datetime import datetime, timezone
 from functools import partial
 from pathlib import Path
 from typing import (
@@ -37,16 +37,19 @@ from pydantic import SecretStr
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
+    DEFAULT_ARTIFACT_CONTENT_MIN_AGE,
     ENV_ZENML_ACTIVE_STACK_ID,
     ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
     ENV_ZENML_REPOSITORY_PATH,
     PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAXIMUM,
     PAGINATION_STARTING_PAGE,
     REPOSITORY_DIRECTORY_NAME,
     handle_bool_env_var,
 )
 from zenml.enums import (
     ArtifactType,
+    GenericFilterOps,
     LogicalOperators,
     PermissionType,
     SecretScope,
@@ -82,7 +85,6 @@ from zenml.models import (
     RoleRequestModel,
     RoleResponseModel,
     RoleUpdateModel,
-    RunMetadataRequestModel,
     RunMetadataResponseModel,
     SecretFilterModel,
     SecretRequestModel,
@@ -128,6 +130,7 @@ from zenml.models.schedule_model import (
 from zenml.utils import io_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, event_handler, track
 from zenml.utils.filesync_model import FileSyncModel
+from zenml.utils.metadata_utils import build_run_metadata_requests
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -676,6 +679,8 @@ class Client(metaclass=ClientMetaClass):
         email: Optional[str] = None,
         active: Optional[bool] = None,
         email_opted_in: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[UserResponseModel]:
         """List all users.
 
@@ -692,6 +697,10 @@ class Client(metaclass=ClientMetaClass):
             email: Use the user email for filtering
             active: User the user active status for filtering
             email_opted_in: Use the user opt in status for filtering
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The User
@@ -701,6 +710,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count_total=count_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -791,6 +802,8 @@ class Client(metaclass=ClientMetaClass):
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[TeamResponseModel]:
         """List all teams.
 
@@ -803,6 +816,10 @@ class Client(metaclass=ClientMetaClass):
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: Use the team name for filtering
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The Team
@@ -812,6 +829,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count_total=count_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -950,6 +969,8 @@ class Client(metaclass=ClientMetaClass):
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[RoleResponseModel]:
         """List all roles.
 
@@ -962,6 +983,10 @@ class Client(metaclass=ClientMetaClass):
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: Use the role name for filtering
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The Role
@@ -971,6 +996,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count_total=count_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1148,6 +1175,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         role_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[UserRoleAssignmentResponseModel]:
         """List all user role assignments.
 
@@ -1162,6 +1191,10 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             user_id: The id of the user to filter by.
             role_id: The id of the role to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The Team
@@ -1171,6 +1204,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count_total=count_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1254,6 +1289,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         team_id: Optional[Union[str, UUID]] = None,
         role_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[TeamRoleAssignmentResponseModel]:
         """List all team role assignments.
 
@@ -1268,6 +1305,10 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             team_id: The id of the team to filter by.
             role_id: The id of the role to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The Team
@@ -1277,6 +1318,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count_total=count_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1360,6 +1403,8 @@ class Client(metaclass=ClientMetaClass):
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[WorkspaceResponseModel]:
         """List all workspaces.
 
@@ -1372,6 +1417,10 @@ class Client(metaclass=ClientMetaClass):
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: Use the team name for filtering
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The Team
@@ -1381,6 +1430,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count_total=count_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1734,6 +1785,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         component_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[StackResponseModel]:
         """Lists all stacks.
 
@@ -1751,6 +1804,10 @@ class Client(metaclass=ClientMetaClass):
             component_id: The id of the component to filter by.
             name: The name of the stack to filter by.
             is_shared: The shared status of the stack to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page of stacks.
@@ -1758,6 +1815,8 @@ class Client(metaclass=ClientMetaClass):
         stack_filter_model = StackFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -1953,6 +2012,8 @@ class Client(metaclass=ClientMetaClass):
         type: Optional[str] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[ComponentResponseModel]:
         """Lists all registered stack components.
 
@@ -1970,6 +2031,10 @@ class Client(metaclass=ClientMetaClass):
             user_id: The id of the user to filter by.
             name: The name of the component to filter by.
             is_shared: The shared status of the component to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page of stack components.
@@ -1977,6 +2042,8 @@ class Client(metaclass=ClientMetaClass):
         component_filter_model = ComponentFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -2088,7 +2155,7 @@ class Client(metaclass=ClientMetaClass):
                 is_shared=shared_status,
                 type=component_type,
             )
-            if existing_components.total > 0:
+            if existing_components.items:
                 raise EntityExistsError(
                     f"There are already existing "
                     f"{'shared' if shared_status else 'unshared'} components "
@@ -2282,6 +2349,8 @@ class Client(metaclass=ClientMetaClass):
         type: Optional[str] = None,
         integration: Optional[str] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[FlavorResponseModel]:
         """Fetches all the flavor models.
 
@@ -2297,6 +2366,10 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the flavor to filter by.
             type: The type of the flavor to filter by.
             integration: The integration of the flavor to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A list of all the flavor models.
@@ -2304,6 +2377,8 @@ class Client(metaclass=ClientMetaClass):
         flavor_filter_model = FlavorFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -2393,6 +2468,8 @@ class Client(metaclass=ClientMetaClass):
         docstring: Optional[str] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[PipelineResponseModel]:
         """List all pipelines.
 
@@ -2410,6 +2487,10 @@ class Client(metaclass=ClientMetaClass):
             docstring: The docstring of the pipeline to filter by.
             workspace_id: The id of the workspace to filter by.
             user_id: The id of the user to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -2418,6 +2499,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2541,6 +2624,8 @@ class Client(metaclass=ClientMetaClass):
         user_id: Optional[Union[str, UUID]] = None,
         pipeline_id: Optional[Union[str, UUID]] = None,
         stack_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[PipelineBuildResponseModel]:
         """List all builds.
 
@@ -2556,6 +2641,10 @@ class Client(metaclass=ClientMetaClass):
             user_id: The  id of the user to filter by.
             pipeline_id: The id of the pipeline to filter by.
             stack_id: The id of the stack to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page with builds fitting the filter description
@@ -2564,6 +2653,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2649,6 +2740,8 @@ class Client(metaclass=ClientMetaClass):
         pipeline_id: Optional[Union[str, UUID]] = None,
         stack_id: Optional[Union[str, UUID]] = None,
         build_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[PipelineDeploymentResponseModel]:
         """List all deployments.
 
@@ -2665,6 +2758,10 @@ class Client(metaclass=ClientMetaClass):
             pipeline_id: The id of the pipeline to filter by.
             stack_id: The id of the stack to filter by.
             build_id: The id of the build to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page with deployments fitting the filter description
@@ -2673,6 +2770,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2767,6 +2866,8 @@ class Client(metaclass=ClientMetaClass):
         end_time: Optional[Union[datetime, str]] = None,
         interval_second: Optional[int] = None,
         catchup: Optional[Union[str, bool]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[ScheduleResponseModel]:
         """List schedules.
 
@@ -2789,6 +2890,10 @@ class Client(metaclass=ClientMetaClass):
             end_time: Use to filter by end time.
             interval_second: Use to filter by interval second.
             catchup: Use to filter by catchup.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A list of schedules.
@@ -2797,6 +2902,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2877,6 +2984,8 @@ class Client(metaclass=ClientMetaClass):
         end_time: Optional[Union[datetime, str]] = None,
         num_steps: Optional[Union[int, str]] = None,
         unlisted: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[PipelineRunResponseModel]:
         """List all pipeline runs.
 
@@ -2902,6 +3011,10 @@ class Client(metaclass=ClientMetaClass):
             end_time: The end_time for the pipeline run
             num_steps: The number of steps for the pipeline run
             unlisted: If the runs should be unlisted or not.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page with Pipeline Runs fitting the filter description
@@ -2910,6 +3023,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2987,6 +3102,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         num_outputs: Optional[Union[int, str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[StepRunResponseModel]:
         """List all pipelines.
 
@@ -3010,6 +3127,10 @@ class Client(metaclass=ClientMetaClass):
             cache_key: The cache_key of the run to filter by.
             status: The name of the run to filter by.
             num_outputs: The number of outputs for the step run
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -3018,6 +3139,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             entrypoint_name=entrypoint_name,
@@ -3073,6 +3196,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         only_unused: Optional[bool] = False,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[ArtifactResponseModel]:
         """Get all artifacts.
 
@@ -3093,6 +3218,10 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             user_id: The  id of the user to filter by.
             only_unused: Only return artifacts that are not used in any runs.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A list of artifacts.
@@ -3101,6 +3230,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3180,7 +3311,52 @@ class Client(metaclass=ClientMetaClass):
             )
             artifact_store = StackComponent.from_model(artifact_store_model)
             assert isinstance(artifact_store, BaseArtifactStore)
-            artifact_store.rmtree(artifact.uri)
+            if artifact_store.get_content_digest(artifact.uri):
+                # Content-addressed artifacts can be shared by multiple
+                # artifact records and are only deleted once none of the
+                # other records references them anymore.
+                references = self._count_artifact_uri_references(
+                    uri=artifact.uri,
+                    artifact_store_id=artifact.artifact_store_id,
+                )
+                if references > 1:
+                    logger.info(
+                        f"Not deleting artifact '{artifact.uri}' from the "
+                        f"artifact store because it is referenced by "
+                        f"{references - 1} other artifact(s)."
+                    )
+                    return
+                # Running steps might have reused the content after this
+                # artifact was created without registering their artifacts
+                # yet. Such content is left to `prune_artifact_content(...)`.
+                stored_at = artifact_store.get_content_addressed_timestamp(
+                    artifact.uri
+                )
+                # Some databases only store timestamps with second precision.
+                created_at = (
+                    artifact.created.replace(tzinfo=timezone.utc).timestamp()
+                    + 1
+                )
+                if stored_at is not None and stored_at > created_at:
+                    logger.info(
+                        f"Not deleting artifact '{artifact.uri}' from the "
+                        "artifact store because its content was reused after "
+                        "the artifact was created."
+                    )
+                    return
+                # Check again right before deleting in case another artifact
+                # was registered in the meantime.
+                if (
+                    self._count_artifact_uri_references(
+                        uri=artifact.uri,
+                        artifact_store_id=artifact.artifact_store_id,
+                    )
+                    > 1
+                ):
+                    return
+                artifact_store.delete_content_addressed(artifact.uri)
+            else:
+                artifact_store.rmtree(artifact.uri)
         except Exception as e:
             logger.error(
                 f"Failed to delete artifact '{artifact.uri}' from the "
@@ -3195,6 +3371,94 @@ class Client(metaclass=ClientMetaClass):
                 f"Deleted artifact '{artifact.uri}' from the artifact store."
             )
 
+    def _count_artifact_uri_references(
+        self, uri: str, artifact_store_id: UUID
+    ) -> int:
+        """Counts the artifacts of all workspaces that are stored at a URI.
+
+        Args:
+            uri: The URI of the artifacts.
+            artifact_store_id: The ID of the artifact store of the artifacts.
+
+        Returns:
+            The number of artifacts stored at the URI.
+        """
+        artifacts = self.zen_store.list_artifacts(
+            ArtifactFilterModel(
+                uri=uri, artifact_store_id=artifact_store_id, size=1
+            )
+        )
+        return artifacts.total or 0
+
+    def prune_artifact_content(
+        self, min_age: float = DEFAULT_ARTIFACT_CONTENT_MIN_AGE
+    ) -> List[str]:
+        """Deletes unreferenced content from the active artifact store.
+
+        If the artifact store uses the content-addressed layout, identical
+        artifact content is shared by all artifacts that reference it. This
+        method deletes all content that is not referenced by any artifact
+        anymore.
+
+        Args:
+            min_age: Minimum age in seconds of the content to delete. Content
+                that was stored more recently is kept, as the artifacts of
+                running steps might not have been registered yet.
+
+        Returns:
+            The URIs of the deleted content.
+        """
+        artifact_store = self.active_stack.artifact_store
+        stored_content = artifact_store.list_content_addressed()
+        if not stored_content:
+            return []
+
+        def _list_content_addressed_artifacts(
+            **kwargs: Any,
+        ) -> Page[ArtifactResponseModel]:
+            """Lists content-addressed artifacts of all workspaces.
+
+            Args:
+                **kwargs: Pagination arguments.
+
+            Returns:
+                A page of artifacts.
+            """
+            return self.zen_store.list_artifacts(
+                ArtifactFilterModel(
+                    artifact_store_id=artifact_store.id,
+                    uri=(
+                        f"{GenericFilterOps.STARTSWITH}:"
+                        f"{artifact_store.content_addressed_path}"
+                    ),
+                    size=PAGE_SIZE_MAXIMUM,
+                    **kwargs,
+                )
+            )
+
+        referenced_uris = {
+            artifact.uri
+            for artifact in self.depaginate(_list_content_addressed_artifacts)
+        }
+
+        deleted_uris = []
+        max_created = time.time() - min_age
+        for uri, created in stored_content.items():
+            if uri in referenced_uris or created > max_created:
+                continue
+            # The content might have been reused or registered since it was
+            # listed, so check again right before deleting it.
+            stored_at = artifact_store.get_content_addressed_timestamp(uri)
+            if stored_at is None or stored_at > max_created:
+                continue
+            if self._count_artifact_uri_references(
+                uri=uri, artifact_store_id=artifact_store.id
+            ):
+                continue
+            artifact_store.delete_content_addressed(uri)
+            deleted_uris.append(uri)
+        return deleted_uris
+
     def _delete_artifact_metadata(
         self, artifact: ArtifactResponseModel
     ) -> None:
@@ -3252,8 +3516,6 @@ class Client(metaclass=ClientMetaClass):
             ValueError: If not exactly one of either `pipeline_run_id`,
                 `step_run_id`, or `artifact_id` is provided.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
         if not (pipeline_run_id or step_run_id or artifact_id):
             raise ValueError(
                 "Cannot create run metadata without linking it to any entity. "
@@ -3271,41 +3533,25 @@ class Client(metaclass=ClientMetaClass):
                 "`step_run_id` or only an `artifact_id`."
             )
 
-        created_metadata: Dict[str, RunMetadataResponseModel] = {}
-        for key, value in metadata.items():
-
-            # Skip metadata that is too large to be stored in the database.
-            if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
-                logger.warning(
-                    f"Metadata value for key '{key}' is too large to be "
-                    "stored in the database. Skipping."
-                )
-                continue
-
-            # Skip metadata that is not of a supported type.
-            try:
-                metadata_type = get_metadata_type(value)
-            except ValueError as e:
-                logger.warning(
-                    f"Metadata value for key '{key}' is not of a supported "
-                    f"type. Skipping. Full error: {e}"
-                )
-                continue
+        run_metadata = build_run_metadata_requests(
+            metadata=metadata,
+            workspace_id=self.active_workspace.id,
+            user_id=self.active_user.id,
+            pipeline_run_id=pipeline_run_id,
+            step_run_id=step_run_id,
+            artifact_id=artifact_id,
+            stack_component_id=stack_component_id,
+        )
+        if not run_metadata:
+            return {}
 
-            run_metadata = RunMetadataRequestModel(
-                workspace=self.active_workspace.id,
-                user=self.active_user.id,
-                pipeline_run_id=pipeline_run_id,
-                step_run_id=step_run_id,
-                artifact_id=artifact_id,
-                stack_component_id=stack_component_id,
-                key=key,
-                value=value,
-                type=metadata_type,
-            )
-            metadata_model = self.zen_store.create_run_metadata(run_metadata)
-            created_metadata[key] = metadata_model
-        return created_metadata
+        created_metadata = self.zen_store.batch_create_run_metadata(
+            run_metadata
+        )
+        return {
+            metadata_model.key: metadata_model
+            for metadata_model in created_metadata
+        }
 
     def list_run_metadata(
         self,
@@ -3325,6 +3571,8 @@ class Client(metaclass=ClientMetaClass):
         key: Optional[str] = None,
         value: Optional["MetadataType"] = None,
         type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[RunMetadataResponseModel]:
         """List run metadata.
 
@@ -3346,6 +3594,10 @@ class Client(metaclass=ClientMetaClass):
             key: The key of the metadata.
             value: The value of the metadata.
             type: The type of the metadata.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The run metadata.
@@ -3354,6 +3606,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3591,6 +3845,8 @@ class Client(metaclass=ClientMetaClass):
         scope: Optional[SecretScope] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[SecretResponseModel]:
         """Fetches all the secret models.
 
@@ -3606,6 +3862,10 @@ class Client(metaclass=ClientMetaClass):
             scope: The scope of the secret to filter by.
             workspace_id: The id of the workspace to filter by.
             user_id: The  id of the user to filter by.
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             A list of all the secret models.
@@ -3617,6 +3877,8 @@ class Client(metaclass=ClientMetaClass):
         secret_filter_model = SecretFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count_total=count_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -3641,11 +3903,21 @@ class Client(metaclass=ClientMetaClass):
     def list_secrets_in_scope(
         self,
         scope: SecretScope,
+        page: int = PAGINATION_STARTING_PAGE,
+        size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Page[SecretResponseModel]:
         """Fetches the list of secret in a given scope.
 
         Args:
             scope: The secrets scope to search for.
+            page: The page of items
+            size: The maximum size of all pages
+            cursor: Cursor returned by the previous page to fetch the next
+                page using keyset pagination.
+            count_total: Whether to count the total number of items and
+                pages.
 
         Returns:
             The list of secrets.
@@ -3654,6 +3926,10 @@ class Client(metaclass=ClientMetaClass):
 
         return self.list_secrets(
             scope=scope,
+            page=page,
+            size=size,
+            cursor=cursor,
+            count_total=count_total,
         )
 
     def update_secret(
@@ -3871,10 +4147,19 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             A list of the corresponding Response Model.
         """
-        page = list_method()
+        page = list_method(count_total=False)
         items = list(page.items)
-        while page.page < page.total_pages:
-            page = list_method(page=page.page + 1)
+        while True:
+            if page.next_cursor:
+                # Keyset pagination, each page directly continues after the
+                # last item of the previous one.
+                page = list_method(cursor=page.next_cursor, count_total=False)
+            elif page.total_pages and page.page < page.total_pages:
+                # Servers that don't support keyset pagination always return
+                # the total number of pages.
+                page = list_method(page=page.page + 1)
+            else:
+                break
             items += list(page.items)
 
         return items
@@ -0,0 +1,57 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Materialization settings class used to configure artifact IO of steps."""
+
+from typing import Optional
+
+from pydantic import Extra, PositiveFloat, PositiveInt
+
+from zenml.config.base_settings import BaseSettings
+
+DEFAULT_MATERIALIZATION_MAX_WORKERS = 1
+
+
+class MaterializationSettings(BaseSettings):
+    """Settings for loading and storing the artifacts of a step.
+
+    Attributes:
+        max_workers: The maximum number of input artifacts that get loaded
+            and output artifacts that get stored concurrently. By default,
+            all artifacts are materialized sequentially. Only set this to a
+            larger value if the materializers of the step are thread-safe.
+        metadata_max_rows: If an output artifact has more rows, the
+            statistics in its metadata are computed on an evenly spaced
+            sample of this many rows.
+        metadata_time_budget: Maximum time in seconds to spend on computing
+            the statistics of each output artifact. Statistics that can't be
+            computed in time are skipped.
+        extract_metadata_in_background: If `True`, the metadata of the
+            output artifacts is extracted and published after the step run
+            was marked as completed, so downstream steps don't need to wait
+            for it.
+    """
+
+    max_workers: PositiveInt = DEFAULT_MATERIALIZATION_MAX_WORKERS
+    metadata_max_rows: Optional[PositiveInt] = None
+    metadata_time_budget: Optional[PositiveFloat] = None
+    extract_metadata_in_background: bool = False
+
+    class Config:
+        """Pydantic configuration class."""
+
+        # public attributes are immutable
+        allow_mutation = False
+
+        # prevent extra attributes during model initialization
+        extra = Extra.forbid
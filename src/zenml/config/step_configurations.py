@@ -17,13 +17,21 @@ from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 from pydantic import root_validator
 
 from zenml.config.base_settings import BaseSettings, SettingsOrDict
-from zenml.config.constants import DOCKER_SETTINGS_KEY, RESOURCE_SETTINGS_KEY
+from zenml.config.constants import (
+    DOCKER_SETTINGS_KEY,
+    MATERIALIZATION_SETTINGS_KEY,
+    RESOURCE_SETTINGS_KEY,
+)
 from zenml.config.strict_base_model import StrictBaseModel
 from zenml.logger import get_logger
 from zenml.utils import source_utils
 
 if TYPE_CHECKING:
-    from zenml.config import DockerSettings, ResourceSettings
+    from zenml.config import (
+        DockerSettings,
+        MaterializationSettings,
+        ResourceSettings,
+    )
 
 logger = get_logger(__name__)
 
@@ -134,6 +142,20 @@ class StepConfiguration(PartialStepConfiguration):
         )
         return DockerSettings.parse_obj(model_or_dict)
 
+    @property
+    def materialization_settings(self) -> "MaterializationSettings":
+        """Materialization settings of this step configuration.
+
+        Returns:
+            The materialization settings of this step configuration.
+        """
+        from zenml.config import MaterializationSettings
+
+        model_or_dict: SettingsOrDict = self.settings.get(
+            MATERIALIZATION_SETTINGS_KEY, {}
+        )
+        return MaterializationSettings.parse_obj(model_or_dict)
+
 
 class InputSpec(StrictBaseModel):
     """Step input specification."""
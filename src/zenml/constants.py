@@ -80,9 +80,21 @@ ENV_ZENML_SECRETS_STORE_PREFIX = "ZENML_SECRETS_STORE_"
 ENV_ZENML_SKIP_PIPELINE_REGISTRATION = "ZENML_SKIP_PIPELINE_REGISTRATION"
 ENV_ZENML_SERVER_ROOT_URL_PATH = "ZENML_SERVER_ROOT_URL_PATH"
 ENV_ZENML_SERVER_DEPLOYMENT_TYPE = "ZENML_SERVER_DEPLOYMENT_TYPE"
+ENV_ZENML_SERVER_RUN_DAG_CACHE_SIZE = "ZENML_SERVER_RUN_DAG_CACHE_SIZE"
+ENV_ZENML_SERVER_AUTH_CACHE_SIZE = "ZENML_SERVER_AUTH_CACHE_SIZE"
+ENV_ZENML_SERVER_AUTH_CACHE_TTL = "ZENML_SERVER_AUTH_CACHE_TTL"
+ENV_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE = (
+    "ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE"
+)
+# Uvicorn and gunicorn use this variable as their default number of workers
+ENV_ZENML_SERVER_WORKERS = "WEB_CONCURRENCY"
 ENV_AUTO_OPEN_DASHBOARD = "AUTO_OPEN_DASHBOARD"
 ENV_ZENML_DISABLE_DATABASE_MIGRATION = "DISABLE_DATABASE_MIGRATION"
 ENV_ZENML_LOCAL_STORES_PATH = "ZENML_LOCAL_STORES_PATH"
+ENV_ZENML_ARTIFACT_CACHE_PATH = "ZENML_ARTIFACT_CACHE_PATH"
+ENV_ZENML_FILEIO_MAX_CONCURRENCY = "ZENML_FILEIO_MAX_CONCURRENCY"
+ENV_ZENML_PANDAS_COMPRESSION = "ZENML_PANDAS_COMPRESSION"
+ENV_ZENML_PANDAS_ROW_GROUP_SIZE = "ZENML_PANDAS_ROW_GROUP_SIZE"
 ENV_ZENML_CONTAINER = "ZENML_CONTAINER"
 ENV_ZENML_PAGINATION_DEFAULT_LIMIT = "ZENML_PAGINATION_DEFAULT_LIMIT"
 ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING = (
@@ -175,6 +187,7 @@ USER_ROLE_ASSIGNMENTS = "/role_assignments"
 TEAM_ROLE_ASSIGNMENTS = "/team_role_assignments"
 PIPELINE_RUNS = "/pipeline_runs"
 LOGIN = "/login"
+AUTH = "/auth"
 LOGOUT = "/logout"
 PIPELINES = "/pipelines"
 PIPELINE_BUILDS = "/pipeline_builds"
@@ -189,6 +202,8 @@ PIPELINE_CONFIGURATION = "/pipeline-configuration"
 STEP_CONFIGURATION = "/step-configuration"
 GRAPH = "/graph"
 STEPS = "/steps"
+CACHED = "/cached"
+FINALIZE = "/finalize"
 ARTIFACTS = "/artifacts"
 COMPONENT_TYPES = "/component-types"
 REPOSITORIES = "/repositories"
@@ -199,6 +214,7 @@ INFO = "/info"
 VERSION_1 = "/v1"
 STATUS = "/status"
 GET_OR_CREATE = "/get-or-create"
+BATCH = "/batch"
 SECRETS = "/secrets"
 
 # mandatory stack component attributes
@@ -211,6 +227,45 @@ MODEL_METADATA_YAML_FILE_NAME = "model_metadata.yaml"
 # orchestrator constants
 ORCHESTRATOR_DOCKER_IMAGE_KEY = "orchestrator"
 
+# Content-addressed artifacts that are younger than this (in seconds) are
+# never garbage collected, as they might belong to a step that is still running
+DEFAULT_ARTIFACT_CONTENT_MIN_AGE = 24 * 60 * 60
+
+# Default maximum size (in bytes) of the local cache for remote artifacts
+DEFAULT_ARTIFACT_CACHE_MAX_SIZE = 10 * 1024**3
+
+# Maximum number of concurrent requests of bulk filesystem operations
+FILEIO_MAX_CONCURRENCY = max(
+    handle_int_env_var(ENV_ZENML_FILEIO_MAX_CONCURRENCY, default=16), 1
+)
+
+# Maximum number of serialized DAGs of finished runs that the server caches
+RUN_DAG_CACHE_SIZE = max(
+    handle_int_env_var(ENV_ZENML_SERVER_RUN_DAG_CACHE_SIZE, default=64), 0
+)
+
+# Number of worker processes that serve the ZenML server
+SERVER_WORKERS = max(
+    handle_int_env_var(ENV_ZENML_SERVER_WORKERS, default=1), 1
+)
+
+# Maximum number of access tokens and time to live (in seconds) of the
+# authentication contexts that the server caches
+AUTH_CACHE_SIZE = max(
+    handle_int_env_var(ENV_ZENML_SERVER_AUTH_CACHE_SIZE, default=1024), 0
+)
+AUTH_CACHE_TTL = max(
+    handle_int_env_var(ENV_ZENML_SERVER_AUTH_CACHE_TTL, default=30), 0
+)
+
+# Maximum size in bytes of compressed request bodies after decompression
+MAX_DECOMPRESSED_REQUEST_SIZE = max(
+    handle_int_env_var(
+        ENV_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE, default=100 * 1024**2
+    ),
+    1,
+)
+
 # Secret constants
 ARBITRARY_SECRET_SCHEMA_TYPE = "arbitrary"
 
@@ -25,7 +25,6 @@ from zenml.stack.authentication_mixin import (
     AuthenticationMixin,
 )
 from zenml.stack.flavor import Flavor
-from zenml.utils import docker_utils
 
 
 class BaseContainerRegistryConfig(AuthenticationConfigMixin):
@@ -129,6 +128,8 @@ class BaseContainerRegistry(AuthenticationMixin):
                 f"registry `{self.config.uri}`."
             )
 
+        from zenml.utils import docker_utils
+
         self.prepare_image_push(image_name)
         return docker_utils.push_image(image_name)
 
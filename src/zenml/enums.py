@@ -38,6 +38,15 @@ class ExecutionStatus(StrEnum):
     RUNNING = "running"
     CACHED = "cached"
 
+    @property
+    def is_finished(self) -> bool:
+        """Whether the execution is finished and its status can't change.
+
+        Returns:
+            Whether the execution is finished.
+        """
+        return self != ExecutionStatus.RUNNING
+
 
 class LoggingLevels(Enum):
     """Enum for logging levels."""
@@ -28,6 +28,9 @@ from typing import (
 import adlfs
 
 from zenml.artifact_stores import BaseArtifactStore
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    FsspecBulkOperationsMixin,
+)
 from zenml.integrations.azure.flavors.azure_artifact_store_flavor import (
     AzureArtifactStoreConfig,
 )
@@ -38,7 +41,9 @@ from zenml.stack.authentication_mixin import AuthenticationMixin
 PathType = Union[bytes, str]
 
 
-class AzureArtifactStore(BaseArtifactStore, AuthenticationMixin):
+class AzureArtifactStore(
+    FsspecBulkOperationsMixin, BaseArtifactStore, AuthenticationMixin
+):
     """Artifact Store for Microsoft Azure based artifacts."""
 
     _filesystem: Optional[adlfs.AzureBlobFileSystem] = None
@@ -65,10 +70,14 @@ class AzureArtifactStore(BaseArtifactStore, AuthenticationMixin):
             )
             credentials = secret.content if secret else {}
 
+            filesystem_kwargs: Dict[str, Any] = {}
+            if self.config.block_size:
+                filesystem_kwargs["blocksize"] = self.config.block_size
             self._filesystem = adlfs.AzureBlobFileSystem(
                 **credentials,
                 anon=False,
                 use_listings_cache=False,
+                **filesystem_kwargs,
             )
         return self._filesystem
 
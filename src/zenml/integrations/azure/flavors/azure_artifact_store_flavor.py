@@ -19,6 +19,9 @@ from zenml.artifact_stores import (
     BaseArtifactStoreConfig,
     BaseArtifactStoreFlavor,
 )
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    ChunkedTransferConfigMixin,
+)
 from zenml.integrations.azure import AZURE_ARTIFACT_STORE_FLAVOR
 from zenml.stack.authentication_mixin import AuthenticationConfigMixin
 
@@ -27,7 +30,9 @@ if TYPE_CHECKING:
 
 
 class AzureArtifactStoreConfig(
-    BaseArtifactStoreConfig, AuthenticationConfigMixin
+    BaseArtifactStoreConfig,
+    AuthenticationConfigMixin,
+    ChunkedTransferConfigMixin,
 ):
     """Configuration class for Azure Artifact Store."""
 
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the GCP Artifact Store."""
 
+import os
 from typing import (
     Any,
     Callable,
@@ -28,18 +29,32 @@ from typing import (
 import gcsfs
 
 from zenml.artifact_stores import BaseArtifactStore
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    FsspecBulkOperationsMixin,
+)
 from zenml.integrations.gcp.flavors.gcp_artifact_store_flavor import (
     GCP_PATH_PREFIX,
     GCPArtifactStoreConfig,
 )
 from zenml.io.fileio import convert_to_str
+from zenml.logger import get_logger
 from zenml.secret.schemas import GCPSecretSchema
 from zenml.stack.authentication_mixin import AuthenticationMixin
+from zenml.utils import transfer_utils
+
+logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
+# Maximum number of objects that can be composed in a single request
+GCS_MAX_COMPOSE_PARTS = 32
+# Maximum number of parts of a single parallel composite upload
+GCS_MAX_PARTS = 10000
 
-class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
+
+class GCPArtifactStore(
+    FsspecBulkOperationsMixin, BaseArtifactStore, AuthenticationMixin
+):
     """Artifact Store for Google Cloud Storage based artifacts."""
 
     _filesystem: Optional[gcsfs.GCSFileSystem] = None
@@ -65,10 +80,86 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
                 expected_schema_type=GCPSecretSchema
             )
             token = secret.get_credential_dict() if secret else None
-            self._filesystem = gcsfs.GCSFileSystem(token=token)
+            filesystem_kwargs: Dict[str, Any] = {}
+            if self.config.block_size:
+                filesystem_kwargs["block_size"] = self.config.block_size
+            self._filesystem = gcsfs.GCSFileSystem(
+                token=token, **filesystem_kwargs
+            )
 
         return self._filesystem
 
+    def _upload_file_in_parts(self, local_path: str, path: str) -> None:
+        """Uploads a large local file using a parallel composite upload.
+
+        The parts are uploaded concurrently as temporary objects, which then
+        get composed into the final object. A single compose request can
+        only combine a limited number of objects, so larger files are
+        composed in multiple rounds instead of using larger parts, which
+        would need to be held in memory while they are uploaded.
+
+        Args:
+            local_path: The local file to upload.
+            path: The remote path to upload the file to.
+        """
+        temporary_paths: List[str] = []
+
+        def _upload_part(part_number: int, data: bytes) -> str:
+            """Uploads a single part as temporary object.
+
+            Args:
+                part_number: The number of the part.
+                data: The content of the part.
+
+            Returns:
+                The path of the temporary object.
+            """
+            part_path = f"{path}.part-{part_number:05d}"
+            self.filesystem.pipe_file(part_path, data)
+            temporary_paths.append(part_path)
+            return part_path
+
+        part_size = transfer_utils.get_part_size(
+            os.path.getsize(local_path),
+            part_size=self.config.part_size,
+            max_parts=GCS_MAX_PARTS,
+        )
+        try:
+            paths = transfer_utils.upload_in_parts(
+                local_path,
+                upload_part=_upload_part,
+                part_size=part_size,
+                max_concurrency=self.config.upload_concurrency,
+            )
+            compose_round = 0
+            while len(paths) > GCS_MAX_COMPOSE_PARTS:
+                composed_paths = []
+                for index in range(0, len(paths), GCS_MAX_COMPOSE_PARTS):
+                    composed_path = (
+                        f"{path}.compose-{compose_round}-{index:05d}"
+                    )
+                    self.filesystem.merge(
+                        composed_path,
+                        paths[index : index + GCS_MAX_COMPOSE_PARTS],
+                    )
+                    temporary_paths.append(composed_path)
+                    composed_paths.append(composed_path)
+                paths = composed_paths
+                compose_round += 1
+            self.filesystem.merge(path, paths)
+        finally:
+            # Delete the temporary objects even if the upload failed. Errors
+            # are only logged to not hide the error of the upload.
+            if temporary_paths:
+                try:
+                    self.filesystem.rm(temporary_paths)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to delete the temporary objects %s: %s",
+                        temporary_paths,
+                        e,
+                    )
+
     def open(self, path: PathType, mode: str = "r") -> Any:
         """Open a file at the given path.
 
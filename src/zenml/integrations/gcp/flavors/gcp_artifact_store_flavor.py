@@ -19,6 +19,9 @@ from zenml.artifact_stores import (
     BaseArtifactStoreConfig,
     BaseArtifactStoreFlavor,
 )
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    ChunkedTransferConfigMixin,
+)
 from zenml.integrations.gcp import GCP_ARTIFACT_STORE_FLAVOR
 from zenml.stack.authentication_mixin import AuthenticationConfigMixin
 
@@ -30,7 +33,9 @@ GCP_PATH_PREFIX = "gs://"
 
 
 class GCPArtifactStoreConfig(
-    BaseArtifactStoreConfig, AuthenticationConfigMixin
+    BaseArtifactStoreConfig,
+    AuthenticationConfigMixin,
+    ChunkedTransferConfigMixin,
 ):
     """Configuration for GCP Artifact Store."""
 
@@ -15,7 +15,7 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
-from pydantic import root_validator
+from pydantic import PositiveInt, root_validator
 
 from zenml.config.base_settings import BaseSettings
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -37,12 +37,27 @@ class KubernetesOrchestratorSettings(BaseSettings):
         timeout: How many seconds to wait for synchronous runs. `0` means
             to wait for an unlimited duration.
         pod_settings: Pod settings to apply.
+        max_parallelism: Maximum number of step pods that the orchestrator pod
+            runs at the same time. If not set, all steps whose upstream steps
+            have finished will be started immediately.
+        worker_pool_size: If set, steps don't run in a separate pod each.
+            Instead, the orchestrator pod starts up to this many long-lived
+            worker pods for each combination of Docker image, pod settings
+            and resource settings, and assigns the steps to these workers.
+            The workers load the deployment and the stack only once and run
+            the steps in-process, which reduces the overhead for pipelines
+            with many short steps.
+        worker_idle_timeout: Seconds after which a worker pod without step
+            assignments shuts down.
     """
 
     synchronous: bool = False
     timeout: int = 0
 
     pod_settings: Optional[KubernetesPodSettings] = None
+    max_parallelism: Optional[PositiveInt] = None
+    worker_pool_size: Optional[PositiveInt] = None
+    worker_idle_timeout: PositiveInt = 600
 
 
 class KubernetesOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
@@ -34,11 +34,23 @@ Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils
 import datetime
 import enum
 import re
+import threading
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
@@ -50,6 +62,18 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+LOG_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+LOG_CHUNK_SIZE = 64 * 1024
+# Seconds to wait for the remaining logs of a terminated pod.
+LOG_FLUSH_TIMEOUT = 30
+# Server-side timeout of a single pod watch request, after which the watch
+# gets restarted from the last seen resource version.
+POD_WATCH_TIMEOUT = 300
+
+
+class PodWaitTimeoutError(RuntimeError):
+    """Raised when waiting for a pod times out."""
+
 
 class PodPhase(enum.Enum):
     """Phase of the Kubernetes pod.
@@ -169,13 +193,403 @@ def get_pod(
         raise RuntimeError from e
 
 
+def _parse_log_timestamp(timestamp: str) -> Optional[Tuple[str, int]]:
+    """Parses the RFC3339 timestamp that Kubernetes prepends to log lines.
+
+    Kubernetes strips trailing zeros of the fractional seconds, so the
+    timestamps can't be compared as strings.
+
+    Args:
+        timestamp: The timestamp, e.g. `2023-01-01T12:00:00.123456789Z`.
+
+    Returns:
+        Tuple of the timestamp without fractional seconds and the nanoseconds,
+        which can be compared with each other. `None` if the value is not a
+        valid timestamp.
+    """
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    try:
+        datetime.datetime.strptime(seconds, LOG_TIMESTAMP_FORMAT)
+        nanoseconds = int(fraction.ljust(9, "0")[:9])
+    except ValueError:
+        return None
+
+    return seconds, nanoseconds
+
+
+def _iter_response_lines(response: Any) -> Iterator[str]:
+    """Iterates over the lines of a streamed HTTP response.
+
+    Args:
+        response: The `urllib3` response returned by a Kubernetes API call
+            with `_preload_content=False`.
+
+    Yields:
+        The decoded lines of the response.
+    """
+    buffer = b""
+    for chunk in response.stream(amt=LOG_CHUNK_SIZE, decode_content=True):
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace")
+
+
+def follow_pod_logs(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    stop_event: Optional[threading.Event] = None,
+    retry_interval: float = 1.0,
+) -> Iterator[str]:
+    """Follows the logs of a pod until it terminates.
+
+    The logs are streamed incrementally instead of being read completely over
+    and over. If the connection breaks while the pod is still running, the
+    stream gets resumed from the timestamp of the last received line without
+    returning any line twice.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        stop_event: Optional event to stop following the logs before the pod
+            terminates.
+        retry_interval: Seconds to wait before reconnecting.
+
+    Yields:
+        The log lines of the pod.
+
+    Raises:
+        ApiException: If reading the logs failed for a reason other than the
+            pod not having started yet.
+    """
+    stop_event = stop_event or threading.Event()
+    last_timestamp: Optional[Tuple[str, int]] = None
+    lines_at_last_timestamp = 0
+
+    while not stop_event.is_set():
+        kwargs: Dict[str, Any] = {}
+        if last_timestamp:
+            last_time = datetime.datetime.strptime(
+                last_timestamp[0], LOG_TIMESTAMP_FORMAT
+            )
+            elapsed = datetime.datetime.utcnow() - last_time
+            kwargs["since_seconds"] = max(int(elapsed.total_seconds()), 0) + 2
+
+        try:
+            response = core_api.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=namespace,
+                follow=True,
+                timestamps=True,
+                _preload_content=False,
+                **kwargs,
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return
+            if e.status != 400:
+                raise
+            # The container is not running yet.
+            stop_event.wait(retry_interval)
+            continue
+
+        lines_to_skip = lines_at_last_timestamp
+        try:
+            for raw_line in _iter_response_lines(response):
+                timestamp_string, _, line = raw_line.partition(" ")
+                timestamp = _parse_log_timestamp(timestamp_string)
+                if timestamp is None:
+                    yield raw_line
+                    continue
+
+                if last_timestamp is not None:
+                    # Skip lines that were already returned before the
+                    # stream got resumed.
+                    if timestamp < last_timestamp:
+                        continue
+                    if timestamp == last_timestamp and lines_to_skip > 0:
+                        lines_to_skip -= 1
+                        continue
+
+                if timestamp == last_timestamp:
+                    lines_at_last_timestamp += 1
+                else:
+                    last_timestamp = timestamp
+                    lines_at_last_timestamp = 1
+                    lines_to_skip = 0
+
+                yield line
+
+                if stop_event.is_set():
+                    return
+        finally:
+            response.release_conn()
+
+        # The stream also ends if the connection breaks, so only stop once the
+        # pod is terminated.
+        pod = get_pod(core_api, pod_name, namespace)
+        if pod is None or pod_failed(pod) or pod_is_done(pod):
+            return
+
+        stop_event.wait(retry_interval)
+
+
+class PodWatcher:
+    """Waits for pods using a single watch on the Kubernetes API.
+
+    Instead of polling the status of each pod, a background thread watches
+    all pods matching the given selectors and wakes up the threads waiting
+    for a pod whenever its status changes. This allows waiting for many pods
+    in parallel (e.g. the step pods of a pipeline run) with a single
+    connection to the API server.
+    """
+
+    def __init__(
+        self,
+        core_api: k8s_client.CoreV1Api,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> None:
+        """Initializes the pod watcher.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            namespace: The namespace of the pods.
+            label_selector: Optional label selector for the watched pods.
+            field_selector: Optional field selector for the watched pods.
+        """
+        self._core_api = core_api
+        self._namespace = namespace
+        self._selectors = {
+            "label_selector": label_selector,
+            "field_selector": field_selector,
+        }
+        self._pods: Dict[str, k8s_client.V1Pod] = {}
+        self._deleted_pods: Set[str] = set()
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PodWatcher":
+        """Starts watching the pods.
+
+        Returns:
+            The pod watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops watching the pods.
+
+        Args:
+            *args: The exception info, if any.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """Starts watching the pods in a background thread."""
+        if self._thread:
+            return
+
+        self._thread = threading.Thread(
+            target=self._watch, name="zenml-pod-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching the pods.
+
+        The background thread exits with the next event or once the current
+        watch request times out.
+        """
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _watch(self) -> None:
+        """Watches the pods and stores their latest state."""
+        resource_version: Optional[str] = None
+        while not self._stop_event.is_set():
+            watch = k8s_watch.Watch()
+            kwargs: Dict[str, Any] = {
+                key: value
+                for key, value in self._selectors.items()
+                if value is not None
+            }
+            if resource_version:
+                kwargs["resource_version"] = resource_version
+
+            try:
+                for event in watch.stream(
+                    self._core_api.list_namespaced_pod,
+                    namespace=self._namespace,
+                    timeout_seconds=POD_WATCH_TIMEOUT,
+                    **kwargs,
+                ):
+                    self._update(event["type"], event["object"])
+                    if self._stop_event.is_set():
+                        watch.stop()
+                        break
+            except ApiException as e:
+                if e.status == 410:
+                    # The resource version is too old, restart the watch
+                    # which returns the current state of all pods.
+                    resource_version = None
+                    continue
+
+                with self._condition:
+                    self._error = e
+                    self._condition.notify_all()
+                return
+            except Exception as e:
+                logger.debug("Watching pods failed, retrying: %s", e)
+                self._stop_event.wait(1)
+
+            resource_version = watch.resource_version
+
+    def _update(self, event_type: str, pod: k8s_client.V1Pod) -> None:
+        """Stores the state of a pod and wakes up the waiting threads.
+
+        Args:
+            event_type: The type of the watch event.
+            pod: The pod.
+        """
+        with self._condition:
+            pod_name = pod.metadata.name
+            if event_type == "DELETED":
+                self._deleted_pods.add(pod_name)
+            else:
+                self._pods[pod_name] = pod
+            self._condition.notify_all()
+
+    def wait(
+        self,
+        pod_name: str,
+        exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
+        timeout_sec: int = 0,
+        stream_logs: bool = False,
+    ) -> k8s_client.V1Pod:
+        """Waits for a pod to meet an exit condition.
+
+        Args:
+            pod_name: The name of the pod.
+            exit_condition_lambda: A lambda which will be called with the pod
+                whenever its status changes. The function returns True to
+                exit.
+            timeout_sec: Timeout in seconds to wait for pod to reach exit
+                condition, or 0 to wait for an unlimited duration.
+            stream_logs: Whether to stream the pod logs to
+                `zenml.logger.info()`.
+
+        Raises:
+            RuntimeError: If the pod failed or was deleted.
+            PodWaitTimeoutError: If waiting for the pod timed out.
+
+        Returns:
+            The pod object which meets the exit condition.
+        """
+        self.start()
+        deadline = time.monotonic() + timeout_sec if timeout_sec else None
+
+        log_thread = None
+        stop_logs = threading.Event()
+        if stream_logs:
+            log_thread = threading.Thread(
+                target=log_pod_output,
+                args=(self._core_api, pod_name, self._namespace, stop_logs),
+                name=f"zenml-pod-logs-{pod_name}",
+                daemon=True,
+            )
+            log_thread.start()
+
+        pod_terminated = False
+        try:
+            with self._condition:
+                while True:
+                    if self._error:
+                        raise RuntimeError(
+                            f"Watching pod `{self._namespace}:{pod_name}` "
+                            "failed."
+                        ) from self._error
+
+                    pod = self._pods.get(pod_name)
+                    if pod is not None:
+                        pod_terminated = pod_failed(pod) or pod_is_done(pod)
+                        if pod_failed(pod):
+                            raise RuntimeError(
+                                f"Pod `{self._namespace}:{pod_name}` failed."
+                            )
+                        if exit_condition_lambda(pod):
+                            return pod
+
+                    if pod_name in self._deleted_pods:
+                        pod_terminated = True
+                        raise RuntimeError(
+                            f"Pod `{self._namespace}:{pod_name}` was deleted."
+                        )
+
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise PodWaitTimeoutError(
+                                f"Waiting for pod `{self._namespace}:"
+                                f"{pod_name}` timed out after {timeout_sec} "
+                                "seconds."
+                            )
+                    self._condition.wait(timeout=remaining)
+        finally:
+            if log_thread:
+                if not pod_terminated:
+                    stop_logs.set()
+                # Once the pod terminated, the log stream ends as soon as all
+                # remaining logs have been received.
+                log_thread.join(timeout=LOG_FLUSH_TIMEOUT)
+                stop_logs.set()
+
+
+def log_pod_output(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    stop_event: threading.Event,
+) -> None:
+    """Logs the output of a pod until it terminates.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        stop_event: Event to stop logging before the pod terminates.
+    """
+    try:
+        for line in follow_pod_logs(
+            core_api=core_api,
+            pod_name=pod_name,
+            namespace=namespace,
+            stop_event=stop_event,
+        ):
+            logger.info(line)
+    except Exception as e:
+        logger.warning(
+            "Failed to stream logs of pod `%s:%s`: %s", namespace, pod_name, e
+        )
+
+
 def wait_pod(
     core_api: k8s_client.CoreV1Api,
     pod_name: str,
     namespace: str,
     exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
     timeout_sec: int = 0,
-    exponential_backoff: bool = False,
     stream_logs: bool = False,
 ) -> k8s_client.V1Pod:
     """Wait for a pod to meet an exit condition.
@@ -185,67 +599,28 @@ def wait_pod(
         pod_name: The name of the pod.
         namespace: The namespace of the pod.
         exit_condition_lambda: A lambda
-            which will be called periodically to wait for a pod to exit. The
-            function returns True to exit.
+            which will be called whenever the pod status changes to wait for
+            a pod to exit. The function returns True to exit.
         timeout_sec: Timeout in seconds to wait for pod to reach exit
             condition, or 0 to wait for an unlimited duration.
             Defaults to unlimited.
-        exponential_backoff: Whether to use exponential back off for polling.
-            Defaults to False.
         stream_logs: Whether to stream the pod logs to
             `zenml.logger.info()`. Defaults to False.
 
-    Raises:
-        RuntimeError: when the function times out.
-
     Returns:
         The pod object which meets the exit condition.
     """
-    start_time = datetime.datetime.utcnow()
-
-    # Link to exponential back-off algorithm used here:
-    # https://cloud.google.com/storage/docs/exponential-backoff
-    backoff_interval = 1
-    maximum_backoff = 32
-
-    logged_lines = 0
-
-    while True:
-        resp = get_pod(core_api, pod_name, namespace)
-
-        # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
-        if stream_logs and pod_is_not_pending(resp):
-            response = core_api.read_namespaced_pod_log(
-                name=pod_name,
-                namespace=namespace,
-            )
-            logs = response.splitlines()
-            if len(logs) > logged_lines:
-                for line in logs[logged_lines:]:
-                    logger.info(line)
-                logged_lines = len(logs)
-
-        # Raise an error if the pod failed.
-        if pod_failed(resp):
-            raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
-
-        # Check if pod is in desired state (e.g. finished / running / ...).
-        if exit_condition_lambda(resp):
-            return resp
-
-        # Check if wait timed out.
-        elapse_time = datetime.datetime.utcnow() - start_time
-        if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
-            raise RuntimeError(
-                f"Waiting for pod `{namespace}:{pod_name}` timed out after "
-                f"{timeout_sec} seconds."
-            )
-
-        # Wait (using exponential backoff).
-        time.sleep(backoff_interval)
-        if exponential_backoff and backoff_interval < maximum_backoff:
-            backoff_interval *= 2
+    with PodWatcher(
+        core_api=core_api,
+        namespace=namespace,
+        field_selector=f"metadata.name={pod_name}",
+    ) as pod_watcher:
+        return pod_watcher.wait(
+            pod_name=pod_name,
+            exit_condition_lambda=exit_condition_lambda,
+            timeout_sec=timeout_sec,
+            stream_logs=stream_logs,
+        )
 
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
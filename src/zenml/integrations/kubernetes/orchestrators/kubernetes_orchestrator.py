@@ -65,6 +65,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 ENV_ZENML_KUBERNETES_RUN_ID = "ZENML_KUBERNETES_RUN_ID"
+KUBERNETES_SERVICE_ACCOUNT_NAME = "zenml-service-account"
 
 
 class KubernetesOrchestrator(ContainerizedOrchestrator):
@@ -324,7 +325,7 @@ class KubernetesOrchestrator(ContainerizedOrchestrator):
         )
 
         # Authorize pod to run Kubernetes commands inside the cluster.
-        service_account_name = "zenml-service-account"
+        service_account_name = KUBERNETES_SERVICE_ACCOUNT_NAME
         kube_utils.create_edit_service_account(
             core_api=self._k8s_core_api,
             rbac_api=self._k8s_rbac_api,
@@ -14,7 +14,9 @@
 """Entrypoint of the Kubernetes master/orchestrator pod."""
 
 import argparse
+import json
 import socket
+from typing import Tuple, cast
 
 from kubernetes import client as k8s_client
 
@@ -28,13 +30,20 @@ from zenml.integrations.kubernetes.flavors.kubernetes_orchestrator_flavor import
 from zenml.integrations.kubernetes.orchestrators import kube_utils
 from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator import (
     ENV_ZENML_KUBERNETES_RUN_ID,
+    KUBERNETES_SERVICE_ACCOUNT_NAME,
     KubernetesOrchestrator,
 )
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_entrypoint_configuration import (
+    KubernetesWorkerEntrypointConfiguration,
+)
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_pool import (
+    KubernetesWorkerPool,
+)
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_pod_manifest,
 )
 from zenml.logger import get_logger
-from zenml.orchestrators.dag_runner import ThreadedDagRunner
+from zenml.orchestrators.dag_runner import DagRunner
 
 logger = get_logger(__name__)
 
@@ -64,6 +73,14 @@ def main() -> None:
     kube_utils.load_kube_config()
     core_api = k8s_client.CoreV1Api()
 
+    # All step pods are labeled with the run name, so a single watch is
+    # enough to wait for all of them.
+    pod_watcher = kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace=args.kubernetes_namespace,
+        label_selector=f"run={args.run_name}",
+    )
+
     orchestrator_run_id = socket.gethostname()
 
     deployment_config = Client().get_deployment(args.deployment_id)
@@ -81,6 +98,32 @@ def main() -> None:
 
     active_stack = Client().active_stack
     mount_local_stores = active_stack.orchestrator.config.is_local
+    pipeline_settings = cast(
+        KubernetesOrchestratorSettings,
+        active_stack.orchestrator.get_settings(deployment_config),
+    )
+
+    def get_step_pod_config(
+        pipeline_step_name: str,
+    ) -> Tuple[str, KubernetesOrchestratorSettings]:
+        """Gets the image and settings for the pod of a step.
+
+        Args:
+            pipeline_step_name: Name of the step in the pipeline.
+
+        Returns:
+            The Docker image and the orchestrator settings of the step.
+        """
+        image = KubernetesOrchestrator.get_image(
+            deployment=deployment_config, step_name=pipeline_step_name
+        )
+        step_config = deployment_config.step_configurations[
+            pipeline_step_name
+        ].config
+        settings = KubernetesOrchestratorSettings.parse_obj(
+            step_config.settings.get("orchestrator.kubernetes", {})
+        )
+        return image, settings
 
     def run_step_on_kubernetes(step_name: str) -> None:
         """Run a pipeline step in a separate Kubernetes pod.
@@ -93,20 +136,11 @@ def main() -> None:
         pod_name = kube_utils.sanitize_pod_name(pod_name)
 
         pipeline_step_name = step_name_to_pipeline_step_name[step_name]
-        image = KubernetesOrchestrator.get_image(
-            deployment=deployment_config, step_name=pipeline_step_name
-        )
+        image, settings = get_step_pod_config(pipeline_step_name)
         step_args = StepEntrypointConfiguration.get_entrypoint_arguments(
             step_name=pipeline_step_name, deployment_id=deployment_config.id
         )
 
-        step_config = deployment_config.step_configurations[
-            pipeline_step_name
-        ].config
-        settings = KubernetesOrchestratorSettings.parse_obj(
-            step_config.settings.get("orchestrator.kubernetes", {})
-        )
-
         # Define Kubernetes pod manifest.
         pod_manifest = build_pod_manifest(
             pod_name=pod_name,
@@ -128,16 +162,98 @@ def main() -> None:
 
         # Wait for pod to finish.
         logger.info(f"Waiting for pod of step `{step_name}` to start...")
-        kube_utils.wait_pod(
-            core_api=core_api,
+        pod_watcher.wait(
             pod_name=pod_name,
-            namespace=args.kubernetes_namespace,
             exit_condition_lambda=kube_utils.pod_is_done,
             stream_logs=True,
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    def run_step_on_worker(step_name: str) -> None:
+        """Run a pipeline step on a long-lived worker pod.
+
+        Args:
+            step_name: Name of the step.
+        """
+        assert worker_pool
+        pipeline_step_name = step_name_to_pipeline_step_name[step_name]
+        image, settings = get_step_pod_config(pipeline_step_name)
+        step_config = deployment_config.step_configurations[
+            pipeline_step_name
+        ].config
+
+        # Steps only share workers if they need the same image and resources.
+        worker_class = json.dumps(
+            {
+                "image": image,
+                "pod_settings": settings.pod_settings.dict()
+                if settings.pod_settings
+                else None,
+                "resource_settings": step_config.resource_settings.dict(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+        def build_worker_manifest(pod_name: str) -> k8s_client.V1Pod:
+            """Builds the manifest of a worker pod.
+
+            Args:
+                pod_name: Name of the worker pod.
+
+            Returns:
+                The worker pod manifest.
+            """
+            return build_pod_manifest(
+                pod_name=pod_name,
+                run_name=args.run_name,
+                pipeline_name=deployment_config.pipeline_configuration.name,
+                image_name=image,
+                command=worker_command,
+                args=worker_args,
+                env={ENV_ZENML_KUBERNETES_RUN_ID: orchestrator_run_id},
+                settings=settings,
+                service_account_name=KUBERNETES_SERVICE_ACCOUNT_NAME,
+                mount_local_stores=mount_local_stores,
+            )
+
+        worker_pool.run_step(
+            step_name=pipeline_step_name,
+            worker_class=worker_class,
+            build_manifest=build_worker_manifest,
+        )
+
+    worker_pool = None
+    if pipeline_settings.worker_pool_size:
+        worker_pool = KubernetesWorkerPool(
+            core_api=core_api,
+            pod_watcher=pod_watcher,
+            namespace=args.kubernetes_namespace,
+            pod_name_prefix=orchestrator_run_id,
+            workers_per_class=pipeline_settings.worker_pool_size,
+        )
+        worker_command = (
+            KubernetesWorkerEntrypointConfiguration.get_entrypoint_command()
+        )
+        worker_args = (
+            KubernetesWorkerEntrypointConfiguration.get_entrypoint_arguments(
+                deployment_id=deployment_config.id,
+                kubernetes_namespace=args.kubernetes_namespace,
+            )
+        )
+
+    with pod_watcher:
+        try:
+            DagRunner(
+                dag=pipeline_dag,
+                run_fn=run_step_on_worker
+                if worker_pool
+                else run_step_on_kubernetes,
+                max_parallelism=pipeline_settings.max_parallelism,
+            ).run()
+        finally:
+            if worker_pool:
+                worker_pool.shutdown()
 
     logger.info("Orchestration pod completed.")
 
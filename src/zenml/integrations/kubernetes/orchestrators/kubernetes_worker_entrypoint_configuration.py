@@ -0,0 +1,141 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Entrypoint configuration for long-lived Kubernetes worker pods."""
+
+import socket
+from typing import Any, List, Set, cast
+
+from kubernetes import client as k8s_client
+
+from zenml.client import Client
+from zenml.entrypoints.base_entrypoint_configuration import (
+    BaseEntrypointConfiguration,
+)
+from zenml.integrations.kubernetes.flavors.kubernetes_orchestrator_flavor import (
+    KubernetesOrchestratorSettings,
+)
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator_entrypoint_configuration import (
+    NAMESPACE_OPTION,
+)
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_pool import (
+    StepResult,
+    report_step_result,
+    wait_for_step_assignment,
+)
+from zenml.integrations.registry import integration_registry
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class KubernetesWorkerEntrypointConfiguration(BaseEntrypointConfiguration):
+    """Entrypoint configuration for long-lived Kubernetes worker pods.
+
+    Instead of running a single step, a worker loads the deployment and the
+    active stack once and then runs all steps that the orchestrator pod
+    assigns to it in-process. The worker shuts down once it doesn't receive
+    a new assignment within the configured idle timeout.
+    """
+
+    @classmethod
+    def get_entrypoint_options(cls) -> Set[str]:
+        """Gets all options required for running with this configuration.
+
+        Returns:
+            The superclass options as well as an option for the namespace of
+            the worker pod.
+        """
+        return super().get_entrypoint_options() | {NAMESPACE_OPTION}
+
+    @classmethod
+    def get_entrypoint_arguments(cls, **kwargs: Any) -> List[str]:
+        """Gets all arguments that the entrypoint command should be called with.
+
+        Args:
+            **kwargs: Kwargs, must include the Kubernetes namespace.
+
+        Returns:
+            The superclass arguments as well as arguments for the namespace of
+            the worker pod.
+        """
+        return super().get_entrypoint_arguments(**kwargs) + [
+            f"--{NAMESPACE_OPTION}",
+            kwargs[NAMESPACE_OPTION],
+        ]
+
+    def run(self) -> None:
+        """Runs the steps assigned to this worker."""
+        deployment = self.load_deployment()
+
+        # Activate all the integrations. This makes sure that all materializers
+        # and stack component flavors are registered.
+        integration_registry.activate_integrations()
+
+        orchestrator = Client().active_stack.orchestrator
+        settings = cast(
+            KubernetesOrchestratorSettings,
+            orchestrator.get_settings(deployment),
+        )
+
+        namespace = self.entrypoint_args[NAMESPACE_OPTION]
+        pod_name = socket.gethostname()
+        kube_utils.load_kube_config()
+        core_api = k8s_client.CoreV1Api()
+
+        with kube_utils.PodWatcher(
+            core_api=core_api,
+            namespace=namespace,
+            field_selector=f"metadata.name={pod_name}",
+        ) as pod_watcher:
+            last_assignment_id = None
+            while True:
+                try:
+                    assignment = wait_for_step_assignment(
+                        pod_watcher=pod_watcher,
+                        pod_name=pod_name,
+                        last_assignment_id=last_assignment_id,
+                        timeout_sec=settings.worker_idle_timeout,
+                    )
+                except kube_utils.PodWaitTimeoutError:
+                    logger.info(
+                        "No step assigned for %d seconds, shutting down.",
+                        settings.worker_idle_timeout,
+                    )
+                    return
+
+                last_assignment_id = assignment.id
+                logger.info(f"Running step `{assignment.step_name}`.")
+                step = deployment.step_configurations[assignment.step_name]
+                orchestrator._prepare_run(deployment=deployment)
+                try:
+                    orchestrator.run_step(step=step)
+                except Exception as e:
+                    logger.error(f"Step `{assignment.step_name}` failed: {e}")
+                    result = StepResult(
+                        id=assignment.id,
+                        succeeded=False,
+                        error=f"{type(e).__name__}: {e}",
+                    )
+                else:
+                    result = StepResult(id=assignment.id, succeeded=True)
+                finally:
+                    orchestrator._cleanup_run()
+
+                report_step_result(
+                    core_api,
+                    pod_name=pod_name,
+                    namespace=namespace,
+                    result=result,
+                )
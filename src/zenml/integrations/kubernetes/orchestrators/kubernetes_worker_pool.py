@@ -0,0 +1,417 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Pool of long-lived Kubernetes worker pods that run pipeline steps.
+
+The orchestrator pod and the worker pods communicate through annotations of
+the worker pods: the orchestrator assigns a step to an idle worker by setting
+the assignment annotation, and the worker reports the result of the step by
+setting the result annotation. Both sides wait for these updates using a
+watch on the pods instead of polling.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Callable, DefaultDict, Dict, List, Optional
+
+from kubernetes import client as k8s_client
+from pydantic import BaseModel
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+STEP_ASSIGNMENT_ANNOTATION = "zenml.io/step-assignment"
+STEP_RESULT_ANNOTATION = "zenml.io/step-result"
+
+
+class StepAssignment(BaseModel):
+    """Assignment of a step to a worker pod."""
+
+    id: int
+    step_name: str
+
+
+class StepResult(BaseModel):
+    """Result of a step that ran on a worker pod."""
+
+    id: int
+    succeeded: bool
+    error: Optional[str] = None
+
+
+def _get_annotation(pod: k8s_client.V1Pod, name: str) -> Optional[str]:
+    """Gets an annotation of a pod.
+
+    Args:
+        pod: The pod.
+        name: The name of the annotation.
+
+    Returns:
+        The annotation value or `None` if the pod has no such annotation.
+    """
+    annotations = pod.metadata.annotations or {}
+    return annotations.get(name)
+
+
+def get_step_assignment(pod: k8s_client.V1Pod) -> Optional[StepAssignment]:
+    """Gets the step assignment of a worker pod.
+
+    Args:
+        pod: The worker pod.
+
+    Returns:
+        The step assignment or `None` if no step was assigned yet.
+    """
+    value = _get_annotation(pod, STEP_ASSIGNMENT_ANNOTATION)
+    return StepAssignment.parse_raw(value) if value else None
+
+
+def get_step_result(pod: k8s_client.V1Pod) -> Optional[StepResult]:
+    """Gets the result of the last step that ran on a worker pod.
+
+    Args:
+        pod: The worker pod.
+
+    Returns:
+        The step result or `None` if no step finished yet.
+    """
+    value = _get_annotation(pod, STEP_RESULT_ANNOTATION)
+    return StepResult.parse_raw(value) if value else None
+
+
+def _annotate_pod(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    name: str,
+    value: str,
+) -> None:
+    """Sets an annotation of a pod.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        name: The name of the annotation.
+        value: The annotation value.
+    """
+    core_api.patch_namespaced_pod(
+        name=pod_name,
+        namespace=namespace,
+        body={"metadata": {"annotations": {name: value}}},
+    )
+
+
+def report_step_result(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    result: StepResult,
+) -> None:
+    """Reports the result of a step from inside a worker pod.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the worker pod.
+        namespace: The namespace of the worker pod.
+        result: The step result.
+    """
+    _annotate_pod(
+        core_api,
+        pod_name=pod_name,
+        namespace=namespace,
+        name=STEP_RESULT_ANNOTATION,
+        value=result.json(),
+    )
+
+
+def wait_for_step_assignment(
+    pod_watcher: kube_utils.PodWatcher,
+    pod_name: str,
+    last_assignment_id: Optional[int],
+    timeout_sec: int = 0,
+) -> StepAssignment:
+    """Waits inside a worker pod until a new step gets assigned to it.
+
+    Args:
+        pod_watcher: Watcher for the worker pod.
+        pod_name: The name of the worker pod.
+        last_assignment_id: ID of the last step assignment that the worker
+            already ran.
+        timeout_sec: Timeout in seconds, or 0 to wait for an unlimited
+            duration.
+
+    Returns:
+        The new step assignment.
+    """
+
+    def _has_new_assignment(pod: k8s_client.V1Pod) -> bool:
+        assignment = get_step_assignment(pod)
+        return assignment is not None and assignment.id != last_assignment_id
+
+    pod = pod_watcher.wait(
+        pod_name=pod_name,
+        exit_condition_lambda=_has_new_assignment,
+        timeout_sec=timeout_sec,
+    )
+    assignment = get_step_assignment(pod)
+    assert assignment
+    return assignment
+
+
+class KubernetesWorkerPool:
+    """Pool of long-lived worker pods, grouped by worker class.
+
+    Steps can only run on workers of their worker class (e.g. a combination
+    of Docker image and resource settings). For each class, the pool starts
+    up to `workers_per_class` workers once steps of that class need to run.
+    """
+
+    def __init__(
+        self,
+        core_api: k8s_client.CoreV1Api,
+        pod_watcher: kube_utils.PodWatcher,
+        namespace: str,
+        pod_name_prefix: str,
+        workers_per_class: int,
+        stream_logs: bool = True,
+    ) -> None:
+        """Initializes the worker pool.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            pod_watcher: Watcher for all worker pods of the pool.
+            namespace: The namespace of the worker pods.
+            pod_name_prefix: Prefix for the names of the worker pods.
+            workers_per_class: Maximum number of worker pods per worker class.
+            stream_logs: Whether to stream the logs of the worker pods to
+                `zenml.logger.info()`.
+
+        Raises:
+            ValueError: If the number of workers per class is not positive.
+        """
+        if workers_per_class < 1:
+            raise ValueError(
+                f"Invalid number of workers per class `{workers_per_class}`, "
+                "the value needs to be a positive integer."
+            )
+
+        self._core_api = core_api
+        self._pod_watcher = pod_watcher
+        self._namespace = namespace
+        self._pod_name_prefix = pod_name_prefix
+        self._workers_per_class = workers_per_class
+        self._stream_logs = stream_logs
+
+        self._condition = threading.Condition()
+        self._class_indices: Dict[str, int] = {}
+        self._idle_workers: DefaultDict[str, List[str]] = defaultdict(list)
+        self._num_workers: DefaultDict[str, int] = defaultdict(int)
+        # Pod names can't be reused, so this keeps counting after workers got
+        # removed from the pool.
+        self._num_started_workers: DefaultDict[str, int] = defaultdict(int)
+        self._worker_pods: List[str] = []
+        self._stop_logs = threading.Event()
+        self._last_assignment_id = 0
+        self._closed = False
+
+    def _acquire_worker(
+        self,
+        worker_class: str,
+        build_manifest: Callable[[str], k8s_client.V1Pod],
+    ) -> str:
+        """Gets an idle worker of a class, starting a new one if possible.
+
+        Blocks until a worker of the class is available.
+
+        Args:
+            worker_class: The worker class.
+            build_manifest: Function that builds the manifest of a new worker
+                pod with the given name.
+
+        Raises:
+            RuntimeError: If the pool is already shut down.
+
+        Returns:
+            The name of the worker pod.
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The worker pool is shut down.")
+                if self._idle_workers[worker_class]:
+                    return self._idle_workers[worker_class].pop()
+                if self._num_workers[worker_class] < self._workers_per_class:
+                    break
+                self._condition.wait()
+
+            class_index = self._class_indices.setdefault(
+                worker_class, len(self._class_indices)
+            )
+            worker_index = self._num_started_workers[worker_class]
+            self._num_started_workers[worker_class] += 1
+            self._num_workers[worker_class] += 1
+            pod_name = kube_utils.sanitize_pod_name(
+                f"{self._pod_name_prefix}-worker-{class_index}-{worker_index}"
+            )
+            self._worker_pods.append(pod_name)
+
+        logger.info(f"Starting worker pod `{pod_name}`.")
+        try:
+            self._core_api.create_namespaced_pod(
+                namespace=self._namespace, body=build_manifest(pod_name)
+            )
+        except Exception:
+            self._remove_worker(worker_class, pod_name)
+            raise
+
+        if self._stream_logs:
+            threading.Thread(
+                target=kube_utils.log_pod_output,
+                args=(
+                    self._core_api,
+                    pod_name,
+                    self._namespace,
+                    self._stop_logs,
+                ),
+                name=f"zenml-pod-logs-{pod_name}",
+                daemon=True,
+            ).start()
+
+        return pod_name
+
+    def _release_worker(self, worker_class: str, pod_name: str) -> None:
+        """Marks a worker as idle.
+
+        Args:
+            worker_class: The worker class.
+            pod_name: The name of the worker pod.
+        """
+        with self._condition:
+            self._idle_workers[worker_class].append(pod_name)
+            self._condition.notify_all()
+
+    def _remove_worker(self, worker_class: str, pod_name: str) -> None:
+        """Removes a broken worker from the pool.
+
+        Args:
+            worker_class: The worker class.
+            pod_name: The name of the worker pod.
+        """
+        with self._condition:
+            self._num_workers[worker_class] -= 1
+            self._condition.notify_all()
+
+        self._delete_worker_pod(pod_name)
+
+    def _delete_worker_pod(self, pod_name: str) -> None:
+        """Deletes a worker pod.
+
+        Args:
+            pod_name: The name of the worker pod.
+        """
+        try:
+            self._core_api.delete_namespaced_pod(
+                name=pod_name, namespace=self._namespace
+            )
+        except k8s_client.rest.ApiException as e:
+            if e.status != 404:
+                logger.warning(
+                    f"Failed to delete worker pod `{pod_name}`: {e.reason}"
+                )
+
+    def run_step(
+        self,
+        step_name: str,
+        worker_class: str,
+        build_manifest: Callable[[str], k8s_client.V1Pod],
+    ) -> None:
+        """Runs a step on a worker of the given class.
+
+        Args:
+            step_name: Name of the step.
+            worker_class: The worker class of the step.
+            build_manifest: Function that builds the manifest of a new worker
+                pod with the given name.
+
+        Raises:
+            RuntimeError: If the step failed.
+        """
+        with self._condition:
+            self._last_assignment_id += 1
+            assignment = StepAssignment(
+                id=self._last_assignment_id, step_name=step_name
+            )
+
+        def _step_finished(pod: k8s_client.V1Pod) -> bool:
+            result = get_step_result(pod)
+            if result is not None and result.id == assignment.id:
+                return True
+            # Workers shut down if they don't receive an assignment for a
+            # while, in which case they'll never report a result.
+            return kube_utils.pod_is_done(pod)
+
+        while True:
+            pod_name = self._acquire_worker(worker_class, build_manifest)
+            try:
+                logger.info(
+                    f"Running step `{step_name}` on worker pod `{pod_name}`."
+                )
+                _annotate_pod(
+                    self._core_api,
+                    pod_name=pod_name,
+                    namespace=self._namespace,
+                    name=STEP_ASSIGNMENT_ANNOTATION,
+                    value=assignment.json(),
+                )
+                pod = self._pod_watcher.wait(
+                    pod_name=pod_name, exit_condition_lambda=_step_finished
+                )
+            except Exception:
+                # The worker pod itself is broken, start a new one for the
+                # next step of this class.
+                self._remove_worker(worker_class, pod_name)
+                raise
+
+            if kube_utils.pod_is_done(pod):
+                self._remove_worker(worker_class, pod_name)
+            else:
+                self._release_worker(worker_class, pod_name)
+
+            result = get_step_result(pod)
+            if result is None or result.id != assignment.id:
+                logger.info(
+                    f"Worker pod `{pod_name}` shut down before running step "
+                    f"`{step_name}`, retrying on a different worker."
+                )
+                continue
+
+            if not result.succeeded:
+                raise RuntimeError(
+                    f"Step `{step_name}` failed on worker pod `{pod_name}`: "
+                    f"{result.error}"
+                )
+            return
+
+    def shutdown(self) -> None:
+        """Deletes all worker pods of the pool."""
+        with self._condition:
+            self._closed = True
+            worker_pods = list(self._worker_pods)
+            self._condition.notify_all()
+
+        for pod_name in worker_pods:
+            self._delete_worker_pod(pod_name)
+        self._stop_logs.set()
@@ -86,7 +86,7 @@ class PillowImageMaterializer(BaseMaterializer):
 
         # copy the saved image to the artifact store
         artifact_store_path = os.path.join(self.uri, full_filename)
-        io_utils.copy(temp_image_path, artifact_store_path, overwrite=True)  # type: ignore[attr-defined]
+        fileio.copy(temp_image_path, artifact_store_path, overwrite=True)
         temp_dir.cleanup()
 
     def extract_metadata(
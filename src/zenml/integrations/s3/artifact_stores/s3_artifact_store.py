@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the S3 Artifact Store."""
 
+import os
 from typing import (
     Any,
     Callable,
@@ -28,17 +29,28 @@ from typing import (
 import s3fs
 
 from zenml.artifact_stores import BaseArtifactStore
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    FsspecBulkOperationsMixin,
+)
 from zenml.integrations.s3.flavors.s3_artifact_store_flavor import (
+    S3_MAX_PARTS,
+    S3_MIN_PART_SIZE,
     S3ArtifactStoreConfig,
 )
 from zenml.io.fileio import convert_to_str
+from zenml.logger import get_logger
 from zenml.secret.schemas import AWSSecretSchema
 from zenml.stack.authentication_mixin import AuthenticationMixin
+from zenml.utils import transfer_utils
+
+logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
 
-class S3ArtifactStore(BaseArtifactStore, AuthenticationMixin):
+class S3ArtifactStore(
+    FsspecBulkOperationsMixin, BaseArtifactStore, AuthenticationMixin
+):
     """Artifact Store for S3 based artifacts."""
 
     _filesystem: Optional[s3fs.S3FileSystem] = None
@@ -86,6 +98,10 @@ class S3ArtifactStore(BaseArtifactStore, AuthenticationMixin):
         """
         if not self._filesystem:
             key, secret, token = self._get_credentials()
+            filesystem_kwargs: Dict[str, Any] = {}
+            if self.config.block_size:
+                block_size = self.config.block_size
+                filesystem_kwargs["default_block_size"] = block_size
 
             self._filesystem = s3fs.S3FileSystem(
                 key=key,
@@ -94,9 +110,79 @@ class S3ArtifactStore(BaseArtifactStore, AuthenticationMixin):
                 client_kwargs=self.config.client_kwargs,
                 config_kwargs=self.config.config_kwargs,
                 s3_additional_kwargs=self.config.s3_additional_kwargs,
+                **filesystem_kwargs,
             )
         return self._filesystem
 
+    def _upload_file_in_parts(self, local_path: str, path: str) -> None:
+        """Uploads a large local file using a parallel multipart upload.
+
+        Args:
+            local_path: The local file to upload.
+            path: The remote path to upload the file to.
+        """
+        bucket, key, _ = self.filesystem.split_path(path)
+        upload_id = self.filesystem.call_s3(
+            "create_multipart_upload", Bucket=bucket, Key=key
+        )["UploadId"]
+
+        def _upload_part(part_number: int, data: bytes) -> Dict[str, Any]:
+            """Uploads a single part.
+
+            Args:
+                part_number: The number of the part.
+                data: The content of the part.
+
+            Returns:
+                The part number and ETag of the uploaded part.
+            """
+            response = self.filesystem.call_s3(
+                "upload_part",
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        part_size = transfer_utils.get_part_size(
+            os.path.getsize(local_path),
+            part_size=self.config.part_size,
+            max_parts=S3_MAX_PARTS,
+            min_part_size=S3_MIN_PART_SIZE,
+        )
+        try:
+            parts = transfer_utils.upload_in_parts(
+                local_path,
+                upload_part=_upload_part,
+                part_size=part_size,
+                max_concurrency=self.config.upload_concurrency,
+            )
+            self.filesystem.call_s3(
+                "complete_multipart_upload",
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            # Errors are only logged to not hide the error of the upload.
+            try:
+                self.filesystem.call_s3(
+                    "abort_multipart_upload",
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to abort the multipart upload of `%s`: %s",
+                    path,
+                    e,
+                )
+            raise
+
     def open(self, path: PathType, mode: str = "r") -> Any:
         """Open a file at the given path.
 
@@ -32,6 +32,9 @@ from zenml.artifact_stores import (
     BaseArtifactStoreConfig,
     BaseArtifactStoreFlavor,
 )
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    ChunkedTransferConfigMixin,
+)
 from zenml.integrations.s3 import S3_ARTIFACT_STORE_FLAVOR
 from zenml.stack.authentication_mixin import AuthenticationConfigMixin
 from zenml.utils.networking_utils import (
@@ -42,9 +45,15 @@ from zenml.utils.secret_utils import SecretField
 if TYPE_CHECKING:
     from zenml.integrations.s3.artifact_stores import S3ArtifactStore
 
+# Limits of S3 multipart uploads
+S3_MIN_PART_SIZE = 5 * 1024**2
+S3_MAX_PARTS = 10000
+
 
 class S3ArtifactStoreConfig(
-    BaseArtifactStoreConfig, AuthenticationConfigMixin
+    BaseArtifactStoreConfig,
+    AuthenticationConfigMixin,
+    ChunkedTransferConfigMixin,
 ):
     """Configuration for the S3 Artifact Store.
 
@@ -60,6 +69,10 @@ class S3ArtifactStoreConfig(
     zenml artifact-store register my_s3_store --flavor=s3 \
     --path=s3://my_bucket --client_kwargs='{"endpoint_url": "http://my-s3-endpoint"}'
     ```
+
+    Files larger than `multipart_threshold` are uploaded using parallel
+    multipart uploads and downloaded using concurrent ranged requests. The
+    `part_size` needs to be at least 5 MiB, the minimum part size of S3.
     """
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]] = {"s3://"}
@@ -142,6 +155,27 @@ class S3ArtifactStoreConfig(
             )
         return value
 
+    @validator("part_size")
+    def _validate_part_size(cls, value: int) -> int:
+        """Validates the `part_size` attribute.
+
+        Args:
+            value: The value to validate.
+
+        Returns:
+            The validated value.
+
+        Raises:
+            ValueError: If the value is smaller than the minimum part size of
+                S3 multipart uploads.
+        """
+        if value < S3_MIN_PART_SIZE:
+            raise ValueError(
+                f"Invalid part size {value}: S3 multipart uploads require "
+                f"parts of at least {S3_MIN_PART_SIZE} bytes."
+            )
+        return value
+
 
 class S3ArtifactStoreFlavor(BaseArtifactStoreFlavor):
     """Flavor of the S3 artifact store."""
@@ -13,13 +13,28 @@
 #  permissions and limitations under the License.
 """Functionality for reading, writing and managing files."""
 import os
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
+import shutil
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from zenml.constants import FILEIO_MAX_CONCURRENCY
 
 # this import required for CI to get local filesystem
 from zenml.io import local_filesystem  # noqa
 from zenml.io.filesystem import BaseFilesystem, PathType
 from zenml.io.filesystem_registry import default_filesystem_registry
 from zenml.logger import get_logger
+from zenml.utils.concurrency_utils import map_concurrently
 
 logger = get_logger(__name__)
 
@@ -86,11 +101,16 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
-
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+        local_fs = local_filesystem.LocalFilesystem
+        if src_fs is local_fs and _implements(dst_fs, "upload_file"):
+            dst_fs.upload_file(convert_to_str(src), dst, overwrite=True)
+        elif dst_fs is local_fs and _implements(src_fs, "download_file"):
+            src_fs.download_file(src, convert_to_str(dst), overwrite=True)
+        else:
+            with open(src, mode="rb") as source, open(
+                dst, mode="wb"
+            ) as destination:
+                shutil.copyfileobj(source, destination)
 
 
 def exists(path: "PathType") -> bool:
@@ -293,9 +313,243 @@ def walk(
     return _get_filesystem(top).walk(top, topdown=topdown, onerror=onerror)
 
 
+def _implements(file_system: Type["BaseFilesystem"], method_name: str) -> bool:
+    """Checks whether a filesystem implements an optional method.
+
+    Args:
+        file_system: The filesystem class.
+        method_name: The name of the method.
+
+    Returns:
+        Whether the filesystem overrides the default method implementation.
+    """
+    return bool(
+        getattr(file_system, method_name)
+        != getattr(BaseFilesystem, method_name)
+    )
+
+
+def _group_by_filesystem(
+    paths: Sequence["PathType"],
+) -> Dict[Type["BaseFilesystem"], List[int]]:
+    """Groups paths by the filesystem responsible for them.
+
+    Args:
+        paths: The paths to group.
+
+    Returns:
+        The indices of the paths for each filesystem.
+    """
+    groups: Dict[Type["BaseFilesystem"], List[int]] = defaultdict(list)
+    for index, path in enumerate(paths):
+        groups[_get_filesystem(path)].append(index)
+    return groups
+
+
+def copy_many(
+    pairs: Sequence[Tuple["PathType", "PathType"]], overwrite: bool = False
+) -> None:
+    """Copies multiple files, using bulk operations if possible.
+
+    Args:
+        pairs: Tuples of source and destination paths.
+        overwrite: Whether to overwrite destination files that exist.
+    """
+    groups: Dict[
+        Tuple[Type["BaseFilesystem"], Type["BaseFilesystem"]],
+        List[Tuple["PathType", "PathType"]],
+    ] = defaultdict(list)
+    for src, dst in pairs:
+        groups[(_get_filesystem(src), _get_filesystem(dst))].append((src, dst))
+
+    for (src_fs, dst_fs), group in groups.items():
+        if src_fs is dst_fs and _implements(src_fs, "copy_many"):
+            src_fs.copy_many(group, overwrite=overwrite)
+        else:
+            map_concurrently(
+                lambda pair: copy(pair[0], pair[1], overwrite=overwrite),
+                group,
+                max_workers=FILEIO_MAX_CONCURRENCY,
+                thread_name_prefix="zenml-fileio",
+            )
+
+
+def remove_many(paths: Sequence["PathType"]) -> None:
+    """Removes multiple files or directories. Dangerous operation.
+
+    Args:
+        paths: The paths to remove. Directories are removed recursively.
+    """
+
+    def _remove(path: "PathType") -> None:
+        """Removes a single file or directory.
+
+        Args:
+            path: The path to remove.
+        """
+        if isdir(path):
+            _get_filesystem(path).rmtree(path)
+        else:
+            remove(path)
+
+    for file_system, indices in _group_by_filesystem(paths).items():
+        group = [paths[index] for index in indices]
+        if _implements(file_system, "remove_many"):
+            file_system.remove_many(group)
+        else:
+            map_concurrently(
+                _remove,
+                group,
+                max_workers=FILEIO_MAX_CONCURRENCY,
+                thread_name_prefix="zenml-fileio",
+            )
+
+
+def exists_many(paths: Sequence["PathType"]) -> List[bool]:
+    """Checks whether multiple paths exist.
+
+    Args:
+        paths: The paths to check.
+
+    Returns:
+        Whether each of the paths exists, in the order of the paths.
+    """
+    results = [False] * len(paths)
+    for file_system, indices in _group_by_filesystem(paths).items():
+        group = [paths[index] for index in indices]
+        if _implements(file_system, "exists_many"):
+            group_results = file_system.exists_many(group)
+        else:
+            group_results = map_concurrently(
+                file_system.exists,
+                group,
+                max_workers=FILEIO_MAX_CONCURRENCY,
+                thread_name_prefix="zenml-fileio",
+            )
+        for index, result in zip(indices, group_results):
+            results[index] = result
+    return results
+
+
+def _list_files(dir_path: "PathType") -> List[str]:
+    """Lists the paths of all files in a directory relative to it.
+
+    Args:
+        dir_path: The path of the directory.
+
+    Returns:
+        The relative paths of all files in the directory and its
+        subdirectories.
+    """
+    dir_path = convert_to_str(dir_path)
+    relative_paths = []
+    for root, _, files in walk(dir_path):
+        relative_root = os.path.relpath(convert_to_str(root), dir_path)
+        for file in files:
+            relative_paths.append(
+                os.path.normpath(
+                    os.path.join(relative_root, convert_to_str(file))
+                )
+            )
+    return relative_paths
+
+
+def _copy_files(
+    source_dir: str,
+    destination_dir: str,
+    relative_paths: Sequence[str],
+    overwrite: bool,
+) -> None:
+    """Copies files between two directories using single file operations.
+
+    Args:
+        source_dir: The source directory.
+        destination_dir: The destination directory.
+        relative_paths: The paths of the files to copy, relative to both
+            directories.
+        overwrite: Whether to overwrite destination files that exist.
+    """
+    destination_paths = [
+        os.path.join(destination_dir, path) for path in relative_paths
+    ]
+    parent_dirs = {os.path.dirname(path) for path in destination_paths}
+    parent_dirs.add(destination_dir)
+    for parent_dir in sorted(parent_dirs):
+        makedirs(parent_dir)
+
+    copy_many(
+        [
+            (os.path.join(source_dir, path), destination_path)
+            for path, destination_path in zip(
+                relative_paths, destination_paths
+            )
+        ],
+        overwrite=overwrite,
+    )
+
+
+def upload_dir(
+    local_dir: str, dir_path: "PathType", overwrite: bool = False
+) -> None:
+    """Copies all files of a local directory into a (remote) directory.
+
+    Args:
+        local_dir: The local directory to copy.
+        dir_path: The directory to copy the files to.
+        overwrite: Whether to overwrite destination files that exist.
+
+    Raises:
+        ValueError: If the source directory is not a local directory.
+    """
+    if _get_filesystem(local_dir) is not local_filesystem.LocalFilesystem:
+        raise ValueError(f"Directory `{local_dir}` is not a local directory.")
+
+    file_system = _get_filesystem(dir_path)
+    if _implements(file_system, "upload_dir"):
+        file_system.upload_dir(local_dir, dir_path, overwrite=overwrite)
+    else:
+        _copy_files(
+            local_dir,
+            convert_to_str(dir_path),
+            _list_files(local_dir),
+            overwrite=overwrite,
+        )
+
+
+def download_dir(
+    dir_path: "PathType", local_dir: str, overwrite: bool = False
+) -> None:
+    """Copies all files of a (remote) directory into a local directory.
+
+    Args:
+        dir_path: The directory to copy.
+        local_dir: The local directory to copy the files to.
+        overwrite: Whether to overwrite destination files that exist.
+
+    Raises:
+        ValueError: If the destination directory is not a local directory.
+    """
+    if _get_filesystem(local_dir) is not local_filesystem.LocalFilesystem:
+        raise ValueError(f"Directory `{local_dir}` is not a local directory.")
+
+    file_system = _get_filesystem(dir_path)
+    if _implements(file_system, "download_dir"):
+        file_system.download_dir(dir_path, local_dir, overwrite=overwrite)
+    else:
+        _copy_files(
+            convert_to_str(dir_path),
+            local_dir,
+            _list_files(dir_path),
+            overwrite=overwrite,
+        )
+
+
 __all__ = [
     "copy",
+    "copy_many",
+    "download_dir",
     "exists",
+    "exists_many",
     "glob",
     "isdir",
     "listdir",
@@ -303,8 +557,10 @@ __all__ = [
     "mkdir",
     "open",
     "remove",
+    "remove_many",
     "rename",
     "rmtree",
     "stat",
+    "upload_dir",
     "walk",
 ]
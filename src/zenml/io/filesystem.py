@@ -35,6 +35,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -232,3 +233,117 @@ class BaseFilesystem(ABC):
             directory path, a list of directories inside the current directory
             and a list of files inside the current directory.
         """
+
+    # --- Bulk operations ---
+    # These are not abstract for backwards compatibility. For filesystems
+    # that don't implement them, the corresponding `fileio` functions fall
+    # back to running the single file operations concurrently.
+    @staticmethod
+    def copy_many(
+        pairs: Sequence[Tuple[PathType, PathType]], overwrite: bool = False
+    ) -> None:
+        """Copies multiple files within this filesystem.
+
+        Args:
+            pairs: Tuples of source and destination paths.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def remove_many(paths: Sequence[PathType]) -> None:
+        """Removes multiple files or directories. Dangerous operation.
+
+        Args:
+            paths: The paths to remove. Directories are removed recursively.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def exists_many(paths: Sequence[PathType]) -> List[bool]:
+        """Checks whether multiple paths exist.
+
+        Args:
+            paths: The paths to check.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def upload_dir(
+        local_dir: str, dir_path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies all files of a local directory into this filesystem.
+
+        Args:
+            local_dir: The local directory to copy.
+            dir_path: The directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def download_dir(
+        dir_path: PathType, local_dir: str, overwrite: bool = False
+    ) -> None:
+        """Copies all files of a directory in this filesystem to a local one.
+
+        Args:
+            dir_path: The directory to copy.
+            local_dir: The local directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def upload_file(
+        local_path: str, path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies a local file into this filesystem.
+
+        Args:
+            local_path: The local file to copy.
+            path: The path to copy the file to.
+            overwrite: Whether to overwrite the destination file if it exists.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def download_file(
+        path: PathType, local_path: str, overwrite: bool = False
+    ) -> None:
+        """Copies a file of this filesystem to a local path.
+
+        Args:
+            path: The file to copy.
+            local_path: The local path to copy the file to.
+            overwrite: Whether to overwrite the destination file if it exists.
+
+        Raises:
+            NotImplementedError: If the filesystem does not support bulk
+                operations.
+        """
+        raise NotImplementedError
@@ -37,6 +37,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
 )
@@ -241,5 +242,107 @@ class LocalFilesystem(BaseFilesystem):
             top, topdown=topdown, onerror=onerror
         )
 
+    @staticmethod
+    def copy_many(
+        pairs: Sequence[Tuple[PathType, PathType]], overwrite: bool = False
+    ) -> None:
+        """Copies multiple files.
+
+        Args:
+            pairs: Tuples of source and destination paths.
+            overwrite: Whether to overwrite destination files that exist.
+        """
+        for src, dst in pairs:
+            LocalFilesystem.copyfile(src, dst, overwrite=overwrite)
+
+    @staticmethod
+    def remove_many(paths: Sequence[PathType]) -> None:
+        """Removes multiple files or directories. Dangerous operation.
+
+        Args:
+            paths: The paths to remove. Directories are removed recursively.
+        """
+        for path in paths:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    @staticmethod
+    def exists_many(paths: Sequence[PathType]) -> List[bool]:
+        """Checks whether multiple paths exist.
+
+        Args:
+            paths: The paths to check.
+
+        Returns:
+            Whether each of the paths exists.
+        """
+        return [os.path.exists(path) for path in paths]
+
+    @staticmethod
+    def upload_dir(
+        local_dir: str, dir_path: PathType, overwrite: bool = False
+    ) -> None:
+        """Copies all files of a local directory to another local directory.
+
+        Args:
+            local_dir: The directory to copy.
+            dir_path: The directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+        """
+        LocalFilesystem._copy_tree(local_dir, dir_path, overwrite=overwrite)
+
+    @staticmethod
+    def download_dir(
+        dir_path: PathType, local_dir: str, overwrite: bool = False
+    ) -> None:
+        """Copies all files of a local directory to another local directory.
+
+        Args:
+            dir_path: The directory to copy.
+            local_dir: The directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+        """
+        LocalFilesystem._copy_tree(dir_path, local_dir, overwrite=overwrite)
+
+    @staticmethod
+    def _copy_tree(
+        source_dir: PathType, destination_dir: PathType, overwrite: bool
+    ) -> None:
+        """Copies all files of a directory into another directory.
+
+        Args:
+            source_dir: The directory to copy.
+            destination_dir: The directory to copy the files to.
+            overwrite: Whether to overwrite destination files that exist.
+
+        Raises:
+            FileExistsError: If a destination file exists and `overwrite` is
+                `False`.
+        """
+        source_dir = os.fsdecode(source_dir)
+        destination_dir = os.fsdecode(destination_dir)
+        for root, dirs, files in os.walk(source_dir):
+            target_root = os.path.join(
+                destination_dir, os.path.relpath(root, source_dir)
+            )
+            # Skip the destination in case it is inside the source directory
+            dirs[:] = [
+                d
+                for d in dirs
+                if os.path.abspath(os.path.join(root, d))
+                != os.path.abspath(destination_dir)
+            ]
+            os.makedirs(target_root, exist_ok=True)
+            for file in files:
+                target_path = os.path.join(target_root, file)
+                if not overwrite and os.path.exists(target_path):
+                    raise FileExistsError(
+                        f"Destination file {target_path} already exists and "
+                        "`overwrite` is false."
+                    )
+                shutil.copyfile(os.path.join(root, file), target_path)
+
 
 default_filesystem_registry.register(LocalFilesystem)
@@ -18,9 +18,8 @@ import os
 import re
 import sys
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator
-
-from rich.traceback import install as rich_tb_install
+from types import TracebackType
+from typing import Any, Dict, Iterator, Optional, Type
 
 import zenml
 from zenml.constants import (
@@ -108,12 +107,48 @@ def get_logging_level() -> LoggingLevels:
     return LoggingLevels[verbosity]
 
 
+def install_rich_traceback(show_locals: bool = False) -> None:
+    """Installs the rich traceback handler.
+
+    Importing `rich.traceback` takes a significant part of the `zenml` import
+    time, so outside of IPython the handler only gets installed once the
+    first uncaught exception is raised.
+
+    Args:
+        show_locals: Whether to show local variables in tracebacks.
+    """
+    if "IPython" in sys.modules:
+        from rich.traceback import install
+
+        install(show_locals=show_locals)
+        return
+
+    def _excepthook(
+        exc_type: Type[BaseException],
+        exc_value: BaseException,
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Installs the rich traceback handler and calls it.
+
+        Args:
+            exc_type: The exception type.
+            exc_value: The exception.
+            traceback: The exception traceback.
+        """
+        from rich.traceback import install
+
+        install(show_locals=show_locals)
+        sys.excepthook(exc_type, exc_value, traceback)
+
+    sys.excepthook = _excepthook
+
+
 def set_root_verbosity() -> None:
     """Set the root verbosity."""
     level = get_logging_level()
     if level != LoggingLevels.NOTSET:
         if ENABLE_RICH_TRACEBACK:
-            rich_tb_install(show_locals=(level == LoggingLevels.DEBUG))
+            install_rich_traceback(show_locals=(level == LoggingLevels.DEBUG))
 
         logging.basicConfig(level=level.value)
         get_logger(__name__).debug(
@@ -148,7 +148,15 @@ class DeprecatedArtifact:
 
 
 class BaseMaterializer(metaclass=BaseMaterializerMeta):
-    """Base Materializer to realize artifact data."""
+    """Base Materializer to realize artifact data.
+
+    If a step sets the `max_workers` of its `MaterializationSettings` to a
+    value larger than `1`, the artifacts of the step get loaded and stored
+    concurrently from multiple threads. Each artifact uses its own
+    materializer instance, but materializers that share state between
+    instances, e.g. in class variables or global objects, need to be
+    thread-safe in that case.
+    """
 
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.BASE
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = ()
@@ -366,12 +366,17 @@ class BuiltInContainerMaterializer(BaseMaterializer):
                 materializer.save(element)
         # If an error occurs, delete all created files.
         except Exception as e:
-            # Delete metadata
-            if fileio.exists(self.metadata_path):
-                fileio.remove(self.metadata_path)
-            # Delete all elements that were already saved.
-            for element_path in paths:
-                fileio.rmtree(element_path)
+            # Delete metadata and all elements that were already saved.
+            created_paths = [self.metadata_path] + paths
+            fileio.remove_many(
+                [
+                    path
+                    for path, exists in zip(
+                        created_paths, fileio.exists_many(created_paths)
+                    )
+                    if exists
+                ]
+            )
             raise e
 
     def extract_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
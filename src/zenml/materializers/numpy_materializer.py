@@ -14,7 +14,19 @@
 """Implementation of the ZenML NumPy materializer."""
 
 import os
-from typing import TYPE_CHECKING, Any, Dict, Type, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import numpy as np
 
@@ -23,6 +35,8 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils, yaml_utils
+from zenml.utils.statistics_utils import compute_array_statistics
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -32,11 +46,269 @@ logger = get_logger(__name__)
 
 NUMPY_FILENAME = "data.npy"
 
+# Large arrays in remote artifact stores are split along their first axis
+# into multiple `.npy` files which can be fetched independently.
+SHARDS_DIRECTORY = "shards"
+SHARDS_INDEX_FILENAME = "shards.json"
+NUMPY_SHARD_SIZE = 64 * 1024 * 1024
+MAX_SHARD_IO_WORKERS = 8
+
 DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
 
+def _load_npy(path: str) -> Any:
+    """Loads a `.npy` file through the ZenML filesystem.
+
+    Args:
+        path: Path of the `.npy` file.
+
+    Returns:
+        The loaded array.
+    """
+    with fileio.open(path, "rb") as f:
+        # This function is untyped for numpy versions supporting python
+        # 3.7, but typed for numpy versions installed on python 3.8+.
+        # We need to cast it to any here so that numpy doesn't complain
+        # about either an untyped function call or an unused ignore
+        # statement
+        return cast(Any, np.load)(f, allow_pickle=True)
+
+
+def _save_npy(path: str, arr: "NDArray[Any]") -> None:
+    """Saves an array as `.npy` file through the ZenML filesystem.
+
+    Args:
+        path: Path of the `.npy` file.
+        arr: The array to save.
+    """
+    with fileio.open(path, "wb") as f:
+        # This function is untyped for numpy versions supporting python
+        # 3.7, but typed for numpy versions installed on python 3.8+.
+        # We need to cast it to any here so that numpy doesn't complain
+        # about either an untyped function call or an unused ignore
+        # statement
+        cast(Any, np.save)(f, arr)
+
+
+class NumpyArrayShards:
+    """Lazy reader for a numpy array that is stored in shards.
+
+    Shards are only fetched from the artifact store when they are accessed,
+    which allows steps to process arrays that don't fit into memory or only
+    need parts of an array, e.g. by using an `UnmaterializedArtifact` input:
+
+    ```python
+    shards = NumpyArrayShards(artifact.uri)
+    for shard in shards.iter_shards():
+        ...
+    first_rows = shards[:100]
+    ```
+    """
+
+    def __init__(self, uri: str) -> None:
+        """Initializes the reader.
+
+        Args:
+            uri: The URI of the artifact.
+        """
+        self.uri = uri
+        index = yaml_utils.read_json(os.path.join(uri, SHARDS_INDEX_FILENAME))
+        self.shape: Tuple[int, ...] = tuple(index["shape"])
+        self.dtype = np.dtype(index["dtype"])
+        self.shard_rows: List[int] = index["shard_rows"]
+        self._offsets = np.cumsum([0] + self.shard_rows)
+
+    @staticmethod
+    def exists(uri: str) -> bool:
+        """Checks whether an artifact is stored in shards.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Returns:
+            Whether the artifact is stored in shards.
+        """
+        return fileio.exists(os.path.join(uri, SHARDS_INDEX_FILENAME))
+
+    @staticmethod
+    def _get_shard_path(uri: str, index: int) -> str:
+        """Gets the path of a shard.
+
+        Args:
+            uri: The URI of the artifact.
+            index: The index of the shard.
+
+        Returns:
+            The path of the shard.
+        """
+        return os.path.join(uri, SHARDS_DIRECTORY, f"{index:06d}.npy")
+
+    @classmethod
+    def save(
+        cls, uri: str, arr: "NDArray[Any]", shard_size: Optional[int] = None
+    ) -> None:
+        """Saves an array in shards of approximately equal size.
+
+        Args:
+            uri: The URI of the artifact.
+            arr: The array to save. Needs to have at least one dimension.
+            shard_size: The maximum size of a shard in bytes. Defaults to
+                `NUMPY_SHARD_SIZE`.
+        """
+        if shard_size is None:
+            shard_size = NUMPY_SHARD_SIZE
+
+        row_size = max(arr.nbytes // max(len(arr), 1), 1)
+        rows_per_shard = max(shard_size // row_size, 1)
+        starts = range(0, len(arr), rows_per_shard)
+
+        fileio.makedirs(os.path.join(uri, SHARDS_DIRECTORY))
+        with ThreadPoolExecutor(max_workers=MAX_SHARD_IO_WORKERS) as executor:
+            for future in [
+                executor.submit(
+                    _save_npy,
+                    cls._get_shard_path(uri, index),
+                    arr[start : start + rows_per_shard],
+                )
+                for index, start in enumerate(starts)
+            ]:
+                future.result()
+
+        # The index gets written last so incomplete artifacts are never read.
+        yaml_utils.write_json(
+            os.path.join(uri, SHARDS_INDEX_FILENAME),
+            {
+                "shape": list(arr.shape),
+                "dtype": arr.dtype.str,
+                "shard_rows": [
+                    len(arr[start : start + rows_per_shard])
+                    for start in starts
+                ],
+            },
+        )
+
+    @property
+    def num_shards(self) -> int:
+        """The number of shards.
+
+        Returns:
+            The number of shards.
+        """
+        return len(self.shard_rows)
+
+    def __len__(self) -> int:
+        """The length of the first axis of the array.
+
+        Returns:
+            The length of the first axis of the array.
+        """
+        return self.shape[0]
+
+    def load_shard(self, index: int) -> "NDArray[Any]":
+        """Loads a single shard.
+
+        Args:
+            index: The index of the shard.
+
+        Returns:
+            The shard.
+        """
+        shard_path = self._get_shard_path(self.uri, index)
+        return cast("NDArray[Any]", _load_npy(shard_path))
+
+    def _get_shard_index(self, row: int) -> int:
+        """Gets the index of the shard that contains a row.
+
+        Args:
+            row: The (non-negative) index of the row.
+
+        Returns:
+            The index of the shard.
+        """
+        return int(np.searchsorted(self._offsets, row, side="right")) - 1
+
+    def iter_shards(self) -> Iterator["NDArray[Any]"]:
+        """Iterates over all shards, loading one shard at a time.
+
+        Yields:
+            The shards in order.
+        """
+        for index in range(self.num_shards):
+            yield self.load_shard(index)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """Loads rows of the array, only fetching the required shards.
+
+        Args:
+            key: Index or slice along the first axis of the array.
+
+        Returns:
+            The selected rows.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+            TypeError: If the key is not an integer or slice.
+        """
+        if isinstance(key, (int, np.integer)):
+            row = int(key) + len(self) if key < 0 else int(key)
+            if not 0 <= row < len(self):
+                raise IndexError(
+                    f"Index {key} is out of bounds for an array of length "
+                    f"{len(self)}."
+                )
+            shard_index = self._get_shard_index(row)
+            return self.load_shard(shard_index)[
+                row - self._offsets[shard_index]
+            ]
+
+        if not isinstance(key, slice):
+            raise TypeError(
+                f"Invalid index {key}: Only integers and slices along the "
+                "first axis are supported."
+            )
+
+        start, stop, step = key.indices(len(self))
+        rows = range(start, stop, step)
+        if not rows:
+            return np.empty((0,) + self.shape[1:], dtype=self.dtype)
+
+        first_shard = self._get_shard_index(min(rows))
+        last_shard = self._get_shard_index(max(rows))
+        with ThreadPoolExecutor(max_workers=MAX_SHARD_IO_WORKERS) as executor:
+            shards = list(
+                executor.map(
+                    self.load_shard, range(first_shard, last_shard + 1)
+                )
+            )
+
+        offset = self._offsets[first_shard]
+        return np.concatenate(shards)[np.asarray(rows) - offset]
+
+    def to_numpy(self) -> "NDArray[Any]":
+        """Loads the complete array, fetching all shards concurrently.
+
+        Returns:
+            The array.
+        """
+        arr: "NDArray[Any]" = np.empty(self.shape, dtype=self.dtype)
+
+        def _load_into_array(index: int) -> None:
+            """Loads a shard into the preallocated array.
+
+            Args:
+                index: The index of the shard.
+            """
+            start, stop = self._offsets[index], self._offsets[index + 1]
+            arr[start:stop] = self.load_shard(index)
+
+        with ThreadPoolExecutor(max_workers=MAX_SHARD_IO_WORKERS) as executor:
+            for _ in executor.map(_load_into_array, range(self.num_shards)):
+                pass
+        return arr
+
+
 class NumpyMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
 
@@ -44,7 +316,12 @@ class NumpyMaterializer(BaseMaterializer):
     ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
 
     def load(self, data_type: Type[Any]) -> "Any":
-        """Reads a numpy array from a `.npy` file.
+        """Reads a numpy array.
+
+        Arrays in local artifact stores are memory-mapped in copy-on-write
+        mode, so the data is only read from disk once it is accessed and
+        modifications of the array don't change the stored artifact. Arrays
+        that are stored in shards are fetched concurrently.
 
         Args:
             data_type: The type of the data to read.
@@ -61,13 +338,17 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if fileio.exists(numpy_file):
-            with fileio.open(numpy_file, "rb") as f:
-                # This function is untyped for numpy versions supporting python
-                # 3.7, but typed for numpy versions installed on python 3.8+.
-                # We need to cast it to any here so that numpy doesn't complain
-                # about either an untyped function call or an unused ignore
-                # statement
-                return cast(Any, np.load)(f, allow_pickle=True)
+            if not io_utils.is_remote(numpy_file):
+                try:
+                    return np.load(
+                        numpy_file, mmap_mode="c", allow_pickle=True
+                    )
+                except ValueError:
+                    # Arrays of Python objects can't be memory-mapped.
+                    pass
+            return _load_npy(numpy_file)
+        elif NumpyArrayShards.exists(self.uri):
+            return NumpyArrayShards(self.uri).to_numpy()
         elif fileio.exists(os.path.join(self.uri, DATA_FILENAME)):
             logger.warning(
                 "A legacy artifact was found. "
@@ -77,8 +358,8 @@ class NumpyMaterializer(BaseMaterializer):
             )
             try:
                 # Import old materializer dependencies
-                import pyarrow as pa  # type: ignore
-                import pyarrow.parquet as pq  # type: ignore
+                import pyarrow as pa
+                import pyarrow.parquet as pq
 
                 from zenml.utils import yaml_utils
 
@@ -103,25 +384,37 @@ class NumpyMaterializer(BaseMaterializer):
                 )
 
     def save(self, arr: "NDArray[Any]") -> None:
-        """Writes a np.ndarray to the artifact store as a `.npy` file.
+        """Writes a np.ndarray to the artifact store.
+
+        Large arrays in remote artifact stores are saved as multiple `.npy`
+        shards which can be uploaded and fetched independently, all other
+        arrays are saved as a single `.npy` file.
 
         Args:
             arr: The numpy array to write.
         """
         super().save(arr)
-        with fileio.open(os.path.join(self.uri, NUMPY_FILENAME), "wb") as f:
-            # This function is untyped for numpy versions supporting python
-            # 3.7, but typed for numpy versions installed on python 3.8+.
-            # We need to cast it to any here so that numpy doesn't complain
-            # about either an untyped function call or an unused ignore
-            # statement
-            cast(Any, np.save)(f, arr)
+        if (
+            io_utils.is_remote(self.uri)
+            and arr.ndim > 0
+            and arr.nbytes > NUMPY_SHARD_SIZE
+            and not arr.dtype.hasobject
+        ):
+            NumpyArrayShards.save(self.uri, arr)
+        else:
+            _save_npy(os.path.join(self.uri, NUMPY_FILENAME), arr)
 
     def extract_metadata(
         self, arr: "NDArray[Any]"
     ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given numpy array.
 
+        The minimum, maximum, mean and standard deviation are only extracted
+        for arrays of booleans, integers or floats. Arrays of other types,
+        e.g. complex numbers, strings or objects, have no ordering or mean
+        that can be stored as metadata, so only their shape and dtype are
+        extracted.
+
         Args:
             arr: The numpy array to extract metadata from.
 
@@ -130,19 +423,11 @@ class NumpyMaterializer(BaseMaterializer):
         """
         base_metadata = super().extract_metadata(arr)
 
-        # These functions are untyped for numpy versions supporting python
-        # 3.7, but typed for numpy versions installed on python 3.8+.
-        # We need to cast them to Any here so that numpy doesn't complain
-        # about either an untyped function call or an unused ignore statement.
-        min_val = cast(Any, np.min)(arr).item()
-        max_val = cast(Any, np.max)(arr).item()
-
         numpy_metadata: Dict[str, "MetadataType"] = {
             "shape": tuple(arr.shape),
             "dtype": DType(arr.dtype.type),
-            "mean": np.mean(arr).item(),
-            "std": np.std(arr).item(),
-            "min": min_val,
-            "max": max_val,
         }
+        statistics = compute_array_statistics(arr)
+        if statistics is not None:
+            numpy_metadata.update(statistics)
         return {**base_metadata, **numpy_metadata}
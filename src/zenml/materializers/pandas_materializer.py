@@ -14,30 +14,242 @@
 """Materializer for Pandas."""
 
 import os
-from typing import Any, Dict, Type, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
 
 import pandas as pd
 
+from zenml.constants import (
+    ENV_ZENML_PANDAS_COMPRESSION,
+    ENV_ZENML_PANDAS_ROW_GROUP_SIZE,
+    handle_int_env_var,
+)
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils.statistics_utils import compute_dataframe_statistics
 
 logger = get_logger(__name__)
 
-PARQUET_FILENAME = "df.parquet.gzip"
-COMPRESSION_TYPE = "gzip"
+PARQUET_FILENAME = "df.parquet"
+LEGACY_PARQUET_FILENAME = "df.parquet.gzip"
+DEFAULT_COMPRESSION_TYPE = "zstd"
+DEFAULT_ROW_GROUP_SIZE = 1_000_000
+DEFAULT_BATCH_SIZE = 64 * 1024
 
 CSV_FILENAME = "df.csv"
 
 
+def get_default_compression_type() -> str:
+    """Gets the default compression codec of `.parquet` artifacts.
+
+    Returns:
+        The codec configured by the `ZENML_PANDAS_COMPRESSION` environment
+        variable or `zstd` if it is not set. A codec of `none` disables the
+        compression.
+    """
+    return os.getenv(ENV_ZENML_PANDAS_COMPRESSION) or DEFAULT_COMPRESSION_TYPE
+
+
+def get_default_row_group_size() -> int:
+    """Gets the default number of rows per row group of `.parquet` artifacts.
+
+    Returns:
+        The number of rows configured by the `ZENML_PANDAS_ROW_GROUP_SIZE`
+        environment variable or 1M rows if it is not set.
+    """
+    return max(
+        handle_int_env_var(
+            ENV_ZENML_PANDAS_ROW_GROUP_SIZE, default=DEFAULT_ROW_GROUP_SIZE
+        ),
+        1,
+    )
+
+
+class PandasArtifactReader:
+    """Lazy reader for artifacts stored by the `PandasMaterializer`.
+
+    The reader only fetches the requested columns and row groups of a
+    `.parquet` artifact and can stream the data in batches, which allows
+    steps to process tables that don't fit into memory. Use it with an
+    `UnmaterializedArtifact` input:
+
+    ```python
+    @step
+    def my_step(artifact: UnmaterializedArtifact) -> None:
+        reader = PandasArtifactReader(artifact.uri)
+        df = reader.read(columns=["a", "b"])
+        for batch in reader.iter_batches(columns=["c"]):
+            ...
+    ```
+
+    Artifacts that were stored as `.csv` file are read in chunks as well, but
+    always need to be parsed completely.
+    """
+
+    def __init__(self, uri: str) -> None:
+        """Initializes the reader.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't contain any data.
+        """
+        self.uri = uri
+        self.parquet_path: Optional[str] = None
+        for filename in (PARQUET_FILENAME, LEGACY_PARQUET_FILENAME):
+            path = os.path.join(uri, filename)
+            if fileio.exists(path):
+                self.parquet_path = path
+                break
+
+        self.csv_path = os.path.join(uri, CSV_FILENAME)
+        if self.parquet_path is None and not fileio.exists(self.csv_path):
+            raise FileNotFoundError(
+                f"No pandas data found for artifact at URI '{uri}'."
+            )
+
+    def _get_parquet_file(self, f: Any) -> Any:
+        """Opens a parquet file.
+
+        Args:
+            f: The file object of the parquet file.
+
+        Returns:
+            The `pyarrow.parquet.ParquetFile`.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Reading `.parquet` artifacts requires `pyarrow`. You can "
+                "install `pyarrow` by running '`pip install pyarrow`'."
+            )
+        return pq.ParquetFile(f)
+
+    @property
+    def num_row_groups(self) -> int:
+        """The number of row groups of the artifact.
+
+        Returns:
+            The number of row groups, `1` for `.csv` artifacts.
+        """
+        if self.parquet_path is None:
+            return 1
+        with fileio.open(self.parquet_path, mode="rb") as f:
+            return int(self._get_parquet_file(f).metadata.num_row_groups)
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        row_groups: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Reads (parts of) the artifact.
+
+        Args:
+            columns: Names of the columns to read. Reads all columns if not
+                given.
+            row_groups: Indices of the row groups to read. Reads all row
+                groups if not given. Ignored for `.csv` artifacts.
+
+        Returns:
+            The dataframe.
+        """
+        if self.parquet_path is None:
+            with fileio.open(self.csv_path, mode="rb") as f:
+                df = pd.read_csv(f, index_col=0, parse_dates=True)
+            return df if columns is None else df[list(columns)]
+
+        with fileio.open(self.parquet_path, mode="rb") as f:
+            parquet_file = self._get_parquet_file(f)
+            column_list = None if columns is None else list(columns)
+            if row_groups is None:
+                table = parquet_file.read(
+                    columns=column_list, use_pandas_metadata=True
+                )
+            else:
+                table = parquet_file.read_row_groups(
+                    list(row_groups),
+                    columns=column_list,
+                    use_pandas_metadata=True,
+                )
+            return table.to_pandas()
+
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        row_groups: Optional[Sequence[int]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the artifact in batches of rows.
+
+        Only a single batch is kept in memory at a time.
+
+        Args:
+            batch_size: The maximum number of rows per batch.
+            columns: Names of the columns to read. Reads all columns if not
+                given.
+            row_groups: Indices of the row groups to read. Reads all row
+                groups if not given. Ignored for `.csv` artifacts.
+
+        Yields:
+            Dataframes with at most `batch_size` rows.
+        """
+        column_list = None if columns is None else list(columns)
+        if self.parquet_path is None:
+            with fileio.open(self.csv_path, mode="rb") as f:
+                for df in pd.read_csv(
+                    f, index_col=0, parse_dates=True, chunksize=batch_size
+                ):
+                    yield df if column_list is None else df[column_list]
+            return
+
+        import pyarrow as pa
+
+        with fileio.open(self.parquet_path, mode="rb") as f:
+            parquet_file = self._get_parquet_file(f)
+            for batch in parquet_file.iter_batches(
+                batch_size=batch_size,
+                row_groups=None if row_groups is None else list(row_groups),
+                columns=column_list,
+                use_pandas_metadata=True,
+            ):
+                yield pa.Table.from_batches([batch]).to_pandas()
+
+
 class PandasMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from pandas.
+
+    Data is stored as `.parquet` file if `pyarrow` is installed. The
+    compression codec (e.g. `zstd`, `lz4`, `snappy` or `none`) and the number
+    of rows per row group are configured by the `ZENML_PANDAS_COMPRESSION`
+    and `ZENML_PANDAS_ROW_GROUP_SIZE` environment variables. Subclasses of
+    this materializer can override them using the `COMPRESSION_TYPE` and
+    `ROW_GROUP_SIZE` class variables.
+    """
 
     ASSOCIATED_TYPES = (pd.DataFrame, pd.Series)
     ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
 
+    # If not set, the values configured by the environment variables are
+    # used.
+    COMPRESSION_TYPE: ClassVar[Optional[str]] = None
+    ROW_GROUP_SIZE: ClassVar[Optional[int]] = None
+
     def __init__(self, uri: str):
         """Define `self.data_path`.
 
@@ -46,7 +258,7 @@ class PandasMaterializer(BaseMaterializer):
         """
         super().__init__(uri)
         try:
-            import pyarrow  # type: ignore # noqa
+            import pyarrow  # noqa
 
             self.pyarrow_exists = True
         except ImportError:
@@ -60,6 +272,9 @@ class PandasMaterializer(BaseMaterializer):
             )
         finally:
             self.parquet_path = os.path.join(self.uri, PARQUET_FILENAME)
+            self.legacy_parquet_path = os.path.join(
+                self.uri, LEGACY_PARQUET_FILENAME
+            )
             self.csv_path = os.path.join(self.uri, CSV_FILENAME)
 
     def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
@@ -75,10 +290,11 @@ class PandasMaterializer(BaseMaterializer):
             The pandas dataframe or series.
         """
         super().load(data_type)
-        if fileio.exists(self.parquet_path):
+        if fileio.exists(self.parquet_path) or fileio.exists(
+            self.legacy_parquet_path
+        ):
             if self.pyarrow_exists:
-                with fileio.open(self.parquet_path, mode="rb") as f:
-                    df = pd.read_parquet(f)
+                df = PandasArtifactReader(self.uri).read()
             else:
                 raise ImportError(
                     "You have an old version of a `PandasMaterializer` "
@@ -128,7 +344,13 @@ class PandasMaterializer(BaseMaterializer):
 
         if self.pyarrow_exists:
             with fileio.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
+                df.to_parquet(
+                    f,
+                    compression=self.COMPRESSION_TYPE
+                    or get_default_compression_type(),
+                    row_group_size=self.ROW_GROUP_SIZE
+                    or get_default_row_group_size(),
+                )
         else:
             with fileio.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
@@ -149,24 +371,17 @@ class PandasMaterializer(BaseMaterializer):
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
+            statistics = compute_dataframe_statistics(df.to_frame())
+            if statistics is not None and statistics["mean"]:
+                for stat_name, values in statistics.items():
+                    (pandas_metadata[stat_name],) = values.values()
 
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
-                pandas_metadata[stat_name] = {
-                    str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
-                }
+            statistics = compute_dataframe_statistics(df)
+            if statistics is not None:
+                pandas_metadata.update(statistics)
 
         return {**base_metadata, **pandas_metadata}
@@ -90,6 +90,7 @@ from zenml.models.stack_models import (
 )
 from zenml.models.step_run_models import (
     StepRunFilterModel,
+    StepRunFinalizeModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -267,6 +268,7 @@ __all__ = [
     "StepRunRequestModel",
     "StepRunResponseModel",
     "StepRunUpdateModel",
+    "StepRunFinalizeModel",
     "StepRunFilterModel",
     "TeamRequestModel",
     "TeamResponseModel",
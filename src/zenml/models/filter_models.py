@@ -23,6 +23,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -31,7 +32,6 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, root_validator, validator
 from pydantic.typing import get_args
-from sqlmodel import SQLModel
 
 from zenml.constants import (
     FILTERING_DATETIME_FORMAT,
@@ -45,6 +45,7 @@ from zenml.logger import get_logger
 
 if TYPE_CHECKING:
     from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
+    from sqlmodel import SQLModel
 
 logger = get_logger(__name__)
 
@@ -95,7 +96,7 @@ class Filter(BaseModel, ABC):
 
     def generate_query_conditions(
         self,
-        table: Type[SQLModel],
+        table: Type["SQLModel"],
     ) -> Union["BinaryExpression[Any]", "BooleanClauseList[Any]"]:
         """Generate the query conditions for the database.
 
@@ -231,6 +232,58 @@ class NumericFilter(Filter):
         return column == self.value
 
 
+# ---------- #
+# PROJECTION #
+# -----------#
+
+
+def _split_fields(fields: str) -> Set[str]:
+    """Splits a comma-separated list of field names.
+
+    Args:
+        fields: The comma-separated field names.
+
+    Returns:
+        The set of field names.
+    """
+    return {field.strip() for field in fields.split(",") if field.strip()}
+
+
+def get_excluded_fields(
+    model_class: Type[BaseModel],
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+) -> Set[str]:
+    """Resolves the fields to exclude from a model for a field projection.
+
+    Args:
+        model_class: The model class to project.
+        fields: Comma-separated list of fields to include. If set, all other
+            fields are excluded.
+        exclude: Comma-separated list of fields to exclude.
+
+    Returns:
+        The names of the fields to exclude. The `id` is never excluded.
+
+    Raises:
+        ValueError: If any of the fields don't exist on the model.
+    """
+    included = _split_fields(fields or "")
+    excluded = _split_fields(exclude or "")
+    unknown_fields = (included | excluded) - set(model_class.__fields__)
+    if unknown_fields:
+        raise ValueError(
+            f"Invalid fields {sorted(unknown_fields)} for "
+            f"`{model_class.__name__}`. Valid fields are: "
+            f"{sorted(model_class.__fields__)}."
+        )
+
+    if included:
+        excluded |= set(model_class.__fields__) - included
+    excluded.discard("id")
+    return excluded
+
+
 # ---------------- #
 # PAGINATION PARAM #
 # -----------------#
@@ -261,10 +314,19 @@ class BaseFilterModel(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "cursor",
+        "count_total",
+        "fields",
+        "exclude",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = [
+        "cursor",
+        "count_total",
+        "fields",
+        "exclude",
+    ]
 
     sort_by: str = Field("created", description="Which column to sort by.")
     logical_operator: LogicalOperators = Field(
@@ -278,6 +340,16 @@ class BaseFilterModel(BaseModel):
     size: int = Field(
         PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAXIMUM, description="Page size"
     )
+    cursor: Optional[str] = Field(
+        None,
+        description="Cursor returned as `next_cursor` of the previous page. If "
+        "set, the page directly following that cursor is returned and the "
+        "page number is ignored.",
+    )
+    count_total: bool = Field(
+        True,
+        description="Whether to count the total number of items and pages.",
+    )
 
     id: Union[UUID, str] = Field(None, description="Id for this resource")
     created: Union[datetime, str] = Field(None, description="Created")
@@ -355,6 +427,37 @@ class BaseFilterModel(BaseModel):
             {key: getattr(self, key) for key in self.__fields__}
         )
 
+    @property
+    def is_projected(self) -> bool:
+        """Whether only a subset of the fields of the items was requested.
+
+        Returns:
+            True if fields should be included or excluded.
+        """
+        return False
+
+    def excludes_field(self, field_name: str) -> bool:
+        """Checks whether a field should be excluded from the returned items.
+
+        Args:
+            field_name: The name of the field.
+
+        Returns:
+            True if the field should be excluded.
+        """
+        return False
+
+    def get_excluded_fields(self, model_class: Type[BaseModel]) -> Set[str]:
+        """Gets the fields to exclude from the returned items.
+
+        Args:
+            model_class: The model class of the returned items.
+
+        Returns:
+            The names of the fields to exclude.
+        """
+        return set()
+
     @property
     def sorting_params(self) -> Tuple[str, SorterOps]:
         """Converts the class variables into a list of usable Filter Models.
@@ -670,7 +773,7 @@ class BaseFilterModel(BaseModel):
         return self.size * (self.page - 1)
 
     def generate_filter(
-        self, table: Type[SQLModel]
+        self, table: Type["SQLModel"]
     ) -> Union["BinaryExpression[Any]", "BooleanClauseList[Any]"]:
         """Generate the filter for the query.
 
@@ -800,3 +903,64 @@ class ShareableWorkspaceScopedFilterModel(WorkspaceScopedFilterModel):
             )
             return and_(base_filter, user_filter)
         return base_filter
+
+
+class FieldProjectionFilterMixin(BaseFilterModel):
+    """Mixin for filter models that allow selecting the returned fields.
+
+    Usage example:
+    ```
+    class ResourceFilterModel(
+        FieldProjectionFilterMixin, WorkspaceScopedFilterModel
+    ):
+        ...
+    ```
+    """
+
+    fields: Optional[str] = Field(
+        None,
+        description="Comma-separated list of fields to include in the "
+        "returned items. The `id` is always included.",
+    )
+    exclude: Optional[str] = Field(
+        None,
+        description="Comma-separated list of fields to exclude from the "
+        "returned items.",
+    )
+
+    @property
+    def is_projected(self) -> bool:
+        """Whether only a subset of the fields of the items was requested.
+
+        Returns:
+            True if fields should be included or excluded.
+        """
+        return bool(self.fields or self.exclude)
+
+    def excludes_field(self, field_name: str) -> bool:
+        """Checks whether a field should be excluded from the returned items.
+
+        Args:
+            field_name: The name of the field.
+
+        Returns:
+            True if the field should be excluded.
+        """
+        if field_name == "id":
+            return False
+        if self.fields and field_name not in _split_fields(self.fields):
+            return True
+        return field_name in _split_fields(self.exclude or "")
+
+    def get_excluded_fields(self, model_class: Type[BaseModel]) -> Set[str]:
+        """Gets the fields to exclude from the returned items.
+
+        Args:
+            model_class: The model class of the returned items.
+
+        Returns:
+            The names of the fields to exclude.
+        """
+        return get_excluded_fields(
+            model_class=model_class, fields=self.fields, exclude=self.exclude
+        )
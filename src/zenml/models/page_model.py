@@ -40,7 +40,7 @@ fastapi-pagination library: https://github.com/uriyyo/fastapi-pagination
 """
 from __future__ import annotations
 
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Optional, Sequence, TypeVar
 
 from pydantic import SecretStr
 from pydantic.generics import GenericModel
@@ -60,9 +60,13 @@ class Page(GenericModel, Generic[B]):
     # TODO: this should be called max_size or max_items instead, and size should
     # return the actual size of the page (len(self.items))
     size: PositiveInt
-    total_pages: NonNegativeInt
-    total: NonNegativeInt
+    # The totals are `None` if counting was skipped by the filter model.
+    total_pages: Optional[NonNegativeInt] = None
+    total: Optional[NonNegativeInt] = None
     items: Sequence[B]
+    # Cursor to fetch the next page using keyset pagination, `None` if this
+    # is the last page.
+    next_cursor: Optional[str] = None
 
     __params_type__ = BaseFilterModel
 
@@ -36,7 +36,10 @@ from zenml.models.base_models import (
     WorkspaceScopedResponseModel,
 )
 from zenml.models.constants import STR_FIELD_MAX_LENGTH
-from zenml.models.filter_models import WorkspaceScopedFilterModel
+from zenml.models.filter_models import (
+    FieldProjectionFilterMixin,
+    WorkspaceScopedFilterModel,
+)
 
 if TYPE_CHECKING:
     from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
@@ -170,7 +173,9 @@ class PipelineRunResponseModel(
 # ------ #
 
 
-class PipelineRunFilterModel(WorkspaceScopedFilterModel):
+class PipelineRunFilterModel(
+    FieldProjectionFilterMixin, WorkspaceScopedFilterModel
+):
     """Model to enable advanced filtering of all Workspaces."""
 
     FILTER_EXCLUDE_FIELDS: ClassVar[List[str]] = [
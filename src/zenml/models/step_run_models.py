@@ -21,12 +21,17 @@ from pydantic import BaseModel, Field
 
 from zenml.config.step_configurations import Step
 from zenml.enums import ExecutionStatus
+from zenml.models.artifact_models import ArtifactRequestModel
 from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
     WorkspaceScopedResponseModel,
 )
 from zenml.models.constants import STR_FIELD_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
-from zenml.models.filter_models import WorkspaceScopedFilterModel
+from zenml.models.filter_models import (
+    FieldProjectionFilterMixin,
+    WorkspaceScopedFilterModel,
+)
+from zenml.models.run_metadata_models import RunMetadataRequestModel
 
 if TYPE_CHECKING:
     from zenml.models import ArtifactResponseModel, RunMetadataResponseModel
@@ -89,7 +94,9 @@ class StepRunResponseModel(StepRunBaseModel, WorkspaceScopedResponseModel):
 # ------ #
 
 
-class StepRunFilterModel(WorkspaceScopedFilterModel):
+class StepRunFilterModel(
+    FieldProjectionFilterMixin, WorkspaceScopedFilterModel
+):
     """Model to enable advanced filtering of all Artifacts."""
 
     name: str = Field(
@@ -159,3 +166,17 @@ class StepRunUpdateModel(BaseModel):
     output_artifacts: Dict[str, UUID] = {}
     status: Optional[ExecutionStatus] = None
     end_time: Optional[datetime] = None
+
+
+class StepRunFinalizeModel(BaseModel):
+    """Model to publish the outputs and final status of a step run at once.
+
+    The metadata of each output artifact gets linked to the artifact that is
+    created for the respective output, so the `artifact_id` of the metadata
+    requests does not need to be set.
+    """
+
+    status: ExecutionStatus = ExecutionStatus.COMPLETED
+    end_time: Optional[datetime] = None
+    output_artifacts: Dict[str, ArtifactRequestModel] = {}
+    output_artifact_metadata: Dict[str, List[RunMetadataRequestModel]] = {}
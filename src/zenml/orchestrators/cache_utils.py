@@ -17,7 +17,6 @@ import hashlib
 from typing import TYPE_CHECKING, Dict, Optional
 
 from zenml.client import Client
-from zenml.enums import ExecutionStatus, SorterOps
 from zenml.logger import get_logger
 
 if TYPE_CHECKING:
@@ -35,6 +34,7 @@ def generate_cache_key(
     input_artifact_ids: Dict[str, "UUID"],
     artifact_store: "BaseArtifactStore",
     workspace_id: "UUID",
+    input_artifact_uris: Optional[Dict[str, str]] = None,
 ) -> str:
     """Generates a cache key for a step run.
 
@@ -46,7 +46,9 @@ def generate_cache_key(
     - the artifact store ID and path,
     - the source code that defines the step,
     - the parameters of the step,
-    - the names and IDs of the input artifacts of the step,
+    - the names and IDs of the input artifacts of the step (or the content
+      digests of content-addressed input artifacts, so identical inputs
+      produced by different step runs result in the same cache key),
     - the names and source codes of the output artifacts of the step,
     - the source codes of the output materializers of the step.
     - additional custom caching parameters of the step.
@@ -56,6 +58,7 @@ def generate_cache_key(
         input_artifact_ids: The input artifact IDs for the step.
         artifact_store: The artifact store of the active stack.
         workspace_id: The ID of the active workspace.
+        input_artifact_uris: The input artifact URIs for the step.
 
     Returns:
         A cache key.
@@ -78,9 +81,18 @@ def generate_cache_key(
         hash_.update(str(value).encode())
 
     # Input artifacts
+    input_artifact_uris = input_artifact_uris or {}
     for name, artifact_id in input_artifact_ids.items():
         hash_.update(name.encode())
-        hash_.update(artifact_id.bytes)
+        digest = None
+        if name in input_artifact_uris:
+            digest = artifact_store.get_content_digest(
+                input_artifact_uris[name]
+            )
+        if digest:
+            hash_.update(digest.encode())
+        else:
+            hash_.update(artifact_id.bytes)
 
     # Output artifacts and materializers
     for name, output in step.config.outputs.items():
@@ -108,15 +120,6 @@ def get_cached_step_run(cache_key: str) -> Optional["StepRunResponseModel"]:
         The existing step run if the step can be cached, otherwise None.
     """
     client = Client()
-
-    cache_candidates = client.list_run_steps(
-        workspace_id=client.active_workspace.id,
-        cache_key=cache_key,
-        status=ExecutionStatus.COMPLETED,
-        sort_by=f"{SorterOps.DESCENDING}:created",
-        size=1,
-    ).items
-
-    if cache_candidates:
-        return cache_candidates[0]
-    return None
+    return client.zen_store.get_cached_step_run(
+        cache_key=cache_key, workspace_id=client.active_workspace.id
+    )
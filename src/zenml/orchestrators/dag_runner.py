@@ -13,12 +13,22 @@
 #  permissions and limitations under the License.
 """DAG (Directed Acyclic Graph) Runners."""
 
-import threading
+import heapq
+import os
 from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from zenml.logger import get_logger
+from zenml.utils.enum_utils import StrEnum
 
 logger = get_logger(__name__)
 
@@ -47,26 +57,91 @@ def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     return reversed_dag
 
 
+def get_critical_path_lengths(
+    dag: Dict[str, List[str]],
+    node_weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """Computes the length of the longest path starting at each node of a DAG.
+
+    The length of a path is the sum of the weights of all nodes on it. Nodes
+    that are part of a cycle (and can therefore never run) get a length of 0.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+        node_weights: Optional weight (e.g. the expected duration) for each
+            node. Nodes without a weight count as `1`.
+
+    Returns:
+        Mapping of each node to the length of the longest path starting at
+        this node.
+    """
+    node_weights = node_weights or {}
+    reversed_dag = reverse_dag(dag)
+
+    # Process nodes in reverse topological order, starting with all nodes
+    # that don't have any downstream nodes.
+    remaining_downstream = {node: len(reversed_dag[node]) for node in dag}
+    queue = [node for node, count in remaining_downstream.items() if not count]
+    lengths = {node: 0.0 for node in dag}
+
+    while queue:
+        node = queue.pop()
+        longest_downstream_path = max(
+            (lengths[downstream] for downstream in reversed_dag[node]),
+            default=0.0,
+        )
+        lengths[node] = node_weights.get(node, 1.0) + longest_downstream_path
+
+        for upstream_node in dag[node]:
+            if upstream_node not in remaining_downstream:
+                continue
+            remaining_downstream[upstream_node] -= 1
+            if remaining_downstream[upstream_node] == 0:
+                queue.append(upstream_node)
+
+    return lengths
+
+
 class NodeStatus(Enum):
     """Status of the execution of a node."""
 
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
 
 
-class ThreadedDagRunner:
-    """Multi-threaded DAG Runner.
+class DagRunnerExecutorType(StrEnum):
+    """Executors that a DAG runner can use to run its nodes."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class DagRunner:
+    """Event-driven DAG Runner with a bounded worker pool.
 
     This class expects a DAG of strings in adjacency list representation, as
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes are scheduled from a ready queue: each node keeps track of how many
+    of its upstream nodes still need to complete and gets added to the queue
+    once this count reaches zero. Ready nodes are ordered by the length of the
+    longest path starting at them, so the critical path of the DAG gets
+    scheduled first. At most `max_parallelism` nodes are running at the same
+    time, and the scheduling itself happens exclusively in the thread that
+    called `run()`.
     """
 
     def __init__(
-        self, dag: Dict[str, List[str]], run_fn: Callable[[str], Any]
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        executor_type: DagRunnerExecutorType = DagRunnerExecutorType.THREAD,
+        fail_fast: bool = True,
+        node_weights: Optional[Dict[str, float]] = None,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -74,114 +149,135 @@ class ThreadedDagRunner:
             dag: Adjacency list representation of a DAG.
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
-            run_fn: A function `run_fn(node)` that runs a single node
+            run_fn: A function `run_fn(node)` that runs a single node. When
+                using the process executor, this function needs to be
+                picklable.
+            max_parallelism: Maximum number of nodes to run at the same time.
+                If not set, the thread executor runs up to
+                `min(32, CPUs + 4)` nodes like a default `ThreadPoolExecutor`
+                and the process executor runs as many nodes as there are
+                CPUs.
+            executor_type: The type of executor to run the nodes on.
+            fail_fast: If `True`, no new nodes will be started once a node
+                failed. Otherwise, all nodes that don't depend on a failed
+                node will still be run.
+            node_weights: Optional weight (e.g. the expected duration) for each
+                node, used to compute the critical path of the DAG.
+
+        Raises:
+            ValueError: If the maximum parallelism is not a positive integer.
         """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Invalid maximum parallelism `{max_parallelism}`, the value "
+                "needs to be a positive integer."
+            )
+
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
-
-    def _can_run(self, node: str) -> bool:
-        """Determine whether a node is ready to be run.
+        self.max_parallelism = max_parallelism
+        self.executor_type = DagRunnerExecutorType(executor_type)
+        self.fail_fast = fail_fast
+        self.priorities = get_critical_path_lengths(
+            dag, node_weights=node_weights
+        )
 
-        This is the case if the node has not run yet and all of its upstream
-        node have already completed.
-
-        Args:
-            node: The node.
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of nodes to run at the same time.
 
         Returns:
-            True if the node can run else False.
-        """
-        # Check that node has not run yet.
-        if not self.node_states[node] == NodeStatus.WAITING:
-            return False
-
-        # Check that all upstream nodes of this node have already completed.
-        for upstream_node in self.dag[node]:
-            if not self.node_states[upstream_node] == NodeStatus.COMPLETED:
-                return False
-
-        return True
-
-    def _run_node(self, node: str) -> None:
-        """Run a single node.
-
-        Calls the user-defined run_fn, then calls `self._finish_node`.
-
-        Args:
-            node: The node.
+            The maximum number of concurrently running nodes.
         """
-        self.run_fn(node)
-        self._finish_node(node)
+        if self.max_parallelism:
+            return self.max_parallelism
 
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
+        if self.executor_type == DagRunnerExecutorType.PROCESS:
+            return os.cpu_count() or 1
 
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+        # Same default as `ThreadPoolExecutor`, so wide DAGs with many
+        # independent nodes don't start a thread for each node.
+        return min(32, (os.cpu_count() or 1) + 4)
 
-        Args:
-            node: The node.
+    def _create_executor(self) -> Executor:
+        """Creates the executor to run the nodes on.
 
         Returns:
-            The thread in which the node was run.
+            The executor.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
-
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
-
-    def _finish_node(self, node: str) -> None:
-        """Finish a node run.
-
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
-
-        Args:
-            node: The node.
-        """
-        # Update node status to completed.
-        assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
-
-        # Run downstream nodes.
-        threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+        if self.executor_type == DagRunnerExecutorType.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            return ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="zenml-dag-runner",
+            )
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
-        The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        Raises:
+            BaseException: The first exception raised by `run_fn`, once all
+                nodes that were already running have finished.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads = []
-        for node in self.nodes:
-            if self._can_run(node):
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
-
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+        if not self.dag:
+            return
+
+        insertion_order = {
+            node: index for index, node in enumerate(self.nodes)
+        }
+        remaining_upstream = {
+            node: len(upstream_nodes)
+            for node, upstream_nodes in self.dag.items()
+        }
+        ready_queue: List[Tuple[float, int, str]] = []
+
+        def _mark_ready(node: str) -> None:
+            heapq.heappush(
+                ready_queue,
+                (-self.priorities[node], insertion_order[node], node),
+            )
+
+        for node, count in remaining_upstream.items():
+            if count == 0:
+                _mark_ready(node)
+
+        running: Dict["Future[Any]", str] = {}
+        failures: List[Tuple[str, BaseException]] = []
+
+        with self._create_executor() as executor:
+            while ready_queue or running:
+                stop_scheduling = self.fail_fast and failures
+                while (
+                    ready_queue
+                    and len(running) < self.max_workers
+                    and not stop_scheduling
+                ):
+                    _, _, node = heapq.heappop(ready_queue)
+                    self.node_states[node] = NodeStatus.RUNNING
+                    running[executor.submit(self.run_fn, node)] = node
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    exception = future.exception()
+                    if exception:
+                        self.node_states[node] = NodeStatus.FAILED
+                        failures.append((node, exception))
+                        logger.error(f"Node `{node}` failed: {exception}")
+                        continue
+
+                    self.node_states[node] = NodeStatus.COMPLETED
+                    for downstream_node in self.reversed_dag[node]:
+                        remaining_upstream[downstream_node] -= 1
+                        if remaining_upstream[downstream_node] == 0:
+                            _mark_ready(downstream_node)
 
         # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
@@ -191,3 +287,34 @@ class ThreadedDagRunner:
                     f"Node `{node}` was never run, because it was still"
                     f" waiting for the following nodes: `{upstream_nodes}`."
                 )
+
+        if failures:
+            raise failures[0][1]
+
+
+class ThreadedDagRunner(DagRunner):
+    """Multi-threaded DAG Runner.
+
+    Runs all nodes in a thread pool. Kept for backwards compatibility, use
+    `DagRunner` instead.
+    """
+
+    def __init__(
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+    ) -> None:
+        """Initializes the DAG runner.
+
+        Args:
+            dag: Adjacency list representation of a DAG.
+            run_fn: A function `run_fn(node)` that runs a single node.
+            max_parallelism: Maximum number of nodes to run at the same time.
+        """
+        super().__init__(
+            dag=dag,
+            run_fn=run_fn,
+            max_parallelism=max_parallelism,
+            executor_type=DagRunnerExecutorType.THREAD,
+        )
@@ -13,11 +13,34 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import os
+import subprocess
+import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Optional, Type
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    cast,
+)
 from uuid import uuid4
 
+from pydantic import Field, PositiveFloat, PositiveInt
+
 from zenml.client import Client
+from zenml.config.base_settings import BaseSettings
+from zenml.config.resource_settings import (
+    MEMORY_REGEX,
+    ByteUnit,
+    ResourceSettings,
+)
+from zenml.entrypoints import StepEntrypointConfiguration
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
 from zenml.orchestrators import utils as orchestrator_utils
@@ -25,8 +48,9 @@ from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import DagRunner
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import source_utils, string_utils
 
 if TYPE_CHECKING:
     from zenml.models.pipeline_deployment_models import (
@@ -35,22 +59,88 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID = "ZENML_LOCAL_ORCHESTRATOR_RUN_ID"
+
+
+class ResourceBudget:
+    """CPU and memory budget shared by concurrently running steps.
+
+    Each step acquires the CPUs and memory of its resource settings before it
+    starts and releases them once it finished. Requests that exceed the total
+    budget are capped to the total budget, so these steps still run but
+    never concurrently with other steps.
+    """
+
+    def __init__(self, cpu_count: float, memory: Optional[float]) -> None:
+        """Initializes the budget.
+
+        Args:
+            cpu_count: The total number of CPU cores.
+            memory: The total memory in GB, or `None` to not limit the memory.
+        """
+        self.cpu_count = cpu_count
+        self.memory = memory
+        self._available_cpu_count = cpu_count
+        self._available_memory = memory or 0.0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def acquire(self, cpu_count: float, memory: float) -> Iterator[None]:
+        """Blocks until the requested resources are available.
+
+        Args:
+            cpu_count: The number of CPU cores to acquire.
+            memory: The memory in GB to acquire.
+
+        Yields:
+            Nothing, the resources are released when exiting the context.
+        """
+        cpu_count = min(cpu_count, self.cpu_count)
+        memory = min(memory, self.memory) if self.memory is not None else 0.0
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: cpu_count <= self._available_cpu_count
+                and memory <= self._available_memory
+            )
+            self._available_cpu_count -= cpu_count
+            self._available_memory -= memory
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._available_cpu_count += cpu_count
+                self._available_memory += memory
+                self._condition.notify_all()
+
 
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially in the current
+    process. If the `max_parallelism` setting is larger than 1, steps whose
+    upstream steps finished run concurrently in separate processes. This
+    orchestrator does not support running on a schedule.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def settings_class(self) -> Optional[Type["BaseSettings"]]:
+        """Settings class for the local orchestrator.
+
+        Returns:
+            The settings class.
+        """
+        return LocalOrchestratorSettings
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponseModel",
         stack: "Stack",
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -66,19 +156,27 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
-        for step in deployment.step_configurations.values():
-            if self.requires_resources_in_orchestration_environment(step):
-                logger.warning(
-                    "Specifying step resources is not supported for the local "
-                    "orchestrator, ignoring resource configuration for "
-                    "step %s.",
-                    step.config.name,
-                )
-
-            self.run_step(
-                step=step,
+        settings = cast(
+            LocalOrchestratorSettings, self.get_settings(deployment)
+        )
+        if settings.max_parallelism > 1:
+            self._run_steps_in_parallel(
+                deployment=deployment, settings=settings
             )
+        else:
+            # Run each step
+            for step in deployment.step_configurations.values():
+                if self.requires_resources_in_orchestration_environment(step):
+                    logger.warning(
+                        "Specifying step resources is not supported for the "
+                        "sequential local orchestrator, ignoring resource "
+                        "configuration for step %s.",
+                        step.config.name,
+                    )
+
+                self.run_step(
+                    step=step,
+                )
 
         run_duration = time.time() - start_time
         run_id = orchestrator_utils.get_run_id_for_orchestrator_run_id(
@@ -92,9 +190,79 @@ class LocalOrchestrator(BaseOrchestrator):
         )
         self._orchestrator_run_id = None
 
+    def _run_steps_in_parallel(
+        self,
+        deployment: "PipelineDeploymentResponseModel",
+        settings: "LocalOrchestratorSettings",
+    ) -> None:
+        """Runs the steps of a deployment concurrently in subprocesses.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            settings: The orchestrator settings of the pipeline.
+        """
+        assert self._orchestrator_run_id
+        budget = ResourceBudget(
+            cpu_count=settings.cpu_budget or os.cpu_count() or 1,
+            memory=settings.get_memory_budget(),
+        )
+
+        pipeline_dag = {}
+        pipeline_step_names = {}
+        for name_in_pipeline, step in deployment.step_configurations.items():
+            pipeline_step_names[step.config.name] = name_in_pipeline
+            pipeline_dag[step.config.name] = step.spec.upstream_steps
+
+        # Run the steps with the same interpreter as the current process.
+        command = [
+            sys.executable
+        ] + StepEntrypointConfiguration.get_entrypoint_command()[1:]
+        source_root = source_utils.get_source_root_path()
+        env = os.environ.copy()
+        env[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID] = self._orchestrator_run_id
+        # Make sure the subprocesses can import the step code.
+        python_path = env.get("PYTHONPATH")
+        env["PYTHONPATH"] = (
+            os.pathsep.join([source_root, python_path])
+            if python_path
+            else source_root
+        )
+
+        def _run_step(step_name: str) -> None:
+            """Runs a single step in a subprocess.
+
+            Args:
+                step_name: Name of the step.
+            """
+            pipeline_step_name = pipeline_step_names[step_name]
+            step = deployment.step_configurations[pipeline_step_name]
+            arguments = StepEntrypointConfiguration.get_entrypoint_arguments(
+                step_name=pipeline_step_name, deployment_id=deployment.id
+            )
+            resources = step.config.resource_settings
+            with budget.acquire(
+                cpu_count=resources.cpu_count or 1,
+                memory=resources.get_memory(ByteUnit.GB) or 0.0,
+            ):
+                run_step_in_subprocess(
+                    step_name=step_name,
+                    command=command + arguments,
+                    cwd=source_root,
+                    env=env,
+                )
+
+        DagRunner(
+            dag=pipeline_dag,
+            run_fn=_run_step,
+            max_parallelism=settings.max_parallelism,
+        ).run()
+
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
 
+        Inside the subprocesses that run the steps of a parallel run, the run
+        id is read from an environment variable.
+
         Raises:
             RuntimeError: If no run id exists. This happens when this method
                 gets called while the orchestrator is not running a pipeline.
@@ -102,13 +270,94 @@ class LocalOrchestrator(BaseOrchestrator):
         Returns:
             The orchestrator run id.
         """
-        if not self._orchestrator_run_id:
-            raise RuntimeError("No run id set.")
+        if self._orchestrator_run_id:
+            return self._orchestrator_run_id
+
+        if ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID in os.environ:
+            return os.environ[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID]
+
+        raise RuntimeError("No run id set.")
+
+
+def run_step_in_subprocess(
+    step_name: str,
+    command: List[str],
+    cwd: str,
+    env: Dict[str, str],
+) -> None:
+    """Runs a step in a subprocess and logs its output.
 
-        return self._orchestrator_run_id
+    Each line of the output gets prefixed with the step name, so the output of
+    concurrently running steps can be told apart.
+
+    Args:
+        step_name: Name of the step.
+        command: The command to run the step.
+        cwd: The working directory of the subprocess.
+        env: The environment variables of the subprocess.
+
+    Raises:
+        RuntimeError: If the step failed.
+    """
+    logger.info("Starting step `%s` in a subprocess.", step_name)
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    assert process.stdout
+    with process.stdout:
+        for line in process.stdout:
+            logger.info("[%s] %s", step_name, line.rstrip())
+
+    return_code = process.wait()
+    if return_code != 0:
+        raise RuntimeError(
+            f"Step `{step_name}` failed with exit code {return_code}."
+        )
+
+
+class LocalOrchestratorSettings(BaseSettings):
+    """Local orchestrator settings.
+
+    Attributes:
+        max_parallelism: Maximum number of steps to run at the same time. If
+            this is larger than 1, each step runs in a separate process. By
+            default, all steps run sequentially in the current process.
+        cpu_budget: Total number of CPU cores that concurrently running steps
+            can use, based on the `cpu_count` of their resource settings.
+            Steps without a configured CPU count use one core. Defaults to
+            the number of CPU cores of the machine.
+        memory_budget: Total memory that concurrently running steps can use,
+            based on the `memory` of their resource settings, e.g. `"16GB"`.
+            If not set, the memory is not limited.
+    """
+
+    max_parallelism: PositiveInt = 1
+    cpu_budget: Optional[PositiveFloat] = None
+    memory_budget: Optional[str] = Field(default=None, regex=MEMORY_REGEX)
+
+    def get_memory_budget(self) -> Optional[float]:
+        """Gets the memory budget in GB.
+
+        Returns:
+            The memory budget in GB or `None` if the memory is not limited.
+        """
+        if not self.memory_budget:
+            return None
+
+        return ResourceSettings(memory=self.memory_budget).get_memory(
+            ByteUnit.GB
+        )
 
 
-class LocalOrchestratorConfig(BaseOrchestratorConfig):
+class LocalOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
+    BaseOrchestratorConfig, LocalOrchestratorSettings
+):
     """Local orchestrator config."""
 
     @property
@@ -88,6 +88,11 @@ def remove_artifact_dirs(artifact_uris: Sequence[str]) -> None:
     Args:
         artifact_uris: URIs of the artifacts to remove the directories for.
     """
-    for artifact_uri in artifact_uris:
-        if fileio.isdir(artifact_uri):
-            fileio.rmtree(artifact_uri)
+    existing_uris = [
+        artifact_uri
+        for artifact_uri, exists in zip(
+            artifact_uris, fileio.exists_many(artifact_uris)
+        )
+        if exists
+    ]
+    fileio.remove_many(existing_uris)
@@ -14,7 +14,6 @@
 """Utilities to publish pipeline and step runs."""
 
 from datetime import datetime
-from functools import partial
 from typing import TYPE_CHECKING, Dict, List
 
 from zenml.client import Client
@@ -24,15 +23,18 @@ from zenml.models.pipeline_run_models import (
     PipelineRunUpdateModel,
 )
 from zenml.models.step_run_models import (
+    StepRunFinalizeModel,
     StepRunResponseModel,
     StepRunUpdateModel,
 )
+from zenml.utils.metadata_utils import build_run_metadata_requests
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from zenml.metadata.metadata_types import MetadataType
     from zenml.models.artifact_models import ArtifactRequestModel
+    from zenml.models.run_metadata_models import RunMetadataRequestModel
 
 
 def publish_output_artifacts(
@@ -46,12 +48,18 @@ def publish_output_artifacts(
     Returns:
         The IDs of the registered output artifacts.
     """
-    output_artifact_ids = {}
-    client = Client()
-    for name, artifact_model in output_artifacts.items():
-        artifact_response = client.zen_store.create_artifact(artifact_model)
-        output_artifact_ids[name] = artifact_response.id
-    return output_artifact_ids
+    if not output_artifacts:
+        return {}
+
+    artifact_responses = Client().zen_store.batch_create_artifacts(
+        list(output_artifacts.values())
+    )
+    return {
+        name: artifact_response.id
+        for name, artifact_response in zip(
+            output_artifacts, artifact_responses
+        )
+    }
 
 
 def publish_output_artifact_metadata(
@@ -65,11 +73,17 @@ def publish_output_artifact_metadata(
         output_artifact_metadata: A mapping from output names to metadata.
     """
     client = Client()
+    run_metadata: List["RunMetadataRequestModel"] = []
     for output_name, artifact_metadata in output_artifact_metadata.items():
-        artifact_id = output_artifact_ids[output_name]
-        client.create_run_metadata(
-            metadata=artifact_metadata, artifact_id=artifact_id
+        run_metadata.extend(
+            build_run_metadata_requests(
+                metadata=artifact_metadata,
+                workspace_id=client.active_workspace.id,
+                user_id=client.active_user.id,
+                artifact_id=output_artifact_ids[output_name],
+            )
         )
+    _publish_run_metadata(run_metadata)
 
 
 def publish_successful_step_run(
@@ -94,6 +108,43 @@ def publish_successful_step_run(
     )
 
 
+def publish_successful_step_run_outputs(
+    step_run_id: "UUID",
+    output_artifacts: Dict[str, "ArtifactRequestModel"],
+    output_artifact_metadata: Dict[str, Dict[str, "MetadataType"]],
+) -> "StepRunResponseModel":
+    """Publishes the outputs of a successful step run and its status at once.
+
+    Args:
+        step_run_id: The ID of the step run to update.
+        output_artifacts: The output artifacts to register.
+        output_artifact_metadata: A mapping from output names to metadata.
+
+    Returns:
+        The updated step run.
+    """
+    client = Client()
+    run_metadata: Dict[str, List["RunMetadataRequestModel"]] = {}
+    for output_name, artifact_metadata in output_artifact_metadata.items():
+        # The artifact IDs are only known once the artifacts are created, so
+        # the store links the metadata to the artifact of the same output.
+        run_metadata[output_name] = build_run_metadata_requests(
+            metadata=artifact_metadata,
+            workspace_id=client.active_workspace.id,
+            user_id=client.active_user.id,
+        )
+
+    return client.zen_store.finalize_run_step(
+        step_run_id=step_run_id,
+        step_run_finalization=StepRunFinalizeModel(
+            status=ExecutionStatus.COMPLETED,
+            end_time=datetime.utcnow(),
+            output_artifacts=output_artifacts,
+            output_artifact_metadata=run_metadata,
+        ),
+    )
+
+
 def publish_failed_step_run(step_run_id: "UUID") -> "StepRunResponseModel":
     """Publishes a failed step run.
 
@@ -132,54 +183,16 @@ def publish_failed_pipeline_run(
     )
 
 
-def get_pipeline_run_status(
-    step_statuses: List[ExecutionStatus], num_steps: int
-) -> ExecutionStatus:
-    """Gets the pipeline run status for the given step statuses.
-
-    Args:
-        step_statuses: The status of steps in this run.
-        num_steps: The total amount of steps in this run.
-
-    Returns:
-        The run status.
-    """
-    if ExecutionStatus.FAILED in step_statuses:
-        return ExecutionStatus.FAILED
-    if (
-        ExecutionStatus.RUNNING in step_statuses
-        or len(step_statuses) < num_steps
-    ):
-        return ExecutionStatus.RUNNING
-
-    return ExecutionStatus.COMPLETED
-
-
 def update_pipeline_run_status(pipeline_run: PipelineRunResponseModel) -> None:
     """Updates the status of the current pipeline run.
 
+    The store aggregates the status of all steps of the run, so this only
+    requires a single request independent of the number of steps.
+
     Args:
         pipeline_run: The model of the current pipeline run.
     """
-    assert pipeline_run.num_steps is not None
-    client = Client()
-    steps_in_current_run = client.depaginate(
-        partial(client.list_run_steps, pipeline_run_id=pipeline_run.id)
-    )
-
-    new_status = get_pipeline_run_status(
-        step_statuses=[step_run.status for step_run in steps_in_current_run],
-        num_steps=pipeline_run.num_steps,
-    )
-
-    if new_status != pipeline_run.status:
-        run_update = PipelineRunUpdateModel(status=new_status)
-        if new_status in {ExecutionStatus.COMPLETED, ExecutionStatus.FAILED}:
-            run_update.end_time = datetime.utcnow()
-
-        Client().zen_store.update_run(
-            run_id=pipeline_run.id, run_update=run_update
-        )
+    Client().zen_store.update_run_status_from_steps(run_id=pipeline_run.id)
 
 
 def publish_pipeline_run_metadata(
@@ -194,12 +207,18 @@ def publish_pipeline_run_metadata(
             metadata they created.
     """
     client = Client()
+    run_metadata: List["RunMetadataRequestModel"] = []
     for stack_component_id, metadata in pipeline_run_metadata.items():
-        client.create_run_metadata(
-            metadata=metadata,
-            pipeline_run_id=pipeline_run_id,
-            stack_component_id=stack_component_id,
+        run_metadata.extend(
+            build_run_metadata_requests(
+                metadata=metadata,
+                workspace_id=client.active_workspace.id,
+                user_id=client.active_user.id,
+                pipeline_run_id=pipeline_run_id,
+                stack_component_id=stack_component_id,
+            )
         )
+    _publish_run_metadata(run_metadata)
 
 
 def publish_step_run_metadata(
@@ -214,9 +233,27 @@ def publish_step_run_metadata(
             metadata they created.
     """
     client = Client()
+    run_metadata: List["RunMetadataRequestModel"] = []
     for stack_component_id, metadata in step_run_metadata.items():
-        client.create_run_metadata(
-            metadata=metadata,
-            step_run_id=step_run_id,
-            stack_component_id=stack_component_id,
+        run_metadata.extend(
+            build_run_metadata_requests(
+                metadata=metadata,
+                workspace_id=client.active_workspace.id,
+                user_id=client.active_user.id,
+                step_run_id=step_run_id,
+                stack_component_id=stack_component_id,
+            )
         )
+    _publish_run_metadata(run_metadata)
+
+
+def _publish_run_metadata(
+    run_metadata: List["RunMetadataRequestModel"],
+) -> None:
+    """Publishes the given run metadata with a single store call.
+
+    Args:
+        run_metadata: The run metadata to publish.
+    """
+    if run_metadata:
+        Client().zen_store.batch_create_run_metadata(run_metadata)
@@ -311,6 +311,10 @@ class StepLauncher:
             input_artifact_ids=input_artifact_ids,
             artifact_store=self._stack.artifact_store,
             workspace_id=Client().active_workspace.id,
+            input_artifact_uris={
+                input_name: artifact.uri
+                for input_name, artifact in input_artifacts.items()
+            },
         )
 
         step_run.input_artifacts = input_artifact_ids
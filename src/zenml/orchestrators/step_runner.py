@@ -15,7 +15,18 @@
 """Class to run steps."""
 
 import inspect
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Type
+import tempfile
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from zenml.artifacts.base_artifact import BaseArtifact
 from zenml.client import Client
@@ -23,6 +34,7 @@ from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
 from zenml.enums import StackComponentType
 from zenml.exceptions import StepInterfaceError
+from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.unmaterialized_artifact import UnmaterializedArtifact
@@ -32,9 +44,8 @@ from zenml.models.artifact_models import (
 )
 from zenml.orchestrators.publish_utils import (
     publish_output_artifact_metadata,
-    publish_output_artifacts,
     publish_step_run_metadata,
-    publish_successful_step_run,
+    publish_successful_step_run_outputs,
 )
 from zenml.orchestrators.utils import is_setting_enabled
 from zenml.steps.step_context import StepContext
@@ -44,8 +55,12 @@ from zenml.steps.utils import (
     resolve_type_annotation,
 )
 from zenml.utils import source_utils
+from zenml.utils.concurrency_utils import map_concurrently
+from zenml.utils.statistics_utils import statistics_budget
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from zenml.config.step_configurations import Step
     from zenml.metadata.metadata_types import MetadataType
     from zenml.stack import Stack
@@ -140,25 +155,43 @@ class StepRunner:
             is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
             is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
         )
+        materialization_settings = self.configuration.materialization_settings
+        extract_metadata_in_background = (
+            artifact_metadata_enabled
+            and materialization_settings.extract_metadata_in_background
+        )
         output_artifacts, artifact_metadata = self._store_output_artifacts(
             output_data=output_data,
             output_artifact_uris=output_artifact_uris,
             output_materializers=output_materializers,
-            artifact_metadata_enabled=artifact_metadata_enabled,
+            artifact_metadata_enabled=artifact_metadata_enabled
+            and not extract_metadata_in_background,
         )
-        output_artifact_ids = publish_output_artifacts(
+
+        # Publish the output artifacts, their metadata and the status of the
+        # step run in a single call.
+        step_run = publish_successful_step_run_outputs(
+            step_run_id=step_run_info.step_run_id,
             output_artifacts=output_artifacts,
-        )
-        publish_output_artifact_metadata(
-            output_artifact_ids=output_artifact_ids,
             output_artifact_metadata=artifact_metadata,
         )
 
-        # Update the status and output artifacts of the step run.
-        publish_successful_step_run(
-            step_run_id=step_run_info.step_run_id,
-            output_artifact_ids=output_artifact_ids,
-        )
+        # Extracting the metadata can take a long time for large artifacts,
+        # so this optionally happens once downstream steps can already run.
+        if extract_metadata_in_background:
+            output_artifact_ids = {
+                name: artifact.id
+                for name, artifact in step_run.output_artifacts.items()
+            }
+            self._publish_output_artifact_metadata_in_background(
+                output_data=output_data,
+                output_materializers=output_materializers,
+                output_artifact_uris={
+                    name: artifact.uri
+                    for name, artifact in output_artifacts.items()
+                },
+                output_artifact_ids=output_artifact_ids,
+            )
 
     def _load_step_entrypoint(self) -> Callable[..., Any]:
         """Load the step entrypoint function.
@@ -211,6 +244,7 @@ class StepRunner:
         from zenml.steps import BaseParameters
 
         function_params: Dict[str, Any] = {}
+        artifacts_to_load: Dict[str, Dict[str, Any]] = {}
 
         if args and args[0] == "self":
             args.pop(0)
@@ -236,12 +270,24 @@ class StepRunner:
 
             # Parse the input artifacts
             else:
-                # At this point, it has to be an artifact, so we resolve
-                function_params[arg] = self._load_input_artifact(
-                    input_artifacts[arg], arg_type
-                )
-
-        return function_params
+                # At this point, it has to be an artifact, so we resolve it
+                # together with all other input artifacts below
+                artifacts_to_load[arg] = {
+                    "artifact": input_artifacts[arg],
+                    "data_type": arg_type,
+                }
+
+        # Load all input artifacts concurrently so the step doesn't wait for
+        # each download from a remote artifact store sequentially.
+        max_workers = self.configuration.materialization_settings.max_workers
+        input_values: List[Any] = map_concurrently(
+            lambda kwargs: self._load_input_artifact(**kwargs),
+            list(artifacts_to_load.values()),
+            max_workers=max_workers,
+            thread_name_prefix="zenml-materializer",
+        )
+        function_params.update(zip(artifacts_to_load, input_values))
+        return {arg: function_params[arg] for arg in args}
 
     def _load_input_artifact(
         self, artifact: "ArtifactResponseModel", data_type: Type[Any]
@@ -381,6 +427,28 @@ class StepRunner:
         )
         assert artifact_stores  # Every stack has an artifact store.
         artifact_store_id = artifact_stores[0].id
+
+        # Save all outputs concurrently so the step doesn't wait for each
+        # upload to a remote artifact store sequentially.
+        max_workers = self.configuration.materialization_settings.max_workers
+        stored_outputs = dict(
+            zip(
+                output_data,
+                map_concurrently(
+                    lambda item: self._store_output_artifact(
+                        output_name=item[0],
+                        return_value=item[1],
+                        materializer_class=output_materializers[item[0]],
+                        uri=output_artifact_uris[item[0]],
+                        artifact_metadata_enabled=artifact_metadata_enabled,
+                    ),
+                    list(output_data.items()),
+                    max_workers=max_workers,
+                    thread_name_prefix="zenml-materializer",
+                ),
+            )
+        )
+
         output_artifacts: Dict[str, ArtifactRequestModel] = {}
         output_artifact_metadata: Dict[str, Dict[str, "MetadataType"]] = {}
         for output_name, return_value in output_data.items():
@@ -388,21 +456,9 @@ class StepRunner:
             materializer_source = self.configuration.outputs[
                 output_name
             ].materializer_source
-            uri = output_artifact_uris[output_name]
-            materializer = materializer_class(uri)
-            materializer.save(return_value)
-            if artifact_metadata_enabled:
-                try:
-                    artifact_metadata = materializer.extract_metadata(
-                        return_value
-                    )
-                    output_artifact_metadata[output_name] = artifact_metadata
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to extract metadata for output artifact "
-                        f"'{output_name}' of step '{self.configuration.name}': "
-                        f"{e}"
-                    )
+            uri, artifact_metadata = stored_outputs[output_name]
+            if artifact_metadata is not None:
+                output_artifact_metadata[output_name] = artifact_metadata
             output_artifact = ArtifactRequestModel(
                 name=output_name,
                 type=materializer_class.ASSOCIATED_ARTIFACT_TYPE,
@@ -415,3 +471,140 @@ class StepRunner:
             )
             output_artifacts[output_name] = output_artifact
         return output_artifacts, output_artifact_metadata
+
+    def _store_output_artifact(
+        self,
+        output_name: str,
+        return_value: Any,
+        materializer_class: Type[BaseMaterializer],
+        uri: str,
+        artifact_metadata_enabled: bool,
+    ) -> Tuple[str, Optional[Dict[str, "MetadataType"]]]:
+        """Stores a single output artifact of the step.
+
+        If the artifact store uses the content-addressed layout, the artifact
+        is first materialized in a local directory and only copied to the
+        artifact store if no artifact with the same content exists yet.
+
+        Args:
+            output_name: The name of the output.
+            return_value: The value returned by the step function.
+            materializer_class: The materializer class to save the value.
+            uri: The URI of the output artifact.
+            artifact_metadata_enabled: Whether artifact metadata collection is
+                enabled.
+
+        Returns:
+            The final URI of the output artifact and its metadata or `None`
+            if no metadata was extracted.
+        """
+        artifact_store = self._stack.artifact_store
+        # Steps can write files to their output URIs directly through the
+        # step context, in which case the content can't be moved anymore.
+        if artifact_store.config.content_addressed and not fileio.listdir(uri):
+            with tempfile.TemporaryDirectory(prefix="zenml-artifact-") as tmp:
+                materializer_class(tmp).save(return_value)
+                content_uri = artifact_store.store_content_addressed(tmp)
+            fileio.rmtree(uri)
+            uri = content_uri
+            materializer = materializer_class(uri)
+        else:
+            materializer = materializer_class(uri)
+            materializer.save(return_value)
+
+        if not artifact_metadata_enabled:
+            return uri, None
+
+        return uri, self._extract_output_artifact_metadata(
+            output_name=output_name,
+            return_value=return_value,
+            materializer=materializer,
+        )
+
+    def _extract_output_artifact_metadata(
+        self,
+        output_name: str,
+        return_value: Any,
+        materializer: BaseMaterializer,
+    ) -> Optional[Dict[str, "MetadataType"]]:
+        """Extracts the metadata of an output artifact.
+
+        Args:
+            output_name: The name of the output.
+            return_value: The value returned by the step function.
+            materializer: The materializer that saved the value.
+
+        Returns:
+            The metadata of the output artifact or `None` if the extraction
+            failed.
+        """
+        settings = self.configuration.materialization_settings
+        try:
+            with statistics_budget(
+                max_rows=settings.metadata_max_rows,
+                time_budget=settings.metadata_time_budget,
+            ):
+                return materializer.extract_metadata(return_value)
+        except Exception as e:
+            logger.warning(
+                f"Failed to extract metadata for output artifact "
+                f"'{output_name}' of step '{self.configuration.name}': "
+                f"{e}"
+            )
+            return None
+
+    def _publish_output_artifact_metadata_in_background(
+        self,
+        output_data: Dict[str, Any],
+        output_materializers: Dict[str, Type[BaseMaterializer]],
+        output_artifact_uris: Dict[str, str],
+        output_artifact_ids: Dict[str, "UUID"],
+    ) -> threading.Thread:
+        """Extracts and publishes the output artifact metadata in a thread.
+
+        The thread is not a daemon thread, so the process waits for the
+        metadata to be published before exiting.
+
+        Args:
+            output_data: The output data of the step function, mapping output
+                names to return values.
+            output_materializers: The output materializers of the step.
+            output_artifact_uris: The output artifact URIs of the step.
+            output_artifact_ids: The IDs of the published output artifacts.
+
+        Returns:
+            The started thread.
+        """
+
+        def _extract_and_publish_metadata() -> None:
+            """Extracts and publishes the metadata of all outputs."""
+            output_artifact_metadata = {}
+            for output_name, return_value in output_data.items():
+                materializer = output_materializers[output_name](
+                    output_artifact_uris[output_name]
+                )
+                artifact_metadata = self._extract_output_artifact_metadata(
+                    output_name=output_name,
+                    return_value=return_value,
+                    materializer=materializer,
+                )
+                if artifact_metadata:
+                    output_artifact_metadata[output_name] = artifact_metadata
+
+            try:
+                publish_output_artifact_metadata(
+                    output_artifact_ids=output_artifact_ids,
+                    output_artifact_metadata=output_artifact_metadata,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to publish the output artifact metadata of step "
+                    f"'{self.configuration.name}': {e}"
+                )
+
+        thread = threading.Thread(
+            target=_extract_and_publish_metadata,
+            name="zenml-artifact-metadata",
+        )
+        thread.start()
+        return thread
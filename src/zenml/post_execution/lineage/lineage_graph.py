@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Class for lineage graph generation."""
 
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -25,8 +26,15 @@ from zenml.post_execution.lineage.node import (
     StepNode,
     StepNodeDetails,
 )
-from zenml.post_execution.pipeline_run import PipelineRunView
-from zenml.post_execution.step import StepView
+
+if TYPE_CHECKING:
+    from zenml.config.step_configurations import StepConfiguration
+    from zenml.models import (
+        PipelineRunResponseModel,
+        StepRunResponseModel,
+    )
+    from zenml.post_execution.pipeline_run import PipelineRunView
+    from zenml.post_execution.step import StepView
 
 ARTIFACT_PREFIX = "artifact_"
 STEP_PREFIX = "step_"
@@ -40,16 +48,78 @@ class LineageGraph(BaseModel):
     root_step_id: Optional[str]
     run_metadata: List[Tuple[str, str, str]] = []
 
-    def generate_step_nodes_and_edges(self, step: StepView) -> None:
+    def generate_step_nodes_and_edges(self, step: "StepView") -> None:
         """Generates the step nodes and the edges between them.
 
         Args:
             step: The step to generate the nodes and edges for.
         """
-        step_id = STEP_PREFIX + str(step.id)
+        self.add_step_run(step.model)
+
+    def add_step_run(self, step: "StepRunResponseModel") -> None:
+        """Adds the nodes and edges of a step run to the graph.
+
+        Args:
+            step: The step run to add, including its input and output
+                artifacts and metadata.
+        """
+        self.add_step_node(
+            step_run_id=step.id,
+            name=step.name,
+            status=step.status,
+            config=step.step.config,
+            inputs={k: v.uri for k, v in step.input_artifacts.items()},
+            outputs={k: v.uri for k, v in step.output_artifacts.items()},
+            metadata=[
+                (m.key, str(m.value), str(m.type))
+                for m in step.metadata.values()
+            ],
+        )
+        for artifact_name, artifact in step.output_artifacts.items():
+            self.add_output_artifact_node(
+                artifact_id=artifact.id,
+                name=artifact_name,
+                step_run_id=step.id,
+                status=step.status,
+                artifact_type=artifact.type,
+                artifact_data_type=artifact.data_type,
+                producer_step_run_id=artifact.producer_step_run_id,
+                uri=artifact.uri,
+                metadata=[
+                    (m.key, str(m.value), str(m.type))
+                    for m in artifact.metadata.values()
+                ],
+            )
+        for artifact in step.input_artifacts.values():
+            self.add_input_artifact_edge(
+                artifact_id=artifact.id, step_run_id=step.id
+            )
+
+    def add_step_node(
+        self,
+        step_run_id: UUID,
+        name: str,
+        status: ExecutionStatus,
+        config: "StepConfiguration",
+        inputs: Dict[str, str],
+        outputs: Dict[str, str],
+        metadata: List[Tuple[str, str, str]],
+    ) -> None:
+        """Adds the node of a step run to the graph.
+
+        Args:
+            step_run_id: The ID of the step run.
+            name: The name of the step.
+            status: The status of the step run.
+            config: The configuration of the step.
+            inputs: The URIs of the input artifacts of the step run.
+            outputs: The URIs of the output artifacts of the step run.
+            metadata: Tuples of key, value and type of the step run metadata.
+        """
+        step_id = STEP_PREFIX + str(step_run_id)
         if self.root_step_id is None:
             self.root_step_id = step_id
-        step_config = step.step_configuration.dict()
+        step_config = config.dict()
         if step_config:
             step_config = {
                 key: value
@@ -60,70 +130,115 @@ class LineageGraph(BaseModel):
             StepNode(
                 id=step_id,
                 data=StepNodeDetails(
-                    execution_id=str(step.id),
-                    name=step.name,  # redundant for consistency
-                    status=step.status,
-                    entrypoint_name=step.entrypoint_name,  # redundant for consistency
-                    parameters=step.parameters,
+                    execution_id=str(step_run_id),
+                    name=name,  # redundant for consistency
+                    status=status,
+                    entrypoint_name=config.name,  # redundant for consistency
+                    parameters=config.parameters,
                     configuration=step_config,
-                    inputs={k: v.uri for k, v in step.inputs.items()},
-                    outputs={k: v.uri for k, v in step.outputs.items()},
-                    metadata=[
-                        (m.key, str(m.value), str(m.type))
-                        for m in step.metadata.values()
-                    ],
+                    inputs=inputs,
+                    outputs=outputs,
+                    metadata=metadata,
                 ),
             )
         )
 
-        for artifact_name, artifact in step.outputs.items():
-            artifact_id = ARTIFACT_PREFIX + str(artifact.id)
-            self.nodes.append(
-                ArtifactNode(
-                    id=artifact_id,
-                    data=ArtifactNodeDetails(
-                        execution_id=str(artifact.id),
-                        name=artifact_name,
-                        status=step.status,
-                        is_cached=step.status == ExecutionStatus.CACHED,
-                        artifact_type=artifact.type,
-                        artifact_data_type=artifact.data_type,
-                        parent_step_id=str(step.id),
-                        producer_step_id=str(artifact.producer_step_run_id),
-                        uri=artifact.uri,
-                        metadata=[
-                            (m.key, str(m.value), str(m.type))
-                            for m in artifact.metadata.values()
-                        ],
-                    ),
-                )
+    def add_output_artifact_node(
+        self,
+        artifact_id: UUID,
+        name: str,
+        step_run_id: UUID,
+        status: ExecutionStatus,
+        artifact_type: str,
+        artifact_data_type: str,
+        producer_step_run_id: Optional[UUID],
+        uri: str,
+        metadata: List[Tuple[str, str, str]],
+    ) -> None:
+        """Adds the node of an output artifact and its incoming edge.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            name: The output name of the artifact.
+            step_run_id: The ID of the step run that output the artifact.
+            status: The status of the step run that output the artifact.
+            artifact_type: The type of the artifact.
+            artifact_data_type: The data type of the artifact.
+            producer_step_run_id: The ID of the step run that originally
+                produced the artifact.
+            uri: The URI of the artifact.
+            metadata: Tuples of key, value and type of the artifact metadata.
+        """
+        step_id = STEP_PREFIX + str(step_run_id)
+        artifact_node_id = ARTIFACT_PREFIX + str(artifact_id)
+        self.nodes.append(
+            ArtifactNode(
+                id=artifact_node_id,
+                data=ArtifactNodeDetails(
+                    execution_id=str(artifact_id),
+                    name=name,
+                    status=status,
+                    is_cached=status == ExecutionStatus.CACHED,
+                    artifact_type=artifact_type,
+                    artifact_data_type=artifact_data_type,
+                    parent_step_id=str(step_run_id),
+                    producer_step_id=str(producer_step_run_id),
+                    uri=uri,
+                    metadata=metadata,
+                ),
             )
-            self.edges.append(
-                Edge(
-                    id=step_id + "_" + artifact_id,
-                    source=step_id,
-                    target=artifact_id,
-                )
+        )
+        self.edges.append(
+            Edge(
+                id=step_id + "_" + artifact_node_id,
+                source=step_id,
+                target=artifact_node_id,
             )
+        )
+
+    def add_input_artifact_edge(
+        self, artifact_id: UUID, step_run_id: UUID
+    ) -> None:
+        """Adds the edge between an input artifact and a step run.
 
-        for artifact_name, artifact in step.inputs.items():
-            artifact_id = ARTIFACT_PREFIX + str(artifact.id)
-            self.edges.append(
-                Edge(
-                    id=step_id + "_" + artifact_id,
-                    source=artifact_id,
-                    target=step_id,
-                )
+        Args:
+            artifact_id: The ID of the input artifact.
+            step_run_id: The ID of the step run consuming the artifact.
+        """
+        step_id = STEP_PREFIX + str(step_run_id)
+        artifact_node_id = ARTIFACT_PREFIX + str(artifact_id)
+        self.edges.append(
+            Edge(
+                id=step_id + "_" + artifact_node_id,
+                source=artifact_node_id,
+                target=step_id,
             )
+        )
 
-    def generate_run_nodes_and_edges(self, run: PipelineRunView) -> None:
+    def generate_run_nodes_and_edges(self, run: "PipelineRunView") -> None:
         """Generates the run nodes and the edges between them.
 
         Args:
             run: The PipelineRunView to generate the lineage graph for.
         """
+        self.add_pipeline_run(
+            run.model, steps=[step.model for step in run.steps]
+        )
+
+    def add_pipeline_run(
+        self,
+        run: "PipelineRunResponseModel",
+        steps: List["StepRunResponseModel"],
+    ) -> None:
+        """Adds the nodes and edges of a pipeline run to the graph.
+
+        Args:
+            run: The pipeline run to add.
+            steps: All step runs of the pipeline run, including their input
+                and output artifacts and metadata.
+        """
         self.run_metadata = [
             (m.key, str(m.value), str(m.type)) for m in run.metadata.values()
         ]
-        for step in run.steps:
-            self.generate_step_nodes_and_edges(step)
+        for step in steps:
+            self.add_step_run(step)
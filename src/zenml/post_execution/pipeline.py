@@ -120,9 +120,9 @@ def get_pipeline(
         name=pipeline_name,
         workspace_id=active_workspace_id,
     )
-    if pipeline_models.total == 1:
+    if len(pipeline_models) == 1:
         return PipelineView(pipeline_models.items[0])
-    elif pipeline_models.total > 1:
+    elif len(pipeline_models) > 1:
         raise RuntimeError(
             f"Pipeline_name `{pipeline_name}` not unique within workspace "
             f"`{active_workspace_id}`."
@@ -163,6 +163,7 @@ class PipelineView(BaseView):
                 )
             )
             .total
+            or 0
         )
 
     @property
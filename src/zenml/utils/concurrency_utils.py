@@ -0,0 +1,71 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to run functions concurrently."""
+
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int,
+    thread_name_prefix: str = "zenml",
+) -> List[R]:
+    """Calls a function for multiple items in a bounded thread pool.
+
+    If one of the calls fails, all calls that haven't started yet are
+    cancelled and the exception is raised once all running calls finished.
+    This makes sure that nothing is still being written when the caller
+    cleans up after the failure.
+
+    Args:
+        func: The function to call.
+        items: The items to call the function for.
+        max_workers: The maximum number of concurrent calls. The items are
+            processed sequentially in the calling thread if this is 1.
+        thread_name_prefix: Prefix for the names of the worker threads.
+
+    Returns:
+        The return values of the function calls, in the order of the items.
+
+    Raises:
+        BaseException: The exception of the first failed call.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix=thread_name_prefix,
+    ) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            wait(futures, return_when=FIRST_EXCEPTION)
+        finally:
+            # Cancel the remaining calls if one failed or the caller got
+            # interrupted. Calls that are already done are not affected.
+            for future in futures:
+                future.cancel()
+
+    for future in futures:
+        if not future.cancelled():
+            exception = future.exception()
+            if exception:
+                raise exception
+
+    return [future.result() for future in futures]
@@ -14,23 +14,25 @@
 """Various utility functions for the io module."""
 
 import fnmatch
+import hashlib
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, cast
 
 import click
 
 from zenml.constants import APP_NAME, ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
 from zenml.io.fileio import (
     convert_to_str,
-    copy,
+    copy_many,
+    download_dir,
     exists,
     isdir,
-    listdir,
     makedirs,
     mkdir,
     open,
     rename,
+    upload_dir,
     walk,
 )
 
@@ -101,27 +103,87 @@ def copy_dir(
 ) -> None:
     """Copies dir from source to destination.
 
+    Copies between the local filesystem and a remote one use the bulk
+    upload/download operations of the remote filesystem. All other files are
+    copied concurrently.
+
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
     """
-    for source_file in listdir(source_dir):
-        source_path = os.path.join(source_dir, convert_to_str(source_file))
-        destination_path = os.path.join(
-            destination_dir, convert_to_str(source_file)
+    if not is_remote(source_dir) and is_remote(destination_dir):
+        upload_dir(source_dir, destination_dir, overwrite=overwrite)
+        return
+    if is_remote(source_dir) and not is_remote(destination_dir):
+        download_dir(source_dir, destination_dir, overwrite=overwrite)
+        return
+
+    pairs = []
+    for root, dirs, files in walk(source_dir):
+        root = convert_to_str(root)
+        # if the destination is a subdirectory of the source, we skip
+        # copying it to avoid an infinite loop.
+        dirs[:] = [
+            dir_
+            for dir_ in dirs
+            if os.path.join(root, convert_to_str(dir_)) != destination_dir
+        ]
+        relative_root = os.path.relpath(root, source_dir)
+        destination_root = (
+            destination_dir
+            if relative_root == os.curdir
+            else os.path.join(destination_dir, relative_root)
         )
-        if isdir(source_path):
-            if source_path == destination_dir:
-                # if the destination is a subdirectory of the source, we skip
-                # copying it to avoid an infinite loop.
-                continue
-            copy_dir(source_path, destination_path, overwrite)
-        else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
+        create_dir_recursive_if_not_exists(destination_root)
+        for file in files:
+            file = convert_to_str(file)
+            pairs.append(
+                (
+                    os.path.join(root, file),
+                    os.path.join(destination_root, file),
+                )
+            )
+    copy_many(pairs, overwrite=overwrite)
+
+
+def compute_directory_digest(
+    dir_path: str, chunk_size: int = 1024 * 1024
+) -> str:
+    """Computes a SHA-256 digest of the contents of a directory.
+
+    The digest covers the relative paths and contents of all files in the
+    directory, so two directories have the same digest if they contain
+    identical files. Files are read in chunks so they never need to be loaded
+    into memory completely.
+
+    Args:
+        dir_path: Path of the directory.
+        chunk_size: Number of bytes to read at once.
+
+    Returns:
+        The hex digest.
+    """
+    hash_ = hashlib.sha256()
+    file_paths = []
+    for root, _, files in walk(dir_path):
+        for file in files:
+            file_path = os.path.join(
+                convert_to_str(root), convert_to_str(file)
             )
-            copy(str(source_path), str(destination_path), overwrite)
+            file_paths.append(file_path)
+
+    for file_path in sorted(file_paths):
+        relative_path = os.path.relpath(file_path, dir_path)
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: cast(bytes, f.read(chunk_size)), b""):
+                file_hash.update(chunk)
+
+        hash_.update(relative_path.replace(os.sep, "/").encode())
+        hash_.update(b"\0")
+        hash_.update(file_hash.digest())
+    return hash_.hexdigest()
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
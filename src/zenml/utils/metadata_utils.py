@@ -0,0 +1,95 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions for run metadata."""
+
+import json
+from typing import TYPE_CHECKING, Dict, List, Optional
+from uuid import UUID
+
+from zenml.logger import get_logger
+from zenml.metadata.metadata_types import get_metadata_type
+from zenml.models.constants import TEXT_FIELD_MAX_LENGTH
+from zenml.models.run_metadata_models import RunMetadataRequestModel
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+logger = get_logger(__name__)
+
+
+def build_run_metadata_requests(
+    metadata: Dict[str, "MetadataType"],
+    workspace_id: UUID,
+    user_id: UUID,
+    pipeline_run_id: Optional[UUID] = None,
+    step_run_id: Optional[UUID] = None,
+    artifact_id: Optional[UUID] = None,
+    stack_component_id: Optional[UUID] = None,
+) -> List[RunMetadataRequestModel]:
+    """Builds the requests to create run metadata.
+
+    Metadata values that are too large to be stored in the database or
+    that are not of a supported type are skipped.
+
+    Args:
+        metadata: The metadata as a dictionary of key-value pairs.
+        workspace_id: The ID of the workspace of the metadata.
+        user_id: The ID of the user that created the metadata.
+        pipeline_run_id: The ID of the pipeline run during which the
+            metadata was produced.
+        step_run_id: The ID of the step run during which the metadata was
+            produced.
+        artifact_id: The ID of the artifact for which the metadata was
+            produced.
+        stack_component_id: The ID of the stack component that produced
+            the metadata.
+
+    Returns:
+        The run metadata requests.
+    """
+    run_metadata: List[RunMetadataRequestModel] = []
+    for key, value in metadata.items():
+
+        # Skip metadata that is too large to be stored in the database.
+        if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
+            logger.warning(
+                f"Metadata value for key '{key}' is too large to be "
+                "stored in the database. Skipping."
+            )
+            continue
+
+        # Skip metadata that is not of a supported type.
+        try:
+            metadata_type = get_metadata_type(value)
+        except ValueError as e:
+            logger.warning(
+                f"Metadata value for key '{key}' is not of a supported "
+                f"type. Skipping. Full error: {e}"
+            )
+            continue
+
+        run_metadata.append(
+            RunMetadataRequestModel(
+                workspace=workspace_id,
+                user=user_id,
+                pipeline_run_id=pipeline_run_id,
+                step_run_id=step_run_id,
+                artifact_id=artifact_id,
+                stack_component_id=stack_component_id,
+                key=key,
+                value=value,
+                type=metadata_type,
+            )
+        )
+    return run_metadata
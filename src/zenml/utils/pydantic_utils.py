@@ -13,10 +13,21 @@
 #  permissions and limitations under the License.
 """Utilities for pydantic models."""
 import json
-from typing import Any, Dict, Optional, Type, TypeVar, Union, cast
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 from pydantic.json import pydantic_encoder
 from pydantic.utils import sequence_like
 
@@ -62,6 +73,84 @@ def update_model(
     return original.__class__(**values)
 
 
+# The excluded fields are chosen by API clients, so the number of cached
+# model classes is bounded.
+@lru_cache(maxsize=128)
+def _create_partial_model(
+    model_class: Type[M], excluded_fields: FrozenSet[str]
+) -> Type[M]:
+    """Creates a subclass of a model in which some fields are optional.
+
+    Args:
+        model_class: The model class.
+        excluded_fields: The fields that are optional in the subclass.
+
+    Returns:
+        The model subclass.
+    """
+    field_definitions: Dict[str, Any] = {
+        field_name: (Optional[Any], None)
+        for field_name in sorted(excluded_fields)
+    }
+    return cast(
+        Type[M],
+        create_model(
+            model_class.__name__,
+            __base__=model_class,
+            **field_definitions,
+        ),
+    )
+
+
+def get_partial_model(
+    model_class: Type[M], excluded_fields: AbstractSet[str]
+) -> Type[M]:
+    """Gets a version of a model class that allows excluding fields.
+
+    The returned class is a subclass of the original model class in which
+    all excluded fields are optional and default to `None`. This allows
+    parsing and returning models of which only a subset of the fields was
+    loaded.
+
+    Args:
+        model_class: The model class.
+        excluded_fields: The fields that can be excluded.
+
+    Returns:
+        The partial model class, or the original model class if no fields are
+        excluded.
+    """
+    if not excluded_fields:
+        return model_class
+    return _create_partial_model(model_class, frozenset(excluded_fields))
+
+
+def exclude_fields(model: M, excluded_fields: AbstractSet[str]) -> M:
+    """Creates a copy of a model without the values of some fields.
+
+    Args:
+        model: The model.
+        excluded_fields: The fields to remove. The values of these fields
+            are `None` in the returned model.
+
+    Returns:
+        The copy of the model, which is an instance of the partial model
+        class returned by `get_partial_model(...)`.
+    """
+    if not excluded_fields:
+        return model
+
+    partial_model_class = get_partial_model(type(model), excluded_fields)
+    values = {
+        key: value
+        for key, value in model.__dict__.items()
+        if key not in excluded_fields
+    }
+    return partial_model_class.construct(
+        _fields_set=model.__fields_set__ - set(excluded_fields), **values
+    )
+
+
 class TemplateGenerator:
     """Class to generate templates for pydantic models or classes."""
 
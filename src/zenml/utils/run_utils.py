@@ -0,0 +1,41 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions for the status of pipeline runs."""
+
+from typing import Mapping
+
+from zenml.enums import ExecutionStatus
+
+
+def get_pipeline_run_status_from_counts(
+    step_status_counts: Mapping[ExecutionStatus, int], num_steps: int
+) -> ExecutionStatus:
+    """Gets the pipeline run status for the given number of steps per status.
+
+    Args:
+        step_status_counts: The number of steps in this run per status.
+        num_steps: The total amount of steps in this run.
+
+    Returns:
+        The run status.
+    """
+    if step_status_counts.get(ExecutionStatus.FAILED):
+        return ExecutionStatus.FAILED
+    if (
+        step_status_counts.get(ExecutionStatus.RUNNING)
+        or sum(step_status_counts.values()) < num_steps
+    ):
+        return ExecutionStatus.RUNNING
+
+    return ExecutionStatus.COMPLETED
@@ -15,7 +15,11 @@
 import re
 from typing import TYPE_CHECKING, Dict, Sequence, Type
 
-from zenml.config.constants import DOCKER_SETTINGS_KEY, RESOURCE_SETTINGS_KEY
+from zenml.config.constants import (
+    DOCKER_SETTINGS_KEY,
+    MATERIALIZATION_SETTINGS_KEY,
+    RESOURCE_SETTINGS_KEY,
+)
 from zenml.enums import StackComponentType
 
 if TYPE_CHECKING:
@@ -125,10 +129,15 @@ def get_general_settings() -> Dict[str, Type["BaseSettings"]]:
     Returns:
         Dictionary mapping general settings keys to their type.
     """
-    from zenml.config import DockerSettings, ResourceSettings
+    from zenml.config import (
+        DockerSettings,
+        MaterializationSettings,
+        ResourceSettings,
+    )
 
     return {
         DOCKER_SETTINGS_KEY: DockerSettings,
+        MATERIALIZATION_SETTINGS_KEY: MaterializationSettings,
         RESOURCE_SETTINGS_KEY: ResourceSettings,
     }
 
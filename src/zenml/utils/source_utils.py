@@ -33,7 +33,6 @@ import site
 import sys
 import types
 from contextlib import contextmanager
-from distutils.sysconfig import get_python_lib
 from types import (
     CodeType,
     FrameType,
@@ -110,6 +109,9 @@ def is_third_party_module(file_path: str) -> bool:
     Returns:
         `True` if the file belongs to a third party package, else `False`.
     """
+    # Importing `distutils` is slow, so only do it when needed.
+    from distutils.sysconfig import get_python_lib
+
     absolute_file_path = pathlib.Path(file_path).resolve()
 
     for path in site.getsitepackages() + [
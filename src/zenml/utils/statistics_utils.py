@@ -0,0 +1,309 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities to compute summary statistics of artifacts.
+
+All statistics (minimum, maximum, mean and standard deviation) are computed in
+a single vectorized pass over the data. The data is processed in chunks and
+the partial results are combined using the parallel variance algorithm by
+Chan et al., so the results match the corresponding numpy/pandas functions up
+to floating point precision.
+
+The cost of the computation can be limited using `statistics_budget(...)`:
+
+```python
+with statistics_budget(max_rows=1_000_000, time_budget=5):
+    materializer.extract_metadata(df)
+```
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from zenml.logger import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from numpy.typing import NDArray
+
+logger = get_logger(__name__)
+
+# Number of values that get processed at once.
+STATISTICS_CHUNK_SIZE = 64 * 1024
+
+
+class StatisticsBudget(BaseModel):
+    """Limits for the computation of statistics.
+
+    Attributes:
+        max_rows: If the data has more rows, the statistics are computed on
+            an evenly spaced sample of `max_rows` rows.
+        deadline: Monotonic time after which the computation is aborted.
+    """
+
+    max_rows: Optional[int] = None
+    deadline: Optional[float] = None
+
+
+_budget: ContextVar[StatisticsBudget] = ContextVar(
+    "statistics_budget", default=StatisticsBudget()
+)
+
+
+@contextlib.contextmanager
+def statistics_budget(
+    max_rows: Optional[int] = None, time_budget: Optional[float] = None
+) -> Iterator[None]:
+    """Context manager to limit the cost of statistics computed inside it.
+
+    Args:
+        max_rows: If the data has more rows, the statistics are computed on
+            an evenly spaced sample of `max_rows` rows.
+        time_budget: Maximum time in seconds to spend on computing statistics
+            inside the context. Statistics that can't be computed in time are
+            skipped.
+
+    Yields:
+        None.
+    """
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    token = _budget.set(StatisticsBudget(max_rows=max_rows, deadline=deadline))
+    try:
+        yield
+    finally:
+        _budget.reset(token)
+
+
+class RunningStatistics:
+    """Accumulates statistics of the columns of 2D chunks of data."""
+
+    def __init__(self, num_columns: int, skipna: bool = False) -> None:
+        """Initializes the accumulators.
+
+        Args:
+            num_columns: The number of columns of the data.
+            skipna: If `True`, NaN values are ignored. Otherwise, any NaN
+                value makes all statistics of its column NaN.
+        """
+        self.skipna = skipna
+        self.count = np.zeros(num_columns)
+        self.mean = np.zeros(num_columns)
+        self.sum_of_squares = np.zeros(num_columns)
+        self.min: Optional["NDArray[Any]"] = None
+        self.max: Optional["NDArray[Any]"] = None
+
+    def update(self, chunk: "NDArray[Any]") -> None:
+        """Adds a chunk of rows to the statistics.
+
+        Args:
+            chunk: Array of shape `(rows, num_columns)`.
+        """
+        if len(chunk) == 0:
+            return
+
+        # `fmin`/`fmax` ignore NaN values, `minimum`/`maximum` propagate them.
+        min_func: np.ufunc
+        max_func: np.ufunc
+        if self.skipna:
+            min_func, max_func = np.fmin, np.fmax
+        else:
+            min_func, max_func = np.minimum, np.maximum
+        chunk_min = min_func.reduce(chunk, axis=0)
+        chunk_max = max_func.reduce(chunk, axis=0)
+        if self.min is None or self.max is None:
+            self.min, self.max = chunk_min, chunk_max
+        else:
+            self.min = min_func(self.min, chunk_min)
+            self.max = max_func(self.max, chunk_max)
+
+        values = chunk.astype(np.float64)
+        if self.skipna:
+            valid = ~np.isnan(values)
+            chunk_count = valid.sum(axis=0)
+            values = np.where(valid, values, 0.0)
+        else:
+            valid = None
+            chunk_count = np.full(values.shape[1], len(values))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            chunk_mean = values.sum(axis=0) / chunk_count
+            deviations = values - chunk_mean
+            if valid is not None:
+                deviations = np.where(valid, deviations, 0.0)
+            chunk_sum_of_squares = np.square(deviations).sum(axis=0)
+
+            total = self.count + chunk_count
+            delta = chunk_mean - self.mean
+            has_values = chunk_count > 0
+            self.mean = np.where(
+                has_values, self.mean + delta * chunk_count / total, self.mean
+            )
+            self.sum_of_squares = np.where(
+                has_values,
+                self.sum_of_squares
+                + chunk_sum_of_squares
+                + delta**2 * self.count * chunk_count / total,
+                self.sum_of_squares,
+            )
+        self.count = total
+
+    def get_results(self, ddof: int = 0) -> Dict[str, "NDArray[Any]"]:
+        """Gets the statistics of all columns.
+
+        Args:
+            ddof: Delta degrees of freedom of the standard deviation.
+
+        Returns:
+            Arrays of the minimum, maximum, mean and standard deviation of
+            each column. Statistics of columns without values are NaN.
+        """
+        has_values = self.count > 0
+        missing = np.full(len(self.count), np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(self.sum_of_squares / (self.count - ddof))
+        return {
+            "min": self.min if self.min is not None else missing,
+            "max": self.max if self.max is not None else missing,
+            "mean": np.where(has_values, self.mean, np.nan),
+            "std": np.where(self.count > ddof, std, np.nan),
+        }
+
+
+def _exceeded_deadline(budget: StatisticsBudget) -> bool:
+    """Checks if the deadline of a budget is exceeded and logs a warning.
+
+    Args:
+        budget: The statistics budget.
+
+    Returns:
+        Whether the deadline is exceeded.
+    """
+    if budget.deadline is not None and time.monotonic() > budget.deadline:
+        logger.warning(
+            "Skipping the computation of statistics because it exceeded its "
+            "time budget."
+        )
+        return True
+    return False
+
+
+def _get_sample_indices(num_rows: int, max_rows: Optional[int]) -> Any:
+    """Gets the indices of the rows to compute the statistics on.
+
+    Args:
+        num_rows: The number of rows of the data.
+        max_rows: The maximum number of rows to use.
+
+    Returns:
+        Evenly spaced row indices or `None` if all rows should be used.
+    """
+    if max_rows is None or num_rows <= max_rows:
+        return None
+    return np.linspace(0, num_rows - 1, num=max_rows).astype(np.int64)
+
+
+def compute_array_statistics(
+    arr: "NDArray[Any]",
+) -> Optional[Dict[str, Any]]:
+    """Computes the statistics of all values of a numpy array.
+
+    NaN values are propagated like in `np.min`, `np.mean` etc. and the
+    standard deviation is computed with `ddof=0` like `np.std`. The rows of
+    the array, which are sampled if the budget limits their number, are the
+    entries along its first axis.
+
+    Args:
+        arr: The array.
+
+    Returns:
+        The minimum, maximum, mean and standard deviation of the array, or
+        `None` if the array is empty, doesn't contain real numbers or the
+        time budget was exceeded.
+    """
+    if arr.size == 0 or arr.dtype.kind not in "biuf":
+        return None
+
+    if arr.ndim == 0:
+        arr = arr.reshape(1)
+
+    budget = _budget.get()
+    sample_indices = _get_sample_indices(len(arr), budget.max_rows)
+    if sample_indices is not None:
+        arr = arr[sample_indices]
+
+    statistics = RunningStatistics(num_columns=1)
+    chunk_rows = max(STATISTICS_CHUNK_SIZE // (arr.size // len(arr)), 1)
+    for start in range(0, len(arr), chunk_rows):
+        rows = arr[start : start + chunk_rows].reshape(-1)
+        # Rows with more values than a chunk are split into multiple chunks.
+        for offset in range(0, rows.size, STATISTICS_CHUNK_SIZE):
+            if _exceeded_deadline(budget):
+                return None
+            chunk = rows[offset : offset + STATISTICS_CHUNK_SIZE]
+            statistics.update(chunk.reshape(-1, 1))
+
+    results = statistics.get_results(ddof=0)
+    return {
+        "min": results["min"][0].item(),
+        "max": results["max"][0].item(),
+        "mean": float(results["mean"][0]),
+        "std": float(results["std"][0]),
+    }
+
+
+def compute_dataframe_statistics(
+    df: "pd.DataFrame",
+) -> Optional[Dict[str, Dict[str, float]]]:
+    """Computes the statistics of all numeric columns of a dataframe.
+
+    NaN values are skipped and the standard deviation is computed with
+    `ddof=1`, like in `df.min`, `df.mean` etc.
+
+    Args:
+        df: The dataframe.
+
+    Returns:
+        Mapping of each statistic to the values of all numeric columns, or
+        `None` if the time budget was exceeded.
+    """
+    numeric_df = df.select_dtypes(include=["number", "bool"])
+    budget = _budget.get()
+    sample_indices = _get_sample_indices(len(numeric_df), budget.max_rows)
+    if sample_indices is not None:
+        numeric_df = numeric_df.iloc[sample_indices]
+
+    num_columns = len(numeric_df.columns)
+    statistics = RunningStatistics(num_columns=num_columns, skipna=True)
+    chunk_rows = max(STATISTICS_CHUNK_SIZE // max(num_columns, 1), 1)
+    for start in range(0, len(numeric_df) if num_columns else 0, chunk_rows):
+        if _exceeded_deadline(budget):
+            return None
+        chunk = numeric_df.iloc[start : start + chunk_rows].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        statistics.update(chunk)
+
+    results = statistics.get_results(ddof=1)
+    columns = [str(column) for column in numeric_df.columns]
+    return {
+        name: {
+            column: float(values[index])
+            for index, column in enumerate(columns)
+        }
+        for name, values in results.items()
+    }
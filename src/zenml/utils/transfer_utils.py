@@ -0,0 +1,219 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities to transfer large files in concurrently processed parts."""
+
+import math
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple, TypeVar
+
+from zenml.logger import get_logger
+from zenml.utils.concurrency_utils import map_concurrently
+from zenml.utils.string_utils import (
+    get_human_readable_filesize,
+    get_human_readable_time,
+)
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def get_part_size(
+    size: int, part_size: int, max_parts: int, min_part_size: int = 1
+) -> int:
+    """Gets the size of the parts in which to transfer a file.
+
+    Args:
+        size: The size of the file in bytes.
+        part_size: The preferred part size in bytes.
+        max_parts: The maximum number of parts that the storage backend
+            supports for a single file.
+        min_part_size: The minimum size in bytes of all parts except the
+            last one that the storage backend supports.
+
+    Returns:
+        The preferred part size, increased if necessary to stay within the
+        maximum number of parts.
+
+    Raises:
+        ValueError: If the preferred part size is smaller than the minimum
+            part size.
+    """
+    if part_size < min_part_size:
+        raise ValueError(
+            f"Invalid part size {part_size}: The storage backend requires "
+            f"parts of at least {min_part_size} bytes."
+        )
+    return max(part_size, math.ceil(size / max_parts), 1)
+
+
+def split_into_parts(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """Splits a file into parts.
+
+    Args:
+        size: The size of the file in bytes.
+        part_size: The size of each part in bytes. The last part might be
+            smaller.
+
+    Returns:
+        The start (inclusive) and end (exclusive) offset of each part.
+    """
+    return [
+        (start, min(start + part_size, size))
+        for start in range(0, size, part_size)
+    ]
+
+
+def _enumerate_parts(
+    parts: List[Tuple[int, int]]
+) -> List[Tuple[int, int, int]]:
+    """Adds the index to the start and end offsets of each part.
+
+    Args:
+        parts: The start and end offsets of the parts.
+
+    Returns:
+        The index, start and end offset of each part.
+    """
+    return [(index, start, end) for index, (start, end) in enumerate(parts)]
+
+
+def download_in_parts(
+    read_range: Callable[[int, int], bytes],
+    size: int,
+    local_path: str,
+    part_size: int,
+    max_concurrency: int,
+) -> None:
+    """Downloads a file using concurrent ranged reads.
+
+    Args:
+        read_range: Function that reads the bytes between a start (inclusive)
+            and end (exclusive) offset of the remote file.
+        size: The size of the remote file in bytes.
+        local_path: The local path to download the file to.
+        part_size: The number of bytes to read per request.
+        max_concurrency: The maximum number of concurrent requests.
+
+    Raises:
+        IOError: If a ranged read returned an unexpected number of bytes.
+    """
+    with open(local_path, "wb") as f:
+        f.truncate(size)
+
+    def _download_part(index: int, start: int, end: int) -> None:
+        """Downloads a single part into the local file.
+
+        Args:
+            index: The index of the part.
+            start: The start offset of the part.
+            end: The end offset of the part.
+
+        Raises:
+            IOError: If the read returned an unexpected number of bytes.
+        """
+        data = read_range(start, end)
+        if len(data) != end - start:
+            raise IOError(
+                f"Expected {end - start} bytes for part {index} of "
+                f"`{local_path}`, got {len(data)} bytes."
+            )
+        with open(local_path, "r+b") as f:
+            f.seek(start)
+            f.write(data)
+
+    map_concurrently(
+        lambda part: _download_part(*part),
+        _enumerate_parts(split_into_parts(size, part_size)),
+        max_workers=max_concurrency,
+        thread_name_prefix="zenml-transfer",
+    )
+
+
+def upload_in_parts(
+    local_path: str,
+    upload_part: Callable[[int, bytes], T],
+    part_size: int,
+    max_concurrency: int,
+) -> List[T]:
+    """Uploads a local file in concurrently uploaded parts.
+
+    Each part is only read from the disk once a worker is available to upload
+    it, so at most `max_concurrency` parts are held in memory at once.
+
+    Args:
+        local_path: The local path of the file to upload.
+        upload_part: Function that uploads a single part. It gets called with
+            the (1-based) part number and the part content.
+        part_size: The size of each part in bytes.
+        max_concurrency: The maximum number of concurrent uploads.
+
+    Returns:
+        The return values of `upload_part`, ordered by part number.
+    """
+
+    def _upload_part(index: int, start: int, end: int) -> T:
+        """Reads and uploads a single part.
+
+        Args:
+            index: The index of the part.
+            start: The start offset of the part.
+            end: The end offset of the part.
+
+        Returns:
+            The return value of `upload_part`.
+        """
+        with open(local_path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        return upload_part(index + 1, data)
+
+    # Empty files still need to be uploaded as a single empty part
+    parts = split_into_parts(os.path.getsize(local_path), part_size) or [
+        (0, 0)
+    ]
+    return map_concurrently(
+        lambda part: _upload_part(*part),
+        _enumerate_parts(parts),
+        max_workers=max_concurrency,
+        thread_name_prefix="zenml-transfer",
+    )
+
+
+@contextmanager
+def log_throughput(operation: str, uri: str, size: int) -> Iterator[None]:
+    """Logs the throughput of a file transfer.
+
+    Args:
+        operation: Description of the transfer, e.g. `Uploaded`.
+        uri: The URI of the remote file.
+        size: The number of transferred bytes.
+
+    Yields:
+        None.
+    """
+    start_time = time.monotonic()
+    yield
+    duration = time.monotonic() - start_time
+    throughput = get_human_readable_filesize(int(size / max(duration, 1e-6)))
+    logger.info(
+        "%s `%s` (%s) in %s (%s/s).",
+        operation,
+        uri,
+        get_human_readable_filesize(size),
+        get_human_readable_time(duration),
+        throughput,
+    )
@@ -14,7 +14,22 @@
 """Authentication module for ZenML server."""
 
 import os
-from typing import Callable, List, Optional, Set, Union
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
@@ -26,7 +41,14 @@ from fastapi.security import (
 )
 from pydantic import BaseModel
 
-from zenml.constants import API, ENV_ZENML_AUTH_TYPE, LOGIN, VERSION_1
+from zenml.constants import (
+    API,
+    AUTH_CACHE_SIZE,
+    AUTH_CACHE_TTL,
+    ENV_ZENML_AUTH_TYPE,
+    LOGIN,
+    VERSION_1,
+)
 from zenml.enums import PermissionType
 from zenml.exceptions import AuthorizationException
 from zenml.logger import get_logger
@@ -35,9 +57,16 @@ from zenml.models.user_models import JWTToken, JWTTokenType, UserAuthModel
 from zenml.utils.enum_utils import StrEnum
 from zenml.zen_server.utils import ROOT_URL_PATH, zen_store
 from zenml.zen_stores.base_zen_store import DEFAULT_USERNAME
+from zenml.zen_stores.zen_store_cache import (
+    CachedEntityType,
+    CacheStatistics,
+    ZenStoreCache,
+)
 
 logger = get_logger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 class AuthScheme(StrEnum):
     """The authentication scheme."""
@@ -71,6 +100,104 @@ class AuthContext(BaseModel):
         return set()
 
 
+class AuthStatistics(BaseModel):
+    """Statistics of the authentication of requests to the server."""
+
+    cache: CacheStatistics = CacheStatistics()
+    num_authentications: int = 0
+    total_latency: float = 0.0
+    average_latency: float = 0.0
+    max_latency: float = 0.0
+
+
+# Authentication contexts of valid access tokens, so authenticated requests
+# don't need to fetch the user and its roles from the store every time.
+# Endpoints that modify users, roles or teams invalidate the cache of their
+# server process, changes made through other processes are picked up once
+# the cached entries expire. Deleted and deactivated users are rejected
+# immediately by all processes, as cached contexts are only used if their
+# user is still active.
+auth_cache: Optional[ZenStoreCache] = (
+    ZenStoreCache(
+        max_size=AUTH_CACHE_SIZE,
+        ttls={CachedEntityType.AUTH_CONTEXT: AUTH_CACHE_TTL},
+    )
+    if AUTH_CACHE_SIZE and AUTH_CACHE_TTL
+    else None
+)
+
+_auth_statistics = AuthStatistics()
+_auth_statistics_lock = threading.Lock()
+
+
+@contextmanager
+def _measure_authentication() -> Iterator[None]:
+    """Records the latency of an authentication.
+
+    Yields:
+        None.
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        latency = time.perf_counter() - start_time
+        with _auth_statistics_lock:
+            _auth_statistics.num_authentications += 1
+            _auth_statistics.total_latency += latency
+            _auth_statistics.max_latency = max(
+                _auth_statistics.max_latency, latency
+            )
+
+
+def get_auth_statistics() -> AuthStatistics:
+    """Gets the authentication statistics of this server process.
+
+    Returns:
+        The authentication statistics.
+    """
+    with _auth_statistics_lock:
+        statistics = _auth_statistics.copy()
+    if statistics.num_authentications:
+        statistics.average_latency = (
+            statistics.total_latency / statistics.num_authentications
+        )
+    if auth_cache is not None:
+        statistics.cache = auth_cache.get_statistics()[
+            CachedEntityType.AUTH_CONTEXT.value
+        ]
+    return statistics
+
+
+def invalidate_auth_cache() -> None:
+    """Removes all cached authentication contexts."""
+    if auth_cache is not None:
+        auth_cache.clear()
+
+
+def invalidates_auth_cache(func: F) -> F:
+    """Decorator for endpoints that modify users, roles or teams.
+
+    Cached authentication contexts contain the user and its permissions, so
+    they are invalidated after every call of the decorated endpoint.
+
+    Args:
+        func: The endpoint function to decorate.
+
+    Returns:
+        The decorated endpoint function.
+    """
+
+    @wraps(func)
+    def decorated(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            invalidate_auth_cache()
+
+    return cast(F, decorated)
+
+
 def authentication_scheme() -> AuthScheme:
     """Returns the authentication type.
 
@@ -140,6 +267,68 @@ def authenticate_credentials(
     return auth_context
 
 
+def _is_user_active(user_id: UUID) -> bool:
+    """Checks whether a user still exists and is active.
+
+    This only fetches the user itself, not its roles or teams, so it's much
+    cheaper than authenticating the user again.
+
+    Args:
+        user_id: The ID of the user.
+
+    Returns:
+        Whether the user exists and is active.
+    """
+    try:
+        return zen_store().get_auth_user(user_id).active
+    except KeyError:
+        return False
+
+
+def _authenticate_access_token(
+    token: str,
+) -> Tuple[Optional[AuthContext], Optional[JWTToken]]:
+    """Authenticates an access token, using cached results if possible.
+
+    Args:
+        token: The encoded JWT access token.
+
+    Returns:
+        The authentication context of the user (`None` if the user could not
+        be authenticated) and the decoded token (`None` if the token is
+        invalid).
+    """
+    if auth_cache is not None:
+        found, cached = auth_cache.get(CachedEntityType.AUTH_CONTEXT, token)
+        if found:
+            auth_context, access_token, expires_at = cached
+            if (
+                expires_at is None or expires_at > time.time()
+            ) and _is_user_active(auth_context.user.id):
+                return auth_context, access_token
+
+    auth_context = authenticate_credentials(access_token=token)
+    try:
+        access_token = JWTToken.decode(
+            token_type=JWTTokenType.ACCESS_TOKEN, token=token
+        )
+    except AuthorizationException:
+        return None, None
+
+    if auth_cache is not None and auth_context is not None:
+        # import here to keep these dependencies out of the client
+        from jose import jwt
+
+        # The token was already verified, so the claims can be trusted.
+        expires_at = jwt.get_unverified_claims(token).get("exp")
+        auth_cache.set(
+            CachedEntityType.AUTH_CONTEXT,
+            token,
+            (auth_context, access_token, expires_at),
+        )
+    return auth_context, access_token
+
+
 def http_authentication(
     security_scopes: SecurityScopes,
     credentials: HTTPBasicCredentials = Depends(HTTPBasic()),
@@ -156,9 +345,11 @@ def http_authentication(
     Raises:
         HTTPException: If the user credentials could not be authenticated.
     """
-    auth_context = authenticate_credentials(
-        user_name_or_id=credentials.username, password=credentials.password
-    )
+    with _measure_authentication():
+        auth_context = authenticate_credentials(
+            user_name_or_id=credentials.username,
+            password=credentials.password,
+        )
     if auth_context is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -197,13 +388,10 @@ def oauth2_password_bearer_authentication(
         authenticate_value = f'Bearer scope="{security_scopes.scope_str}"'
     else:
         authenticate_value = "Bearer"
-    auth_context = authenticate_credentials(access_token=token)
+    with _measure_authentication():
+        auth_context, access_token = _authenticate_access_token(token)
 
-    try:
-        access_token = JWTToken.decode(
-            token_type=JWTTokenType.ACCESS_TOKEN, token=token
-        )
-    except AuthorizationException:
+    if access_token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
@@ -239,7 +427,10 @@ def no_authentication(security_scopes: SecurityScopes) -> AuthContext:
     Raises:
         HTTPException: If the default user is not available.
     """
-    auth_context = authenticate_credentials(user_name_or_id=DEFAULT_USERNAME)
+    with _measure_authentication():
+        auth_context = authenticate_credentials(
+            user_name_or_id=DEFAULT_USERNAME
+        )
 
     if auth_context is None:
         raise HTTPException(
@@ -24,7 +24,9 @@ from zenml.constants import (
     ENV_ZENML_DISABLE_DATABASE_MIGRATION,
     ENV_ZENML_LOCAL_STORES_PATH,
     ENV_ZENML_SERVER_DEPLOYMENT_TYPE,
+    ENV_ZENML_SERVER_WORKERS,
     LOCAL_STORES_DIRECTORY_NAME,
+    SERVER_WORKERS,
     ZEN_SERVER_ENTRYPOINT,
 )
 from zenml.enums import StoreType
@@ -190,6 +192,7 @@ class DockerZenServer(ContainerService):
             LOCAL_STORES_DIRECTORY_NAME,
         )
         env[ENV_ZENML_DISABLE_DATABASE_MIGRATION] = "True"
+        env[ENV_ZENML_SERVER_WORKERS] = str(SERVER_WORKERS)
 
         return cmd, env
 
@@ -224,6 +227,7 @@ class DockerZenServer(ContainerService):
                 ZEN_SERVER_ENTRYPOINT,
                 host="0.0.0.0",
                 port=self.endpoint.config.port,
+                workers=SERVER_WORKERS,
                 log_level="info",
             )
         except KeyboardInterrupt:
@@ -0,0 +1,316 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Middleware for the ZenML server."""
+
+import importlib
+import zlib
+from typing import Any, Callable, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from zenml.constants import MAX_DECOMPRESSED_REQUEST_SIZE
+from zenml.zen_server.utils import error_detail
+
+
+class GzipRequestMiddleware:
+    """ASGI middleware that decompresses gzip-encoded request bodies.
+
+    Clients can send large request bodies (e.g. pipeline deployments) with a
+    `Content-Encoding: gzip` header. The body gets decompressed before it is
+    passed on to the route handlers, so these don't need to be aware of the
+    compression. The body is decompressed incrementally while it is received
+    and rejected once it exceeds the maximum size, as this happens before
+    the request is authenticated.
+    """
+
+    def __init__(
+        self, app: ASGIApp, max_size: int = MAX_DECOMPRESSED_REQUEST_SIZE
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            max_size: Maximum size in bytes of the decompressed body.
+        """
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Decompresses the request body if necessary and calls the app.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("content-encoding", "").lower() != "gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # A window size of 16 + 15 bits only accepts gzip-compressed data.
+        decompressor = zlib.decompressobj(31)
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                data = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                while data and not decompressor.eof:
+                    # Decompress at most one byte more than allowed, so
+                    # oversized bodies never get decompressed completely.
+                    chunk = decompressor.decompress(
+                        data, max_length=self.max_size - size + 1
+                    )
+                    size += len(chunk)
+                    if size > self.max_size:
+                        response = JSONResponse(
+                            status_code=413,
+                            content={
+                                "detail": error_detail(
+                                    ValueError(
+                                        "Decompressed request body exceeds "
+                                        f"the maximum size of {self.max_size} "
+                                        "bytes."
+                                    )
+                                )
+                            },
+                        )
+                        await response(scope, receive, send)
+                        return
+                    chunks.append(chunk)
+                    data = decompressor.unconsumed_tail
+            if not decompressor.eof:
+                raise EOFError("Compressed body ended before the end marker.")
+        except (EOFError, zlib.error) as e:
+            response = JSONResponse(
+                status_code=400,
+                content={
+                    "detail": error_detail(
+                        ValueError(f"Invalid gzip-encoded request body: {e}")
+                    )
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        body = b"".join(chunks)
+
+        raw_headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        raw_headers.append((b"content-length", str(len(body)).encode()))
+        scope = dict(scope, headers=raw_headers)
+
+        body_sent = False
+
+        async def _receive() -> Message:
+            """Returns the decompressed body.
+
+            Returns:
+                The ASGI message containing the decompressed body.
+            """
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, _receive, send)
+
+
+# Response encodings in order of preference.
+BROTLI_ENCODING = "br"
+GZIP_ENCODING = "gzip"
+
+
+def _get_brotli_module() -> Optional[Any]:
+    """Imports the optional `brotli` package.
+
+    Returns:
+        The `brotli` module or `None` if it is not installed.
+    """
+    try:
+        return importlib.import_module("brotli")
+    except ImportError:
+        return None
+
+
+def _create_compressor(
+    encoding: str, compresslevel: int
+) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """Creates a streaming compressor for the given encoding.
+
+    Args:
+        encoding: The content encoding, either `gzip` or `br`.
+        compresslevel: The gzip compression level.
+
+    Returns:
+        A function that compresses a chunk of data and a function that
+        flushes the remaining compressed data at the end of the stream.
+    """
+    if encoding == BROTLI_ENCODING:
+        brotli = _get_brotli_module()
+        assert brotli is not None
+        # Use a medium quality, the maximum quality is too slow for
+        # on-the-fly compression of API responses.
+        compressor = brotli.Compressor(quality=5)
+        return compressor.process, compressor.finish
+
+    # A window size of 16 + 15 bits produces a gzip header and trailer.
+    gzip_compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)
+    return gzip_compressor.compress, gzip_compressor.flush
+
+
+class CompressedResponseMiddleware:
+    """ASGI middleware that compresses response bodies.
+
+    Responses are compressed with brotli if the client accepts it and the
+    optional `brotli` package is installed, and with gzip otherwise. Small
+    responses and responses that already have a content encoding are sent
+    unchanged.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            minimum_size: Minimum size in bytes of response bodies to
+                compress.
+            compresslevel: The gzip compression level.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.brotli_available = _get_brotli_module() is not None
+
+    def _select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """Selects the response encoding based on the `Accept-Encoding` header.
+
+        Args:
+            accept_encoding: The value of the `Accept-Encoding` header.
+
+        Returns:
+            The response encoding or `None` if the response should not be
+            compressed.
+        """
+        accepted = set()
+        for value in accept_encoding.lower().split(","):
+            encoding, _, params = value.strip().partition(";")
+            if params.replace(" ", "") in ("q=0", "q=0.0"):
+                continue
+            accepted.add(encoding.strip())
+
+        if self.brotli_available and BROTLI_ENCODING in accepted:
+            return BROTLI_ENCODING
+        if GZIP_ENCODING in accepted:
+            return GZIP_ENCODING
+        return None
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Calls the app and compresses its response if necessary.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        selected: str = encoding
+        initial_message: Message = {}
+        compress: Optional[Callable[[bytes], bytes]] = None
+        flush: Optional[Callable[[], bytes]] = None
+        started = False
+
+        async def _send(message: Message) -> None:
+            """Compresses the response body messages.
+
+            Args:
+                message: The ASGI message sent by the app.
+            """
+            nonlocal initial_message, compress, flush, started
+            if message["type"] == "http.response.start":
+                # The headers can only be sent once it is known whether the
+                # response will be compressed.
+                initial_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if not started:
+                started = True
+                headers = MutableHeaders(raw=initial_message["headers"])
+                if "content-encoding" in headers or (
+                    len(body) < self.minimum_size and not more_body
+                ):
+                    await send(initial_message)
+                    await send(message)
+                    return
+
+                compress, flush = _create_compressor(
+                    selected, compresslevel=self.compresslevel
+                )
+                headers["Content-Encoding"] = selected
+                headers.add_vary_header("Accept-Encoding")
+                del headers["Content-Length"]
+                body = compress(body)
+                if not more_body:
+                    body += flush()
+                    headers["Content-Length"] = str(len(body))
+                await send(initial_message)
+                await send(dict(message, body=body))
+                return
+
+            if compress is None or flush is None:
+                # The response is sent uncompressed.
+                await send(message)
+                return
+
+            body = compress(body)
+            if not more_body:
+                body += flush()
+            await send(dict(message, body=body))
+
+        await self.app(scope, receive, _send)
@@ -13,11 +13,12 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
+from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
-from zenml.constants import API, ARTIFACTS, VERSION_1
+from zenml.constants import API, ARTIFACTS, BATCH, VERSION_1
 from zenml.enums import PermissionType
 from zenml.models import (
     ArtifactFilterModel,
@@ -27,6 +28,7 @@ from zenml.models import (
 from zenml.models.page_model import Page
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.utils import (
+    async_zen_store,
     error_response,
     handle_exceptions,
     make_dependable,
@@ -46,7 +48,7 @@ router = APIRouter(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def list_artifacts(
+async def list_artifacts(
     artifact_filter_model: ArtifactFilterModel = Depends(
         make_dependable(ArtifactFilterModel)
     ),
@@ -61,7 +63,7 @@ def list_artifacts(
     Returns:
         The artifacts according to query filters.
     """
-    return zen_store().list_artifacts(
+    return await async_zen_store().list_artifacts(
         artifact_filter_model=artifact_filter_model
     )
 
@@ -87,13 +89,34 @@ def create_artifact(
     return zen_store().create_artifact(artifact)
 
 
+@router.post(
+    BATCH,
+    response_model=List[ArtifactResponseModel],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def batch_create_artifacts(
+    artifacts: List[ArtifactRequestModel],
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> List[ArtifactResponseModel]:
+    """Create multiple artifacts in one transaction.
+
+    Args:
+        artifacts: The artifacts to create.
+
+    Returns:
+        The created artifacts.
+    """
+    return zen_store().batch_create_artifacts(artifacts)
+
+
 @router.get(
     "/{artifact_id}",
     response_model=ArtifactResponseModel,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def get_artifact(
+async def get_artifact(
     artifact_id: UUID,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> ArtifactResponseModel:
@@ -105,7 +128,7 @@ def get_artifact(
     Returns:
         The artifact with the given ID.
     """
-    return zen_store().get_artifact(artifact_id)
+    return await async_zen_store().get_artifact(artifact_id)
 
 
 @router.delete(
@@ -26,7 +26,11 @@ from zenml.models import (
     RoleUpdateModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidates_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -71,6 +75,7 @@ def list_roles(
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def create_role(
     role: RoleRequestModel,
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -115,6 +120,7 @@ def get_role(
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def update_role(
     role_id: UUID,
     role_update: RoleUpdateModel,
@@ -139,6 +145,7 @@ def update_role(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def delete_role(
     role_name_or_id: Union[str, UUID],
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -12,15 +12,18 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
-from typing import Any, Dict
+import hashlib
+from typing import Any, Dict, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
+from fastapi.responses import JSONResponse
 
 from zenml.constants import (
     API,
     GRAPH,
     PIPELINE_CONFIGURATION,
+    RUN_DAG_CACHE_SIZE,
     RUNS,
     STATUS,
     STEPS,
@@ -34,15 +37,20 @@ from zenml.models import (
     StepRunFilterModel,
     StepRunResponseModel,
 )
+from zenml.models.filter_models import get_excluded_fields
 from zenml.models.page_model import Page
 from zenml.post_execution.lineage.lineage_graph import LineageGraph
+from zenml.post_execution.lineage.node import StepNode
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.utils import (
+    async_zen_store,
     error_response,
     handle_exceptions,
     make_dependable,
+    project_response,
     zen_store,
 )
+from zenml.zen_stores.zen_store_cache import CachedEntityType, ZenStoreCache
 
 router = APIRouter(
     prefix=API + VERSION_1 + RUNS,
@@ -50,6 +58,13 @@ router = APIRouter(
     responses={401: error_response},
 )
 
+# The serialized DAGs of runs without running steps are cached. Output
+# metadata can still be published in the background after a step finished,
+# so the cached DAGs expire after a short time.
+run_dag_cache: Optional[ZenStoreCache] = (
+    ZenStoreCache(max_size=RUN_DAG_CACHE_SIZE) if RUN_DAG_CACHE_SIZE else None
+)
+
 
 @router.get(
     "",
@@ -57,12 +72,12 @@ router = APIRouter(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def list_runs(
+async def list_runs(
     runs_filter_model: PipelineRunFilterModel = Depends(
         make_dependable(PipelineRunFilterModel)
     ),
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> Page[PipelineRunResponseModel]:
+) -> Union[Page[PipelineRunResponseModel], JSONResponse]:
     """Get pipeline runs according to query filters.
 
     Args:
@@ -71,7 +86,13 @@ def list_runs(
     Returns:
         The pipeline runs according to query filters.
     """
-    return zen_store().list_runs(runs_filter_model=runs_filter_model)
+    excluded_fields = runs_filter_model.get_excluded_fields(
+        PipelineRunResponseModel
+    )
+    return project_response(
+        await async_zen_store().list_runs(runs_filter_model=runs_filter_model),
+        excluded_fields,
+    )
 
 
 @router.get(
@@ -80,19 +101,29 @@ def list_runs(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def get_run(
+async def get_run(
     run_id: UUID,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> PipelineRunResponseModel:
+) -> Union[PipelineRunResponseModel, JSONResponse]:
     """Get a specific pipeline run using its ID.
 
     Args:
         run_id: ID of the pipeline run to get.
+        fields: Comma-separated list of fields to include in the response.
+        exclude: Comma-separated list of fields to exclude from the response.
 
     Returns:
         The pipeline run.
     """
-    return zen_store().get_run(run_name_or_id=run_id)
+    excluded_fields = get_excluded_fields(
+        PipelineRunResponseModel, fields=fields, exclude=exclude
+    )
+    return project_response(
+        await async_zen_store().get_run(run_name_or_id=run_id),
+        excluded_fields,
+    )
 
 
 @router.put(
@@ -143,22 +174,57 @@ def delete_run(
 @handle_exceptions
 def get_run_dag(
     run_id: UUID,
+    request: Request,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> LineageGraph:
+) -> Response:
     """Get the DAG for a given pipeline run.
 
+    The response contains an `ETag` header. If the `If-None-Match` header of
+    the request matches this ETag, an empty `304 Not Modified` response is
+    returned instead.
+
     Args:
         run_id: ID of the pipeline run to use to get the DAG.
+        request: The request.
 
     Returns:
         The DAG for a given pipeline run.
     """
-    from zenml.post_execution.pipeline_run import PipelineRunView
-
-    run = zen_store().get_run(run_name_or_id=run_id)
-    graph = LineageGraph()
-    graph.generate_run_nodes_and_edges(PipelineRunView(run))
-    return graph
+    store = zen_store()
+    is_finished = store.get_run(run_name_or_id=run_id).status.is_finished
+
+    cached_dag: Optional[Tuple[str, bytes]] = None
+    if run_dag_cache and is_finished:
+        found, value = run_dag_cache.get(CachedEntityType.RUN_DAG, run_id)
+        if found:
+            cached_dag = value
+
+    if cached_dag is not None:
+        etag, content = cached_dag
+    else:
+        dag = store.get_run_dag(run_id)
+        content = dag.json().encode()
+        etag = f'"{hashlib.sha256(content).hexdigest()}"'
+        # A run is failed as soon as one of its steps failed, even if other
+        # steps are still running. The DAG of such a run can still change.
+        has_running_steps = any(
+            isinstance(node, StepNode)
+            and node.data.status == ExecutionStatus.RUNNING
+            for node in dag.nodes
+        )
+        if run_dag_cache and is_finished and not has_running_steps:
+            run_dag_cache.set(
+                CachedEntityType.RUN_DAG, run_id, (etag, content)
+            )
+
+    headers = {"ETag": etag}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=content, media_type="application/json", headers=headers
+    )
 
 
 @router.get(
@@ -172,7 +238,7 @@ def get_run_steps(
         make_dependable(StepRunFilterModel)
     ),
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> Page[StepRunResponseModel]:
+) -> Union[Page[StepRunResponseModel], JSONResponse]:
     """Get all steps for a given pipeline run.
 
     Args:
@@ -182,7 +248,12 @@ def get_run_steps(
     Returns:
         The steps for a given pipeline run.
     """
-    return zen_store().list_run_steps(step_run_filter_model)
+    excluded_fields = step_run_filter_model.get_excluded_fields(
+        StepRunResponseModel
+    )
+    return project_response(
+        zen_store().list_run_steps(step_run_filter_model), excluded_fields
+    )
 
 
 @router.get(
@@ -212,7 +283,7 @@ def get_pipeline_configuration(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def get_run_status(
+async def get_run_status(
     run_id: UUID,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> ExecutionStatus:
@@ -224,4 +295,26 @@ def get_run_status(
     Returns:
         The status of the pipeline run.
     """
-    return zen_store().get_run(run_id).status
+    run = await async_zen_store().get_run(run_name_or_id=run_id)
+    return run.status
+
+
+@router.put(
+    "/{run_id}" + STATUS,
+    response_model=PipelineRunResponseModel,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def update_run_status_from_steps(
+    run_id: UUID,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> PipelineRunResponseModel:
+    """Updates the status of a pipeline run from the status of its steps.
+
+    Args:
+        run_id: ID of the pipeline run to update.
+
+    Returns:
+        The updated pipeline run.
+    """
+    return zen_store().update_run_status_from_steps(run_id=run_id)
@@ -13,11 +13,18 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for authentication (login)."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Security
 
 import zenml
-from zenml.constants import API, INFO, VERSION_1
+from zenml.constants import API, AUTH, INFO, STATISTICS, VERSION_1
+from zenml.enums import PermissionType
 from zenml.models.server_models import ServerModel
+from zenml.zen_server.auth import (
+    AuthContext,
+    AuthStatistics,
+    authorize,
+    get_auth_statistics,
+)
 from zenml.zen_server.utils import error_response, handle_exceptions, zen_store
 
 router = APIRouter(
@@ -50,3 +57,22 @@ def server_info() -> ServerModel:
         Information about the server.
     """
     return zen_store().get_store_info()
+
+
+@router.get(
+    AUTH + STATISTICS,
+    response_model=AuthStatistics,
+    responses={401: error_response, 422: error_response},
+)
+@handle_exceptions
+def auth_statistics(
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> AuthStatistics:
+    """Get the authentication cache and latency statistics of the server.
+
+    The statistics are collected per server process.
+
+    Returns:
+        The authentication statistics.
+    """
+    return get_auth_statistics()
@@ -13,25 +13,39 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
+from fastapi.responses import JSONResponse
 
-from zenml.constants import API, STATUS, STEP_CONFIGURATION, STEPS, VERSION_1
+from zenml.constants import (
+    API,
+    CACHED,
+    FINALIZE,
+    STATUS,
+    STEP_CONFIGURATION,
+    STEPS,
+    VERSION_1,
+)
 from zenml.enums import ExecutionStatus, PermissionType
+from zenml.exceptions import IllegalOperationError
 from zenml.models import (
     StepRunFilterModel,
+    StepRunFinalizeModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
 )
+from zenml.models.filter_models import get_excluded_fields
 from zenml.models.page_model import Page
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.utils import (
+    async_zen_store,
     error_response,
     handle_exceptions,
     make_dependable,
+    project_response,
     zen_store,
 )
 
@@ -48,12 +62,12 @@ router = APIRouter(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def list_run_steps(
+async def list_run_steps(
     step_run_filter_model: StepRunFilterModel = Depends(
         make_dependable(StepRunFilterModel)
     ),
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> Page[StepRunResponseModel]:
+) -> Union[Page[StepRunResponseModel], JSONResponse]:
     """Get run steps according to query filters.
 
     Args:
@@ -63,8 +77,14 @@ def list_run_steps(
     Returns:
         The run steps according to query filters.
     """
-    return zen_store().list_run_steps(
-        step_run_filter_model=step_run_filter_model
+    excluded_fields = step_run_filter_model.get_excluded_fields(
+        StepRunResponseModel
+    )
+    return project_response(
+        await async_zen_store().list_run_steps(
+            step_run_filter_model=step_run_filter_model
+        ),
+        excluded_fields,
     )
 
 
@@ -89,25 +109,61 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.get(
+    CACHED,
+    response_model=Optional[StepRunResponseModel],  # type: ignore[arg-type]
+    responses={401: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_cached_step_run(
+    cache_key: str,
+    workspace_id: UUID,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> Optional[StepRunResponseModel]:
+    """Get the latest completed step run with the given cache key.
+
+    Args:
+        cache_key: The cache key of the step run.
+        workspace_id: The ID of the workspace in which to look for the step
+            run.
+
+    Returns:
+        The latest completed step run with the given cache key, or `None` if
+        no such step run exists.
+    """
+    return zen_store().get_cached_step_run(
+        cache_key=cache_key, workspace_id=workspace_id
+    )
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponseModel,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def get_step(
+async def get_step(
     step_id: UUID,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> StepRunResponseModel:
+) -> Union[StepRunResponseModel, JSONResponse]:
     """Get one specific step.
 
     Args:
         step_id: ID of the step to get.
+        fields: Comma-separated list of fields to include in the response.
+        exclude: Comma-separated list of fields to exclude from the response.
 
     Returns:
         The step.
     """
-    return zen_store().get_run_step(step_id)
+    excluded_fields = get_excluded_fields(
+        StepRunResponseModel, fields=fields, exclude=exclude
+    )
+    return project_response(
+        await async_zen_store().get_run_step(step_id), excluded_fields
+    )
 
 
 @router.put(
@@ -135,6 +191,56 @@ def update_step(
     )
 
 
+@router.post(
+    "/{step_id}" + FINALIZE,
+    response_model=StepRunResponseModel,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def finalize_step(
+    step_id: UUID,
+    step_finalization: StepRunFinalizeModel,
+    auth_context: AuthContext = Security(
+        authorize, scopes=[PermissionType.WRITE]
+    ),
+) -> StepRunResponseModel:
+    """Publishes the outputs and final status of a step.
+
+    Args:
+        step_id: ID of the step.
+        step_finalization: The outputs and status of the step.
+        auth_context: Authentication context.
+
+    Returns:
+        The updated step model.
+
+    Raises:
+        IllegalOperationError: If the artifact metadata is created outside of
+            the workspace of the step or for a user other than the
+            authenticated user.
+    """
+    if step_finalization.output_artifact_metadata:
+        step = zen_store().get_run_step(step_id)
+        metadata_of_outputs = step_finalization.output_artifact_metadata
+        for run_metadata in metadata_of_outputs.values():
+            for metadata in run_metadata:
+                if metadata.workspace != step.workspace.id:
+                    raise IllegalOperationError(
+                        "Creating run metadata outside of the workspace of "
+                        f"step `{step_id}` is not supported."
+                    )
+
+                if metadata.user != auth_context.user.id:
+                    raise IllegalOperationError(
+                        "Creating run metadata for a user other than "
+                        "yourself is not supported."
+                    )
+
+    return zen_store().finalize_run_step(
+        step_run_id=step_id, step_run_finalization=step_finalization
+    )
+
+
 @router.get(
     "/{step_id}" + STEP_CONFIGURATION,
     response_model=Dict[str, Any],
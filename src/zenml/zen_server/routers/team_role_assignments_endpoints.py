@@ -24,7 +24,11 @@ from zenml.models import (
     TeamRoleAssignmentResponseModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidates_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -71,6 +75,7 @@ def list_team_role_assignments(
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def create_team_role_assignment(
     role_assignment: TeamRoleAssignmentRequestModel,
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -118,6 +123,7 @@ def get_team_role_assignment(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def delete_team_role_assignment(
     role_assignment_id: UUID,
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -28,7 +28,11 @@ from zenml.models import (
     TeamUpdateModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidates_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -72,6 +76,7 @@ def list_teams(
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def create_team(
     team: TeamRequestModel,
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -116,6 +121,7 @@ def get_team(
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def update_team(
     team_id: UUID,
     team_update: TeamUpdateModel,
@@ -140,6 +146,7 @@ def update_team(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def delete_team(
     team_name_or_id: Union[str, UUID],
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -43,6 +43,7 @@ from zenml.zen_server.auth import (
     AuthContext,
     authenticate_credentials,
     authorize,
+    invalidates_auth_cache,
 )
 from zenml.zen_server.utils import (
     error_response,
@@ -103,6 +104,7 @@ def list_users(
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def create_user(
     user: UserRequestModel,
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -164,6 +166,7 @@ def get_user(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def update_user(
     user_name_or_id: Union[str, UUID],
     user_update: UserUpdateModel,
@@ -192,6 +195,7 @@ def update_user(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def activate_user(
     user_name_or_id: Union[str, UUID],
     user_update: UserUpdateModel,
@@ -230,6 +234,7 @@ def activate_user(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def deactivate_user(
     user_name_or_id: Union[str, UUID],
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -257,6 +262,7 @@ def deactivate_user(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def delete_user(
     user_name_or_id: Union[str, UUID],
     auth_context: AuthContext = Security(
@@ -290,6 +296,7 @@ def delete_user(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def email_opt_in_response(
     user_name_or_id: Union[str, UUID],
     user_response: UserUpdateModel,
@@ -381,6 +388,7 @@ def get_current_user(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
+@invalidates_auth_cache
 def update_myself(
     user: UserUpdateModel,
     auth_context: AuthContext = Security(
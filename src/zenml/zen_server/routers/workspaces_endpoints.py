@@ -12,13 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for workspaces."""
-from typing import Dict, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
 from zenml.constants import (
     API,
+    BATCH,
     GET_OR_CREATE,
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
@@ -71,7 +72,11 @@ from zenml.models import (
 )
 from zenml.models.page_model import Page
 from zenml.models.secret_models import SecretRequestModel, SecretResponseModel
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidates_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -225,6 +230,7 @@ def update_workspace(
     deprecated=True,
 )
 @handle_exceptions
+@invalidates_auth_cache
 def delete_workspace(
     workspace_name_or_id: Union[str, UUID],
     _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
@@ -962,6 +968,53 @@ def create_run_metadata(
     return zen_store().create_run_metadata(run_metadata=run_metadata)
 
 
+@router.post(
+    WORKSPACES + "/{workspace_name_or_id}" + RUN_METADATA + BATCH,
+    response_model=List[RunMetadataResponseModel],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def batch_create_run_metadata(
+    workspace_name_or_id: Union[str, UUID],
+    run_metadata: List[RunMetadataRequestModel],
+    auth_context: AuthContext = Security(
+        authorize, scopes=[PermissionType.WRITE]
+    ),
+) -> List[RunMetadataResponseModel]:
+    """Creates multiple run metadata entries in one transaction.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        run_metadata: The run metadata to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created run metadata.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in any of
+            the run metadata entries does not match the current workspace or
+            authenticated user.
+    """
+    workspace = zen_store().get_workspace(workspace_name_or_id)
+
+    for metadata in run_metadata:
+        if metadata.workspace != workspace.id:
+            raise IllegalOperationError(
+                "Creating run metadata outside of the workspace scope "
+                f"of this endpoint `{workspace_name_or_id}` is "
+                f"not supported."
+            )
+
+        if metadata.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating run metadata for a user other than yourself "
+                "is not supported."
+            )
+
+    return zen_store().batch_create_run_metadata(run_metadata=run_metadata)
+
+
 @router.post(
     WORKSPACES + "/{workspace_name_or_id}" + SECRETS,
     response_model=SecretResponseModel,
@@ -1032,19 +1085,38 @@ def get_workspace_statistics(
     """
     workspace = zen_store().get_workspace(workspace_name_or_id)
 
+    def _total(page: Page[Any]) -> int:
+        # The totals are always counted for the filters below.
+        assert page.total is not None
+        return page.total
+
     return {
-        "stacks": zen_store()
-        .list_stacks(StackFilterModel(scope_workspace=workspace.id))
-        .total,
-        "components": zen_store()
-        .list_stack_components(
-            ComponentFilterModel(scope_workspace=workspace.id)
-        )
-        .total,
-        "pipelines": zen_store()
-        .list_pipelines(PipelineFilterModel(scope_workspace=workspace.id))
-        .total,
-        "runs": zen_store()
-        .list_runs(PipelineRunFilterModel(scope_workspace=workspace.id))
-        .total,
+        "stacks": _total(
+            zen_store().list_stacks(
+                StackFilterModel(
+                    scope_workspace=workspace.id, count_total=True
+                )
+            )
+        ),
+        "components": _total(
+            zen_store().list_stack_components(
+                ComponentFilterModel(
+                    scope_workspace=workspace.id, count_total=True
+                )
+            )
+        ),
+        "pipelines": _total(
+            zen_store().list_pipelines(
+                PipelineFilterModel(
+                    scope_workspace=workspace.id, count_total=True
+                )
+            )
+        ),
+        "runs": _total(
+            zen_store().list_runs(
+                PipelineRunFilterModel(
+                    scope_workspace=workspace.id, count_total=True
+                )
+            )
+        ),
     }
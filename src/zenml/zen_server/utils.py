@@ -13,12 +13,27 @@
 #  permissions and limitations under the License.
 """Util functions for the ZenML Server."""
 
+import contextlib
 import inspect
 import os
 from functools import wraps
-from typing import Any, Callable, List, Optional, Type, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
 
 from zenml.config.global_config import GlobalConfiguration
@@ -32,8 +47,12 @@ from zenml.exceptions import (
     StackExistsError,
 )
 from zenml.logger import get_logger
+from zenml.models.page_model import Page
 from zenml.zen_stores.base_zen_store import BaseZenStore
 
+if TYPE_CHECKING:
+    from zenml.zen_stores.async_sql_zen_store import AsyncSqlZenStore
+
 logger = get_logger(__name__)
 
 
@@ -41,6 +60,7 @@ ROOT_URL_PATH = os.getenv(ENV_ZENML_SERVER_ROOT_URL_PATH, "")
 
 
 _zen_store: Optional[BaseZenStore] = None
+_async_zen_store: Optional["AsyncSqlZenStore"] = None
 
 
 def zen_store() -> BaseZenStore:
@@ -58,13 +78,28 @@ def zen_store() -> BaseZenStore:
     return _zen_store
 
 
+def async_zen_store() -> "AsyncSqlZenStore":
+    """Get the asynchronous store for the hot read endpoints.
+
+    Returns:
+        The asynchronous ZenML Store.
+
+    Raises:
+        RuntimeError: If the ZenML Store has not been initialized.
+    """
+    global _async_zen_store
+    if _async_zen_store is None:
+        raise RuntimeError("ZenML Store not initialized")
+    return _async_zen_store
+
+
 def initialize_zen_store() -> None:
     """Initialize the ZenML Store.
 
     Raises:
         ValueError: If the ZenML Store is using a REST back-end.
     """
-    global _zen_store
+    global _zen_store, _async_zen_store
 
     logger.debug("Initializing ZenML Store for FastAPI...")
     _zen_store = GlobalConfiguration().zen_store
@@ -80,6 +115,46 @@ def initialize_zen_store() -> None:
             "when trying to start the ZenML Server."
         )
 
+    from zenml.zen_stores.async_sql_zen_store import AsyncSqlZenStore
+    from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+    assert isinstance(_zen_store, SqlZenStore)
+    _async_zen_store = AsyncSqlZenStore(_zen_store)
+    if not _async_zen_store.uses_async_driver:
+        logger.debug(
+            "No async driver installed for the database of the ZenML Store, "
+            "running the asynchronous read endpoints in worker threads."
+        )
+
+
+def initialize_thread_limiter() -> None:
+    """Limit the number of concurrently running synchronous route handlers.
+
+    FastAPI runs synchronous route handlers in a thread pool. Each handler
+    uses at most one database connection at a time, so running more handlers
+    concurrently than the connection pool of this worker process allows only
+    makes them wait for a connection.
+    """
+    from anyio import to_thread
+
+    from zenml.zen_stores.sql_zen_store import (
+        SQLDatabaseDriver,
+        SqlZenStoreConfiguration,
+    )
+
+    config = zen_store().config
+    if (
+        isinstance(config, SqlZenStoreConfiguration)
+        and config.driver == SQLDatabaseDriver.MYSQL
+    ):
+        pool_size, max_overflow = config.get_pool_size()
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = pool_size + max_overflow
+        logger.debug(
+            "Running up to %d request handlers concurrently.",
+            limiter.total_tokens,
+        )
+
 
 class ErrorModel(BaseModel):
     """Base class for error responses."""
@@ -163,6 +238,7 @@ def unprocessable(error: Exception) -> HTTPException:
 
 
 F = TypeVar("F", bound=Callable[..., Any])
+M = TypeVar("M", bound=BaseModel)
 
 
 def handle_exceptions(func: F) -> F:
@@ -174,37 +250,60 @@ def handle_exceptions(func: F) -> F:
     Returns:
         Decorated function.
     """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_decorated(*args: Any, **kwargs: Any) -> Any:
+            with _convert_exceptions():
+                return await func(*args, **kwargs)
+
+        return cast(F, async_decorated)
 
     @wraps(func)
     def decorated(*args: Any, **kwargs: Any) -> Any:
-        try:
+        with _convert_exceptions():
             return func(*args, **kwargs)
-        except NotAuthorizedError as error:
-            logger.exception("Authorization error")
-            raise not_authorized(error) from error
-        except KeyError as error:
-            logger.exception("Entity not found")
-            raise not_found(error) from error
-        except (
-            StackExistsError,
-            StackComponentExistsError,
-            EntityExistsError,
-        ) as error:
-            logger.exception("Entity already exists")
-            raise conflict(error) from error
-        except IllegalOperationError as error:
-            logger.exception("Illegal operation")
-            raise forbidden(error) from error
-        except ValueError as error:
-            logger.exception("Validation error")
-            raise unprocessable(error) from error
-        except NotImplementedError as error:
-            logger.exception("Not implemented")
-            raise unprocessable(error) from error
 
     return cast(F, decorated)
 
 
+@contextlib.contextmanager
+def _convert_exceptions() -> Iterator[None]:
+    """Converts exceptions raised inside the context to HTTP errors.
+
+    Yields:
+        None.
+
+    Raises:
+        HTTPException: With the status code that corresponds to the
+            exception raised inside the context.
+    """
+    try:
+        yield
+    except NotAuthorizedError as error:
+        logger.exception("Authorization error")
+        raise not_authorized(error) from error
+    except KeyError as error:
+        logger.exception("Entity not found")
+        raise not_found(error) from error
+    except (
+        StackExistsError,
+        StackComponentExistsError,
+        EntityExistsError,
+    ) as error:
+        logger.exception("Entity already exists")
+        raise conflict(error) from error
+    except IllegalOperationError as error:
+        logger.exception("Illegal operation")
+        raise forbidden(error) from error
+    except ValueError as error:
+        logger.exception("Validation error")
+        raise unprocessable(error) from error
+    except NotImplementedError as error:
+        logger.exception("Not implemented")
+        raise unprocessable(error) from error
+
+
 # Code from https://github.com/tiangolo/fastapi/issues/1474#issuecomment-1160633178
 # to send 422 response when receiving invalid query parameters
 def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
@@ -239,3 +338,30 @@ def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
     init_cls_and_handle_errors.__signature__ = inspect.signature(cls)  # type: ignore[attr-defined]
 
     return init_cls_and_handle_errors
+
+
+def project_response(
+    result: M, excluded_fields: AbstractSet[str]
+) -> Union[M, JSONResponse]:
+    """Removes the excluded fields from a response.
+
+    FastAPI validates responses against the response model of the endpoint,
+    which fails if required fields are missing. Responses with excluded fields
+    are therefore serialized directly.
+
+    Args:
+        result: The model or page of models to return.
+        excluded_fields: The fields to exclude from the model or from each
+            item of the page.
+
+    Returns:
+        The unchanged result if no fields are excluded, otherwise a JSON
+        response without the excluded fields.
+    """
+    if not excluded_fields:
+        return result
+
+    exclude: Any = set(excluded_fields)
+    if isinstance(result, Page):
+        exclude = {"items": {"__all__": exclude}}
+    return JSONResponse(content=jsonable_encoder(result, exclude=exclude))
@@ -25,6 +25,10 @@ from starlette.responses import FileResponse
 
 import zenml
 from zenml.constants import API, HEALTH
+from zenml.zen_server.middleware import (
+    CompressedResponseMiddleware,
+    GzipRequestMiddleware,
+)
 from zenml.zen_server.routers import (
     artifacts_endpoints,
     auth_endpoints,
@@ -47,7 +51,12 @@ from zenml.zen_server.routers import (
     users_endpoints,
     workspaces_endpoints,
 )
-from zenml.zen_server.utils import ROOT_URL_PATH, initialize_zen_store
+from zenml.zen_server.utils import (
+    ROOT_URL_PATH,
+    async_zen_store,
+    initialize_thread_limiter,
+    initialize_zen_store,
+)
 
 DASHBOARD_DIRECTORY = "dashboard"
 
@@ -77,6 +86,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GzipRequestMiddleware)
+app.add_middleware(CompressedResponseMiddleware)
 
 
 @app.on_event("startup")
@@ -85,6 +96,13 @@ def initialize() -> None:
     # IMPORTANT: this needs to be done before the fastapi app starts, to avoid
     # race conditions
     initialize_zen_store()
+    initialize_thread_limiter()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Close the database connections of the asynchronous store."""
+    await async_zen_store().aclose()
 
 
 app.mount(
@@ -0,0 +1,496 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Asynchronous read client for a ZenML server.
+
+Example:
+    ```python
+    import asyncio
+
+    from zenml.client import Client
+    from zenml.models import StepRunFilterModel
+    from zenml.zen_stores.async_rest_zen_store import AsyncRestZenStore
+
+
+    async def list_steps(run_ids):
+        async with AsyncRestZenStore(Client().zen_store) as store:
+            return await asyncio.gather(
+                *(
+                    store.depaginate(
+                        store.list_run_steps,
+                        StepRunFilterModel(pipeline_run_id=run_id),
+                    )
+                    for run_id in run_ids
+                )
+            )
+    ```
+"""
+
+import asyncio
+import importlib.util
+from types import TracebackType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+import httpx
+
+from zenml.constants import (
+    API,
+    ARTIFACTS,
+    RUN_METADATA,
+    RUNS,
+    STEPS,
+    VERSION_1,
+)
+from zenml.exceptions import AuthorizationException
+from zenml.logger import get_logger
+from zenml.models import (
+    ArtifactFilterModel,
+    ArtifactResponseModel,
+    PipelineRunFilterModel,
+    PipelineRunResponseModel,
+    RunMetadataResponseModel,
+    StepRunFilterModel,
+    StepRunResponseModel,
+)
+from zenml.models.base_models import BaseResponseModel
+from zenml.models.filter_models import BaseFilterModel
+from zenml.models.page_model import Page
+from zenml.models.run_metadata_models import RunMetadataFilterModel
+from zenml.zen_stores.rest_zen_store import Json, RestZenStore
+
+logger = get_logger(__name__)
+
+AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
+AnyFilterModel = TypeVar("AnyFilterModel", bound=BaseFilterModel)
+
+DEFAULT_DEPAGINATION_CONCURRENCY = 10
+
+
+class AsyncRestZenStore:
+    """Asynchronous client for the read methods of a ZenML server.
+
+    This class wraps a `RestZenStore` and reuses its configuration,
+    authentication token and response handling. All requests are sent through
+    a single `httpx.AsyncClient`, which multiplexes concurrent requests over
+    HTTP/2 connections if the `h2` package is installed.
+    """
+
+    def __init__(self, store: RestZenStore) -> None:
+        """Initializes the async store.
+
+        Args:
+            store: The REST store to wrap.
+
+        Raises:
+            TypeError: If the store is not a REST store.
+        """
+        if not isinstance(store, RestZenStore):
+            raise TypeError(
+                "The asynchronous store can only be used with a ZenML server "
+                f"(REST store), got a store of type {type(store).__name__}."
+            )
+
+        self._store = store
+        self._client: Optional[httpx.AsyncClient] = None
+        self._auth_headers: Optional[Dict[str, str]] = None
+
+    @property
+    def url(self) -> str:
+        """The URL of the ZenML server.
+
+        Returns:
+            The URL of the ZenML server.
+        """
+        return self._store.url
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client used to send the requests.
+
+        Returns:
+            The HTTP client.
+        """
+        if self._client is None:
+            config = self._store.config
+            http2 = importlib.util.find_spec("h2") is not None
+            if not http2:
+                logger.debug(
+                    "The `h2` package is not installed, falling back to "
+                    "HTTP/1.1 for the asynchronous ZenML store."
+                )
+
+            limits = httpx.Limits(
+                max_connections=config.http_pool_maxsize,
+                max_keepalive_connections=config.http_pool_maxsize,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.url + API + VERSION_1,
+                timeout=config.http_timeout,
+                # Only failed connections are retried, as the client is only
+                # used for idempotent read requests that don't have any side
+                # effects.
+                transport=httpx.AsyncHTTPTransport(
+                    verify=config.verify_ssl,
+                    limits=limits,
+                    http2=http2,
+                    retries=config.http_max_retries,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes all open connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncRestZenStore":
+        """Enters the async context.
+
+        Returns:
+            The async store.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes all open connections when exiting the async context.
+
+        Args:
+            exc_type: The class of the exception.
+            exc_value: The instance of the exception.
+            traceback: The traceback of the exception.
+        """
+        await self.aclose()
+
+    # ----
+    # Runs
+    # ----
+
+    async def get_run(
+        self, run_name_or_id: Union[UUID, str]
+    ) -> PipelineRunResponseModel:
+        """Gets a pipeline run.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run to get.
+
+        Returns:
+            The pipeline run.
+        """
+        return await self._get_resource(
+            resource_id=run_name_or_id,
+            route=RUNS,
+            response_model=PipelineRunResponseModel,
+        )
+
+    async def list_runs(
+        self, runs_filter_model: PipelineRunFilterModel
+    ) -> Page[PipelineRunResponseModel]:
+        """List all pipeline runs matching the given filter criteria.
+
+        Args:
+            runs_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of pipeline runs matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=RUNS,
+            response_model=PipelineRunResponseModel,
+            filter_model=runs_filter_model,
+        )
+
+    # ---------
+    # Step runs
+    # ---------
+
+    async def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+        """Get a step run by ID.
+
+        Args:
+            step_run_id: The ID of the step run to get.
+
+        Returns:
+            The step run.
+        """
+        return await self._get_resource(
+            resource_id=step_run_id,
+            route=STEPS,
+            response_model=StepRunResponseModel,
+        )
+
+    async def list_run_steps(
+        self, step_run_filter_model: StepRunFilterModel
+    ) -> Page[StepRunResponseModel]:
+        """List all step runs matching the given filter criteria.
+
+        Args:
+            step_run_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of step runs matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=STEPS,
+            response_model=StepRunResponseModel,
+            filter_model=step_run_filter_model,
+        )
+
+    # ---------
+    # Artifacts
+    # ---------
+
+    async def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+        """Gets an artifact.
+
+        Args:
+            artifact_id: The ID of the artifact to get.
+
+        Returns:
+            The artifact.
+        """
+        return await self._get_resource(
+            resource_id=artifact_id,
+            route=ARTIFACTS,
+            response_model=ArtifactResponseModel,
+        )
+
+    async def list_artifacts(
+        self, artifact_filter_model: ArtifactFilterModel
+    ) -> Page[ArtifactResponseModel]:
+        """List all artifacts matching the given filter criteria.
+
+        Args:
+            artifact_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of artifacts matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=ARTIFACTS,
+            response_model=ArtifactResponseModel,
+            filter_model=artifact_filter_model,
+        )
+
+    # ------------
+    # Run Metadata
+    # ------------
+
+    async def list_run_metadata(
+        self,
+        run_metadata_filter_model: RunMetadataFilterModel,
+    ) -> Page[RunMetadataResponseModel]:
+        """List run metadata.
+
+        Args:
+            run_metadata_filter_model: All filter parameters including
+                pagination params.
+
+        Returns:
+            A page of run metadata matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=RUN_METADATA,
+            response_model=RunMetadataResponseModel,
+            filter_model=run_metadata_filter_model,
+        )
+
+    # ----------
+    # Pagination
+    # ----------
+
+    @staticmethod
+    async def depaginate(
+        list_method: Callable[
+            [AnyFilterModel], Awaitable[Page[AnyResponseModel]]
+        ],
+        filter_model: AnyFilterModel,
+        max_concurrency: int = DEFAULT_DEPAGINATION_CONCURRENCY,
+    ) -> List[AnyResponseModel]:
+        """Fetches all pages of a list method.
+
+        The first page is fetched to find out the total number of pages, all
+        remaining pages are then fetched concurrently.
+
+        Args:
+            list_method: The async list method to call, e.g.
+                `store.list_run_steps`.
+            filter_model: The filter model to pass to the list method. The
+                `page` and `cursor` attributes are ignored.
+            max_concurrency: Maximum number of pages to fetch at the same
+                time.
+
+        Returns:
+            The items of all pages.
+
+        Raises:
+            ValueError: If the maximum concurrency is not a positive integer.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"Invalid maximum concurrency `{max_concurrency}`, the value "
+                "needs to be a positive integer."
+            )
+
+        def _get_filter_model(page: int) -> AnyFilterModel:
+            """Creates the filter model to fetch a page.
+
+            Args:
+                page: The page to fetch.
+
+            Returns:
+                The filter model.
+            """
+            return filter_model.copy(
+                update={"page": page, "cursor": None, "count_total": True}
+            )
+
+        first_page = await list_method(_get_filter_model(1))
+        items = list(first_page.items)
+        if not first_page.total_pages or first_page.total_pages <= 1:
+            return items
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch_page(page: int) -> Page[AnyResponseModel]:
+            """Fetches a page while respecting the concurrency limit.
+
+            Args:
+                page: The page to fetch.
+
+            Returns:
+                The page.
+            """
+            async with semaphore:
+                return await list_method(_get_filter_model(page))
+
+        pages = await asyncio.gather(
+            *(
+                _fetch_page(page)
+                for page in range(2, first_page.total_pages + 1)
+            )
+        )
+        for page in pages:
+            items.extend(page.items)
+        return items
+
+    # ---------------
+    # Request helpers
+    # ---------------
+
+    async def _get_auth_headers(self) -> Dict[str, str]:
+        """Gets the authentication headers.
+
+        The token is shared with the wrapped REST store. If the store did not
+        fetch a token yet, this is done in a separate thread to avoid
+        blocking the event loop.
+
+        Returns:
+            The authentication headers.
+        """
+        if self._auth_headers is None:
+            token = await asyncio.get_running_loop().run_in_executor(
+                None, self._store._get_auth_token
+            )
+            self._auth_headers = {"Authorization": "Bearer " + token}
+        return self._auth_headers
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Json:
+        """Make a GET request to the given endpoint path.
+
+        Args:
+            path: The path to the endpoint.
+            params: The query parameters to pass to the endpoint.
+
+        Returns:
+            The response body.
+        """
+        logger.debug(f"Sending async GET request to {path}...")
+        params = {k: str(v) for k, v in params.items()} if params else {}
+        response = await self.client.get(
+            path, params=params, headers=await self._get_auth_headers()
+        )
+        try:
+            return self._store._handle_response(response)
+        except AuthorizationException:
+            # The authentication token could have expired; refresh it and try
+            # again
+            self._auth_headers = None
+            response = await self.client.get(
+                path, params=params, headers=await self._get_auth_headers()
+            )
+            return self._store._handle_response(response)
+
+    async def _get_resource(
+        self,
+        resource_id: Union[str, UUID],
+        route: str,
+        response_model: Type[AnyResponseModel],
+    ) -> AnyResponseModel:
+        """Retrieve a single resource.
+
+        Args:
+            resource_id: The ID of the resource to retrieve.
+            route: The resource REST API route to use.
+            response_model: Model to use to serialize the response body.
+
+        Returns:
+            The retrieved resource.
+        """
+        body = await self.get(f"{route}/{str(resource_id)}")
+        return response_model.parse_obj(body)
+
+    async def _list_paginated_resources(
+        self,
+        route: str,
+        response_model: Type[AnyResponseModel],
+        filter_model: BaseFilterModel,
+    ) -> Page[AnyResponseModel]:
+        """Retrieve a list of resources filtered by some criteria.
+
+        Args:
+            route: The resource REST API route to use.
+            response_model: Model to use to serialize the response body.
+            filter_model: The filter model to use for the list query.
+
+        Returns:
+            List of retrieved resources matching the filter criteria.
+        """
+        # leave out filter params that are not supplied
+        body = await self.get(
+            route, params=filter_model.dict(exclude_none=True)
+        )
+        return RestZenStore._parse_page(
+            body, response_model=response_model, filter_model=filter_model
+        )
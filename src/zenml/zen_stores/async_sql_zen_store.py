@@ -0,0 +1,326 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Asynchronous read access to a SQL ZenML store.
+
+The ZenML server uses this store for its most frequently called read
+endpoints. If the async database driver for the configured database is
+installed (`pip install "zenml[server-async]"`), the queries run on an async
+SQLAlchemy engine and don't block a thread while waiting for the database.
+Otherwise, the synchronous store is called in a worker thread.
+"""
+
+import importlib.util
+import ssl
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+from uuid import UUID
+
+from anyio import to_thread
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from zenml.logger import get_logger
+from zenml.models import (
+    ArtifactFilterModel,
+    ArtifactResponseModel,
+    PipelineRunFilterModel,
+    PipelineRunResponseModel,
+    StepRunFilterModel,
+    StepRunResponseModel,
+)
+from zenml.models.page_model import Page
+from zenml.zen_stores.sql_zen_store import SQLDatabaseDriver, SqlZenStore
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+# SQLAlchemy driver name and module of the async driver for each database.
+ASYNC_DRIVERS = {
+    SQLDatabaseDriver.SQLITE: ("sqlite+aiosqlite", "aiosqlite"),
+    SQLDatabaseDriver.MYSQL: ("mysql+aiomysql", "aiomysql"),
+}
+
+
+def _get_ssl_context(ssl_args: Dict[str, Any]) -> ssl.SSLContext:
+    """Creates the SSL context for the async MySQL driver.
+
+    `pymysql` accepts the SSL settings as a dictionary, `aiomysql` expects an
+    SSL context instead. The context is configured the same way `pymysql`
+    configures it.
+
+    Args:
+        ssl_args: The SSL settings of the synchronous engine.
+
+    Returns:
+        The SSL context.
+    """
+    ca = ssl_args.get("ca")
+    context = ssl.create_default_context(cafile=ca)
+    context.check_hostname = ca is not None and ssl_args.get(
+        "check_hostname", True
+    )
+    context.verify_mode = ssl.CERT_NONE if ca is None else ssl.CERT_REQUIRED
+    if "cert" in ssl_args:
+        context.load_cert_chain(ssl_args["cert"], keyfile=ssl_args.get("key"))
+    return context
+
+
+class AsyncSqlZenStore:
+    """Asynchronous access to the hot read methods of a SQL ZenML store.
+
+    This class wraps a `SqlZenStore` and reuses its configuration as well as
+    its queries and model conversions. These run through
+    `AsyncSession.run_sync(...)`, which executes them on the async engine.
+    """
+
+    def __init__(self, store: SqlZenStore) -> None:
+        """Initializes the async store.
+
+        Args:
+            store: The SQL store to wrap.
+
+        Raises:
+            TypeError: If the store is not a SQL store.
+        """
+        if not isinstance(store, SqlZenStore):
+            raise TypeError(
+                "The asynchronous store can only be used with a SQL store, "
+                f"got a store of type {type(store).__name__}."
+            )
+
+        # This is guaranteed by the validator of the store configuration.
+        assert store.config.driver is not None
+
+        self._store = store
+        self._drivername, self._driver_module = ASYNC_DRIVERS[
+            store.config.driver
+        ]
+        self._engine: Optional[AsyncEngine] = None
+
+    @property
+    def uses_async_driver(self) -> bool:
+        """Whether the async driver of the configured database is installed.
+
+        Returns:
+            Whether the queries run on an async engine.
+        """
+        return importlib.util.find_spec(self._driver_module) is not None
+
+    @property
+    def engine(self) -> Optional[AsyncEngine]:
+        """The async SQLAlchemy engine.
+
+        The engine is configured like the engine of the synchronous store,
+        but its connection pool only gets half of the connections of this
+        worker process. Together with the limit of concurrently running
+        queries (see `_run(...)`), this keeps both engines within the
+        connection budget of the worker.
+
+        Returns:
+            The async engine, or `None` if the async driver is not installed.
+        """
+        if self._engine is None and self.uses_async_driver:
+            config = self._store.config
+            url, connect_args, engine_args = config.get_sqlmodel_config()
+            if "ssl" in connect_args:
+                connect_args["ssl"] = _get_ssl_context(connect_args["ssl"])
+            if "pool_size" in engine_args:
+                engine_args["pool_size"] = max(
+                    engine_args["pool_size"] // 2, 1
+                )
+                engine_args["max_overflow"] = engine_args["max_overflow"] // 2
+
+            self._engine = create_async_engine(
+                make_url(url).set(drivername=self._drivername),
+                connect_args=connect_args,
+                **engine_args,
+            )
+            logger.debug(
+                "Created async database engine with driver `%s`.",
+                self._drivername,
+            )
+        return self._engine
+
+    async def aclose(self) -> None:
+        """Closes all open database connections."""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    async def __aenter__(self) -> "AsyncSqlZenStore":
+        """Enters the async context.
+
+        Returns:
+            The async store.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes all open connections when exiting the async context.
+
+        Args:
+            exc_type: The class of the exception.
+            exc_value: The instance of the exception.
+            traceback: The traceback of the exception.
+        """
+        await self.aclose()
+
+    async def _run(self, func: Callable[[Session], R]) -> R:
+        """Runs a function of the synchronous store in a database session.
+
+        Queries on the async engine take a token of the thread limiter of
+        the synchronous route handlers (see `initialize_thread_limiter()` of
+        the ZenML server), so synchronous and asynchronous handlers together
+        don't use more connections at a time than this worker has.
+
+        Args:
+            func: The function to run. It gets passed the session.
+
+        Returns:
+            The return value of the function.
+        """
+        engine = self.engine
+        if engine is None:
+
+            def _run_with_sync_session() -> R:
+                with Session(self._store.engine) as session:
+                    return func(session)
+
+            # This already takes a token of the thread limiter.
+            return await to_thread.run_sync(_run_with_sync_session)
+
+        async with to_thread.current_default_thread_limiter():
+            async with AsyncSession(engine) as session:
+                return await session.run_sync(func)
+
+    # ----
+    # Runs
+    # ----
+
+    async def get_run(
+        self, run_name_or_id: Union[str, UUID]
+    ) -> PipelineRunResponseModel:
+        """Gets a pipeline run.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run to get.
+
+        Returns:
+            The pipeline run.
+        """
+        return await self._run(
+            lambda session: self._store._get_run(
+                run_name_or_id, session=session
+            )
+        )
+
+    async def list_runs(
+        self, runs_filter_model: PipelineRunFilterModel
+    ) -> Page[PipelineRunResponseModel]:
+        """List all pipeline runs matching the given filter criteria.
+
+        Args:
+            runs_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all pipeline runs matching the filter criteria.
+        """
+        return await self._run(
+            lambda session: self._store._list_runs(
+                runs_filter_model, session=session
+            )
+        )
+
+    # ---------
+    # Run steps
+    # ---------
+
+    async def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+        """Get a step run by ID.
+
+        Args:
+            step_run_id: The ID of the step run to get.
+
+        Returns:
+            The step run.
+        """
+        return await self._run(
+            lambda session: self._store._get_run_step(
+                step_run_id, session=session
+            )
+        )
+
+    async def list_run_steps(
+        self, step_run_filter_model: StepRunFilterModel
+    ) -> Page[StepRunResponseModel]:
+        """List all step runs matching the given filter criteria.
+
+        Args:
+            step_run_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all step runs matching the filter criteria.
+        """
+        return await self._run(
+            lambda session: self._store._list_run_steps(
+                step_run_filter_model, session=session
+            )
+        )
+
+    # ---------
+    # Artifacts
+    # ---------
+
+    async def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+        """Gets an artifact.
+
+        Args:
+            artifact_id: The ID of the artifact to get.
+
+        Returns:
+            The artifact.
+        """
+        return await self._run(
+            lambda session: self._store._get_artifact(
+                artifact_id, session=session
+            )
+        )
+
+    async def list_artifacts(
+        self, artifact_filter_model: ArtifactFilterModel
+    ) -> Page[ArtifactResponseModel]:
+        """List all artifacts matching the given filter criteria.
+
+        Args:
+            artifact_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all artifacts matching the filter criteria.
+        """
+        return await self._run(
+            lambda session: self._store._list_artifacts(
+                artifact_filter_model, session=session
+            )
+        )
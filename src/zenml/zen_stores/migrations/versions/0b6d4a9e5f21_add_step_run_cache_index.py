@@ -0,0 +1,30 @@
+"""Add step run cache index [0b6d4a9e5f21].
+
+Revision ID: 0b6d4a9e5f21
+Revises: 0.34.0
+Create Date: 2023-03-06 10:12:31.472019
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0b6d4a9e5f21"
+down_revision = "0.34.0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_cache_lookup",
+            ["workspace_id", "cache_key", "status", "created"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_step_run_cache_lookup")
@@ -12,8 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
+import copy
+import gzip
+import json
 import os
 import re
+import threading
 from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
@@ -22,17 +26,30 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from urllib.parse import urlparse
 from uuid import UUID
 
 import requests
 import urllib3
-from pydantic import BaseModel, root_validator, validator
+from pydantic import (
+    BaseModel,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveInt,
+    PrivateAttr,
+    parse_obj_as,
+    root_validator,
+    validator,
+)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import zenml
 from zenml.config.global_config import GlobalConfiguration
@@ -40,11 +57,15 @@ from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     API,
     ARTIFACTS,
+    BATCH,
+    CACHED,
     CURRENT_USER,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
+    FINALIZE,
     FLAVORS,
     GET_OR_CREATE,
+    GRAPH,
     INFO,
     LOGIN,
     PIPELINE_BUILDS,
@@ -56,6 +77,7 @@ from zenml.constants import (
     SCHEDULES,
     STACK_COMPONENTS,
     STACKS,
+    STATUS,
     STEPS,
     TEAM_ROLE_ASSIGNMENTS,
     TEAMS,
@@ -116,6 +138,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunFinalizeModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -146,6 +169,7 @@ from zenml.models.run_metadata_models import RunMetadataFilterModel
 from zenml.models.schedule_model import ScheduleFilterModel
 from zenml.models.server_models import ServerModel
 from zenml.models.team_models import TeamFilterModel, TeamUpdateModel
+from zenml.utils import pydantic_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, track
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
@@ -154,11 +178,21 @@ from zenml.zen_stores.base_zen_store import BaseZenStore
 from zenml.zen_stores.secrets_stores.rest_secrets_store import (
     RestSecretsStoreConfiguration,
 )
+from zenml.zen_stores.zen_store_cache import (
+    DEFAULT_ZEN_STORE_CACHE_SIZE,
+    CachedEntityType,
+    ZenStoreCache,
+    cached,
+    invalidates_cache,
+)
 
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
+    import httpx
+
     from zenml.models import UserAuthModel
+    from zenml.post_execution.lineage.lineage_graph import LineageGraph
 
 # type alias for possible json payloads (the Anys are recursive Json instances)
 Json = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
@@ -168,6 +202,15 @@ AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
 
 
 DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_CONNECTIONS = 10
+DEFAULT_HTTP_POOL_MAXSIZE = 32
+DEFAULT_HTTP_MAX_RETRIES = 3
+DEFAULT_HTTP_RETRY_BACKOFF_FACTOR = 0.5
+
+# Transient server errors (e.g. while the server is restarting) for which
+# idempotent requests are retried.
+HTTP_RETRY_STATUS_CODES = [502, 503, 504]
+HTTP_IDEMPOTENT_METHODS = ["HEAD", "GET", "PUT", "DELETE", "OPTIONS"]
 
 
 class RestZenStoreConfiguration(StoreConfiguration):
@@ -184,6 +227,24 @@ class RestZenStoreConfiguration(StoreConfiguration):
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
         http_timeout: The timeout to use for all requests.
+        http_pool_connections: The number of connection pools to cache.
+        http_pool_maxsize: The maximum number of connections to keep open
+            per connection pool. This should be at least the number of
+            threads that use the store concurrently.
+        http_max_retries: The maximum number of retries for failed
+            connections and for idempotent requests that fail with a
+            transient server error.
+        http_retry_backoff_factor: The backoff factor to apply between
+            retries.
+        http_compression_threshold: Request bodies larger than this number of
+            bytes are sent gzip-compressed. Compression is disabled by default
+            as older servers can't decompress request bodies, so only set
+            this if the server runs the same or a newer ZenML version.
+        cache_size: The maximum number of entities to cache on the client
+            side. Set to 0 to disable the cache.
+        cache_ttls: Time to live in seconds per cached entity type (e.g.
+            `stack` or `flavor`), overriding the default values. A value of
+            `None` caches the entities until they are evicted.
 
     """
 
@@ -196,6 +257,39 @@ class RestZenStoreConfiguration(StoreConfiguration):
     api_token: Optional[str] = None
     verify_ssl: Union[bool, str] = True
     http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    http_pool_connections: PositiveInt = DEFAULT_HTTP_POOL_CONNECTIONS
+    http_pool_maxsize: PositiveInt = DEFAULT_HTTP_POOL_MAXSIZE
+    http_max_retries: NonNegativeInt = DEFAULT_HTTP_MAX_RETRIES
+    http_retry_backoff_factor: NonNegativeFloat = (
+        DEFAULT_HTTP_RETRY_BACKOFF_FACTOR
+    )
+    http_compression_threshold: Optional[NonNegativeInt] = None
+    cache_size: NonNegativeInt = DEFAULT_ZEN_STORE_CACHE_SIZE
+    cache_ttls: Dict[str, Optional[float]] = {}
+
+    @validator("cache_ttls")
+    def validate_cache_ttls(
+        cls, cache_ttls: Dict[str, Optional[float]]
+    ) -> Dict[str, Optional[float]]:
+        """Validates that the cache TTLs refer to cacheable entity types.
+
+        Args:
+            cache_ttls: The cache TTLs to be validated.
+
+        Returns:
+            The validated cache TTLs.
+
+        Raises:
+            ValueError: If an entity type is not cacheable.
+        """
+        for entity_type in cache_ttls:
+            if entity_type not in CachedEntityType.values():
+                raise ValueError(
+                    f"Invalid cached entity type `{entity_type}`. Valid "
+                    f"entity types are: {CachedEntityType.values()}."
+                )
+
+        return cache_ttls
 
     @validator("secrets_store")
     def validate_secrets_store(
@@ -385,6 +479,22 @@ class RestZenStore(BaseZenStore):
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
     _session: Optional[requests.Session] = None
+    _session_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _cache: Optional[ZenStoreCache] = None
+
+    @property
+    def cache(self) -> Optional[ZenStoreCache]:
+        """The client-side cache for entities fetched from the server.
+
+        Returns:
+            The cache or `None` if caching is disabled.
+        """
+        if self._cache is None and self.config.cache_size > 0:
+            self._cache = ZenStoreCache(
+                max_size=self.config.cache_size,
+                ttls=self.config.cache_ttls,
+            )
+        return self._cache
 
     def _initialize_database(self) -> None:
         """Initialize the database."""
@@ -416,6 +526,7 @@ class RestZenStore(BaseZenStore):
                 ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
             )
 
+    @cached(CachedEntityType.SERVER_INFO)
     def get_store_info(self) -> ServerModel:
         """Get information about the server.
 
@@ -430,6 +541,7 @@ class RestZenStore(BaseZenStore):
     # ------
 
     @track(AnalyticsEvent.REGISTERED_STACK)
+    @invalidates_cache(CachedEntityType.STACK)
     def create_stack(self, stack: StackRequestModel) -> StackResponseModel:
         """Register a new stack.
 
@@ -445,6 +557,7 @@ class RestZenStore(BaseZenStore):
             response_model=StackResponseModel,
         )
 
+    @cached(CachedEntityType.STACK)
     def get_stack(self, stack_id: UUID) -> StackResponseModel:
         """Get a stack by its unique ID.
 
@@ -479,6 +592,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.UPDATED_STACK)
+    @invalidates_cache(CachedEntityType.STACK)
     def update_stack(
         self, stack_id: UUID, stack_update: StackUpdateModel
     ) -> StackResponseModel:
@@ -499,6 +613,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.DELETED_STACK)
+    @invalidates_cache(CachedEntityType.STACK)
     def delete_stack(self, stack_id: UUID) -> None:
         """Delete a stack.
 
@@ -515,6 +630,7 @@ class RestZenStore(BaseZenStore):
     # ----------------
 
     @track(AnalyticsEvent.REGISTERED_STACK_COMPONENT)
+    @invalidates_cache(CachedEntityType.STACK_COMPONENT)
     def create_stack_component(
         self,
         component: ComponentRequestModel,
@@ -533,6 +649,7 @@ class RestZenStore(BaseZenStore):
             response_model=ComponentResponseModel,
         )
 
+    @cached(CachedEntityType.STACK_COMPONENT)
     def get_stack_component(
         self, component_id: UUID
     ) -> ComponentResponseModel:
@@ -569,6 +686,10 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.UPDATED_STACK_COMPONENT)
+    @invalidates_cache(
+        CachedEntityType.STACK_COMPONENT,
+        CachedEntityType.STACK,
+    )
     def update_stack_component(
         self,
         component_id: UUID,
@@ -591,6 +712,10 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.DELETED_STACK_COMPONENT)
+    @invalidates_cache(
+        CachedEntityType.STACK_COMPONENT,
+        CachedEntityType.STACK,
+    )
     def delete_stack_component(self, component_id: UUID) -> None:
         """Delete a stack component.
 
@@ -607,6 +732,7 @@ class RestZenStore(BaseZenStore):
     # -----------------------
 
     @track(AnalyticsEvent.CREATED_FLAVOR)
+    @invalidates_cache(CachedEntityType.FLAVOR)
     def create_flavor(self, flavor: FlavorRequestModel) -> FlavorResponseModel:
         """Creates a new stack component flavor.
 
@@ -622,6 +748,7 @@ class RestZenStore(BaseZenStore):
             response_model=FlavorResponseModel,
         )
 
+    @invalidates_cache(CachedEntityType.FLAVOR)
     def update_flavor(
         self, flavor_id: UUID, flavor_update: FlavorUpdateModel
     ) -> FlavorResponseModel:
@@ -641,6 +768,7 @@ class RestZenStore(BaseZenStore):
             response_model=FlavorResponseModel,
         )
 
+    @cached(CachedEntityType.FLAVOR)
     def get_flavor(self, flavor_id: UUID) -> FlavorResponseModel:
         """Get a stack component flavor by ID.
 
@@ -656,6 +784,7 @@ class RestZenStore(BaseZenStore):
             response_model=FlavorResponseModel,
         )
 
+    @cached(CachedEntityType.FLAVOR)
     def list_flavors(
         self, flavor_filter_model: FlavorFilterModel
     ) -> Page[FlavorResponseModel]:
@@ -675,6 +804,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.DELETED_FLAVOR)
+    @invalidates_cache(CachedEntityType.FLAVOR)
     def delete_flavor(self, flavor_id: UUID) -> None:
         """Delete a stack component flavor.
 
@@ -691,6 +821,7 @@ class RestZenStore(BaseZenStore):
     # -----
 
     @track(AnalyticsEvent.CREATED_USER)
+    @invalidates_cache(CachedEntityType.USER)
     def create_user(self, user: UserRequestModel) -> UserResponseModel:
         """Creates a new user.
 
@@ -706,6 +837,7 @@ class RestZenStore(BaseZenStore):
             response_model=UserResponseModel,
         )
 
+    @cached(CachedEntityType.USER)
     def get_user(
         self,
         user_name_or_id: Optional[Union[str, UUID]] = None,
@@ -772,6 +904,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.UPDATED_USER)
+    @invalidates_cache(CachedEntityType.USER)
     def update_user(
         self, user_id: UUID, user_update: UserUpdateModel
     ) -> UserResponseModel:
@@ -792,6 +925,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.DELETED_USER)
+    @invalidates_cache(CachedEntityType.USER)
     def delete_user(self, user_name_or_id: Union[str, UUID]) -> None:
         """Deletes a user.
 
@@ -1116,6 +1250,7 @@ class RestZenStore(BaseZenStore):
     # --------
 
     @track(AnalyticsEvent.CREATED_WORKSPACE)
+    @invalidates_cache(CachedEntityType.WORKSPACE)
     def create_workspace(
         self, workspace: WorkspaceRequestModel
     ) -> WorkspaceResponseModel:
@@ -1133,6 +1268,7 @@ class RestZenStore(BaseZenStore):
             response_model=WorkspaceResponseModel,
         )
 
+    @cached(CachedEntityType.WORKSPACE)
     def get_workspace(
         self, workspace_name_or_id: Union[UUID, str]
     ) -> WorkspaceResponseModel:
@@ -1169,6 +1305,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.UPDATED_WORKSPACE)
+    @invalidates_cache(CachedEntityType.WORKSPACE)
     def update_workspace(
         self, workspace_id: UUID, workspace_update: WorkspaceUpdateModel
     ) -> WorkspaceResponseModel:
@@ -1189,6 +1326,7 @@ class RestZenStore(BaseZenStore):
         )
 
     @track(AnalyticsEvent.DELETED_WORKSPACE)
+    @invalidates_cache(CachedEntityType.WORKSPACE)
     def delete_workspace(self, workspace_name_or_id: Union[str, UUID]) -> None:
         """Deletes a workspace.
 
@@ -1309,6 +1447,7 @@ class RestZenStore(BaseZenStore):
             response_model=PipelineBuildResponseModel,
         )
 
+    @cached(CachedEntityType.BUILD)
     def get_build(self, build_id: UUID) -> PipelineBuildResponseModel:
         """Get a build with a given ID.
 
@@ -1342,6 +1481,7 @@ class RestZenStore(BaseZenStore):
             filter_model=build_filter_model,
         )
 
+    @invalidates_cache(CachedEntityType.BUILD)
     def delete_build(self, build_id: UUID) -> None:
         """Deletes a build.
 
@@ -1375,6 +1515,7 @@ class RestZenStore(BaseZenStore):
             response_model=PipelineDeploymentResponseModel,
         )
 
+    @cached(CachedEntityType.DEPLOYMENT)
     def get_deployment(
         self, deployment_id: UUID
     ) -> PipelineDeploymentResponseModel:
@@ -1410,6 +1551,7 @@ class RestZenStore(BaseZenStore):
             filter_model=deployment_filter_model,
         )
 
+    @invalidates_cache(CachedEntityType.DEPLOYMENT)
     def delete_deployment(self, deployment_id: UUID) -> None:
         """Deletes a deployment.
 
@@ -1545,6 +1687,43 @@ class RestZenStore(BaseZenStore):
             response_model=PipelineRunResponseModel,
         )
 
+    def get_run_dag(self, run_id: UUID) -> "LineageGraph":
+        """Gets the lineage graph of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+
+        Returns:
+            The lineage graph of the pipeline run.
+        """
+        from zenml.post_execution.lineage.lineage_graph import LineageGraph
+
+        # The server sends an ETag with each DAG, so a cached DAG only needs
+        # to be downloaded again if it changed.
+        cache = self.cache
+        cached_dag: Optional[Tuple[str, LineageGraph]] = None
+        if cache:
+            found, value = cache.get(CachedEntityType.RUN_DAG, run_id)
+            if found:
+                cached_dag = value
+
+        headers = {"If-None-Match": cached_dag[0]} if cached_dag else {}
+        path = f"{RUNS}/{str(run_id)}{GRAPH}"
+        logger.debug(f"Sending GET request to {path}...")
+        response = self._send_request(
+            "GET", self.url + API + VERSION_1 + path, headers=headers
+        )
+        if cached_dag and response.status_code == 304:
+            dag = cached_dag[1]
+        else:
+            dag = LineageGraph.parse_obj(self._handle_response(response))
+            etag = response.headers.get("ETag")
+            if cache and etag:
+                cache.set(CachedEntityType.RUN_DAG, run_id, (etag, dag))
+
+        # Return a copy so callers can't modify the cached DAG.
+        return copy.deepcopy(dag)
+
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequestModel
     ) -> Tuple[PipelineRunResponseModel, bool]:
@@ -1604,6 +1783,23 @@ class RestZenStore(BaseZenStore):
             route=RUNS,
         )
 
+    def update_run_status_from_steps(
+        self, run_id: UUID
+    ) -> PipelineRunResponseModel:
+        """Updates the status of a pipeline run from the status of its steps.
+
+        Args:
+            run_id: The ID of the pipeline run to update.
+
+        Returns:
+            The updated pipeline run.
+        """
+        body = self._request(
+            "PUT", self.url + API + VERSION_1 + f"{RUNS}/{run_id}{STATUS}"
+        )
+        return PipelineRunResponseModel.parse_obj(body)
+
+    @invalidates_cache(CachedEntityType.STEP_RUN)
     def delete_run(self, run_id: UUID) -> None:
         """Deletes a pipeline run.
 
@@ -1636,6 +1832,7 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    @cached(CachedEntityType.STEP_RUN)
     def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
         """Get a step run by ID.
 
@@ -1669,6 +1866,29 @@ class RestZenStore(BaseZenStore):
             filter_model=step_run_filter_model,
         )
 
+    def get_cached_step_run(
+        self, cache_key: str, workspace_id: UUID
+    ) -> Optional[StepRunResponseModel]:
+        """Gets the latest completed step run with the given cache key.
+
+        Args:
+            cache_key: The cache key of the step run.
+            workspace_id: The ID of the workspace in which to look for the
+                step run.
+
+        Returns:
+            The latest completed step run with the given cache key in the
+            workspace, or `None` if no such step run exists.
+        """
+        body = self.get(
+            f"{STEPS}{CACHED}",
+            params={"cache_key": cache_key, "workspace_id": workspace_id},
+        )
+        if body is None:
+            return None
+        return StepRunResponseModel.parse_obj(body)
+
+    @invalidates_cache(CachedEntityType.STEP_RUN)
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -1690,6 +1910,27 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    @invalidates_cache(CachedEntityType.STEP_RUN)
+    def finalize_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_finalization: StepRunFinalizeModel,
+    ) -> StepRunResponseModel:
+        """Publishes the outputs and final status of a step run.
+
+        Args:
+            step_run_id: The ID of the step run to finalize.
+            step_run_finalization: The outputs and status of the step run.
+
+        Returns:
+            The updated step run.
+        """
+        response_body = self.post(
+            f"{STEPS}/{str(step_run_id)}{FINALIZE}",
+            body=step_run_finalization,
+        )
+        return StepRunResponseModel.parse_obj(response_body)
+
     # ---------
     # Artifacts
     # ---------
@@ -1711,6 +1952,24 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACTS,
         )
 
+    def batch_create_artifacts(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in one transaction.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+        if not artifacts:
+            return []
+
+        response_body = self.post(f"{ARTIFACTS}{BATCH}", body=artifacts)
+        return parse_obj_as(List[ArtifactResponseModel], response_body)
+
+    @cached(CachedEntityType.ARTIFACT)
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
 
@@ -1744,6 +2003,7 @@ class RestZenStore(BaseZenStore):
             filter_model=artifact_filter_model,
         )
 
+    @invalidates_cache(CachedEntityType.ARTIFACT)
     def delete_artifact(self, artifact_id: UUID) -> None:
         """Deletes an artifact.
 
@@ -1756,6 +2016,7 @@ class RestZenStore(BaseZenStore):
     # Run Metadata
     # ------------
 
+    @invalidates_cache(CachedEntityType.STEP_RUN, CachedEntityType.ARTIFACT)
     def create_run_metadata(
         self, run_metadata: RunMetadataRequestModel
     ) -> RunMetadataResponseModel:
@@ -1773,6 +2034,41 @@ class RestZenStore(BaseZenStore):
             route=RUN_METADATA,
         )
 
+    @invalidates_cache(CachedEntityType.STEP_RUN, CachedEntityType.ARTIFACT)
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequestModel]
+    ) -> List[RunMetadataResponseModel]:
+        """Creates multiple run metadata entries.
+
+        All entries that belong to the same workspace are created in one
+        transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata, in the same order as the requests.
+        """
+        workspace_indices: Dict[UUID, List[int]] = {}
+        for index, metadata in enumerate(run_metadata):
+            workspace_indices.setdefault(metadata.workspace, []).append(index)
+
+        created_metadata: List[Optional[RunMetadataResponseModel]] = [
+            None
+        ] * len(run_metadata)
+        for workspace_id, indices in workspace_indices.items():
+            response_body = self.post(
+                f"{WORKSPACES}/{str(workspace_id)}{RUN_METADATA}{BATCH}",
+                body=[run_metadata[index] for index in indices],
+            )
+            workspace_metadata = parse_obj_as(
+                List[RunMetadataResponseModel], response_body
+            )
+            for index, metadata_model in zip(indices, workspace_metadata):
+                created_metadata[index] = metadata_model
+
+        return cast(List[RunMetadataResponseModel], created_metadata)
+
     def list_run_metadata(
         self,
         run_metadata_filter_model: RunMetadataFilterModel,
@@ -1848,24 +2144,67 @@ class RestZenStore(BaseZenStore):
     def session(self) -> requests.Session:
         """Authenticate to the ZenML server.
 
+        The session is shared by all threads that use this store. Its
+        connection pools and retry policy are configured from the store
+        configuration.
+
         Returns:
             A requests session with the authentication token.
         """
         if self._session is None:
-            if self.config.verify_ssl is False:
-                urllib3.disable_warnings(
-                    urllib3.exceptions.InsecureRequestWarning
-                )
-
-            self._session = requests.Session()
-            self._session.verify = self.config.verify_ssl
-            token = self._get_auth_token()
-            self._session.headers.update({"Authorization": "Bearer " + token})
-            logger.debug("Authenticated to ZenML server.")
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
         return self._session
 
+    def _create_session(self) -> requests.Session:
+        """Creates an authenticated requests session.
+
+        Returns:
+            The session.
+        """
+        if self.config.verify_ssl is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        retries = Retry(
+            total=self.config.http_max_retries,
+            backoff_factor=self.config.http_retry_backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            # Requests that were already sent are only retried for idempotent
+            # methods, failed connections are retried for all methods.
+            allowed_methods=HTTP_IDEMPOTENT_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.http_pool_connections,
+            pool_maxsize=self.config.http_pool_maxsize,
+            max_retries=retries,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.config.verify_ssl
+        token = self._get_auth_token()
+        session.headers.update({"Authorization": "Bearer " + token})
+        logger.debug("Authenticated to ZenML server.")
+        return session
+
+    def _reset_session(self, session: requests.Session) -> None:
+        """Discards a session so a new one gets created on the next request.
+
+        Args:
+            session: The session to discard. If another thread already
+                replaced this session, nothing happens.
+        """
+        with self._session_lock:
+            if self._session is session:
+                self._session = None
+
     @staticmethod
-    def _handle_response(response: requests.Response) -> Json:
+    def _handle_response(
+        response: Union[requests.Response, "httpx.Response"]
+    ) -> Json:
         """Handle API response, translating http status codes to Exception.
 
         Args:
@@ -1900,7 +2239,10 @@ class RestZenStore(BaseZenStore):
             try:
                 payload: Json = response.json()
                 return payload
-            except requests.exceptions.JSONDecodeError:
+            except (
+                requests.exceptions.JSONDecodeError,
+                json.JSONDecodeError,
+            ):
                 raise ValueError(
                     "Bad response from API. Expected json, got\n"
                     f"{response.text}"
@@ -1974,14 +2316,14 @@ class RestZenStore(BaseZenStore):
                 f"{response.status_code} with body:\n{response.text}"
             )
 
-    def _request(
+    def _send_request(
         self,
         method: str,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
-    ) -> Json:
-        """Make a request to the REST API.
+    ) -> requests.Response:
+        """Sends a request to the REST API without handling the response.
 
         Args:
             method: The HTTP method to use.
@@ -1990,34 +2332,87 @@ class RestZenStore(BaseZenStore):
             kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
-            The parsed response.
+            The response.
         """
         params = {k: str(v) for k, v in params.items()} if params else {}
-        try:
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
+        data = kwargs.pop("data", None)
+        headers = kwargs.pop("headers", {})
+        if data is not None:
+            data, encoding_headers = self._encode_request_body(data)
+            headers = {**headers, **encoding_headers}
+
+        def _send(session: requests.Session) -> requests.Response:
+            """Sends the request using a session.
+
+            Args:
+                session: The session to use.
+
+            Returns:
+                The response.
+            """
+            return session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                verify=self.config.verify_ssl,
+                timeout=self.config.http_timeout,
+                **kwargs,
             )
-        except AuthorizationException:
+
+        session = self.session
+        response = _send(session)
+        if response.status_code == 401:
             # The authentication token could have expired; refresh it and try
             # again
-            self._session = None
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
-            )
+            self._reset_session(session)
+            response = _send(self.session)
+        return response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Json:
+        """Make a request to the REST API.
+
+        Args:
+            method: The HTTP method to use.
+            url: The URL to request.
+            params: The query parameters to pass to the endpoint.
+            kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            The parsed response.
+        """
+        return self._handle_response(
+            self._send_request(method, url, params=params, **kwargs)
+        )
+
+    def _encode_request_body(
+        self, data: Union[str, bytes]
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Encodes a JSON request body, compressing it if it is large.
+
+        Args:
+            data: The JSON request body.
+
+        Returns:
+            The encoded body and the headers describing its encoding.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        headers = {"Content-Type": "application/json"}
+        threshold = self.config.http_compression_threshold
+        if threshold is not None and len(data) > threshold:
+            data = gzip.compress(data, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+
+        return data, headers
 
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -2061,7 +2456,7 @@ class RestZenStore(BaseZenStore):
     def post(
         self,
         path: str,
-        body: BaseModel,
+        body: Union[BaseModel, Sequence[BaseModel]],
         params: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Json:
@@ -2069,18 +2464,24 @@ class RestZenStore(BaseZenStore):
 
         Args:
             path: The path to the endpoint.
-            body: The body to send.
+            body: The body to send. If a sequence of models is passed, they
+                are sent as a JSON list.
             params: The query parameters to pass to the endpoint.
             kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
             The response body.
         """
+        if isinstance(body, BaseModel):
+            data = body.json()
+        else:
+            data = "[" + ",".join(model.json() for model in body) + "]"
+
         logger.debug(f"Sending POST request to {path}...")
         return self._request(
             "POST",
             self.url + API + VERSION_1 + path,
-            data=body.json(),
+            data=data,
             params=params,
             **kwargs,
         )
@@ -2271,18 +2672,56 @@ class RestZenStore(BaseZenStore):
 
         Returns:
             List of retrieved resources matching the filter criteria.
-
-        Raises:
-            ValueError: If the value returned by the server is not a list.
         """
         # leave out filter params that are not supplied
         body = self.get(
             f"{route}", params=filter_model.dict(exclude_none=True)
         )
+        return self._parse_page(
+            body, response_model=response_model, filter_model=filter_model
+        )
+
+    @staticmethod
+    def _parse_page(
+        body: Json,
+        response_model: Type[AnyResponseModel],
+        filter_model: Optional[BaseFilterModel] = None,
+    ) -> Page[AnyResponseModel]:
+        """Parses the response body of a paginated list request.
+
+        Args:
+            body: The response body.
+            response_model: Model to use to serialize the page items.
+            filter_model: The filter model used for the list request. If it
+                excludes some fields, the items are parsed into a partial
+                response model in which these fields are optional.
+
+        Returns:
+            The page of parsed items.
+
+        Raises:
+            ValueError: If the value returned by the server is not a page.
+        """
         if not isinstance(body, dict):
             raise ValueError(
                 f"Bad API Response. Expected list, got {type(body)}"
             )
+        if filter_model and filter_model.is_projected:
+            # Some fields of the items are missing, so they can only be
+            # parsed into a partial response model.
+            partial_response_model = pydantic_utils.get_partial_model(
+                response_model,
+                filter_model.get_excluded_fields(response_model),
+            )
+            projected_page: Page[AnyResponseModel] = Page.parse_obj(
+                dict(body, items=[])
+            )
+            projected_page.items = [
+                partial_response_model.parse_obj(item)
+                for item in body.get("items", [])
+            ]
+            return projected_page
+
         # The initial page of items will be of type BaseResponseModel
         page_of_items: Page[AnyResponseModel] = Page.parse_obj(body)
         # So these items will be parsed into their correct types like here
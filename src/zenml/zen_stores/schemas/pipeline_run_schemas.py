@@ -15,7 +15,7 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column
@@ -49,6 +49,15 @@ class PipelineRunSchema(NamedSchema, table=True):
 
     __tablename__ = "pipeline_run"
 
+    # Large columns that don't need to be loaded if the corresponding field
+    # of the response model is excluded, mapped to the placeholder values
+    # that are used instead.
+    PROJECTED_COLUMNS: ClassVar[Dict[str, Dict[str, Any]]] = {
+        "pipeline_configuration": {"pipeline_configuration": "{}"},
+        "client_environment": {"client_environment": None},
+        "orchestrator_environment": {"orchestrator_environment": None},
+    }
+
     stack_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
         target=StackSchema.__tablename__,
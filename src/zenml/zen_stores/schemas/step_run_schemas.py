@@ -15,14 +15,18 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, Column, Index
 from sqlmodel import Field, Relationship, SQLModel
 
-from zenml.config.step_configurations import Step
+from zenml.config.step_configurations import (
+    Step,
+    StepConfiguration,
+    StepSpec,
+)
 from zenml.constants import STEP_SOURCE_PARAMETER_NAME
 from zenml.enums import ExecutionStatus
 from zenml.models.step_run_models import (
@@ -41,11 +45,41 @@ if TYPE_CHECKING:
     from zenml.models import ArtifactResponseModel
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
 
+# Serialized step that is used instead of the actual step configuration if the
+# step configuration was not loaded from the database.
+_STEP_CONFIGURATION_PLACEHOLDER = Step(
+    spec=StepSpec(source="", upstream_steps=[]),
+    config=StepConfiguration(name=""),
+).json()
+
 
 class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        # Used to look up the latest completed step run for a cache key.
+        Index(
+            "ix_step_run_cache_lookup",
+            "workspace_id",
+            "cache_key",
+            "status",
+            "created",
+        ),
+    )
+
+    # Large columns that don't need to be loaded if the corresponding field
+    # of the response model is excluded, mapped to the placeholder values
+    # that are used instead.
+    PROJECTED_COLUMNS: ClassVar[Dict[str, Dict[str, Any]]] = {
+        "step": {
+            "step_configuration": _STEP_CONFIGURATION_PLACEHOLDER,
+            "parameters": "{}",
+            "caching_parameters": None,
+        },
+        "docstring": {"docstring": None},
+        "source_code": {"source_code": None},
+    }
 
     pipeline_run_id: UUID = build_foreign_key_field(
         source=__tablename__,
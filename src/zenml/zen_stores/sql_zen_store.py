@@ -19,15 +19,20 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
+from datetime import datetime
+from functools import partial
 from pathlib import Path, PurePath
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -38,18 +43,27 @@ from uuid import UUID
 
 import pymysql
 from pydantic import root_validator, validator
-from sqlalchemy import asc, desc, func, text
+from pydantic.json import pydantic_encoder
+from sqlalchemy import DateTime, Enum, asc, desc, func, text
 from sqlalchemy.engine import URL, Engine, make_url
-from sqlalchemy.exc import ArgumentError, NoResultFound, OperationalError
-from sqlalchemy.orm import noload
-from sqlmodel import Session, create_engine, or_, select
+from sqlalchemy.exc import (
+    ArgumentError,
+    IntegrityError,
+    NoResultFound,
+    OperationalError,
+)
+from sqlalchemy.orm import defer, noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, SQLModel, and_, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
 from zenml.config.global_config import GlobalConfiguration
+from zenml.config.step_configurations import Step
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     ENV_ZENML_DISABLE_DATABASE_MIGRATION,
     ENV_ZENML_SERVER_DEPLOYMENT_TYPE,
+    SERVER_WORKERS,
 )
 from zenml.enums import (
     ExecutionStatus,
@@ -107,6 +121,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunFinalizeModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -136,13 +151,13 @@ from zenml.models.page_model import Page
 from zenml.models.run_metadata_models import RunMetadataFilterModel
 from zenml.models.schedule_model import ScheduleFilterModel
 from zenml.models.server_models import ServerDatabaseType, ServerModel
-from zenml.stack.flavor_registry import FlavorRegistry
-from zenml.utils import uuid_utils
+from zenml.utils import pydantic_utils, uuid_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, track
 from zenml.utils.enum_utils import StrEnum
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
 )
+from zenml.utils.run_utils import get_pipeline_run_status_from_counts
 from zenml.zen_stores.base_zen_store import (
     DEFAULT_ADMIN_ROLE,
     DEFAULT_GUEST_ROLE,
@@ -185,6 +200,11 @@ from zenml.zen_stores.secrets_stores.sql_secrets_store import (
     SqlSecretsStoreConfiguration,
 )
 
+if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
+
+    from zenml.post_execution.lineage.lineage_graph import LineageGraph
+
 AnyNamedSchema = TypeVar("AnyNamedSchema", bound=NamedSchema)
 AnySchema = TypeVar("AnySchema", bound=BaseSchema)
 B = TypeVar("B", bound=BaseResponseModel)
@@ -201,6 +221,12 @@ logger = get_logger(__name__)
 
 ZENML_SQLITE_DB_FILENAME = "zenml.db"
 
+# Number of database connections that are divided between the worker
+# processes of the ZenML server, unless the pool size is configured explicitly.
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_OVERFLOW = 20
+MIN_POOL_SIZE = 5
+
 
 def _is_mysql_missing_database_error(error: OperationalError) -> bool:
     """Checks if the given error is due to a missing database.
@@ -220,6 +246,80 @@ def _is_mysql_missing_database_error(error: OperationalError) -> bool:
     return error_code == BAD_DB_ERROR
 
 
+def _encode_cursor(schema: SQLModel, column: str) -> str:
+    """Encodes a keyset pagination cursor pointing to an item.
+
+    Args:
+        schema: The item to which the cursor should point.
+        column: The column by which the items are sorted.
+
+    Returns:
+        The opaque cursor string.
+    """
+    value = json.dumps(
+        [getattr(schema, column), getattr(schema, "id")],
+        default=pydantic_encoder,
+    )
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def _get_keyset_condition(
+    table: Type[SQLModel], column: str, operand: SorterOps, cursor: str
+) -> Union["BinaryExpression[Any]", "BooleanClauseList[Any]"]:
+    """Gets the condition that selects all items after a cursor.
+
+    The condition relies on the ordering of `NULL` values in SQLite and MySQL,
+    where `NULL` values come first in ascending and last in descending order.
+
+    Args:
+        table: The table that is queried.
+        column: The column by which the items are sorted.
+        operand: The sorting operand.
+        cursor: The cursor pointing to the last item of the previous page.
+
+    Returns:
+        The condition.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    try:
+        value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        last_id = UUID(last_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor `{cursor}`.") from e
+
+    sort_column = getattr(table, column)
+    id_column = getattr(table, "id")
+    column_type = sort_column.type
+    if value is not None:
+        if isinstance(column_type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(column_type, Enum):
+            enum_class = getattr(column_type, "enum_class", None)
+            if enum_class:
+                value = enum_class(value)
+
+    if operand == SorterOps.DESCENDING:
+        if value is None:
+            return and_(sort_column.is_(None), id_column < last_id)
+        return or_(
+            sort_column < value,
+            and_(sort_column == value, id_column < last_id),
+            sort_column.is_(None),
+        )
+    else:
+        if value is None:
+            return or_(
+                and_(sort_column.is_(None), id_column > last_id),
+                sort_column.is_not(None),
+            )
+        return or_(
+            sort_column > value,
+            and_(sort_column == value, id_column > last_id),
+        )
+
+
 class SQLDatabaseDriver(StrEnum):
     """SQL database drivers supported by the SQL ZenML store."""
 
@@ -250,9 +350,12 @@ class SqlZenStoreConfiguration(StoreConfiguration):
         ssl_verify_server_cert: set to verify the identity of the server
             against the provided server certificate.
         pool_size: The maximum number of connections to keep in the SQLAlchemy
-            pool.
+            pool. If not set, the default pool size is divided between the
+            worker processes of the ZenML server.
         max_overflow: The maximum number of connections to allow in the
-            SQLAlchemy pool in addition to the pool_size.
+            SQLAlchemy pool in addition to the pool_size. If not set, the
+            default overflow is divided between the worker processes of the
+            ZenML server.
     """
 
     type: StoreType = StoreType.SQL
@@ -267,8 +370,8 @@ class SqlZenStoreConfiguration(StoreConfiguration):
     ssl_cert: Optional[str] = None
     ssl_key: Optional[str] = None
     ssl_verify_server_cert: bool = False
-    pool_size: int = 20
-    max_overflow: int = 20
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
 
     @validator("secrets_store")
     def validate_secrets_store(
@@ -526,6 +629,41 @@ class SqlZenStoreConfiguration(StoreConfiguration):
 
         return config
 
+    def get_pool_size(self) -> Tuple[int, int]:
+        """Get the size and overflow of the connection pool of this process.
+
+        Every worker process of the ZenML server has its own connection pool.
+        Unless configured explicitly, the default number of connections is
+        therefore divided between the workers, so all workers together use
+        about `DEFAULT_POOL_SIZE + DEFAULT_MAX_OVERFLOW` connections. The pool
+        of each worker however keeps at least `MIN_POOL_SIZE` connections, so
+        with more workers than that allows, the total number of connections is
+        `MIN_POOL_SIZE` times the number of workers.
+
+        Returns:
+            The pool size and the maximum overflow.
+        """
+        default_pool_size = max(
+            math.ceil(DEFAULT_POOL_SIZE / SERVER_WORKERS), MIN_POOL_SIZE
+        )
+        pool_size = self.pool_size
+        if pool_size is None:
+            pool_size = default_pool_size
+
+        max_overflow = self.max_overflow
+        if max_overflow is None:
+            # The overflow gets whatever is left of the total number of
+            # connections of each worker after the minimum pool size.
+            max_overflow = max(
+                math.ceil(
+                    (DEFAULT_POOL_SIZE + DEFAULT_MAX_OVERFLOW) / SERVER_WORKERS
+                )
+                - default_pool_size,
+                0,
+            )
+
+        return pool_size, max_overflow
+
     def get_sqlmodel_config(
         self,
     ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
@@ -554,9 +692,10 @@ class SqlZenStoreConfiguration(StoreConfiguration):
             assert self.password is not None
             assert sql_url.host is not None
 
+            pool_size, max_overflow = self.get_pool_size()
             engine_args = {
-                "pool_size": self.pool_size,
-                "max_overflow": self.max_overflow,
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
             }
 
             sql_url = sql_url._replace(
@@ -669,6 +808,10 @@ class SqlZenStore(BaseZenStore):
         custom_schema_to_model_conversion: Optional[
             Callable[[AnySchema], B]
         ] = None,
+        custom_bulk_schema_to_model_conversion: Optional[
+            Callable[[List[AnySchema], Session], List[B]]
+        ] = None,
+        response_model: Optional[Type[B]] = None,
     ) -> Page[B]:
         """Given a query, return a Page instance with a list of filtered Models.
 
@@ -681,14 +824,29 @@ class SqlZenStore(BaseZenStore):
                 into a model. This is used if the Model contains additional
                 data that is not explicitly stored as a field or relationship
                 on the model.
+            custom_bulk_schema_to_model_conversion: Callable to convert all
+                schemas of the page into models at once, using the given
+                session. This is used to load additional data for all items of
+                the page with a constant number of queries instead of one or
+                more queries per item.
+            response_model: The model class of the returned items. This is
+                required to validate the fields to include or exclude if the
+                filter model allows a field projection.
 
         Returns:
             The Domain Model representation of the DB resource
 
         Raises:
-            ValueError: if the filtered page number is out of bounds.
+            ValueError: if the filtered page number is out of bounds or the
+                filter contains invalid fields to include or exclude.
             RuntimeError: if the schema does not have a `to_model` method.
         """
+        # Validate the projection before querying, so invalid fields are
+        # rejected even if the page is empty.
+        excluded_fields: Optional[Set[str]] = None
+        if filter_model.is_projected and response_model is not None:
+            excluded_fields = filter_model.get_excluded_fields(response_model)
+
         # Filtering
         filters = filter_model.generate_filter(table=table)
 
@@ -696,44 +854,95 @@ class SqlZenStore(BaseZenStore):
             query = query.where(filters)
 
         # Get the total amount of items in the database for a given query
-        total = session.scalar(
-            select([func.count("*")]).select_from(
-                query.options(noload("*")).subquery()
+        total: Optional[int] = None
+        total_pages: Optional[int] = None
+        if filter_model.count_total:
+            item_count: int = session.scalar(
+                select([func.count("*")]).select_from(
+                    query.options(noload("*")).subquery()
+                )
             )
-        )
 
-        # Sorting
+            # Get the total amount of pages in the database for a given query
+            if item_count == 0:
+                page_count = 1
+            else:
+                page_count = math.ceil(item_count / filter_model.size)
+
+            if filter_model.page > page_count and not filter_model.cursor:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. The requested page "
+                    f"size is {filter_model.size} and there are a total of "
+                    f"{item_count} items for this query. The maximum page "
+                    f"value therefore is {page_count}."
+                )
+
+            total = item_count
+            total_pages = page_count
+
+        # Sorting. The ID is used as a tie-breaker so that the order is stable
+        # and can be used for keyset pagination.
         column, operand = filter_model.sorting_params
+        sort_column = getattr(table, column)
         if operand == SorterOps.DESCENDING:
-            query = query.order_by(desc(getattr(table, column)))
+            query = query.order_by(desc(sort_column), desc(table.id))
         else:
-            query = query.order_by(asc(getattr(table, column)))
-
-        # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
+            query = query.order_by(asc(sort_column), asc(table.id))
+
+        if filter_model.cursor:
+            # Keyset pagination: continue right after the last item of the
+            # previous page instead of skipping `offset` items.
+            query = query.where(
+                _get_keyset_condition(
+                    table=table,
+                    column=column,
+                    operand=operand,
+                    cursor=filter_model.cursor,
+                )
+            )
         else:
-            total_pages = math.ceil(total / filter_model.size)
-
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
+            query = query.offset(filter_model.offset)
+
+        # Projection: large columns of fields that are excluded from the
+        # returned items are not loaded, placeholders are used instead.
+        projected_columns: Dict[str, Any] = {}
+        if filter_model.is_projected:
+            for field_name, columns in getattr(
+                table, "PROJECTED_COLUMNS", {}
+            ).items():
+                if filter_model.excludes_field(field_name):
+                    projected_columns.update(columns)
+        if projected_columns:
+            query = query.options(
+                *(
+                    defer(getattr(table, projected_column))
+                    for projected_column in projected_columns
+                )
             )
 
-        # Get a page of the actual data
+        # Get a page of the actual data. We fetch one additional item to know
+        # whether there is a next page without having to count all items.
         item_schemas: List[AnySchema] = (
-            session.exec(
-                query.limit(filter_model.size).offset(filter_model.offset)
-            )
-            .unique()
-            .all()
+            session.exec(query.limit(filter_model.size + 1)).unique().all()
         )
+        for schema in item_schemas:
+            for projected_column, placeholder in projected_columns.items():
+                set_committed_value(schema, projected_column, placeholder)
+        next_cursor: Optional[str] = None
+        if len(item_schemas) > filter_model.size:
+            item_schemas = item_schemas[: filter_model.size]
+            next_cursor = _encode_cursor(
+                schema=item_schemas[-1], column=column
+            )
 
         # Convert this page of items from schemas to models.
         items: List[B] = []
+        if custom_bulk_schema_to_model_conversion:
+            items = custom_bulk_schema_to_model_conversion(
+                item_schemas, session
+            )
+            item_schemas = []
+
         for schema in item_schemas:
             # If a custom conversion function is provided, use it.
             if custom_schema_to_model_conversion:
@@ -750,12 +959,23 @@ class SqlZenStore(BaseZenStore):
                 "since it does not have a `to_model` method."
             )
 
+        if filter_model.is_projected and items:
+            if excluded_fields is None:
+                excluded_fields = filter_model.get_excluded_fields(
+                    type(items[0])
+                )
+            items = [
+                pydantic_utils.exclude_fields(item, excluded_fields)
+                for item in items
+            ]
+
         return Page(
             total=total,
             total_pages=total_pages,
             items=items,
             page=filter_model.page,
             size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
     # ====================================
@@ -905,6 +1125,10 @@ class SqlZenStore(BaseZenStore):
 
     def _sync_flavors(self) -> None:
         """Purge all in-built and integration flavors from the DB and sync."""
+        # Importing the flavor registry imports all integrations, which is
+        # slow and only necessary after a migration.
+        from zenml.stack.flavor_registry import FlavorRegistry
+
         FlavorRegistry().register_flavors(store=self)
 
     def get_store_info(self) -> ServerModel:
@@ -3170,7 +3394,16 @@ class SqlZenStore(BaseZenStore):
             # Create the pipeline run
             new_run = PipelineRunSchema.from_request(pipeline_run)
             session.add(new_run)
-            session.commit()
+            try:
+                session.commit()
+            except IntegrityError as e:
+                # Another process (e.g. a concurrently running step) created
+                # the same run after the checks above.
+                raise EntityExistsError(
+                    f"Unable to create pipeline run: A pipeline run with ID "
+                    f"'{pipeline_run.id}' or name '{pipeline_run.name}' "
+                    "already exists."
+                ) from e
 
             return new_run.to_model()
 
@@ -3186,8 +3419,169 @@ class SqlZenStore(BaseZenStore):
             The pipeline run.
         """
         with Session(self.engine) as session:
-            run = self._get_run_schema(run_name_or_id, session=session)
-            return run.to_model()
+            return self._get_run(run_name_or_id, session=session)
+
+    def _get_run(
+        self, run_name_or_id: Union[str, UUID], session: Session
+    ) -> PipelineRunResponseModel:
+        """Gets a pipeline run using the given session.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run to get.
+            session: The database session to use.
+
+        Returns:
+            The pipeline run.
+        """
+        return self._get_run_schema(run_name_or_id, session=session).to_model()
+
+    def get_run_dag(self, run_id: UUID) -> "LineageGraph":
+        """Gets the lineage graph of a pipeline run.
+
+        All steps, their artifact links, the artifacts and the metadata of
+        the run are fetched with a constant number of queries, independent of
+        the number of steps in the run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+
+        Returns:
+            The lineage graph of the pipeline run.
+        """
+        from zenml.post_execution.lineage.lineage_graph import LineageGraph
+
+        with Session(self.engine) as session:
+            run = self._get_run_schema(run_id, session=session)
+            step_runs = session.exec(
+                select(
+                    StepRunSchema.id,
+                    StepRunSchema.name,
+                    StepRunSchema.status,
+                    StepRunSchema.step_configuration,
+                )
+                .where(StepRunSchema.pipeline_run_id == run.id)
+                .order_by(StepRunSchema.created, StepRunSchema.id)
+            ).all()
+            step_run_ids = select(StepRunSchema.id).where(
+                StepRunSchema.pipeline_run_id == run.id
+            )
+
+            # Fetch the input and output links of all steps together with the
+            # artifact columns that are part of the graph.
+            inputs: Dict[UUID, List[Tuple[str, UUID, str]]] = defaultdict(list)
+            for step_run_id, name, artifact_id, uri in session.exec(
+                select(
+                    StepRunInputArtifactSchema.step_id,
+                    StepRunInputArtifactSchema.name,
+                    ArtifactSchema.id,
+                    ArtifactSchema.uri,
+                )
+                .where(
+                    StepRunInputArtifactSchema.artifact_id == ArtifactSchema.id
+                )
+                .where(
+                    StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+            ).all():
+                inputs[step_run_id].append((name, artifact_id, uri))
+
+            outputs: Dict[
+                UUID, List[Tuple[str, ArtifactSchema]]
+            ] = defaultdict(list)
+            output_artifact_ids = set()
+            for step_run_id, name, artifact in session.exec(
+                select(
+                    StepRunOutputArtifactSchema.step_id,
+                    StepRunOutputArtifactSchema.name,
+                    ArtifactSchema,
+                )
+                .where(
+                    StepRunOutputArtifactSchema.artifact_id
+                    == ArtifactSchema.id
+                )
+                .where(
+                    StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(noload("*"))
+            ).all():
+                outputs[step_run_id].append((name, artifact))
+                output_artifact_ids.add(artifact.id)
+
+            producer_step_run_ids = self._get_producer_step_run_ids(
+                list(output_artifact_ids), session=session
+            )
+
+            # Fetch the metadata of the run, its steps and their outputs.
+            metadata: Dict[
+                Optional[UUID], Dict[str, Tuple[str, str, str]]
+            ] = defaultdict(dict)
+            metadata_conditions = [
+                RunMetadataSchema.pipeline_run_id == run.id,
+                RunMetadataSchema.step_run_id.in_(  # type: ignore[union-attr]
+                    step_run_ids
+                ),
+            ]
+            if output_artifact_ids:
+                metadata_conditions.append(
+                    RunMetadataSchema.artifact_id.in_(  # type: ignore[union-attr]
+                        output_artifact_ids
+                    )
+                )
+            for run_metadata in session.exec(
+                select(RunMetadataSchema)
+                .where(or_(*metadata_conditions))
+                .order_by(RunMetadataSchema.created)
+                .options(noload("*"))
+            ).all():
+                owner_id = (
+                    run_metadata.pipeline_run_id
+                    or run_metadata.step_run_id
+                    or run_metadata.artifact_id
+                )
+                metadata[owner_id][run_metadata.key] = (
+                    run_metadata.key,
+                    str(json.loads(run_metadata.value)),
+                    str(run_metadata.type),
+                )
+
+        graph = LineageGraph()
+        graph.run_metadata = list(metadata[run.id].values())
+        for step_run_id, step_name, status, step_configuration in step_runs:
+            step_outputs = outputs[step_run_id]
+            graph.add_step_node(
+                step_run_id=step_run_id,
+                name=step_name,
+                status=ExecutionStatus(status),
+                config=Step.parse_raw(step_configuration).config,
+                inputs={name: uri for name, _, uri in inputs[step_run_id]},
+                outputs={
+                    name: artifact.uri for name, artifact in step_outputs
+                },
+                metadata=list(metadata[step_run_id].values()),
+            )
+            for output_name, artifact in step_outputs:
+                graph.add_output_artifact_node(
+                    artifact_id=artifact.id,
+                    name=output_name,
+                    step_run_id=step_run_id,
+                    status=ExecutionStatus(status),
+                    artifact_type=artifact.type,
+                    artifact_data_type=artifact.data_type,
+                    producer_step_run_id=producer_step_run_ids.get(
+                        artifact.id
+                    ),
+                    uri=artifact.uri,
+                    metadata=list(metadata[artifact.id].values()),
+                )
+            for _, artifact_id, _ in inputs[step_run_id]:
+                graph.add_input_artifact_edge(
+                    artifact_id=artifact_id, step_run_id=step_run_id
+                )
+        return graph
 
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequestModel
@@ -3230,13 +3624,29 @@ class SqlZenStore(BaseZenStore):
             A list of all pipeline runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(PipelineRunSchema)
-            return self.filter_and_paginate(
-                session=session,
-                query=query,
-                table=PipelineRunSchema,
-                filter_model=runs_filter_model,
-            )
+            return self._list_runs(runs_filter_model, session=session)
+
+    def _list_runs(
+        self, runs_filter_model: PipelineRunFilterModel, session: Session
+    ) -> Page[PipelineRunResponseModel]:
+        """List all pipeline runs matching the given filter criteria.
+
+        Args:
+            runs_filter_model: All filter parameters including pagination
+                params.
+            session: The database session to use.
+
+        Returns:
+            A list of all pipeline runs matching the filter criteria.
+        """
+        query = select(PipelineRunSchema)
+        return self.filter_and_paginate(
+            session=session,
+            query=query,
+            table=PipelineRunSchema,
+            filter_model=runs_filter_model,
+            response_model=PipelineRunResponseModel,
+        )
 
     def update_run(
         self, run_id: UUID, run_update: PipelineRunUpdateModel
@@ -3272,6 +3682,68 @@ class SqlZenStore(BaseZenStore):
             session.refresh(existing_run)
             return existing_run.to_model()
 
+    def update_run_status_from_steps(
+        self, run_id: UUID
+    ) -> PipelineRunResponseModel:
+        """Updates the status of a pipeline run from the status of its steps.
+
+        The step statuses are aggregated with a single query while the run
+        row is locked, so concurrently finishing steps can't overwrite each
+        other's status updates.
+
+        Args:
+            run_id: The ID of the pipeline run to update.
+
+        Returns:
+            The updated pipeline run.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
+        """
+        with Session(self.engine) as session:
+            existing_run = session.exec(
+                select(PipelineRunSchema)
+                .where(PipelineRunSchema.id == run_id)
+                .with_for_update()
+            ).first()
+            if existing_run is None:
+                raise KeyError(
+                    f"Unable to update status of pipeline run with ID "
+                    f"{run_id}: No pipeline run with this ID found."
+                )
+
+            status_counts = session.exec(
+                select(  # type: ignore[call-overload]
+                    StepRunSchema.status, func.count(StepRunSchema.id)
+                )
+                .where(StepRunSchema.pipeline_run_id == run_id)
+                .group_by(StepRunSchema.status)
+            ).all()
+            step_status_counts = {
+                ExecutionStatus(status): count
+                for status, count in status_counts
+            }
+            num_steps = existing_run.num_steps
+            if num_steps is None:
+                num_steps = sum(step_status_counts.values())
+
+            new_status = get_pipeline_run_status_from_counts(
+                step_status_counts=step_status_counts, num_steps=num_steps
+            )
+            if new_status != existing_run.status:
+                run_update = PipelineRunUpdateModel(status=new_status)
+                if new_status in {
+                    ExecutionStatus.COMPLETED,
+                    ExecutionStatus.FAILED,
+                }:
+                    run_update.end_time = datetime.utcnow()
+                existing_run.update(run_update=run_update)
+                session.add(existing_run)
+            session.commit()
+
+            session.refresh(existing_run)
+            return existing_run.to_model()
+
     def delete_run(self, run_id: UUID) -> None:
         """Deletes a pipeline run.
 
@@ -3376,7 +3848,7 @@ class SqlZenStore(BaseZenStore):
 
             session.commit()
 
-            return self._run_step_schema_to_model(step_schema)
+            return self._run_step_schema_to_model(step_schema, session=session)
 
     def _set_run_step_parent_step(
         self, child_id: UUID, parent_id: UUID, session: Session
@@ -3540,79 +4012,164 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The step run.
 
+        """
+        with Session(self.engine) as session:
+            return self._get_run_step(step_run_id, session=session)
+
+    def _get_run_step(
+        self, step_run_id: UUID, session: Session
+    ) -> StepRunResponseModel:
+        """Get a step run by ID using the given session.
+
+        Args:
+            step_run_id: The ID of the step run to get.
+            session: The database session to use.
+
+        Returns:
+            The step run.
+
         Raises:
             KeyError: if the step run doesn't exist.
         """
-        with Session(self.engine) as session:
-            step_run = session.exec(
-                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
-            ).first()
-            if step_run is None:
-                raise KeyError(
-                    f"Unable to get step run with ID {step_run_id}: No step "
-                    "run with this ID found."
-                )
-            return self._run_step_schema_to_model(step_run)
+        step_run = session.exec(
+            select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+        ).first()
+        if step_run is None:
+            raise KeyError(
+                f"Unable to get step run with ID {step_run_id}: No step "
+                "run with this ID found."
+            )
+        return self._run_step_schema_to_model(step_run, session=session)
 
     def _run_step_schema_to_model(
-        self, step_run: StepRunSchema
+        self, step_run: StepRunSchema, session: Session
     ) -> StepRunResponseModel:
         """Converts a run step schema to a step model.
 
         Args:
             step_run: The run step schema to convert.
+            session: The database session to use.
 
         Returns:
             The run step model.
         """
-        with Session(self.engine) as session:
-            # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
-            ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+        return self._run_step_schemas_to_models([step_run], session=session)[0]
 
+    def _run_step_schemas_to_models(
+        self,
+        step_runs: List[StepRunSchema],
+        session: Session,
+        include_artifacts: bool = True,
+    ) -> List[StepRunResponseModel]:
+        """Converts multiple run step schemas to step models.
+
+        The parent steps, input artifacts and output artifacts of all step runs
+        are fetched with a constant number of queries, independent of the
+        number of step runs.
+
+        Args:
+            step_runs: The run step schemas to convert.
+            session: The database session to use.
+            include_artifacts: Whether to fetch the input and output
+                artifacts. If `False`, the artifacts of the returned models
+                are empty.
+
+        Returns:
+            The run step models, in the same order as the schemas.
+        """
+        step_run_ids = [step_run.id for step_run in step_runs]
+        if not step_run_ids:
+            return []
+
+        # Get parent steps.
+        parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+        parent_links = session.exec(
+            select(StepRunParentsSchema).where(
+                StepRunParentsSchema.child_id.in_(  # type: ignore[attr-defined]
+                    step_run_ids
+                )
+            )
+        ).all()
+        for parent_link in parent_links:
+            parent_step_ids[parent_link.child_id].append(parent_link.parent_id)
+
+        input_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        output_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        if include_artifacts:
             # Get input artifacts.
             input_artifact_list = session.exec(
                 select(
-                    ArtifactSchema,
+                    StepRunInputArtifactSchema.step_id,
                     StepRunInputArtifactSchema.name,
+                    ArtifactSchema,
                 )
                 .where(
                     ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
                 )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(selectinload(ArtifactSchema.run_metadata))
             ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
 
             # Get output artifacts.
             output_artifact_list = session.exec(
                 select(
-                    ArtifactSchema,
+                    StepRunOutputArtifactSchema.step_id,
                     StepRunOutputArtifactSchema.name,
+                    ArtifactSchema,
                 )
                 .where(
                     ArtifactSchema.id
                     == StepRunOutputArtifactSchema.artifact_id
                 )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(selectinload(ArtifactSchema.run_metadata))
             ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
+
+            # Convert all artifacts, fetching their producer steps at once.
+            artifact_schemas = {
+                artifact.id: artifact
+                for (_, _, artifact) in (
+                    input_artifact_list + output_artifact_list
+                )
+            }
+            artifact_models = {
+                artifact_model.id: artifact_model
+                for artifact_model in self._artifact_schemas_to_models(
+                    list(artifact_schemas.values()), session=session
+                )
             }
 
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
+            for step_id, input_name, artifact in input_artifact_list:
+                input_artifacts[step_id][input_name] = artifact_models[
+                    artifact.id
+                ]
+
+            for step_id, output_name, artifact in output_artifact_list:
+                output_artifacts[step_id][output_name] = artifact_models[
+                    artifact.id
+                ]
+
+        # Convert to models.
+        return [
+            step_run.to_model(
+                parent_step_ids=parent_step_ids[step_run.id],
+                input_artifacts=input_artifacts[step_run.id],
+                output_artifacts=output_artifacts[step_run.id],
             )
+            for step_run in step_runs
+        ]
 
     def list_run_steps(
         self, step_run_filter_model: StepRunFilterModel
@@ -3627,14 +4184,67 @@ class SqlZenStore(BaseZenStore):
             A list of all step runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(StepRunSchema)
-            return self.filter_and_paginate(
-                session=session,
-                query=query,
-                table=StepRunSchema,
-                filter_model=step_run_filter_model,
-                custom_schema_to_model_conversion=self._run_step_schema_to_model,
-            )
+            return self._list_run_steps(step_run_filter_model, session=session)
+
+    def _list_run_steps(
+        self, step_run_filter_model: StepRunFilterModel, session: Session
+    ) -> Page[StepRunResponseModel]:
+        """List all step runs matching the given filter criteria.
+
+        Args:
+            step_run_filter_model: All filter parameters including pagination
+                params.
+            session: The database session to use.
+
+        Returns:
+            A list of all step runs matching the filter criteria.
+        """
+        query = select(StepRunSchema).options(
+            selectinload(StepRunSchema.run_metadata)
+        )
+        # Don't fetch the artifacts if they are excluded anyway.
+        include_artifacts = not (
+            step_run_filter_model.excludes_field("input_artifacts")
+            and step_run_filter_model.excludes_field("output_artifacts")
+        )
+        return self.filter_and_paginate(
+            session=session,
+            query=query,
+            table=StepRunSchema,
+            filter_model=step_run_filter_model,
+            custom_bulk_schema_to_model_conversion=partial(
+                self._run_step_schemas_to_models,
+                include_artifacts=include_artifacts,
+            ),
+            response_model=StepRunResponseModel,
+        )
+
+    def get_cached_step_run(
+        self, cache_key: str, workspace_id: UUID
+    ) -> Optional[StepRunResponseModel]:
+        """Gets the latest completed step run with the given cache key.
+
+        Args:
+            cache_key: The cache key of the step run.
+            workspace_id: The ID of the workspace in which to look for the
+                step run.
+
+        Returns:
+            The latest completed step run with the given cache key in the
+            workspace, or `None` if no such step run exists.
+        """
+        with Session(self.engine) as session:
+            step_run = session.exec(
+                select(StepRunSchema)
+                .where(StepRunSchema.workspace_id == workspace_id)
+                .where(StepRunSchema.cache_key == cache_key)
+                .where(StepRunSchema.status == ExecutionStatus.COMPLETED)
+                .order_by(desc(StepRunSchema.created))
+                .limit(1)
+            ).first()
+            if step_run is None:
+                return None
+            return self._run_step_schema_to_model(step_run, session=session)
 
     def update_run_step(
         self,
@@ -3684,7 +4294,91 @@ class SqlZenStore(BaseZenStore):
             session.commit()
             session.refresh(existing_step_run)
 
-            return self._run_step_schema_to_model(existing_step_run)
+            return self._run_step_schema_to_model(
+                existing_step_run, session=session
+            )
+
+    def finalize_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_finalization: StepRunFinalizeModel,
+    ) -> StepRunResponseModel:
+        """Publishes the outputs and final status of a step run.
+
+        Creates the output artifacts and their metadata, links the artifacts
+        to the step run and updates the step run status in one transaction.
+
+        Args:
+            step_run_id: The ID of the step run to finalize.
+            step_run_finalization: The outputs and status of the step run.
+
+        Returns:
+            The updated step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist or metadata was provided
+                for an output without an artifact.
+        """
+        with Session(self.engine) as session:
+            existing_step_run = session.exec(
+                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+            ).first()
+            if existing_step_run is None:
+                raise KeyError(
+                    f"Unable to finalize step with ID {step_run_id}: "
+                    f"No step with this ID found."
+                )
+
+            # Create the output artifacts and link them to the step run. The
+            # artifact IDs are generated when creating the schemas, so no
+            # intermediate flush is required.
+            artifact_ids: Dict[str, UUID] = {}
+            for (
+                name,
+                artifact,
+            ) in step_run_finalization.output_artifacts.items():
+                artifact_schema = ArtifactSchema.from_request(artifact)
+                session.add(artifact_schema)
+                session.add(
+                    StepRunOutputArtifactSchema(
+                        step_id=step_run_id,
+                        artifact_id=artifact_schema.id,
+                        name=name,
+                    )
+                )
+                artifact_ids[name] = artifact_schema.id
+
+            # Create the metadata of the output artifacts.
+            for (
+                name,
+                run_metadata,
+            ) in step_run_finalization.output_artifact_metadata.items():
+                if name not in artifact_ids:
+                    raise KeyError(
+                        f"Unable to finalize step with ID {step_run_id}: "
+                        f"No output artifact with name '{name}' found for "
+                        "the artifact metadata."
+                    )
+                for metadata in run_metadata:
+                    metadata = metadata.copy(
+                        update={"artifact_id": artifact_ids[name]}
+                    )
+                    session.add(RunMetadataSchema.from_request(metadata))
+
+            existing_step_run.update(
+                StepRunUpdateModel(
+                    status=step_run_finalization.status,
+                    end_time=step_run_finalization.end_time,
+                )
+            )
+            session.add(existing_step_run)
+
+            session.commit()
+            session.refresh(existing_step_run)
+
+            return self._run_step_schema_to_model(
+                existing_step_run, session=session
+            )
 
     # ---------
     # Artifacts
@@ -3705,35 +4399,121 @@ class SqlZenStore(BaseZenStore):
             artifact_schema = ArtifactSchema.from_request(artifact)
             session.add(artifact_schema)
             session.commit()
-            return self._artifact_schema_to_model(artifact_schema)
+            return self._artifact_schema_to_model(
+                artifact_schema, session=session
+            )
+
+    def batch_create_artifacts(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in one transaction.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+        with Session(self.engine) as session:
+            artifact_schemas = [
+                ArtifactSchema.from_request(artifact) for artifact in artifacts
+            ]
+            session.add_all(artifact_schemas)
+            session.commit()
+
+            # Reload all expired schemas with a single query.
+            session.exec(
+                select(ArtifactSchema).where(
+                    ArtifactSchema.id.in_(  # type: ignore[attr-defined]
+                        [schema.id for schema in artifact_schemas]
+                    )
+                )
+            ).all()
+            return self._artifact_schemas_to_models(
+                artifact_schemas, session=session
+            )
 
     def _artifact_schema_to_model(
-        self, artifact_schema: ArtifactSchema
+        self, artifact_schema: ArtifactSchema, session: Session
     ) -> ArtifactResponseModel:
         """Converts an artifact schema to a model.
 
         Args:
             artifact_schema: The artifact schema to convert.
+            session: The database session to use.
 
         Returns:
             The converted artifact model.
         """
-        # Find the producer step run ID.
-        with Session(self.engine) as session:
-            producer_step_run_id = session.exec(
-                select(StepRunOutputArtifactSchema.step_id)
-                .where(
-                    StepRunOutputArtifactSchema.artifact_id
-                    == artifact_schema.id
-                )
-                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
-                .where(StepRunSchema.status != ExecutionStatus.CACHED)
-            ).first()
+        return self._artifact_schemas_to_models(
+            [artifact_schema], session=session
+        )[0]
+
+    def _artifact_schemas_to_models(
+        self, artifact_schemas: List[ArtifactSchema], session: Session
+    ) -> List[ArtifactResponseModel]:
+        """Converts multiple artifact schemas to models.
+
+        The producer step runs of all artifacts are fetched with a single
+        query.
+
+        Args:
+            artifact_schemas: The artifact schemas to convert.
+            session: The database session to use.
+
+        Returns:
+            The converted artifact models, in the same order as the schemas.
+        """
+        artifact_ids = [artifact.id for artifact in artifact_schemas]
+        if not artifact_ids:
+            return []
+
+        producer_step_run_ids = self._get_producer_step_run_ids(
+            artifact_ids, session=session
+        )
+
+        # Convert the artifact schemas to models.
+        return [
+            artifact.to_model(
+                producer_step_run_id=producer_step_run_ids.get(artifact.id)
+            )
+            for artifact in artifact_schemas
+        ]
+
+    @staticmethod
+    def _get_producer_step_run_ids(
+        artifact_ids: List[UUID], session: Session
+    ) -> Dict[UUID, UUID]:
+        """Finds the step runs that originally produced artifacts.
+
+        Args:
+            artifact_ids: The IDs of the artifacts.
+            session: The database session to use.
 
-            # Convert the artifact schema to a model.
-            return artifact_schema.to_model(
-                producer_step_run_id=producer_step_run_id
+        Returns:
+            Mapping of artifact IDs to the ID of the first non-cached step run
+            that output the artifact.
+        """
+        if not artifact_ids:
+            return {}
+
+        producer_step_run_ids: Dict[UUID, UUID] = {}
+        producer_links = session.exec(
+            select(
+                StepRunOutputArtifactSchema.artifact_id,
+                StepRunOutputArtifactSchema.step_id,
+            )
+            .where(
+                StepRunOutputArtifactSchema.artifact_id.in_(  # type: ignore[attr-defined]
+                    artifact_ids
+                )
             )
+            .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
+            .where(StepRunSchema.status != ExecutionStatus.CACHED)
+        ).all()
+        for artifact_id, step_run_id in producer_links:
+            producer_step_run_ids.setdefault(artifact_id, step_run_id)
+        return producer_step_run_ids
 
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -3744,19 +4524,34 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The artifact.
 
+        """
+        with Session(self.engine) as session:
+            return self._get_artifact(artifact_id, session=session)
+
+    def _get_artifact(
+        self, artifact_id: UUID, session: Session
+    ) -> ArtifactResponseModel:
+        """Gets an artifact using the given session.
+
+        Args:
+            artifact_id: The ID of the artifact to get.
+            session: The database session to use.
+
+        Returns:
+            The artifact.
+
         Raises:
             KeyError: if the artifact doesn't exist.
         """
-        with Session(self.engine) as session:
-            artifact = session.exec(
-                select(ArtifactSchema).where(ArtifactSchema.id == artifact_id)
-            ).first()
-            if artifact is None:
-                raise KeyError(
-                    f"Unable to get artifact with ID {artifact_id}: "
-                    f"No artifact with this ID found."
-                )
-            return self._artifact_schema_to_model(artifact)
+        artifact = session.exec(
+            select(ArtifactSchema).where(ArtifactSchema.id == artifact_id)
+        ).first()
+        if artifact is None:
+            raise KeyError(
+                f"Unable to get artifact with ID {artifact_id}: "
+                f"No artifact with this ID found."
+            )
+        return self._artifact_schema_to_model(artifact, session=session)
 
     def list_artifacts(
         self, artifact_filter_model: ArtifactFilterModel
@@ -3771,25 +4566,42 @@ class SqlZenStore(BaseZenStore):
             A list of all artifacts matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(ArtifactSchema)
-            if artifact_filter_model.only_unused:
-                query = query.where(
-                    ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
-                        select(StepRunOutputArtifactSchema.artifact_id)
-                    )
+            return self._list_artifacts(artifact_filter_model, session=session)
+
+    def _list_artifacts(
+        self, artifact_filter_model: ArtifactFilterModel, session: Session
+    ) -> Page[ArtifactResponseModel]:
+        """List all artifacts matching the given filter criteria.
+
+        Args:
+            artifact_filter_model: All filter parameters including pagination
+                params.
+            session: The database session to use.
+
+        Returns:
+            A list of all artifacts matching the filter criteria.
+        """
+        query = select(ArtifactSchema).options(
+            selectinload(ArtifactSchema.run_metadata)
+        )
+        if artifact_filter_model.only_unused:
+            query = query.where(
+                ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
+                    select(StepRunOutputArtifactSchema.artifact_id)
                 )
-                query = query.where(
-                    ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
-                        select(StepRunInputArtifactSchema.artifact_id)
-                    )
+            )
+            query = query.where(
+                ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
+                    select(StepRunInputArtifactSchema.artifact_id)
                 )
-            return self.filter_and_paginate(
-                session=session,
-                query=query,
-                table=ArtifactSchema,
-                filter_model=artifact_filter_model,
-                custom_schema_to_model_conversion=self._artifact_schema_to_model,
             )
+        return self.filter_and_paginate(
+            session=session,
+            query=query,
+            table=ArtifactSchema,
+            filter_model=artifact_filter_model,
+            custom_bulk_schema_to_model_conversion=self._artifact_schemas_to_models,
+        )
 
     def delete_artifact(self, artifact_id: UUID) -> None:
         """Deletes an artifact.
@@ -3833,6 +4645,35 @@ class SqlZenStore(BaseZenStore):
             session.commit()
             return run_metadata_schema.to_model()
 
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequestModel]
+    ) -> List[RunMetadataResponseModel]:
+        """Creates multiple run metadata entries in one transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata, in the same order as the requests.
+        """
+        with Session(self.engine) as session:
+            run_metadata_schemas = [
+                RunMetadataSchema.from_request(metadata)
+                for metadata in run_metadata
+            ]
+            session.add_all(run_metadata_schemas)
+            session.commit()
+
+            # Reload all expired schemas with a single query.
+            session.exec(
+                select(RunMetadataSchema).where(
+                    RunMetadataSchema.id.in_(  # type: ignore[attr-defined]
+                        [schema.id for schema in run_metadata_schemas]
+                    )
+                )
+            ).all()
+            return [schema.to_model() for schema in run_metadata_schemas]
+
     def list_run_metadata(
         self,
         run_metadata_filter_model: RunMetadataFilterModel,
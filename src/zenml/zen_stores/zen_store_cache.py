@@ -0,0 +1,419 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache for entities fetched from a Zen store."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from pydantic import BaseModel
+
+from zenml.logger import get_logger
+from zenml.utils.enum_utils import StrEnum
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_ZEN_STORE_CACHE_SIZE = 1024
+
+
+class CachedEntityType(StrEnum):
+    """Types of entities that can be cached."""
+
+    SERVER_INFO = "server_info"
+    USER = "user"
+    WORKSPACE = "workspace"
+    STACK = "stack"
+    STACK_COMPONENT = "stack_component"
+    FLAVOR = "flavor"
+    DEPLOYMENT = "deployment"
+    BUILD = "build"
+    STEP_RUN = "step_run"
+    ARTIFACT = "artifact"
+    RUN_DAG = "run_dag"
+    AUTH_CONTEXT = "auth_context"
+
+
+# Time to live (in seconds) for each entity type. Entities that are immutable
+# by design have a TTL of `None` and only get evicted if the cache is full or
+# if they are invalidated by a write operation of the same client. Metadata
+# can be added to finished step runs and artifacts at any time, e.g. by
+# extracting the artifact metadata in the background, so these expire.
+DEFAULT_CACHE_TTLS: Dict[CachedEntityType, Optional[float]] = {
+    CachedEntityType.SERVER_INFO: 300,
+    CachedEntityType.USER: 30,
+    CachedEntityType.WORKSPACE: 30,
+    CachedEntityType.STACK: 30,
+    CachedEntityType.STACK_COMPONENT: 30,
+    CachedEntityType.FLAVOR: 60,
+    CachedEntityType.DEPLOYMENT: None,
+    CachedEntityType.BUILD: None,
+    CachedEntityType.STEP_RUN: 300,
+    CachedEntityType.ARTIFACT: 300,
+    # Output metadata of finished steps can be published in the background.
+    CachedEntityType.RUN_DAG: 60,
+    CachedEntityType.AUTH_CONTEXT: 30,
+}
+
+_CacheKey = Tuple[CachedEntityType, Hashable]
+_CacheEntry = Tuple[Optional[float], Any]
+
+
+class CacheStatistics(BaseModel):
+    """Hit and miss counters of a cached entity type."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class ZenStoreCache:
+    """Thread-safe LRU cache with a time to live per entity type.
+
+    Cache entries are keyed by the entity type and an arbitrary hashable key,
+    e.g. the name and arguments of the store method that fetched the entity.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_ZEN_STORE_CACHE_SIZE,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: Maximum number of entries to keep in the cache. Once this
+                size is exceeded, the least recently used entries are evicted.
+            ttls: Time to live in seconds for each entity type, overriding the
+                defaults. A value of `None` caches the entities until they are
+                evicted or invalidated.
+
+        Raises:
+            ValueError: If the maximum size is not positive.
+        """
+        if max_size < 1:
+            raise ValueError(
+                f"Invalid cache size `{max_size}`, the value needs to be a "
+                "positive integer."
+            )
+
+        self.max_size = max_size
+        self.ttls: Dict[CachedEntityType, Optional[float]] = dict(
+            DEFAULT_CACHE_TTLS
+        )
+        for entity_type, ttl in (ttls or {}).items():
+            self.ttls[CachedEntityType(entity_type)] = ttl
+
+        # Maps (entity type, key) to (expiration time, value).
+        self._entries: "OrderedDict[_CacheKey, _CacheEntry]" = OrderedDict()
+        self._statistics = {
+            entity_type: CacheStatistics() for entity_type in CachedEntityType
+        }
+        # Incremented whenever entities of a type are invalidated, so values
+        # that were fetched before an invalidation don't get cached.
+        self._generations = {
+            entity_type: 0 for entity_type in CachedEntityType
+        }
+        self._lock = threading.RLock()
+
+    def get_generation(self, entity_type: CachedEntityType) -> int:
+        """Gets the number of times that entities of a type were invalidated.
+
+        Args:
+            entity_type: The type of the cached entities.
+
+        Returns:
+            The invalidation counter of the entity type.
+        """
+        with self._lock:
+            return self._generations[entity_type]
+
+    def get(
+        self, entity_type: CachedEntityType, key: Hashable
+    ) -> Tuple[bool, Any]:
+        """Gets an entry from the cache.
+
+        Args:
+            entity_type: The type of the cached entity.
+            key: The key of the entry.
+
+        Returns:
+            Tuple of a boolean indicating whether the entry was found and the
+            cached value.
+        """
+        with self._lock:
+            statistics = self._statistics[entity_type]
+            entry = self._entries.get((entity_type, key))
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end((entity_type, key))
+                    statistics.hits += 1
+                    return True, value
+
+                del self._entries[(entity_type, key)]
+                statistics.size -= 1
+
+            statistics.misses += 1
+            return False, None
+
+    def set(
+        self,
+        entity_type: CachedEntityType,
+        key: Hashable,
+        value: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Stores an entry in the cache.
+
+        Args:
+            entity_type: The type of the cached entity.
+            key: The key of the entry.
+            value: The value to cache.
+            generation: The invalidation counter of the entity type at the
+                time the value was fetched. If the entities were invalidated
+                since then, the value might be outdated and is not cached.
+        """
+        ttl = self.ttls[entity_type]
+        if ttl is not None and ttl <= 0:
+            return
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if (
+                generation is not None
+                and generation != self._generations[entity_type]
+            ):
+                return
+            if (entity_type, key) not in self._entries:
+                self._statistics[entity_type].size += 1
+            self._entries[(entity_type, key)] = (expires_at, value)
+            self._entries.move_to_end((entity_type, key))
+
+            while len(self._entries) > self.max_size:
+                (evicted_type, _), _ = self._entries.popitem(last=False)
+                self._statistics[evicted_type].size -= 1
+                self._statistics[evicted_type].evictions += 1
+
+    def invalidate(self, *entity_types: CachedEntityType) -> None:
+        """Removes all entries of the given entity types from the cache.
+
+        Args:
+            *entity_types: The entity types to invalidate.
+        """
+        with self._lock:
+            for cache_key in list(self._entries):
+                if cache_key[0] in entity_types:
+                    del self._entries[cache_key]
+            for entity_type in entity_types:
+                self._statistics[entity_type].size = 0
+                self._generations[entity_type] += 1
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        self.invalidate(*CachedEntityType)
+
+    def get_statistics(self) -> Dict[str, CacheStatistics]:
+        """Gets the hit and miss counters for each entity type.
+
+        Returns:
+            A copy of the current counters for each entity type.
+        """
+        with self._lock:
+            return {
+                entity_type.value: statistics.copy()
+                for entity_type, statistics in self._statistics.items()
+            }
+
+
+def _is_finished_step_run(step_run: Any) -> bool:
+    """Checks if a step run is finished and can't change anymore.
+
+    Args:
+        step_run: The step run model.
+
+    Returns:
+        Whether the step run is finished.
+    """
+    return cast(bool, step_run.status.is_finished)
+
+
+CACHE_CONDITIONS: Dict[CachedEntityType, Callable[[Any], bool]] = {
+    CachedEntityType.STEP_RUN: _is_finished_step_run,
+}
+
+
+def cached(entity_type: CachedEntityType) -> Callable[[F], F]:
+    """Decorator to cache the return value of a Zen store method.
+
+    The decorated method must belong to a store with a `cache` attribute.
+    If this attribute is `None`, the method is called without caching. The
+    cache key consists of the method name and all arguments, so these
+    need to be hashable or pydantic models.
+
+    Args:
+        entity_type: The type of entity returned by the method.
+
+    Returns:
+        The method decorator.
+    """
+
+    def _decorator(func: F) -> F:
+        """Caches the return value of a method.
+
+        Args:
+            func: The method to decorate.
+
+        Returns:
+            The decorated method.
+        """
+
+        @wraps(func)
+        def _wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            """Fetches the return value from the cache if possible.
+
+            Args:
+                self: The store instance.
+                *args: Positional arguments of the method.
+                **kwargs: Keyword arguments of the method.
+
+            Returns:
+                The (possibly cached) return value of the method.
+            """
+            cache: Optional[ZenStoreCache] = getattr(self, "cache", None)
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            try:
+                key = _make_cache_key(func.__name__, args, kwargs)
+            except TypeError:
+                logger.debug(
+                    "Unable to cache the result of `%s`: unhashable "
+                    "arguments.",
+                    func.__name__,
+                )
+                return func(self, *args, **kwargs)
+
+            found, value = cache.get(entity_type, key)
+            if not found:
+                generation = cache.get_generation(entity_type)
+                value = func(self, *args, **kwargs)
+                condition = CACHE_CONDITIONS.get(entity_type)
+                if condition is not None and not condition(value):
+                    return value
+                cache.set(entity_type, key, value, generation=generation)
+
+            # Return a copy so callers can't modify the cached value.
+            return copy.deepcopy(value)
+
+        return cast(F, _wrapper)
+
+    return _decorator
+
+
+def invalidates_cache(*entity_types: CachedEntityType) -> Callable[[F], F]:
+    """Decorator to invalidate cached entities when calling a store method.
+
+    Args:
+        *entity_types: The entity types that the method modifies.
+
+    Returns:
+        The method decorator.
+    """
+
+    def _decorator(func: F) -> F:
+        """Invalidates the cache after calling a method.
+
+        Args:
+            func: The method to decorate.
+
+        Returns:
+            The decorated method.
+        """
+
+        @wraps(func)
+        def _wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            """Invalidates the cache after calling the method.
+
+            Args:
+                self: The store instance.
+                *args: Positional arguments of the method.
+                **kwargs: Keyword arguments of the method.
+
+            Returns:
+                The return value of the method.
+            """
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                cache: Optional[ZenStoreCache] = getattr(self, "cache", None)
+                if cache is not None:
+                    cache.invalidate(*entity_types)
+
+        return cast(F, _wrapper)
+
+    return _decorator
+
+
+def _make_cache_key(
+    method_name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Hashable:
+    """Builds a cache key from the name and arguments of a method.
+
+    Args:
+        method_name: The name of the method.
+        args: Positional arguments of the method.
+        kwargs: Keyword arguments of the method.
+
+    Returns:
+        The cache key.
+    """
+
+    def _to_hashable(value: Any) -> Hashable:
+        """Converts a method argument to a hashable value.
+
+        Args:
+            value: The method argument.
+
+        Returns:
+            The hashable value.
+        """
+        if isinstance(value, BaseModel):
+            return (type(value).__name__, value.json(sort_keys=True))
+        hash(value)
+        return cast(Hashable, value)
+
+    return (
+        method_name,
+        tuple(_to_hashable(arg) for arg in args),
+        tuple(
+            (name, _to_hashable(value))
+            for name, value in sorted(kwargs.items())
+        ),
+    )
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """ZenML Store interface."""
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.models import (
@@ -55,6 +55,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunFinalizeModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -86,6 +87,9 @@ from zenml.models.schedule_model import (
 )
 from zenml.models.server_models import ServerModel
 
+if TYPE_CHECKING:
+    from zenml.post_execution.lineage.lineage_graph import LineageGraph
+
 
 class ZenStoreInterface(ABC):
     """ZenML store interface.
@@ -1147,6 +1151,21 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def get_run_dag(self, run_id: UUID) -> "LineageGraph":
+        """Gets the lineage graph of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+
+        Returns:
+            The lineage graph with all steps, artifacts and metadata of the
+            pipeline run.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
+        """
+
     @abstractmethod
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequestModel
@@ -1195,6 +1214,22 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def update_run_status_from_steps(
+        self, run_id: UUID
+    ) -> PipelineRunResponseModel:
+        """Updates the status of a pipeline run from the status of its steps.
+
+        Args:
+            run_id: The ID of the pipeline run to update.
+
+        Returns:
+            The updated pipeline run.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
+        """
+
     @abstractmethod
     def delete_run(self, run_id: UUID) -> None:
         """Deletes a pipeline run.
@@ -1255,6 +1290,25 @@ class ZenStoreInterface(ABC):
             A list of all step runs matching the filter criteria.
         """
 
+    @abstractmethod
+    def get_cached_step_run(
+        self, cache_key: str, workspace_id: UUID
+    ) -> Optional[StepRunResponseModel]:
+        """Gets the latest completed step run with the given cache key.
+
+        Unlike `list_run_steps`, this does not count the total number of
+        matching step runs, which makes it a single indexed lookup.
+
+        Args:
+            cache_key: The cache key of the step run.
+            workspace_id: The ID of the workspace in which to look for the
+                step run.
+
+        Returns:
+            The latest completed step run with the given cache key in the
+            workspace, or `None` if no such step run exists.
+        """
+
     @abstractmethod
     def update_run_step(
         self,
@@ -1274,6 +1328,28 @@ class ZenStoreInterface(ABC):
             KeyError: if the step run doesn't exist.
         """
 
+    @abstractmethod
+    def finalize_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_finalization: StepRunFinalizeModel,
+    ) -> StepRunResponseModel:
+        """Publishes the outputs and final status of a step run.
+
+        Creates the output artifacts and their metadata, links the artifacts
+        to the step run and updates the step run status in one transaction.
+
+        Args:
+            step_run_id: The ID of the step run to finalize.
+            step_run_finalization: The outputs and status of the step run.
+
+        Returns:
+            The updated step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+
     # ---------
     # Artifacts
     # ---------
@@ -1291,6 +1367,19 @@ class ZenStoreInterface(ABC):
             The created artifact.
         """
 
+    @abstractmethod
+    def batch_create_artifacts(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in one transaction.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+
     @abstractmethod
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -1347,6 +1436,19 @@ class ZenStoreInterface(ABC):
             The created run metadata.
         """
 
+    @abstractmethod
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequestModel]
+    ) -> List[RunMetadataResponseModel]:
+        """Creates multiple run metadata entries in one transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata, in the same order as the requests.
+        """
+
     @abstractmethod
     def list_run_metadata(
         self,
@@ -18,7 +18,7 @@ import click
 import pytest
 from click.testing import CliRunner
 
-from zenml.cli.cli import ZenMLCLI, cli
+from zenml.cli.cli import LAZY_COMMANDS, ZenMLCLI, cli
 from zenml.cli.formatter import ZenFormatter
 
 
@@ -39,6 +39,21 @@ def test_cli(runner):
     assert result.exit_code == 0
 
 
+def test_lazy_commands_match_registered_commands():
+    """Tests that the lazily imported modules register all lazy commands."""
+    cli.commands.load_all()
+    assert set(cli.commands) == set(LAZY_COMMANDS)
+    assert cli.list_commands(click.Context(cli)) == sorted(LAZY_COMMANDS)
+
+
+def test_missing_cli_command_raises_key_error():
+    """Tests that accessing a command that doesn't exist fails."""
+    with pytest.raises(KeyError):
+        cli.commands["not_a_command"]
+
+    assert cli.get_command(click.Context(cli), "not_a_command") is None
+
+
 def test_ZenMLCLI_formatter():
     """
     Test the ZenFormatter class.
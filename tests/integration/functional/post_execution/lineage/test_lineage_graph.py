@@ -137,3 +137,7 @@ def test_generate_run_nodes_and_edges(
                 "True",
                 MetadataTypeEnum.BOOL,
             )
+
+    # Check that the store builds the same graph
+    store_graph = clean_client.zen_store.get_run_dag(pipeline_run.id)
+    assert store_graph == graph
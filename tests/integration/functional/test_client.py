@@ -14,16 +14,21 @@
 import os
 import random
 import string
+import time
 from contextlib import ExitStack as does_not_raise
 from contextlib import contextmanager
+from functools import partial
 from typing import Generator, Optional
 from uuid import uuid4
 
 import pytest
 
+from zenml.artifact_stores.base_artifact_store import (
+    CONTENT_INDEX_FILE_SUFFIX,
+)
 from zenml.client import Client
 from zenml.config.pipeline_configurations import PipelineSpec
-from zenml.enums import SecretScope, StackComponentType
+from zenml.enums import ArtifactType, SecretScope, StackComponentType
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
@@ -34,13 +39,14 @@ from zenml.exceptions import (
 from zenml.io import fileio
 from zenml.metadata.metadata_types import MetadataTypeEnum
 from zenml.models import (
+    ArtifactRequestModel,
     ComponentResponseModel,
     PipelineBuildRequestModel,
     PipelineDeploymentRequestModel,
     PipelineRequestModel,
     StackResponseModel,
 )
-from zenml.utils import io_utils
+from zenml.utils import io_utils, yaml_utils
 from zenml.utils.string_utils import random_str
 
 
@@ -858,6 +864,105 @@ def test_listing_builds(clean_client):
     assert len(builds) == 0
 
 
+def test_listing_builds_with_cursor(clean_client):
+    """Tests listing builds using keyset pagination."""
+    for _ in range(5):
+        request = PipelineBuildRequestModel(
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            images={},
+            is_local=False,
+        )
+        clean_client.zen_store.create_build(request)
+
+    all_builds = clean_client.list_builds(sort_by="desc:created").items
+
+    page = clean_client.list_builds(
+        sort_by="desc:created", size=2, count_total=False
+    )
+    assert page.total is None
+    assert page.total_pages is None
+
+    builds = list(page.items)
+    while page.next_cursor:
+        page = clean_client.list_builds(
+            sort_by="desc:created",
+            size=2,
+            cursor=page.next_cursor,
+            count_total=False,
+        )
+        builds += page.items
+
+    assert builds == all_builds
+    assert (
+        clean_client.depaginate(partial(clean_client.list_builds, size=2))
+        == clean_client.list_builds().items
+    )
+
+
+def test_listing_builds_without_counting(clean_client):
+    """Tests listing builds without counting the total number of items."""
+    for _ in range(3):
+        request = PipelineBuildRequestModel(
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            images={},
+            is_local=False,
+        )
+        clean_client.zen_store.create_build(request)
+
+    counted_page = clean_client.list_builds(size=2)
+    assert counted_page.total == 3
+    assert counted_page.total_pages == 2
+
+    page = clean_client.list_builds(size=2, count_total=False)
+    assert page.total is None
+    assert page.total_pages is None
+    assert page.items == counted_page.items
+    assert page.next_cursor is not None
+
+    # Without counting, page numbers past the end return an empty page
+    # instead of raising an error
+    page = clean_client.list_builds(page=5, size=2, count_total=False)
+    assert len(page) == 0
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "sort_by",
+    ["asc:user_id", "desc:user_id", "asc:stack_id", "desc:stack_id"],
+)
+def test_listing_builds_with_cursor_and_ties(clean_client, sort_by):
+    """Tests keyset pagination if many items have the same sort value."""
+    # All builds have the same user and no stack, so the sort column only has
+    # ties (and `NULL` values for the stack) and the ID decides the order.
+    for _ in range(5):
+        request = PipelineBuildRequestModel(
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            images={},
+            is_local=False,
+        )
+        clean_client.zen_store.create_build(request)
+
+    all_builds = clean_client.list_builds(sort_by=sort_by).items
+    assert len(all_builds) == 5
+
+    page = clean_client.list_builds(sort_by=sort_by, size=2, count_total=False)
+    builds = list(page.items)
+    while page.next_cursor:
+        assert len(builds) < len(all_builds)
+        page = clean_client.list_builds(
+            sort_by=sort_by,
+            size=2,
+            cursor=page.next_cursor,
+            count_total=False,
+        )
+        builds += page.items
+
+    assert builds == all_builds
+
+
 def test_getting_builds(clean_client):
     """Tests getting builds."""
 
@@ -964,3 +1069,77 @@ def test_deleting_deployments(clean_client):
 
     with pytest.raises(KeyError):
         clean_client.get_deployment(str(response.id))
+
+
+def test_pruning_content_addressed_artifacts(clean_client: Client, tmp_path):
+    """Tests deleting and pruning content-addressed artifact data."""
+    artifact_store = clean_client.active_stack.artifact_store
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "data.txt").write_text("shared")
+    shared_uri = artifact_store.store_content_addressed(str(source_dir))
+    (source_dir / "data.txt").write_text("unreferenced")
+    unreferenced_uri = artifact_store.store_content_addressed(str(source_dir))
+
+    artifacts = [
+        clean_client.zen_store.create_artifact(
+            ArtifactRequestModel(
+                name="output",
+                artifact_store_id=artifact_store.id,
+                type=ArtifactType.DATA,
+                uri=shared_uri,
+                materializer="module.Materializer",
+                data_type="module.DataType",
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+            )
+        )
+        for _ in range(2)
+    ]
+
+    assert clean_client.prune_artifact_content() == []
+    assert clean_client.prune_artifact_content(min_age=0) == [unreferenced_uri]
+    assert not fileio.exists(unreferenced_uri)
+
+    # The content is shared, so it only gets deleted with the last artifact
+    clean_client.delete_artifact(
+        artifacts[0].id, delete_from_artifact_store=True
+    )
+    assert fileio.exists(shared_uri)
+    clean_client.delete_artifact(
+        artifacts[1].id, delete_from_artifact_store=True
+    )
+    assert not fileio.exists(shared_uri)
+
+
+def test_deleting_artifacts_keeps_recently_reused_content(
+    clean_client: Client, tmp_path
+):
+    """Tests that content reused after an artifact was created is kept."""
+    artifact_store = clean_client.active_stack.artifact_store
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "data.txt").write_text("reused")
+    uri = artifact_store.store_content_addressed(str(source_dir))
+
+    artifact = clean_client.zen_store.create_artifact(
+        ArtifactRequestModel(
+            name="output",
+            artifact_store_id=artifact_store.id,
+            type=ArtifactType.DATA,
+            uri=uri,
+            materializer="module.Materializer",
+            data_type="module.DataType",
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+        )
+    )
+    # A running step reuses the content but didn't register its artifact yet
+    index_path = uri + CONTENT_INDEX_FILE_SUFFIX
+    index = yaml_utils.read_json(index_path)
+    index["created"] = time.time() + 60
+    yaml_utils.write_json(index_path, index)
+
+    clean_client.delete_artifact(artifact.id, delete_from_artifact_store=True)
+    assert fileio.exists(uri)
+    assert clean_client.prune_artifact_content(min_age=0) == []
@@ -28,24 +28,36 @@ from tests.integration.functional.zen_stores.utils import (
     list_of_entities,
 )
 from zenml.client import Client
-from zenml.enums import StackComponentType, StoreType
+from zenml.enums import (
+    ArtifactType,
+    ExecutionStatus,
+    StackComponentType,
+    StoreType,
+)
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
     StackExistsError,
 )
+from zenml.metadata.metadata_types import MetadataTypeEnum
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactRequestModel,
     ComponentFilterModel,
     ComponentUpdateModel,
     PipelineRunFilterModel,
+    PipelineRunResponseModel,
     RoleFilterModel,
     RoleRequestModel,
     RoleUpdateModel,
+    RunMetadataFilterModel,
+    RunMetadataRequestModel,
     StackFilterModel,
     StackRequestModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunFinalizeModel,
+    StepRunUpdateModel,
     TeamRoleAssignmentRequestModel,
     TeamUpdateModel,
     UserRoleAssignmentRequestModel,
@@ -997,6 +1009,198 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_list_run_steps_matches_get_run_step():
+    """Tests that listed step runs contain the same links as fetched ones."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(2) as runs:
+        for run in runs:
+            steps = store.list_run_steps(
+                StepRunFilterModel(pipeline_run_id=run.id)
+            )
+            assert steps.total == 2
+            for step in steps.items:
+                fetched_step = store.get_run_step(step.id)
+                assert step.parent_step_ids == fetched_step.parent_step_ids
+                assert step.input_artifacts == fetched_step.input_artifacts
+                assert step.output_artifacts == fetched_step.output_artifacts
+                for artifact in step.output_artifacts.values():
+                    assert artifact == store.get_artifact(artifact.id)
+
+
+def test_list_runs_and_steps_with_field_projection():
+    """Tests that only the requested fields of runs and steps are returned."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        run = runs[0]
+        projected_runs = store.list_runs(
+            PipelineRunFilterModel(id=run.id, fields="name,status")
+        )
+        projected_run = projected_runs.items[0]
+        assert isinstance(projected_run, PipelineRunResponseModel)
+        assert projected_run.id == run.id
+        assert projected_run.name == run.name
+        assert projected_run.status == run.status
+        assert projected_run.pipeline_configuration is None
+        assert projected_run.client_environment is None
+
+        steps = store.list_run_steps(
+            StepRunFilterModel(pipeline_run_id=run.id)
+        ).items
+        projected_steps = store.list_run_steps(
+            StepRunFilterModel(
+                pipeline_run_id=run.id,
+                exclude="step,docstring,source_code,input_artifacts,"
+                "output_artifacts",
+            )
+        ).items
+        assert len(projected_steps) == len(steps)
+        for step, projected_step in zip(steps, projected_steps):
+            assert projected_step.id == step.id
+            assert projected_step.status == step.status
+            assert projected_step.parent_step_ids == step.parent_step_ids
+            assert projected_step.step is None
+            assert projected_step.docstring is None
+            assert projected_step.input_artifacts is None
+
+        with pytest.raises(ValueError):
+            store.list_run_steps(
+                StepRunFilterModel(
+                    pipeline_run_id=run.id, fields="not_a_field"
+                )
+            )
+
+        # Invalid fields are also rejected if no items match the filter
+        with pytest.raises(ValueError):
+            store.list_runs(
+                PipelineRunFilterModel(id=uuid.uuid4(), exclude="not_a_field")
+            )
+
+
+def test_paginating_projected_runs_with_cursor():
+    """Tests that keyset pagination works if columns are excluded."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(3) as runs:
+        run_ids = {run.id for run in runs}
+        name_filter = f"startswith:{runs[0].name.rsplit('_', 1)[0]}"
+
+        page = store.list_runs(
+            PipelineRunFilterModel(
+                name=name_filter,
+                exclude="client_environment",
+                size=1,
+                count_total=False,
+            )
+        )
+        projected_run_ids = [run.id for run in page.items]
+        while page.next_cursor:
+            # A broken cursor could otherwise return the same page forever
+            assert len(projected_run_ids) <= len(run_ids)
+            page = store.list_runs(
+                PipelineRunFilterModel(
+                    name=name_filter,
+                    exclude="client_environment",
+                    size=1,
+                    cursor=page.next_cursor,
+                    count_total=False,
+                )
+            )
+            projected_run_ids += [run.id for run in page.items]
+
+        assert len(projected_run_ids) == len(run_ids)
+        assert set(projected_run_ids) == run_ids
+
+
+def test_finalize_run_step():
+    """Tests finalizing a step run with new outputs and metadata."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        step = store.list_run_steps(
+            StepRunFilterModel(pipeline_run_id=runs[0].id)
+        ).items[0]
+        artifact = ArtifactRequestModel(
+            name="extra_output",
+            uri=f"some/uri/{uuid.uuid4()}",
+            materializer="some_materializer",
+            data_type="some_data_type",
+            type=ArtifactType.DATA,
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+        )
+        metadata = RunMetadataRequestModel(
+            key="some_key",
+            value="some_value",
+            type=MetadataTypeEnum.STRING,
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+        )
+
+        with pytest.raises(KeyError):
+            store.finalize_run_step(
+                step_run_id=step.id,
+                step_run_finalization=StepRunFinalizeModel(
+                    output_artifact_metadata={"missing_output": [metadata]}
+                ),
+            )
+
+        finalized_step = store.finalize_run_step(
+            step_run_id=step.id,
+            step_run_finalization=StepRunFinalizeModel(
+                status=ExecutionStatus.FAILED,
+                output_artifacts={"extra_output": artifact},
+                output_artifact_metadata={"extra_output": [metadata]},
+            ),
+        )
+        assert finalized_step.status == ExecutionStatus.FAILED
+        assert finalized_step.output_artifacts.keys() == set(
+            step.output_artifacts
+        ) | {"extra_output"}
+        new_artifact = finalized_step.output_artifacts["extra_output"]
+        assert new_artifact.uri == artifact.uri
+        assert new_artifact.producer_step_run_id == step.id
+        assert new_artifact.metadata["some_key"].value == "some_value"
+
+
+def test_update_run_status_from_steps():
+    """Tests updating the run status from the status of its steps."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        run = runs[0]
+        step = store.list_run_steps(
+            StepRunFilterModel(pipeline_run_id=run.id)
+        ).items[0]
+
+        updated_run = store.update_run_status_from_steps(run.id)
+        assert updated_run.status == ExecutionStatus.COMPLETED
+
+        store.update_run_step(
+            step_run_id=step.id,
+            step_run_update=StepRunUpdateModel(status=ExecutionStatus.RUNNING),
+        )
+        updated_run = store.update_run_status_from_steps(run.id)
+        assert updated_run.status == ExecutionStatus.RUNNING
+
+        store.update_run_step(
+            step_run_id=step.id,
+            step_run_update=StepRunUpdateModel(status=ExecutionStatus.FAILED),
+        )
+        updated_run = store.update_run_status_from_steps(run.id)
+        assert updated_run.status == ExecutionStatus.FAILED
+        assert store.get_run(run.id).status == ExecutionStatus.FAILED
+
+    with pytest.raises(KeyError):
+        store.update_run_status_from_steps(uuid.uuid4())
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
@@ -1021,6 +1225,53 @@ def test_list_unused_artifacts():
         assert artifacts.total == num_unused_artifacts_before
 
 
+def test_batch_create_artifacts_and_run_metadata():
+    """Tests creating multiple artifacts and run metadata at once."""
+    client = Client()
+    store = client.zen_store
+
+    uris = [f"some/uri/{uuid.uuid4()}" for _ in range(3)]
+    artifacts = store.batch_create_artifacts(
+        [
+            ArtifactRequestModel(
+                name="some_name",
+                uri=uri,
+                materializer="some_materializer",
+                data_type="some_data_type",
+                type=ArtifactType.DATA,
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+            )
+            for uri in uris
+        ]
+    )
+    assert [artifact.uri for artifact in artifacts] == uris
+
+    run_metadata = store.batch_create_run_metadata(
+        [
+            RunMetadataRequestModel(
+                artifact_id=artifact.id,
+                key="index",
+                value=str(index),
+                type=MetadataTypeEnum.STRING,
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+            )
+            for index, artifact in enumerate(artifacts)
+        ]
+    )
+    assert [metadata.value for metadata in run_metadata] == ["0", "1", "2"]
+    for index, artifact in enumerate(artifacts):
+        metadata = store.list_run_metadata(
+            RunMetadataFilterModel(artifact_id=artifact.id)
+        )
+        assert metadata.total == 1
+        assert metadata.items[0].value == str(index)
+
+    for artifact in artifacts:
+        store.delete_artifact(artifact.id)
+
+
 def test_artifacts_are_not_deleted_with_run():
     """Tests listing with `unused=True` only returns unused artifacts."""
     client = Client()
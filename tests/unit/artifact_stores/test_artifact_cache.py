@@ -0,0 +1,270 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
+from zenml.artifact_stores.artifact_cache import LocalArtifactCache
+from zenml.client import Client
+from zenml.constants import ENV_ZENML_ARTIFACT_CACHE_PATH
+from zenml.enums import StackComponentType
+from zenml.io import fileio
+
+
+def _write(content: bytes):
+    """Returns a fetch function that writes the given content."""
+
+    def _fetch(path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(content)
+
+    return _fetch
+
+
+def test_cache_entries_are_only_fetched_once(tmp_path):
+    """Tests that cached entries are served from the local disk."""
+    cache = LocalArtifactCache(cache_dir=str(tmp_path), max_size=100)
+    key = cache.make_key("s3://bucket/file", "etag")
+    calls = []
+
+    def _fetch(path: str) -> None:
+        calls.append(path)
+        _write(b"data")(path)
+
+    def _read(_: int) -> bytes:
+        with cache.open(key, fetch=_fetch) as f:
+            return f.read()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        contents = list(executor.map(_read, range(8)))
+
+    assert len(calls) == 1
+    assert contents == [b"data"] * 8
+    with open(cache.get_path(key), "rb") as f:
+        assert f.read() == b"data"
+
+    statistics = cache.statistics
+    assert statistics.misses == 1
+    assert statistics.hits == 7
+    assert statistics.hit_rate == 7 / 8
+
+    assert key != cache.make_key("s3://bucket/file", "other_etag")
+
+
+def test_failed_fetches_dont_populate_the_cache(tmp_path):
+    """Tests that failed downloads don't leave any files behind."""
+    cache = LocalArtifactCache(cache_dir=str(tmp_path), max_size=100)
+    key = cache.make_key("s3://bucket/file", "etag")
+
+    def _fetch(path: str) -> None:
+        _write(b"partial")(path)
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        cache.open(key, fetch=_fetch)
+
+    assert os.listdir(os.path.dirname(cache.get_path(key))) == [
+        os.path.basename(cache.get_path(key)) + ".lock"
+    ]
+    with cache.open(key, fetch=_write(b"data"), mode="r") as f:
+        assert f.read() == "data"
+
+
+def _fetch_entry(cache: LocalArtifactCache, key: str, fetch) -> None:
+    with cache.open(key, fetch=fetch):
+        pass
+
+
+def test_least_recently_used_entries_get_evicted(tmp_path):
+    """Tests that the cache evicts the least recently used entries."""
+    cache = LocalArtifactCache(cache_dir=str(tmp_path), max_size=10)
+    first, second, third = (
+        cache.make_key(f"s3://bucket/{i}", "etag") for i in range(3)
+    )
+    _fetch_entry(cache, first, fetch=_write(b"1234"))
+    _fetch_entry(cache, second, fetch=_write(b"1234"))
+    os.utime(cache.get_path(first), (0, 0))
+    os.utime(cache.get_path(second), (1, 1))
+    # Accessing the first entry makes the second one the least recently used
+    _fetch_entry(cache, first, fetch=_write(b"1234"))
+
+    _fetch_entry(cache, third, fetch=_write(b"1234"))
+
+    assert os.path.exists(cache.get_path(first))
+    assert not os.path.exists(cache.get_path(second))
+    assert os.path.exists(cache.get_path(third))
+    assert cache.statistics.evictions == 1
+
+
+def test_entries_are_readable_if_they_get_evicted(tmp_path):
+    """Tests that fetched entries can be read even if the cache is full."""
+    cache = LocalArtifactCache(cache_dir=str(tmp_path), max_size=4)
+    first, second = (
+        cache.make_key(f"s3://bucket/{i}", "etag") for i in range(2)
+    )
+    _fetch_entry(cache, first, fetch=_write(b"1234"))
+    os.utime(cache.get_path(first), (0, 0))
+
+    with cache.open(second, fetch=_write(b"5678")) as f:
+        # The least recently used entry gets evicted, not the new one
+        assert not os.path.exists(cache.get_path(first))
+        assert f.read() == b"5678"
+
+    # Files that are larger than the cache are not cached
+    large = cache.make_key("s3://bucket/large", "etag")
+    with cache.open(large, fetch=_write(b"123456789")) as f:
+        assert f.read() == b"123456789"
+    assert not os.path.exists(cache.get_path(large))
+    assert os.path.exists(cache.get_path(second))
+    assert [
+        name
+        for name in os.listdir(os.path.dirname(cache.get_path(large)))
+        if name.endswith(".tmp")
+    ] == []
+
+
+def test_cache_fails_with_invalid_size(tmp_path):
+    """Tests that the cache size needs to be positive."""
+    with pytest.raises(ValueError):
+        LocalArtifactCache(cache_dir=str(tmp_path), max_size=0)
+
+
+@pytest.fixture
+def remote_artifact_store(tmp_path, mocker, monkeypatch):
+    """Returns an artifact store that is treated as a remote one."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_PATH, str(tmp_path / "cache"))
+    mocker.patch.object(
+        LocalArtifactStoreConfig,
+        "is_local",
+        new_callable=mocker.PropertyMock,
+        return_value=False,
+    )
+
+    def _create(
+        local_cache: bool, content_addressed: bool = False
+    ) -> LocalArtifactStore:
+        return LocalArtifactStore(
+            name="",
+            id=uuid4(),
+            config=LocalArtifactStoreConfig(
+                path=str(tmp_path / "store"),
+                local_cache=local_cache,
+                content_addressed=content_addressed,
+            ),
+            flavor="default",
+            type=StackComponentType.ARTIFACT_STORE,
+            user=uuid4(),
+            workspace=uuid4(),
+            created=datetime.now(),
+            updated=datetime.now(),
+        )
+
+    return _create
+
+
+def test_artifact_store_serves_reads_from_local_cache(
+    tmp_path, mocker, remote_artifact_store
+):
+    """Tests that the artifact store caches files that it reads."""
+    artifact_store = remote_artifact_store(local_cache=True)
+    mocker.patch.object(
+        artifact_store, "stat", side_effect=lambda path: {"ETag": "1"}
+    )
+    open_spy = mocker.spy(artifact_store, "open")
+    file_path = str(tmp_path / "store" / "file.txt")
+    os.makedirs(os.path.dirname(file_path))
+    with open(file_path, "w") as f:
+        f.write("data")
+
+    for _ in range(3):
+        with artifact_store._open_with_cache(file_path, "r") as f:
+            assert f.read() == "data"
+
+    assert open_spy.call_count == 1
+    assert artifact_store.artifact_cache.statistics.hits == 2
+
+    # Writes bypass the cache
+    with artifact_store._open_with_cache(file_path, "w") as f:
+        f.write("new_data")
+    assert open_spy.call_count == 2
+
+
+def test_cached_artifact_stores_dont_register_bulk_downloads(
+    remote_artifact_store,
+):
+    """Tests that downloads are served from the cache instead of in bulk."""
+    bulk_operations = remote_artifact_store(
+        local_cache=False
+    )._get_bulk_operations()
+    assert "download_dir" in bulk_operations
+
+    bulk_operations = remote_artifact_store(
+        local_cache=True
+    )._get_bulk_operations()
+    assert "download_dir" not in bulk_operations
+    assert "upload_dir" in bulk_operations
+
+
+def test_pruning_reads_fresh_content_timestamps_with_cache(
+    tmp_path, mocker, remote_artifact_store, clean_client
+):
+    """Tests that cached index files don't hide reused content from pruning."""
+    artifact_store = remote_artifact_store(
+        local_cache=True, content_addressed=True
+    )
+
+    def _stat(path):
+        # Mimic object stores whose ETag changes with the file content
+        with open(path, "rb") as f:
+            return {"ETag": hashlib.md5(f.read()).hexdigest()}
+
+    mocker.patch.object(artifact_store, "stat", side_effect=_stat)
+    # Route file reads through the cache like the filesystem that remote
+    # artifact stores register
+    mocker.patch(
+        "zenml.utils.io_utils.open", new=artifact_store._open_with_cache
+    )
+    mocker.patch.object(
+        Client,
+        "active_stack",
+        new_callable=mocker.PropertyMock,
+        return_value=mocker.Mock(artifact_store=artifact_store),
+    )
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "data.txt").write_text("content")
+
+    mock_time = mocker.patch(
+        "zenml.artifact_stores.base_artifact_store.time.time",
+        return_value=100,
+    )
+    uri = artifact_store.store_content_addressed(str(source_dir))
+    assert artifact_store.list_content_addressed() == {uri: 100}
+
+    # A running step reuses the content, which refreshes its timestamp
+    mock_time.return_value = 200
+    assert artifact_store.store_content_addressed(str(source_dir)) == uri
+    assert artifact_store.get_content_addressed_timestamp(uri) == 200
+
+    mocker.patch("zenml.client.time.time", return_value=250)
+    assert clean_client.prune_artifact_content(min_age=100) == []
+    assert fileio.exists(uri)
+    assert clean_client.prune_artifact_content(min_age=10) == [uri]
+    assert not fileio.exists(uri)
@@ -0,0 +1,159 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+import shutil
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
+from zenml.artifact_stores.fsspec_bulk_operations_mixin import (
+    ChunkedTransferConfigMixin,
+    FsspecBulkOperationsMixin,
+)
+from zenml.enums import StackComponentType
+
+
+class _FakeFilesystem:
+    """Minimal stand-in for an async fsspec filesystem on the local disk."""
+
+    def __init__(self):
+        self.calls = []
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def size(self, path):
+        return os.path.getsize(path)
+
+    def put_file(self, lpath, rpath):
+        self.calls.append("put_file")
+        os.makedirs(os.path.dirname(rpath), exist_ok=True)
+        shutil.copyfile(lpath, rpath)
+
+    def get_file(self, rpath, lpath):
+        self.calls.append("get_file")
+        shutil.copyfile(rpath, lpath)
+
+    def put(self, lpaths, rpaths, batch_size):
+        self.calls.append("put")
+        for lpath, rpath in zip(lpaths, rpaths):
+            os.makedirs(os.path.dirname(rpath), exist_ok=True)
+            shutil.copyfile(lpath, rpath)
+
+    def get(self, rpaths, lpaths, batch_size):
+        self.calls.append("get")
+        for rpath, lpath in zip(rpaths, lpaths):
+            shutil.copyfile(rpath, lpath)
+
+    def cat_file(self, path, start, end):
+        self.calls.append("cat_file")
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def find(self, path, detail):
+        return {
+            os.path.join(root, file): {
+                "size": os.path.getsize(os.path.join(root, file))
+            }
+            for root, _, files in os.walk(path)
+            for file in files
+        }
+
+    def invalidate_cache(self, path):
+        pass
+
+    @staticmethod
+    def _strip_protocol(path):
+        return path
+
+
+class _Config(LocalArtifactStoreConfig, ChunkedTransferConfigMixin):
+    """Local artifact store config with chunked transfer options."""
+
+
+class _ArtifactStore(FsspecBulkOperationsMixin, LocalArtifactStore):
+    """Local artifact store that uses the fsspec bulk operations."""
+
+    _fake_filesystem = None
+
+    @property
+    def filesystem(self):
+        if self._fake_filesystem is None:
+            self._fake_filesystem = _FakeFilesystem()
+        return self._fake_filesystem
+
+
+@pytest.fixture
+def artifact_store(tmp_path) -> _ArtifactStore:
+    """Returns an artifact store with a fake fsspec filesystem."""
+    return _ArtifactStore(
+        name="",
+        id=uuid4(),
+        config=_Config(
+            path=str(tmp_path / "store"), multipart_threshold=100, part_size=30
+        ),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+def test_large_files_get_transferred_in_parts(artifact_store, tmp_path):
+    """Tests that files above the multipart threshold use ranged reads."""
+    content = os.urandom(100)
+    local_path = tmp_path / "large"
+    local_path.write_bytes(content)
+    remote_path = str(tmp_path / "store" / "large")
+
+    artifact_store.upload_file(str(local_path), remote_path)
+    # The mixin falls back to a regular upload without a multipart API
+    assert artifact_store.filesystem.calls == ["put_file"]
+    with pytest.raises(FileExistsError):
+        artifact_store.upload_file(str(local_path), remote_path)
+
+    artifact_store.download_file(remote_path, str(tmp_path / "downloaded"))
+    assert (tmp_path / "downloaded").read_bytes() == content
+    assert artifact_store.filesystem.calls[1:] == ["cat_file"] * 4
+
+    (tmp_path / "small").write_bytes(b"small")
+    artifact_store.upload_file(str(tmp_path / "small"), remote_path + "_s")
+    artifact_store.download_file(remote_path + "_s", str(tmp_path / "s"))
+    assert artifact_store.filesystem.calls[-2:] == ["put_file", "get_file"]
+
+
+def test_directories_get_transferred_in_bulk(artifact_store, tmp_path):
+    """Tests uploading and downloading directories."""
+    source_dir = tmp_path / "source"
+    (source_dir / "sub").mkdir(parents=True)
+    (source_dir / "a.txt").write_bytes(b"a")
+    (source_dir / "sub" / "b.txt").write_bytes(b"b")
+    (source_dir / "sub" / "large").write_bytes(os.urandom(100))
+    remote_dir = str(tmp_path / "store" / "dir")
+
+    artifact_store.upload_dir(str(source_dir), remote_dir)
+    assert artifact_store.filesystem.calls == ["put", "put_file"]
+
+    artifact_store.download_dir(remote_dir, str(tmp_path / "downloaded"))
+    assert artifact_store.filesystem.calls[2:] == ["get"] + ["cat_file"] * 4
+    for path in ("a.txt", "sub/b.txt", "sub/large"):
+        assert (tmp_path / "downloaded" / path).read_bytes() == (
+            source_dir / path
+        ).read_bytes()
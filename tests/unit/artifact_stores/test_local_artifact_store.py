@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from uuid import uuid4
 
@@ -21,6 +23,7 @@ import pytest
 from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
+from zenml.utils import io_utils
 
 
 def test_local_artifact_store_attributes():
@@ -94,3 +97,138 @@ def test_local_artifact_store_only_supports_local_paths():
         updated=datetime.now(),
     )
     assert artifact_store.path == os.getcwd()
+
+
+def test_content_addressed_storage(tmp_path):
+    """Tests that identical artifact content is only stored once."""
+    artifact_store = LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(
+            path=str(tmp_path / "store"), content_addressed=True
+        ),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+    def _write_artifact(name: str, content: str) -> str:
+        artifact_dir = tmp_path / name
+        (artifact_dir / "nested").mkdir(parents=True)
+        (artifact_dir / "nested" / "data.txt").write_text(content)
+        return str(artifact_dir)
+
+    uri_1 = artifact_store.store_content_addressed(
+        _write_artifact("first", "content")
+    )
+    uri_2 = artifact_store.store_content_addressed(
+        _write_artifact("second", "content")
+    )
+    uri_3 = artifact_store.store_content_addressed(
+        _write_artifact("third", "other content")
+    )
+
+    assert uri_1 == uri_2
+    assert uri_1 != uri_3
+    assert uri_1.startswith(artifact_store.content_addressed_path)
+    with open(os.path.join(uri_1, "nested", "data.txt")) as f:
+        assert f.read() == "content"
+
+    digest = artifact_store.get_content_digest(uri_1)
+    assert digest
+    assert artifact_store.get_content_addressed_uri(digest) == uri_1
+    assert artifact_store.get_content_digest(str(tmp_path / "first")) is None
+    assert set(artifact_store.list_content_addressed()) == {uri_1, uri_3}
+
+    artifact_store.delete_content_addressed(uri_1)
+    assert not os.path.exists(uri_1)
+    assert set(artifact_store.list_content_addressed()) == {uri_3}
+
+
+def test_reusing_content_addressed_artifacts_refreshes_timestamp(
+    tmp_path, mocker
+):
+    """Tests that reusing stored content refreshes its timestamp."""
+    artifact_store = LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(
+            path=str(tmp_path / "store"), content_addressed=True
+        ),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "data.txt").write_text("content")
+
+    mock_time = mocker.patch(
+        "zenml.artifact_stores.base_artifact_store.time.time",
+        return_value=100,
+    )
+    uri = artifact_store.store_content_addressed(str(source_dir))
+    assert artifact_store.get_content_addressed_timestamp(uri) == 100
+
+    mock_time.return_value = 200
+    assert artifact_store.store_content_addressed(str(source_dir)) == uri
+    assert artifact_store.get_content_addressed_timestamp(uri) == 200
+    assert artifact_store.list_content_addressed() == {uri: 200}
+
+
+def test_storing_identical_content_concurrently(tmp_path, mocker):
+    """Tests that concurrent steps can store the same content."""
+    artifact_store = LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(
+            path=str(tmp_path / "store"), content_addressed=True
+        ),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    source_dir = tmp_path / "source"
+    (source_dir / "nested").mkdir(parents=True)
+    (source_dir / "nested" / "data.txt").write_text("content")
+
+    # Make both steps upload the content at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    copy_dir = io_utils.copy_dir
+
+    def _copy_dir(*args, **kwargs):
+        barrier.wait()
+        copy_dir(*args, **kwargs)
+        barrier.wait()
+
+    mocker.patch.object(io_utils, "copy_dir", side_effect=_copy_dir)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        uris = list(
+            executor.map(
+                lambda _: artifact_store.store_content_addressed(
+                    str(source_dir)
+                ),
+                range(2),
+            )
+        )
+
+    uri = uris[0]
+    assert uris == [uri, uri]
+    assert artifact_store.list_content_addressed().keys() == {uri}
+    # No staging directories are left behind
+    assert sorted(os.listdir(os.path.dirname(uri))) == [
+        os.path.basename(uri),
+        os.path.basename(uri) + ".json",
+    ]
+    with open(os.path.join(uri, "nested", "data.txt")) as f:
+        assert f.read() == "content"
@@ -52,3 +52,50 @@ def test_must_be_gcs_path():
 
     artifact_store = _get_gcp_artifact_store(path="gs://mybucket")
     assert artifact_store.path == "gs://mybucket"
+
+
+def test_composite_uploads_delete_temporary_objects(mocker, tmp_path):
+    """Tests that the parts of failed composite uploads get deleted."""
+    artifact_store = _get_gcp_artifact_store(
+        path="gs://mybucket", part_size=10, upload_concurrency=1
+    )
+    filesystem = mocker.MagicMock()
+    filesystem.pipe_file.side_effect = [None, RuntimeError("failed")]
+    artifact_store._filesystem = filesystem
+
+    local_path = tmp_path / "file"
+    local_path.write_bytes(b"0" * 20)
+
+    with pytest.raises(RuntimeError):
+        artifact_store._upload_file_in_parts(
+            str(local_path), "gs://mybucket/file"
+        )
+
+    filesystem.merge.assert_not_called()
+    filesystem.rm.assert_called_once_with(["gs://mybucket/file.part-00001"])
+
+
+def test_composite_uploads_compose_many_parts_in_rounds(mocker, tmp_path):
+    """Tests that more parts than a single compose supports get composed."""
+    artifact_store = _get_gcp_artifact_store(
+        path="gs://mybucket", part_size=10, upload_concurrency=4
+    )
+    filesystem = mocker.MagicMock()
+    artifact_store._filesystem = filesystem
+
+    local_path = tmp_path / "file"
+    local_path.write_bytes(b"0" * 400)
+    artifact_store._upload_file_in_parts(str(local_path), "gs://mybucket/file")
+
+    part_paths = [f"gs://mybucket/file.part-{i:05d}" for i in range(1, 41)]
+    composed_paths = [
+        "gs://mybucket/file.compose-0-00000",
+        "gs://mybucket/file.compose-0-00032",
+    ]
+    assert filesystem.merge.call_args_list == [
+        mocker.call(composed_paths[0], part_paths[:32]),
+        mocker.call(composed_paths[1], part_paths[32:]),
+        mocker.call("gs://mybucket/file", composed_paths),
+    ]
+    (deleted_paths,), _ = filesystem.rm.call_args
+    assert sorted(deleted_paths) == sorted(part_paths + composed_paths)
@@ -0,0 +1,160 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+from typing import Any, Dict, List
+
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+class _FakeLogResponse:
+    """Streamed log response that returns its content in small chunks."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.released = False
+
+    def stream(self, amt: int, decode_content: bool):
+        for i in range(0, len(self.content), 7):
+            yield self.content[i : i + 7]
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+def _pod(name: str, phase: str) -> k8s_client.V1Pod:
+    """Creates a pod object with the given phase."""
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(name=name),
+        status=k8s_client.V1PodStatus(phase=phase),
+    )
+
+
+def test_following_pod_logs_resumes_without_duplicates(mocker):
+    """Tests that log streams get resumed after the last returned line."""
+    responses = [
+        _FakeLogResponse(
+            b"2023-01-01T00:00:00.1Z first\n"
+            b"2023-01-01T00:00:01.5Z second\n"
+        ),
+        _FakeLogResponse(
+            b"2023-01-01T00:00:00.1Z first\n"
+            b"2023-01-01T00:00:01.5Z second\n"
+            b"2023-01-01T00:00:01.5Z third\n"
+            b"2023-01-01T00:00:01.25Z fourth\n"
+        ),
+    ]
+    core_api = mocker.MagicMock()
+    core_api.read_namespaced_pod_log.side_effect = responses
+    core_api.read_namespaced_pod.side_effect = [
+        _pod("pod", "Running"),
+        _pod("pod", "Succeeded"),
+    ]
+
+    lines = list(
+        kube_utils.follow_pod_logs(
+            core_api, "pod", "namespace", retry_interval=0
+        )
+    )
+
+    # The fourth line is out of order and already covered by the resumed
+    # stream, so it's skipped.
+    assert lines == ["first", "second", "third"]
+    assert all(response.released for response in responses)
+    first_call, second_call = core_api.read_namespaced_pod_log.call_args_list
+    assert first_call.kwargs["follow"] is True
+    assert "since_seconds" not in first_call.kwargs
+    assert second_call.kwargs["since_seconds"] > 0
+
+
+def test_following_pod_logs_waits_for_container_to_start(mocker):
+    """Tests that log streaming retries while the container is starting."""
+    core_api = mocker.MagicMock()
+    core_api.read_namespaced_pod_log.side_effect = [
+        ApiException(status=400),
+        _FakeLogResponse(b"2023-01-01T00:00:00Z done"),
+    ]
+    core_api.read_namespaced_pod.return_value = _pod("pod", "Succeeded")
+
+    lines = kube_utils.follow_pod_logs(
+        core_api, "pod", "namespace", retry_interval=0
+    )
+    assert list(lines) == ["done"]
+
+
+class _FakeWatch:
+    """Watch that returns predefined events and then blocks until stopped."""
+
+    events: List[Dict[str, Any]] = []
+    stopped = threading.Event()
+
+    def __init__(self) -> None:
+        self.resource_version = None
+
+    def stream(self, func, **kwargs):
+        yield from self.events
+        self.stopped.wait()
+
+    def stop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_watch(mocker):
+    """Patches the Kubernetes watch used by the pod watcher."""
+    mocker.patch.object(kube_utils.k8s_watch, "Watch", _FakeWatch)
+    _FakeWatch.stopped.clear()
+    yield _FakeWatch
+    _FakeWatch.stopped.set()
+
+
+def test_pod_watcher_waits_for_multiple_pods(mocker, fake_watch):
+    """Tests that a single pod watcher waits for multiple pods."""
+    fake_watch.events = [
+        {"type": "ADDED", "object": _pod("first", "Running")},
+        {"type": "MODIFIED", "object": _pod("first", "Succeeded")},
+        {"type": "ADDED", "object": _pod("second", "Succeeded")},
+        {"type": "ADDED", "object": _pod("third", "Failed")},
+        {"type": "DELETED", "object": _pod("fourth", "Running")},
+    ]
+
+    with kube_utils.PodWatcher(
+        core_api=mocker.MagicMock(), namespace="namespace"
+    ) as pod_watcher:
+        for pod_name in ["first", "second"]:
+            pod = pod_watcher.wait(
+                pod_name, exit_condition_lambda=kube_utils.pod_is_done
+            )
+            assert pod.status.phase == "Succeeded"
+
+        with pytest.raises(RuntimeError, match="failed"):
+            pod_watcher.wait(
+                "third", exit_condition_lambda=kube_utils.pod_is_done
+            )
+
+        with pytest.raises(RuntimeError, match="deleted"):
+            pod_watcher.wait(
+                "fourth", exit_condition_lambda=kube_utils.pod_is_done
+            )
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            pod_watcher.wait(
+                "fifth",
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=0.1,
+            )
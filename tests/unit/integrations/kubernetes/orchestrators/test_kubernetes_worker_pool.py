@@ -0,0 +1,292 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import copy
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_pool import (
+    KubernetesWorkerPool,
+    StepResult,
+    report_step_result,
+    wait_for_step_assignment,
+)
+from zenml.orchestrators.dag_runner import DagRunner
+
+NAMESPACE = "namespace"
+
+
+class _FakeCoreApi:
+    """In-memory Kubernetes API that runs a fake worker for each pod."""
+
+    def __init__(
+        self,
+        run_step: Callable[[str, str], Optional[str]],
+        idle_timeout: int = 0,
+    ) -> None:
+        self.run_step = run_step
+        self.idle_timeout = idle_timeout
+        self.pods: Dict[str, k8s_client.V1Pod] = {}
+        self.created_pods: List[str] = []
+        self.deleted_pods: List[str] = []
+        self.subscribers: List["queue.Queue"] = []
+        self.lock = threading.Lock()
+        self.closed = threading.Event()
+
+    def _publish(self, event_type: str, pod: k8s_client.V1Pod) -> None:
+        for subscriber in self.subscribers:
+            subscriber.put({"type": event_type, "object": copy.deepcopy(pod)})
+
+    def list_namespaced_pod(self, namespace, **kwargs):
+        """Only passed to the watch, which receives the pods directly."""
+
+    def create_namespaced_pod(self, namespace, body):
+        body.metadata.annotations = {}
+        body.status = k8s_client.V1PodStatus(phase="Running")
+        with self.lock:
+            self.pods[body.metadata.name] = body
+            self.created_pods.append(body.metadata.name)
+            self._publish("ADDED", body)
+
+        threading.Thread(
+            target=self._run_worker, args=(body.metadata.name,), daemon=True
+        ).start()
+
+    def patch_namespaced_pod(self, name, namespace, body):
+        with self.lock:
+            if name not in self.pods:
+                raise ApiException(status=404)
+            pod = self.pods[name]
+            pod.metadata.annotations.update(body["metadata"]["annotations"])
+            self._publish("MODIFIED", pod)
+
+    def delete_namespaced_pod(self, name, namespace):
+        with self.lock:
+            self.deleted_pods.append(name)
+            pod = self.pods.pop(name, None)
+            if pod:
+                self._publish("DELETED", pod)
+
+    def _run_worker(self, pod_name: str) -> None:
+        """Emulates the worker entrypoint running inside a worker pod."""
+        with kube_utils.PodWatcher(
+            core_api=self,
+            namespace=NAMESPACE,
+            field_selector=f"metadata.name={pod_name}",
+        ) as pod_watcher:
+            last_assignment_id = None
+            while True:
+                try:
+                    assignment = wait_for_step_assignment(
+                        pod_watcher,
+                        pod_name=pod_name,
+                        last_assignment_id=last_assignment_id,
+                        timeout_sec=self.idle_timeout,
+                    )
+                except kube_utils.PodWaitTimeoutError:
+                    with self.lock:
+                        pod = self.pods[pod_name]
+                        pod.status.phase = "Succeeded"
+                        self._publish("MODIFIED", pod)
+                    return
+                except RuntimeError:
+                    # The pod was deleted.
+                    return
+
+                last_assignment_id = assignment.id
+                error = self.run_step(pod_name, assignment.step_name)
+                try:
+                    report_step_result(
+                        self,
+                        pod_name=pod_name,
+                        namespace=NAMESPACE,
+                        result=StepResult(
+                            id=assignment.id,
+                            succeeded=error is None,
+                            error=error,
+                        ),
+                    )
+                except ApiException:
+                    # The pod was deleted while running the step.
+                    return
+
+
+class _FakeWatch:
+    """Watch that receives the events of the fake Kubernetes API."""
+
+    api: _FakeCoreApi
+
+    def __init__(self) -> None:
+        self.resource_version = None
+        self._stopped = False
+
+    def stream(self, func, namespace, timeout_seconds, **kwargs):
+        events: "queue.Queue" = queue.Queue()
+        with self.api.lock:
+            self.api.subscribers.append(events)
+            for pod in self.api.pods.values():
+                events.put({"type": "ADDED", "object": copy.deepcopy(pod)})
+
+        field_selector = kwargs.get("field_selector")
+        pod_name = field_selector.split("=")[1] if field_selector else None
+        while not self._stopped and not self.api.closed.is_set():
+            try:
+                event = events.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if pod_name and event["object"].metadata.name != pod_name:
+                continue
+            yield event
+
+    def stop(self) -> None:
+        self._stopped = True
+
+
+@pytest.fixture
+def fake_api(mocker):
+    """Creates a fake Kubernetes API that records the steps run per pod."""
+    executed_steps: Dict[str, List[str]] = {}
+
+    def _run_step(pod_name: str, step_name: str) -> Optional[str]:
+        executed_steps.setdefault(pod_name, []).append(step_name)
+        time.sleep(0.05)
+        if step_name.startswith("failing"):
+            return "Step failed."
+        return None
+
+    api = _FakeCoreApi(run_step=_run_step)
+    api.executed_steps = executed_steps
+    mocker.patch.object(kube_utils.k8s_watch, "Watch", _FakeWatch)
+    _FakeWatch.api = api
+    yield api
+    api.closed.set()
+
+
+def _run_steps(
+    api: _FakeCoreApi,
+    dag: Dict[str, List[str]],
+    worker_classes: Dict[str, str],
+    workers_per_class: int = 1,
+) -> None:
+    """Runs the steps of a DAG on a worker pool."""
+    with kube_utils.PodWatcher(
+        core_api=api, namespace=NAMESPACE
+    ) as pod_watcher:
+        pool = KubernetesWorkerPool(
+            core_api=api,
+            pod_watcher=pod_watcher,
+            namespace=NAMESPACE,
+            pod_name_prefix="run",
+            workers_per_class=workers_per_class,
+            stream_logs=False,
+        )
+
+        def _run_step(step_name: str) -> None:
+            pool.run_step(
+                step_name=step_name,
+                worker_class=worker_classes[step_name],
+                build_manifest=lambda pod_name: k8s_client.V1Pod(
+                    metadata=k8s_client.V1ObjectMeta(name=pod_name)
+                ),
+            )
+
+        try:
+            DagRunner(dag=dag, run_fn=_run_step, fail_fast=False).run()
+        finally:
+            pool.shutdown()
+
+
+def test_steps_reuse_workers_of_their_class(fake_api):
+    """Tests that steps only run on workers of their worker class."""
+    dag = {"a1": [], "a2": ["a1"], "b1": ["a2"], "a3": ["b1"]}
+    worker_classes = {"a1": "a", "a2": "a", "b1": "b", "a3": "a"}
+
+    _run_steps(fake_api, dag=dag, worker_classes=worker_classes)
+
+    assert fake_api.executed_steps == {
+        "run-worker-0-0": ["a1", "a2", "a3"],
+        "run-worker-1-0": ["b1"],
+    }
+    assert sorted(fake_api.deleted_pods) == sorted(fake_api.created_pods)
+
+
+def test_worker_pool_size_limits_number_of_workers(fake_api):
+    """Tests that the pool starts at most the configured number of workers."""
+    dag = {f"step_{i}": [] for i in range(6)}
+    worker_classes = {step_name: "a" for step_name in dag}
+
+    _run_steps(
+        fake_api, dag=dag, worker_classes=worker_classes, workers_per_class=2
+    )
+
+    assert len(fake_api.created_pods) <= 2
+    executed_steps = sum(fake_api.executed_steps.values(), [])
+    assert sorted(executed_steps) == sorted(dag)
+
+
+def test_failed_step_raises_error_and_keeps_worker(fake_api):
+    """Tests that failing steps fail the run but not the worker."""
+    dag = {"failing": [], "other": []}
+    worker_classes = {"failing": "a", "other": "a"}
+
+    with pytest.raises(RuntimeError, match="Step failed."):
+        _run_steps(fake_api, dag=dag, worker_classes=worker_classes)
+
+    assert len(fake_api.created_pods) == 1
+    assert sorted(fake_api.executed_steps["run-worker-0-0"]) == [
+        "failing",
+        "other",
+    ]
+
+
+def test_steps_get_reassigned_if_worker_shut_down(fake_api):
+    """Tests that steps get a new worker if the idle worker shut down."""
+    fake_api.idle_timeout = 0.2
+    dag = {"first": [], "middle": ["first"], "second": ["middle"]}
+    worker_classes = {"first": "a", "middle": "b", "second": "a"}
+    original_run_step = fake_api.run_step
+
+    def _run_step(pod_name: str, step_name: str) -> Optional[str]:
+        if step_name == "middle":
+            # Wait until the idle worker of the first step shut down.
+            time.sleep(0.5)
+        return original_run_step(pod_name, step_name)
+
+    fake_api.run_step = _run_step
+    _run_steps(fake_api, dag=dag, worker_classes=worker_classes)
+
+    assert fake_api.executed_steps == {
+        "run-worker-0-0": ["first"],
+        "run-worker-1-0": ["middle"],
+        "run-worker-0-1": ["second"],
+    }
+
+
+def test_worker_pool_requires_positive_size(mocker):
+    """Tests that the number of workers per class needs to be positive."""
+    with pytest.raises(ValueError):
+        KubernetesWorkerPool(
+            core_api=mocker.MagicMock(),
+            pod_watcher=mocker.MagicMock(),
+            namespace=NAMESPACE,
+            pod_name_prefix="run",
+            workers_per_class=0,
+        )
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 
 
+import os
+import socket
 from datetime import datetime
 from uuid import uuid4
 
@@ -85,3 +87,89 @@ def test_must_be_s3_path():
         updated=datetime.now(),
     )
     assert artifact_store.path == "s3://mybucket"
+
+
+@pytest.fixture
+def moto_endpoint_url():
+    """Runs a local S3-compatible moto server."""
+    moto_server = pytest.importorskip("moto.server")
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+def test_s3_artifact_store_transfers_large_files_in_parts(
+    moto_endpoint_url, tmp_path
+):
+    """Tests multipart uploads and ranged downloads of large files."""
+    artifact_store = S3ArtifactStore(
+        name="",
+        id=uuid4(),
+        config=S3ArtifactStoreConfig(
+            path="s3://mybucket",
+            key="key",
+            secret="secret",
+            client_kwargs={
+                "endpoint_url": moto_endpoint_url,
+                "region_name": "us-east-1",
+            },
+            multipart_threshold=6 * 1024**2,
+            part_size=5 * 1024**2,
+        ),
+        flavor="s3",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    artifact_store.filesystem.mkdir("mybucket")
+    content = os.urandom(12 * 1024**2)
+    local_path = tmp_path / "large"
+    local_path.write_bytes(content)
+
+    artifact_store.upload_file(str(local_path), "s3://mybucket/large")
+    assert artifact_store.size("s3://mybucket/large") == len(content)
+    assert "-3" in artifact_store.stat("s3://mybucket/large")["ETag"]
+
+    artifact_store.download_file(
+        "s3://mybucket/large", str(tmp_path / "downloaded")
+    )
+    assert (tmp_path / "downloaded").read_bytes() == content
+
+
+def test_failed_aborts_dont_hide_upload_errors(mocker, tmp_path):
+    """Tests that the upload error is raised if aborting the upload fails."""
+    artifact_store = S3ArtifactStore(
+        name="",
+        id=uuid4(),
+        config=S3ArtifactStoreConfig(path="s3://tmp"),
+        flavor="s3",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+    def _call_s3(method, **kwargs):
+        if method == "create_multipart_upload":
+            return {"UploadId": "upload_id"}
+        if method == "upload_part":
+            raise RuntimeError("upload failed")
+        raise ConnectionError("abort failed")
+
+    filesystem = mocker.MagicMock()
+    filesystem.split_path.return_value = ("tmp", "file", None)
+    filesystem.call_s3.side_effect = _call_s3
+    artifact_store._filesystem = filesystem
+
+    local_path = tmp_path / "file"
+    local_path.write_bytes(b"data")
+    with pytest.raises(RuntimeError, match="upload failed"):
+        artifact_store._upload_file_in_parts(str(local_path), "s3://tmp/file")
@@ -24,6 +24,9 @@ from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import text
 
 from zenml.io import fileio
+from zenml.io.filesystem import BaseFilesystem
+from zenml.io.filesystem_registry import default_filesystem_registry
+from zenml.io.local_filesystem import LocalFilesystem
 from zenml.logger import get_logger
 from zenml.utils import io_utils
 
@@ -247,3 +250,127 @@ def test_walk_returns_an_iterator(tmp_path) -> None:
 def test_walk_function_returns_a_generator_object(tmp_path):
     """Check walk function returns a generator object."""
     assert isinstance(fileio.walk(str(tmp_path)), GeneratorType)
+
+
+FAKE_SCHEME = "fakefs://"
+
+
+def _strip(path):
+    return fileio.convert_to_str(path)[len(FAKE_SCHEME) :]
+
+
+class _FakeRemoteFilesystem(BaseFilesystem):
+    """Local filesystem with a remote scheme and without bulk operations."""
+
+    SUPPORTED_SCHEMES = {FAKE_SCHEME}
+    copied = []
+
+    open = staticmethod(lambda name, mode="r": open(_strip(name), mode))
+    exists = staticmethod(lambda path: os.path.exists(_strip(path)))
+    glob = staticmethod(lambda pattern: [])
+    isdir = staticmethod(lambda path: os.path.isdir(_strip(path)))
+    listdir = staticmethod(lambda path: os.listdir(_strip(path)))
+    makedirs = staticmethod(
+        lambda path: os.makedirs(_strip(path), exist_ok=True)
+    )
+    mkdir = staticmethod(lambda path: os.mkdir(_strip(path)))
+    remove = staticmethod(lambda path: os.remove(_strip(path)))
+    rename = staticmethod(lambda src, dst, overwrite=False: None)
+    rmtree = staticmethod(lambda path: LocalFilesystem.rmtree(_strip(path)))
+    stat = staticmethod(lambda path: os.stat(_strip(path)))
+
+    @staticmethod
+    def copyfile(src, dst, overwrite=False):
+        _FakeRemoteFilesystem.copied.append((src, dst))
+        LocalFilesystem.copyfile(_strip(src), _strip(dst), overwrite)
+
+    @staticmethod
+    def walk(top, topdown=True, onerror=None):
+        for root, dirs, files in os.walk(_strip(top)):
+            yield FAKE_SCHEME + root, dirs, files
+
+
+@pytest.fixture
+def fake_remote_filesystem():
+    """Registers a remote filesystem that doesn't implement bulk operations."""
+    default_filesystem_registry.register(_FakeRemoteFilesystem)
+    _FakeRemoteFilesystem.copied = []
+    return _FakeRemoteFilesystem
+
+
+def _create_files(dir_path, relative_paths):
+    for relative_path in relative_paths:
+        path = dir_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative_path)
+
+
+def test_bulk_operations_on_local_filesystem(tmp_path) -> None:
+    """Tests the native bulk operations of the local filesystem."""
+    source_dir = tmp_path / "source"
+    _create_files(source_dir, ["a.txt", "sub/b.txt"])
+
+    fileio.upload_dir(str(source_dir), str(tmp_path / "uploaded"))
+    assert (tmp_path / "uploaded" / "sub" / "b.txt").read_text() == "sub/b.txt"
+    with pytest.raises(FileExistsError):
+        fileio.download_dir(str(source_dir), str(tmp_path / "uploaded"))
+
+    fileio.copy_many(
+        [(str(source_dir / "a.txt"), str(tmp_path / "copy_a.txt"))]
+    )
+    assert (tmp_path / "copy_a.txt").read_text() == "a.txt"
+
+    paths = [str(tmp_path / "copy_a.txt"), str(tmp_path / "uploaded")]
+    assert fileio.exists_many(paths + [str(tmp_path / "missing")]) == [
+        True,
+        True,
+        False,
+    ]
+    fileio.remove_many(paths)
+    assert fileio.exists_many(paths) == [False, False]
+
+
+def test_bulk_operations_fall_back_to_single_file_operations(
+    tmp_path, fake_remote_filesystem
+) -> None:
+    """Tests the bulk operations of filesystems that don't implement them."""
+    source_dir = tmp_path / "source"
+    relative_paths = ["a.txt", "sub/b.txt", "sub/nested/c.txt"]
+    _create_files(source_dir, relative_paths)
+    remote_dir = FAKE_SCHEME + str(tmp_path / "remote")
+
+    fileio.upload_dir(str(source_dir), remote_dir)
+    assert len(fake_remote_filesystem.copied) == 0
+    assert (
+        fileio.exists_many(
+            [os.path.join(remote_dir, path) for path in relative_paths]
+        )
+        == [True] * 3
+    )
+    with pytest.raises(FileExistsError):
+        fileio.upload_dir(str(source_dir), remote_dir)
+    fileio.upload_dir(str(source_dir), remote_dir, overwrite=True)
+
+    fileio.download_dir(remote_dir, str(tmp_path / "downloaded"))
+    for path in relative_paths:
+        assert (tmp_path / "downloaded" / path).read_text() == path
+
+    remote_copy_dir = FAKE_SCHEME + str(tmp_path / "remote_copy")
+    fileio.makedirs(remote_copy_dir)
+    fileio.copy_many(
+        [
+            (
+                os.path.join(remote_dir, "a.txt"),
+                os.path.join(remote_copy_dir, "a.txt"),
+            )
+        ]
+    )
+    assert len(fake_remote_filesystem.copied) == 1
+
+    fileio.remove_many(
+        [os.path.join(remote_dir, "a.txt"), os.path.join(remote_dir, "sub")]
+    )
+    assert os.listdir(tmp_path / "remote") == []
+
+    with pytest.raises(ValueError):
+        fileio.upload_dir(remote_dir, str(tmp_path / "local"))
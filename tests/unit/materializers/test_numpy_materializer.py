@@ -0,0 +1,119 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+import numpy as np
+import pytest
+
+from tests.unit.test_general import _test_materializer
+from zenml.materializers.numpy_materializer import (
+    NumpyArrayShards,
+    NumpyMaterializer,
+)
+
+
+def test_numpy_materializer():
+    """Test the numpy materializer."""
+    arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    result = _test_materializer(
+        step_output_type=np.ndarray,
+        materializer_class=NumpyMaterializer,
+        step_output=arr,
+    )
+    assert np.array_equal(arr, result)
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.array([1 + 2j, 3 - 1j]),
+        np.array(["a", "b"]),
+        np.array([{"a": 1}, None], dtype=object),
+    ],
+)
+def test_numpy_materializer_skips_statistics_of_non_real_arrays(arr, tmp_path):
+    """Tests that only the shape and dtype are extracted for arrays that
+    don't contain real numbers."""
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    metadata = materializer.extract_metadata(arr)
+
+    assert metadata["shape"] == (2,)
+    assert str(metadata["dtype"]) == str(arr.dtype.type)
+    for key in ("min", "max", "mean", "std"):
+        assert key not in metadata
+
+
+def test_numpy_materializer_memory_maps_local_arrays(tmp_path):
+    """Tests that arrays in local artifact stores are memory-mapped in
+    copy-on-write mode."""
+    arr = np.arange(10)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(arr)
+
+    loaded = materializer.load(np.ndarray)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(arr, loaded)
+
+    loaded[0] = 42
+    assert materializer.load(np.ndarray)[0] == 0
+
+
+def test_numpy_materializer_loads_object_arrays(tmp_path):
+    """Tests that arrays which can't be memory-mapped are still loaded."""
+    arr = np.array([{"a": 1}, None], dtype=object)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(arr)
+
+    loaded = materializer.load(np.ndarray)
+    assert not isinstance(loaded, np.memmap)
+    assert loaded.tolist() == arr.tolist()
+
+
+def test_numpy_materializer_shards_large_remote_arrays(mocker, tmp_path):
+    """Tests that large arrays in remote artifact stores get sharded."""
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.io_utils.is_remote",
+        return_value=True,
+    )
+    mocker.patch("zenml.materializers.numpy_materializer.NUMPY_SHARD_SIZE", 0)
+    arr = np.arange(20).reshape(10, 2)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(arr)
+
+    assert len(os.listdir(tmp_path / "shards")) == 10
+    assert np.array_equal(arr, materializer.load(np.ndarray))
+
+
+def test_numpy_array_shards_load_lazily(tmp_path):
+    """Tests that sharded arrays only load the required shards."""
+    arr = np.arange(30).reshape(10, 3)
+    NumpyArrayShards.save(str(tmp_path), arr, shard_size=3 * arr.itemsize * 3)
+
+    shards = NumpyArrayShards(str(tmp_path))
+    assert shards.shard_rows == [3, 3, 3, 1]
+    assert len(shards) == 10
+    assert shards.shape == (10, 3)
+    assert np.array_equal(np.concatenate(list(shards.iter_shards())), arr)
+    assert np.array_equal(shards.to_numpy(), arr)
+
+    assert np.array_equal(shards[4], arr[4])
+    assert np.array_equal(shards[-1], arr[-1])
+    for key in [slice(2, 7), slice(None, None, 4), slice(8, 1, -3)]:
+        assert np.array_equal(shards[key], arr[key])
+    assert shards[5:5].shape == (0, 3)
+
+    with pytest.raises(IndexError):
+        shards[10]
@@ -13,11 +13,23 @@
 #  permissions and limitations under the License.
 
 import datetime
+from importlib.util import find_spec
 
 import pandas
+import pytest
 
 from tests.unit.test_general import _test_materializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.materializers.pandas_materializer import (
+    CSV_FILENAME,
+    LEGACY_PARQUET_FILENAME,
+    PARQUET_FILENAME,
+    PandasArtifactReader,
+    PandasMaterializer,
+)
+
+requires_pyarrow = pytest.mark.skipif(
+    find_spec("pyarrow") is None, reason="Requires pyarrow."
+)
 
 
 def test_pandas_materializer():
@@ -90,3 +102,105 @@ def test_pandas_materializer_with_index():
         step_output=df_datetime_indexed,
     )
     assert df_datetime_indexed.equals(result)
+
+
+@requires_pyarrow
+def test_pandas_materializer_compression_and_row_groups(tmp_path):
+    """Tests that the materializer writes compressed row groups."""
+    import pyarrow.parquet as pq
+
+    class _SnappyMaterializer(PandasMaterializer):
+        COMPRESSION_TYPE = "snappy"
+        ROW_GROUP_SIZE = 2
+
+    df = pandas.DataFrame({"A": range(5), "B": list("abcde")})
+    for materializer_class, compression, num_row_groups in [
+        (PandasMaterializer, "ZSTD", 1),
+        (_SnappyMaterializer, "SNAPPY", 3),
+    ]:
+        uri = tmp_path / compression
+        uri.mkdir()
+        materializer = materializer_class(uri=str(uri))
+        materializer.save(df)
+
+        metadata = pq.ParquetFile(uri / PARQUET_FILENAME).metadata
+        assert metadata.num_row_groups == num_row_groups
+        assert metadata.row_group(0).column(0).compression == compression
+        assert df.equals(materializer.load(pandas.DataFrame))
+
+
+@requires_pyarrow
+def test_pandas_materializer_compression_from_environment(
+    monkeypatch, tmp_path
+):
+    """Tests configuring the compression and row groups using environment
+    variables."""
+    import pyarrow.parquet as pq
+
+    monkeypatch.setenv("ZENML_PANDAS_COMPRESSION", "lz4")
+    monkeypatch.setenv("ZENML_PANDAS_ROW_GROUP_SIZE", "2")
+
+    df = pandas.DataFrame({"A": range(5)})
+    materializer = PandasMaterializer(uri=str(tmp_path))
+    materializer.save(df)
+
+    metadata = pq.ParquetFile(tmp_path / PARQUET_FILENAME).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "LZ4"
+    assert df.equals(materializer.load(pandas.DataFrame))
+
+    monkeypatch.setenv("ZENML_PANDAS_COMPRESSION", "none")
+    materializer.save(df)
+    metadata = pq.ParquetFile(tmp_path / PARQUET_FILENAME).metadata
+    assert metadata.row_group(0).column(0).compression == "UNCOMPRESSED"
+
+
+@requires_pyarrow
+def test_pandas_materializer_loads_legacy_artifacts(tmp_path):
+    """Tests that gzip-compressed parquet and csv artifacts are readable."""
+    df = pandas.DataFrame({"A": [1, 2, 3]}, index=["a", "b", "c"])
+
+    legacy_uri = tmp_path / "parquet"
+    legacy_uri.mkdir()
+    df.to_parquet(legacy_uri / LEGACY_PARQUET_FILENAME, compression="gzip")
+    materializer = PandasMaterializer(uri=str(legacy_uri))
+    assert df.equals(materializer.load(pandas.DataFrame))
+
+    csv_uri = tmp_path / "csv"
+    csv_uri.mkdir()
+    df.to_csv(csv_uri / CSV_FILENAME, index=True)
+    materializer = PandasMaterializer(uri=str(csv_uri))
+    assert df.equals(materializer.load(pandas.DataFrame))
+    assert df.equals(
+        pandas.concat(PandasArtifactReader(str(csv_uri)).iter_batches(2))
+    )
+
+
+@requires_pyarrow
+def test_pandas_artifact_reader_projection_and_batches(tmp_path):
+    """Tests reading parts of an artifact and streaming it in batches."""
+
+    class _SmallRowGroupMaterializer(PandasMaterializer):
+        ROW_GROUP_SIZE = 4
+
+    df = pandas.DataFrame(
+        {
+            "A": range(10),
+            "B": [float(i) for i in range(10)],
+            "C": list("x" * 10),
+        },
+        index=[f"row_{i}" for i in range(10)],
+    )
+    _SmallRowGroupMaterializer(uri=str(tmp_path)).save(df)
+
+    reader = PandasArtifactReader(str(tmp_path))
+    assert reader.num_row_groups == 3
+    assert df[["A", "C"]].equals(reader.read(columns=["A", "C"]))
+    assert df.iloc[4:8].equals(reader.read(row_groups=[1]))
+    assert (
+        df[["B"]].iloc[8:].equals(reader.read(columns=["B"], row_groups=[2]))
+    )
+
+    batches = list(reader.iter_batches(batch_size=3, columns=["A"]))
+    assert all(len(batch) <= 3 for batch in batches)
+    assert df[["A"]].equals(pandas.concat(batches))
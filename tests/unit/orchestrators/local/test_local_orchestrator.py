@@ -12,8 +12,22 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+import sys
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
 from zenml.enums import StackComponentType
 from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.orchestrators.local import local_orchestrator
+from zenml.orchestrators.local.local_orchestrator import (
+    LocalOrchestratorSettings,
+    ResourceBudget,
+    run_step_in_subprocess,
+)
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +37,79 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+def test_resource_budget_limits_concurrently_used_resources():
+    """Tests that steps wait until enough resources are available."""
+    budget = ResourceBudget(cpu_count=2, memory=4)
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def _run(cpu_count: float, memory: float) -> None:
+        with budget.acquire(cpu_count=cpu_count, memory=memory):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+    threads = [
+        threading.Thread(target=_run, args=(1, 2)) for _ in range(4)
+    ] + [threading.Thread(target=_run, args=(1, 3))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(max_running) == 2
+    assert budget._available_cpu_count == 2
+    assert budget._available_memory == 4
+
+
+def test_resource_budget_caps_requests_that_exceed_the_budget():
+    """Tests that steps which need more than the budget still run alone."""
+    budget = ResourceBudget(cpu_count=2, memory=None)
+
+    with budget.acquire(cpu_count=8, memory=100):
+        assert budget._available_cpu_count == 0
+        assert budget._available_memory == 0
+
+    assert budget._available_cpu_count == 2
+
+
+def test_local_orchestrator_settings_memory_budget():
+    """Tests converting the memory budget to GB."""
+    assert LocalOrchestratorSettings().get_memory_budget() is None
+    assert (
+        LocalOrchestratorSettings(memory_budget="500MB").get_memory_budget()
+        == 0.5
+    )
+
+    with pytest.raises(ValidationError):
+        LocalOrchestratorSettings(memory_budget="a lot")
+
+
+def test_running_step_in_subprocess_prefixes_output(mocker):
+    """Tests that the output of step subprocesses gets the step name."""
+    mock_log = mocker.patch.object(local_orchestrator.logger, "info")
+
+    run_step_in_subprocess(
+        step_name="step_1",
+        command=[sys.executable, "-c", "print('first'); print('second')"],
+        cwd=os.getcwd(),
+        env=dict(os.environ),
+    )
+
+    logged_lines = [call.args[1:] for call in mock_log.call_args_list]
+    assert ("step_1", "first") in logged_lines
+    assert ("step_1", "second") in logged_lines
+
+    with pytest.raises(RuntimeError, match="exit code 3"):
+        run_step_in_subprocess(
+            step_name="step_1",
+            command=[sys.executable, "-c", "import sys; sys.exit(3)"],
+            cwd=os.getcwd(),
+            env=dict(os.environ),
+        )
@@ -20,8 +20,6 @@ import pytest
 
 from zenml.config.compiler import Compiler
 from zenml.config.step_configurations import Step
-from zenml.enums import ExecutionStatus, SorterOps
-from zenml.models.page_model import Page
 from zenml.orchestrators import cache_utils
 from zenml.steps import Output, step
 from zenml.steps.base_step import BaseStep
@@ -155,40 +153,20 @@ def test_fetching_cached_step_run_queries_cache_candidates(
     mocker, create_step_run
 ):
     """Tests fetching a cached step run."""
-    mock_list_run_steps = mocker.patch(
-        "zenml.client.Client.list_run_steps",
-        return_value=Page(
-            page=1,
-            size=1,
-            total_pages=1,
-            total=0,
-            items=[],
-        ),
+    mock_get_cached_step_run = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_cached_step_run",
+        return_value=None,
     )
 
     assert cache_utils.get_cached_step_run(cache_key="cache_key") is None
 
     cache_candidate = create_step_run()
-
-    mock_list_run_steps = mocker.patch(
-        "zenml.client.Client.list_run_steps",
-        return_value=Page(
-            page=1,
-            size=1,
-            total_pages=1,
-            total=1,
-            items=[cache_candidate],
-        ),
-    )
+    mock_get_cached_step_run.return_value = cache_candidate
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == cache_candidate
-    mock_list_run_steps.assert_called_with(
-        workspace_id=ANY,
-        cache_key="cache_key",
-        status=ExecutionStatus.COMPLETED,
-        sort_by=f"{SorterOps.DESCENDING}:created",
-        size=1,
+    mock_get_cached_step_run.assert_called_with(
+        cache_key="cache_key", workspace_id=ANY
     )
 
 
@@ -228,3 +206,24 @@ def test_fetching_cached_step_run_uses_latest_candidate(
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == response_2
+
+
+def test_generate_cache_key_uses_content_digest_of_inputs(
+    generate_cache_key_kwargs,
+):
+    """Check that content-addressed inputs are identified by their content
+    instead of the artifact ID."""
+    artifact_store = generate_cache_key_kwargs["artifact_store"]
+    generate_cache_key_kwargs["input_artifact_uris"] = {
+        "input_1": artifact_store.get_content_addressed_uri("0123abcd")
+    }
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_2 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 == key_2
+
+    generate_cache_key_kwargs["input_artifact_uris"] = {
+        "input_1": artifact_store.get_content_addressed_uri("4567abcd")
+    }
+    key_3 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 != key_3
@@ -12,10 +12,21 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+import pytest
+
+from zenml.orchestrators.dag_runner import (
+    DagRunner,
+    DagRunnerExecutorType,
+    NodeStatus,
+    ThreadedDagRunner,
+    get_critical_path_lengths,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -68,3 +79,125 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_critical_path_lengths():
+    """Test computing the longest path starting at each node."""
+    dag = {1: [], 2: [1], 3: [1], 4: [3], 5: [4]}
+    assert get_critical_path_lengths(dag) == {1: 4, 2: 1, 3: 3, 4: 2, 5: 1}
+
+    weighted = get_critical_path_lengths(dag, node_weights={2: 10})
+    assert weighted[1] == 11
+    assert weighted[2] == 10
+
+
+def test_dag_runner_schedules_critical_path_first():
+    """Test that ready nodes on the longest path are started first."""
+    # 1 is a single node, 2->3->4 is a chain
+    dag = {"1": [], "2": [], "3": ["2"], "4": ["3"]}
+    order = []
+    DagRunner(dag, order.append, max_parallelism=1).run()
+    assert order == ["2", "3", "1", "4"]
+
+
+def test_dag_runner_respects_max_parallelism():
+    """Test that no more than `max_parallelism` nodes run at the same time."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run_fn(node: str) -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    dag = {str(i): [] for i in range(20)}
+    dag["sink"] = list(dag)
+    runner = DagRunner(dag, run_fn, max_parallelism=3)
+    runner.run()
+
+    assert max_running == 3
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+
+
+def test_dag_runner_limits_threads_of_wide_dags(mocker):
+    """Test that wide DAGs don't start a thread for each node by default."""
+    mocker.patch("os.cpu_count", return_value=2)
+    dag = {str(i): [] for i in range(1000)}
+
+    assert DagRunner(dag, print).max_workers == 6
+    assert (
+        DagRunner(
+            dag, print, executor_type=DagRunnerExecutorType.PROCESS
+        ).max_workers
+        == 2
+    )
+
+    mocker.patch("os.cpu_count", return_value=64)
+    assert DagRunner(dag, print).max_workers == 32
+
+
+def test_dag_runner_with_invalid_max_parallelism_fails():
+    """Test that the maximum parallelism needs to be positive."""
+    with pytest.raises(ValueError):
+        DagRunner({}, print, max_parallelism=0)
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes get started once a node failed."""
+    order = []
+
+    def run_fn(node: str) -> None:
+        order.append(node)
+        if node == "fail":
+            raise RuntimeError("Node failed")
+
+    dag = {"fail": [], "other": [], "downstream": ["fail"]}
+    runner = DagRunner(dag, run_fn, max_parallelism=1, fail_fast=True)
+    runner.priorities["fail"] = 10
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert order == ["fail"]
+    assert runner.node_states["fail"] == NodeStatus.FAILED
+    assert runner.node_states["other"] == NodeStatus.WAITING
+    assert runner.node_states["downstream"] == NodeStatus.WAITING
+
+
+def test_dag_runner_without_fail_fast_runs_independent_nodes():
+    """Test that nodes not depending on a failed node still run."""
+
+    def run_fn(node: str) -> None:
+        if node == "fail":
+            raise RuntimeError("Node failed")
+
+    dag = {"fail": [], "other": [], "downstream": ["fail"]}
+    runner = DagRunner(dag, run_fn, max_parallelism=1, fail_fast=False)
+    runner.priorities["fail"] = 10
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert runner.node_states["other"] == NodeStatus.COMPLETED
+    assert runner.node_states["downstream"] == NodeStatus.WAITING
+
+
+def test_dag_runner_with_process_executor():
+    """Test running a DAG in a process pool."""
+    runner = DagRunner(
+        {"1": [], "2": ["1"], "3": ["1"]},
+        str,
+        max_parallelism=2,
+        executor_type=DagRunnerExecutorType.PROCESS,
+    )
+    runner.run()
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
@@ -14,11 +14,8 @@
 
 from uuid import UUID, uuid4
 
-import pytest
-
 from zenml.enums import ArtifactType, ExecutionStatus
 from zenml.models.artifact_models import ArtifactRequestModel
-from zenml.models.page_model import Page
 from zenml.orchestrators import publish_utils
 
 
@@ -96,6 +93,42 @@ def test_publishing_a_successful_step_run(mocker):
     assert call_kwargs["step_run_update"].status == ExecutionStatus.COMPLETED
 
 
+def test_publishing_successful_step_run_outputs(mocker, clean_client):
+    """Tests publishing the outputs of a successful step run at once."""
+    mock_finalize_run_step = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.finalize_run_step",
+    )
+
+    step_run_id = uuid4()
+    artifact = ArtifactRequestModel(
+        uri="some/uri/abc/",
+        materializer="some_materializer",
+        data_type="np.ndarray",
+        type=ArtifactType.DATA,
+        name="some_name",
+        user=clean_client.active_user.id,
+        workspace=clean_client.active_workspace.id,
+    )
+
+    publish_utils.publish_successful_step_run_outputs(
+        step_run_id=step_run_id,
+        output_artifacts={"output_name": artifact},
+        output_artifact_metadata={
+            "output_name": {"key": "value", "key_2": "value_2"}
+        },
+    )
+    mock_finalize_run_step.assert_called_once()
+    _, call_kwargs = mock_finalize_run_step.call_args
+    assert call_kwargs["step_run_id"] == step_run_id
+    finalization = call_kwargs["step_run_finalization"]
+    assert finalization.status == ExecutionStatus.COMPLETED
+    assert finalization.output_artifacts == {"output_name": artifact}
+    assert [
+        metadata.key
+        for metadata in finalization.output_artifact_metadata["output_name"]
+    ] == ["key", "key_2"]
+
+
 def test_publishing_a_failed_step_run(mocker):
     """Tests publishing a failed step run."""
     mock_update_run_step = mocker.patch(
@@ -124,80 +157,28 @@ def test_publishing_a_failed_pipeline_run(mocker):
     assert call_kwargs["run_update"].status == ExecutionStatus.FAILED
 
 
-@pytest.mark.parametrize(
-    "step_statuses, num_steps, expected_run_status",
-    [
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED],
-            2,
-            ExecutionStatus.FAILED,
-        ),
-        ([ExecutionStatus.COMPLETED], 2, ExecutionStatus.RUNNING),
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.RUNNING],
-            2,
-            ExecutionStatus.RUNNING,
-        ),
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.COMPLETED],
-            2,
-            ExecutionStatus.COMPLETED,
-        ),
-    ],
-)
-def test_pipeline_run_status_computation(
-    step_statuses, num_steps, expected_run_status
-):
-    """Tests computing a pipeline run status from step statuses."""
-    assert (
-        publish_utils.get_pipeline_run_status(
-            step_statuses=step_statuses, num_steps=num_steps
-        )
-        == expected_run_status
-    )
-
-
-@pytest.mark.parametrize(
-    "old_status, new_status",
-    [
-        (ExecutionStatus.RUNNING, ExecutionStatus.RUNNING),
-        (ExecutionStatus.RUNNING, ExecutionStatus.COMPLETED),
-        (ExecutionStatus.RUNNING, ExecutionStatus.FAILED),
-        (ExecutionStatus.RUNNING, ExecutionStatus.CACHED),
-    ],
-)
-def test_updating_the_pipeline_run_status(
-    mocker, sample_pipeline_run_model, old_status, new_status
-):
-    """Tests updating the status of a pipeline run."""
-    mocker.patch(
+def test_updating_the_pipeline_run_status(mocker, sample_pipeline_run_model):
+    """Tests that the run status gets updated with a single store call."""
+    mock_list_run_steps = mocker.patch(
         "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(page=1, size=50, total_pages=1, total=0, items=[]),
-    )
-    mocker.patch(
-        "zenml.orchestrators.publish_utils.get_pipeline_run_status",
-        return_value=new_status,
     )
-
-    mock_update_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.update_run",
+    mock_update_status = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore."
+        "update_run_status_from_steps",
     )
 
-    sample_pipeline_run_model.status = old_status
     publish_utils.update_pipeline_run_status(sample_pipeline_run_model)
 
-    if old_status == new_status:
-        mock_update_run.assert_not_called()
-    else:
-        _, call_kwargs = mock_update_run.call_args
-        call_kwargs["run_id"] == sample_pipeline_run_model.id
-        call_kwargs["run_update"].status == new_status
+    mock_list_run_steps.assert_not_called()
+    mock_update_status.assert_called_once_with(
+        run_id=sample_pipeline_run_model.id
+    )
 
 
 def test_publish_output_artifact_metadata(mocker):
     """Unit test for `publish_output_artifact_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.batch_create_run_metadata",
     )
     output_artifact_ids = {
         "output_name": uuid4(),
@@ -214,13 +195,15 @@ def test_publish_output_artifact_metadata(mocker):
         output_artifact_ids=output_artifact_ids,
         output_artifact_metadata=output_artifact_metadata,
     )
-    assert mock_create_run.call_count == 3  # once per key-value pair
+    mock_create_run.assert_called_once()  # one call for all key-value pairs
+    (run_metadata,), _ = mock_create_run.call_args
+    assert len(run_metadata) == 3
 
 
 def test_publish_pipeline_run_metadata(mocker):
     """Unit test for `publish_pipeline_run_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.batch_create_run_metadata",
     )
     pipeline_run_id = uuid4()
     pipeline_run_metadata = {
@@ -231,13 +214,15 @@ def test_publish_pipeline_run_metadata(mocker):
         pipeline_run_id=pipeline_run_id,
         pipeline_run_metadata=pipeline_run_metadata,
     )
-    assert mock_create_run.call_count == 3  # once per key-value pair
+    mock_create_run.assert_called_once()  # one call for all key-value pairs
+    (run_metadata,), _ = mock_create_run.call_args
+    assert len(run_metadata) == 3
 
 
 def test_publish_step_run_metadata(mocker):
     """Unit test for `publish_step_run_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.batch_create_run_metadata",
     )
     step_run_id = uuid4()
     step_run_metadata = {
@@ -248,4 +233,6 @@ def test_publish_step_run_metadata(mocker):
         step_run_id=step_run_id,
         step_run_metadata=step_run_metadata,
     )
-    assert mock_create_run.call_count == 3  # once per key-value pair
+    mock_create_run.assert_called_once()  # one call for all key-value pairs
+    (run_metadata,), _ = mock_create_run.call_args
+    assert len(run_metadata) == 3
@@ -13,19 +13,44 @@
 #  permissions and limitations under the License.
 
 import sys
+import threading
+from typing import Any, Type
 from uuid import uuid4
 
+import numpy as np
 import pytest
 
+from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
 from zenml.materializers import UnmaterializedArtifact
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.built_in_materializer import BuiltInMaterializer
+from zenml.materializers.numpy_materializer import NumpyMaterializer
 from zenml.orchestrators.step_launcher import StepRunner
 from zenml.stack import Stack
 from zenml.steps import step
 
 
+class _ConcurrentData:
+    pass
+
+
+class _ConcurrentMaterializer(BaseMaterializer):
+    """Materializer that only saves if two artifacts are saved concurrently."""
+
+    ASSOCIATED_TYPES = (_ConcurrentData,)
+    barrier = threading.Barrier(2, timeout=10)
+
+    def load(self, data_type: Type[Any]) -> Any:
+        self.barrier.wait()
+        return _ConcurrentData()
+
+    def save(self, data: Any) -> None:
+        self.barrier.wait()
+
+
 @step
 def successful_step() -> None:
     pass
@@ -41,12 +66,8 @@ def test_running_a_successful_step(mocker, local_stack):
     and correctly prepares/cleans up."""
     mock_prepare_step_run = mocker.patch.object(Stack, "prepare_step_run")
     mock_cleanup_step_run = mocker.patch.object(Stack, "cleanup_step_run")
-    mock_publish_output_artifacts = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_output_artifacts",
-        return_value={},
-    )
-    mock_publish_successful_step_run = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_successful_step_run"
+    mock_publish_successful_step_run_outputs = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_successful_step_run_outputs"
     )
     if sys.version_info >= (3, 8):
         # Mocking the entrypoint function adds a `_mock_self` arg to the mock
@@ -85,8 +106,7 @@ def test_running_a_successful_step(mocker, local_stack):
     mock_cleanup_step_run.assert_called_with(
         info=step_run_info, step_failed=False
     )
-    mock_publish_output_artifacts.assert_called_once()
-    mock_publish_successful_step_run.assert_called_once()
+    mock_publish_successful_step_run_outputs.assert_called_once()
     if sys.version_info >= (3, 8):
         mock_entrypoint.assert_called_once()
 
@@ -97,12 +117,8 @@ def test_running_a_failing_step(mocker, local_stack):
 
     mock_prepare_step_run = mocker.patch.object(Stack, "prepare_step_run")
     mock_cleanup_step_run = mocker.patch.object(Stack, "cleanup_step_run")
-    mock_publish_output_artifacts = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_output_artifacts",
-        return_value={},
-    )
-    mock_publish_successful_step_run = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_successful_step_run"
+    mock_publish_successful_step_run_outputs = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_successful_step_run_outputs"
     )
 
     step = Step.parse_obj(
@@ -137,8 +153,7 @@ def test_running_a_failing_step(mocker, local_stack):
     mock_cleanup_step_run.assert_called_with(
         info=step_run_info, step_failed=True
     )
-    mock_publish_output_artifacts.assert_not_called()
-    mock_publish_successful_step_run.assert_not_called()
+    mock_publish_successful_step_run_outputs.assert_not_called()
 
 
 def test_loading_unmaterialized_input_artifact(
@@ -164,3 +179,179 @@ def test_loading_unmaterialized_input_artifact(
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact == artifact_response
+
+
+def test_storing_output_artifacts_concurrently(local_stack):
+    """Tests that multiple output artifacts are stored concurrently."""
+    materializer_source = (
+        "tests.unit.orchestrators.test_step_runner._ConcurrentMaterializer"
+    )
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+                "outputs": {
+                    "output_1": {"materializer_source": materializer_source},
+                    "output_2": {"materializer_source": materializer_source},
+                },
+                "settings": {"materialization": {"max_workers": 2}},
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+
+    output_artifacts, _ = runner._store_output_artifacts(
+        output_data={
+            "output_1": _ConcurrentData(),
+            "output_2": _ConcurrentData(),
+        },
+        output_materializers={
+            "output_1": _ConcurrentMaterializer,
+            "output_2": _ConcurrentMaterializer,
+        },
+        output_artifact_uris={"output_1": "uri_1", "output_2": "uri_2"},
+        artifact_metadata_enabled=False,
+    )
+    assert output_artifacts["output_1"].uri == "uri_1"
+    assert output_artifacts["output_2"].uri == "uri_2"
+
+
+def test_loading_input_artifacts_concurrently(
+    mocker, local_stack, sample_artifact_model
+):
+    """Tests that multiple input artifacts are loaded concurrently."""
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+                "settings": {"materialization": {"max_workers": 2}},
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    mocker.patch(
+        "zenml.orchestrators.step_runner.source_utils."
+        "load_and_validate_class",
+        return_value=_ConcurrentMaterializer,
+    )
+
+    function_params = runner._parse_inputs(
+        args=["input_1", "input_2"],
+        annotations={"input_1": _ConcurrentData, "input_2": _ConcurrentData},
+        input_artifacts={
+            "input_1": sample_artifact_model,
+            "input_2": sample_artifact_model,
+        },
+        output_artifact_uris={},
+        output_materializers={},
+    )
+    assert list(function_params) == ["input_1", "input_2"]
+    assert all(
+        isinstance(value, _ConcurrentData)
+        for value in function_params.values()
+    )
+
+
+def test_publishing_output_artifact_metadata_in_background(
+    mocker, local_stack, tmp_path
+):
+    """Tests that output artifact metadata can be extracted and published
+    in a background thread."""
+    mock_publish_output_artifact_metadata = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_output_artifact_metadata"
+    )
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+                "settings": {"materialization": {"metadata_max_rows": 3}},
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    artifact_id = uuid4()
+
+    thread = runner._publish_output_artifact_metadata_in_background(
+        output_data={"output": np.arange(1001)},
+        output_materializers={"output": NumpyMaterializer},
+        output_artifact_uris={"output": str(tmp_path)},
+        output_artifact_ids={"output": artifact_id},
+    )
+    thread.join()
+
+    mock_publish_output_artifact_metadata.assert_called_once()
+    call_kwargs = mock_publish_output_artifact_metadata.call_args.kwargs
+    assert call_kwargs["output_artifact_ids"] == {"output": artifact_id}
+    metadata = call_kwargs["output_artifact_metadata"]["output"]
+    assert metadata["shape"] == (1001,)
+    # The statistics are computed on the sample [0, 500, 1000]
+    assert metadata["std"] == pytest.approx(np.std([0, 500, 1000]))
+
+
+def test_storing_content_addressed_output_artifacts(
+    mocker, local_stack, tmp_path
+):
+    """Tests that outputs with identical content share the same URI if the
+    artifact store is content-addressed."""
+    mocker.patch.object(
+        LocalArtifactStore,
+        "config",
+        new_callable=mocker.PropertyMock,
+        return_value=LocalArtifactStoreConfig(
+            path=str(tmp_path / "store"), content_addressed=True
+        ),
+    )
+    materializer_source = (
+        "zenml.materializers.built_in_materializer.BuiltInMaterializer"
+    )
+    output_names = ["output_1", "output_2", "output_3"]
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+                "outputs": {
+                    name: {"materializer_source": materializer_source}
+                    for name in output_names
+                },
+            },
+        }
+    )
+    output_artifact_uris = {}
+    for name in output_names:
+        (tmp_path / name).mkdir()
+        output_artifact_uris[name] = str(tmp_path / name)
+
+    runner = StepRunner(step=step, stack=local_stack)
+    output_artifacts, _ = runner._store_output_artifacts(
+        output_data={"output_1": 1, "output_2": 1, "output_3": 2},
+        output_materializers={
+            name: BuiltInMaterializer for name in output_names
+        },
+        output_artifact_uris=output_artifact_uris,
+        artifact_metadata_enabled=False,
+    )
+
+    uris = {name: artifact.uri for name, artifact in output_artifacts.items()}
+    assert uris["output_1"] == uris["output_2"] != uris["output_3"]
+    assert all(
+        local_stack.artifact_store.get_content_digest(uri)
+        for uri in uris.values()
+    )
+    assert not any((tmp_path / name).exists() for name in output_names)
+    assert BuiltInMaterializer(uris["output_3"]).load(int) == 2
@@ -0,0 +1,103 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+import zenml
+
+# Import time budgets in seconds. These are far above the actual import times
+# to avoid flaky failures on slow machines, but still catch regressions that
+# import heavy dependencies at module level.
+IMPORT_TIME_BUDGETS = {
+    "zenml": 0.5,
+    "zenml.cli.cli": 1.0,
+}
+
+# Modules that are slow to import and should only get imported when needed.
+LAZY_MODULES = [
+    "alembic",
+    "docker",
+    "pandas",
+    "rich.traceback",
+    "sqlalchemy",
+    "sqlmodel",
+    "zenml.cli.stack",
+    "zenml.client",
+    "zenml.integrations",
+]
+
+
+def _run_python(args: List[str]) -> subprocess.CompletedProcess:
+    """Runs a new Python interpreter that can import ZenML.
+
+    Args:
+        args: Arguments for the interpreter.
+
+    Returns:
+        The completed process.
+    """
+    source_root = os.path.dirname(os.path.dirname(zenml.__file__))
+    python_path = os.pathsep.join(
+        filter(None, [source_root, os.environ.get("PYTHONPATH")])
+    )
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=python_path),
+    )
+
+
+def _get_import_time(module: str) -> float:
+    """Measures the import time of a module in a new interpreter.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        The cumulative import time of the module in seconds.
+    """
+    result = _run_python(["-X", "importtime", "-c", f"import {module}"])
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        # Format: `import time: <self us> | <cumulative us> | <module>`
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and not name.startswith("  "):
+            return int(cumulative) / 1e6
+
+    raise RuntimeError(f"Unable to measure the import time of `{module}`.")
+
+
+@pytest.mark.parametrize("module", list(IMPORT_TIME_BUDGETS))
+def test_import_time_is_within_budget(module):
+    """Tests that importing ZenML and its CLI is fast."""
+    import_time = min(_get_import_time(module) for _ in range(3))
+    assert import_time < IMPORT_TIME_BUDGETS[module]
+
+
+@pytest.mark.parametrize("module", list(IMPORT_TIME_BUDGETS))
+def test_heavy_modules_are_imported_lazily(module):
+    """Tests that importing ZenML and its CLI skips heavy dependencies."""
+    result = _run_python(
+        ["-c", f"import sys, {module}; print('\\n'.join(sys.modules))"]
+    )
+    imported_modules = set(result.stdout.splitlines())
+    assert not imported_modules.intersection(LAZY_MODULES)
@@ -0,0 +1,69 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from zenml.utils.concurrency_utils import map_concurrently
+
+
+def _call(item):
+    duration, fail = item
+    time.sleep(duration)
+    if fail:
+        raise RuntimeError()
+    return duration
+
+
+def test_map_concurrently_keeps_the_order_of_the_items():
+    """Tests that the results are returned in the order of the items."""
+    assert map_concurrently(
+        _call, [(0.1, False), (0.0, False)], max_workers=2
+    ) == [0.1, 0.0]
+
+
+def test_map_concurrently_runs_sequentially_with_a_single_worker():
+    """Tests that a single worker runs all calls in the calling thread."""
+    thread_ids = map_concurrently(
+        lambda _: threading.get_ident(), [1, 2, 3], max_workers=1
+    )
+    assert thread_ids == [threading.get_ident()] * 3
+
+
+def test_map_concurrently_waits_for_running_calls_on_failure():
+    """Tests that a failure waits for running calls before raising."""
+    finished = []
+
+    def _record(item):
+        finished.append(_call(item))
+
+    with pytest.raises(RuntimeError):
+        map_concurrently(_record, [(0.0, True), (0.2, False)], max_workers=2)
+    assert finished == [0.2]
+
+
+def test_map_concurrently_cancels_pending_calls_on_failure():
+    """Tests that calls which didn't start yet are skipped after a failure."""
+    started = []
+
+    def _record(item):
+        started.append(item)
+        _call(item)
+
+    items = [(0.0, True)] + [(0.1, False)] * 10
+    with pytest.raises(RuntimeError):
+        map_concurrently(_record, items, max_workers=2)
+    assert len(started) < len(items)
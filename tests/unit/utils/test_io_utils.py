@@ -304,3 +304,27 @@ def test_get_parent_gets_the_parent_directory(tmp_path) -> None:
     )
     parent = io_utils.get_parent(os.path.join(tmp_path, "new_dir/new_dir2"))
     assert parent == "new_dir"
+
+
+def test_compute_directory_digest_depends_on_content_and_paths(
+    tmp_path,
+) -> None:
+    """Tests that the directory digest only changes if files change."""
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    for dir_path in (first_dir, second_dir):
+        (dir_path / "sub").mkdir(parents=True)
+        (dir_path / "data.txt").write_text("data")
+        (dir_path / "sub" / "more.txt").write_text("more")
+
+    digest = io_utils.compute_directory_digest(str(first_dir))
+    assert digest == io_utils.compute_directory_digest(
+        str(second_dir), chunk_size=1
+    )
+
+    (second_dir / "sub" / "more.txt").write_text("changed")
+    assert digest != io_utils.compute_directory_digest(str(second_dir))
+
+    (second_dir / "sub" / "more.txt").rename(second_dir / "more.txt")
+    (second_dir / "more.txt").write_text("more")
+    assert digest != io_utils.compute_directory_digest(str(second_dir))
@@ -0,0 +1,59 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.models.constants import TEXT_FIELD_MAX_LENGTH
+from zenml.utils import metadata_utils
+
+
+def test_building_run_metadata_requests():
+    """Tests building the requests to create run metadata."""
+    workspace_id = uuid4()
+    user_id = uuid4()
+    artifact_id = uuid4()
+
+    requests = metadata_utils.build_run_metadata_requests(
+        metadata={"int": 1, "str": "value"},
+        workspace_id=workspace_id,
+        user_id=user_id,
+        artifact_id=artifact_id,
+    )
+
+    assert [request.key for request in requests] == ["int", "str"]
+    assert [request.type for request in requests] == [
+        MetadataTypeEnum.INT,
+        MetadataTypeEnum.STRING,
+    ]
+    for request in requests:
+        assert request.workspace == workspace_id
+        assert request.user == user_id
+        assert request.artifact_id == artifact_id
+        assert request.step_run_id is None
+
+
+def test_building_run_metadata_requests_skips_invalid_values():
+    """Tests that too large or unsupported metadata values are skipped."""
+    requests = metadata_utils.build_run_metadata_requests(
+        metadata={
+            "too_large": "a" * (TEXT_FIELD_MAX_LENGTH + 1),
+            "unsupported": None,
+            "valid": 1.0,
+        },
+        workspace_id=uuid4(),
+        user_id=uuid4(),
+    )
+
+    assert [request.key for request in requests] == ["valid"]
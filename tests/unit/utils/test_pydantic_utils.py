@@ -99,6 +99,30 @@ def test_update_model_works_with_none_exclusion():
     assert updated2.b is None
 
 
+def test_excluding_model_fields():
+    """Tests that fields can be removed from a model using a partial model."""
+
+    class TestModel(BaseModel):
+        a: int
+        b: Dict[str, int]
+
+    partial_model_class = pydantic_utils.get_partial_model(TestModel, {"b"})
+    assert issubclass(partial_model_class, TestModel)
+    assert partial_model_class.parse_obj({"a": 1}).b is None
+    assert pydantic_utils.get_partial_model(TestModel, {"b"}) is (
+        partial_model_class
+    )
+    assert pydantic_utils.get_partial_model(TestModel, set()) is TestModel
+
+    model = TestModel(a=1, b={"key": 2})
+    partial_model = pydantic_utils.exclude_fields(model, {"b"})
+    assert isinstance(partial_model, partial_model_class)
+    assert partial_model.a == 1
+    assert partial_model.b is None
+    assert partial_model.dict(exclude_unset=True) == {"a": 1}
+    assert model.b == {"key": 2}
+
+
 def test_template_generator_works():
     """Tests that the template generator works."""
 
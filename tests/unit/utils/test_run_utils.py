@@ -0,0 +1,47 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pytest
+
+from zenml.enums import ExecutionStatus
+from zenml.utils import run_utils
+
+
+@pytest.mark.parametrize(
+    "step_status_counts, num_steps, expected_run_status",
+    [
+        (
+            {ExecutionStatus.COMPLETED: 1, ExecutionStatus.FAILED: 1},
+            2,
+            ExecutionStatus.FAILED,
+        ),
+        ({ExecutionStatus.COMPLETED: 1}, 2, ExecutionStatus.RUNNING),
+        (
+            {ExecutionStatus.COMPLETED: 1, ExecutionStatus.RUNNING: 1},
+            2,
+            ExecutionStatus.RUNNING,
+        ),
+        ({ExecutionStatus.COMPLETED: 2}, 2, ExecutionStatus.COMPLETED),
+    ],
+)
+def test_pipeline_run_status_computation(
+    step_status_counts, num_steps, expected_run_status
+):
+    """Tests computing a pipeline run status from the steps per status."""
+    assert (
+        run_utils.get_pipeline_run_status_from_counts(
+            step_status_counts=step_status_counts, num_steps=num_steps
+        )
+        == expected_run_status
+    )
@@ -0,0 +1,143 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from zenml.utils.statistics_utils import (
+    compute_array_statistics,
+    compute_dataframe_statistics,
+    statistics_budget,
+)
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.random.default_rng(0).normal(size=(300, 500)),
+        np.arange(200_001, dtype=np.int64)[::-1],
+        np.asfortranarray(np.arange(100_000).reshape(500, 200)),
+        np.array([True, False, True]),
+    ],
+)
+def test_array_statistics_match_numpy(arr):
+    """Tests that the single pass statistics match the numpy functions."""
+    statistics = compute_array_statistics(arr)
+
+    assert statistics["min"] == np.min(arr).item()
+    assert statistics["max"] == np.max(arr).item()
+    assert statistics["mean"] == pytest.approx(np.mean(arr).item())
+    assert statistics["std"] == pytest.approx(np.std(arr).item())
+
+
+def test_array_statistics_propagate_nan():
+    """Tests that NaN values are propagated like in numpy."""
+    statistics = compute_array_statistics(np.array([1.0, np.nan, 3.0]))
+    assert all(np.isnan(value) for value in statistics.values())
+
+
+def test_statistics_of_empty_and_non_numeric_arrays():
+    """Tests that statistics are only computed for non-empty real arrays."""
+    assert compute_array_statistics(np.array([])) is None
+    assert compute_array_statistics(np.array(["a", "b"])) is None
+
+
+def test_dataframe_statistics_match_pandas():
+    """Tests that the single pass statistics match the pandas functions."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "float": rng.normal(size=100_000),
+            "int": rng.integers(0, 100, size=100_000),
+            "bool": rng.integers(0, 2, size=100_000).astype(bool),
+            "str": ["a"] * 100_000,
+            "nullable": pd.array([1, None] * 50_000, dtype="Int64"),
+        }
+    )
+    df.loc[::7, "float"] = np.nan
+
+    statistics = compute_dataframe_statistics(df)
+
+    for name, stat in {
+        "mean": df.mean,
+        "std": df.std,
+        "min": df.min,
+        "max": df.max,
+    }.items():
+        expected = stat(numeric_only=True).to_dict()
+        assert statistics[name] == pytest.approx(
+            {key: float(value) for key, value in expected.items()}
+        )
+
+
+def test_dataframe_statistics_without_values():
+    """Tests the statistics of dataframes without numeric values."""
+    df = pd.DataFrame({"a": [np.nan], "b": ["b"]})
+
+    statistics = compute_dataframe_statistics(df)
+    assert list(statistics["mean"]) == ["a"]
+    assert all(np.isnan(values["a"]) for values in statistics.values())
+
+    assert compute_dataframe_statistics(df[["b"]]) == {
+        "min": {},
+        "max": {},
+        "mean": {},
+        "std": {},
+    }
+
+
+def test_statistics_are_computed_on_samples():
+    """Tests that statistics are computed on a sample of large data."""
+    arr = np.arange(1000)
+    with statistics_budget(max_rows=11):
+        array_statistics = compute_array_statistics(arr)
+        dataframe_statistics = compute_dataframe_statistics(
+            pd.DataFrame({"a": arr})
+        )
+
+    # The sample contains the first and last row, so min and max are exact.
+    assert array_statistics["min"] == 0
+    assert array_statistics["max"] == 999
+    assert array_statistics["mean"] == pytest.approx(499.5, abs=1)
+    assert array_statistics["std"] == pytest.approx(
+        np.std(np.linspace(0, 999, 11).astype(int))
+    )
+    assert dataframe_statistics["mean"]["a"] == pytest.approx(499.5, abs=1)
+
+
+def test_array_statistics_sample_rows():
+    """Tests that multidimensional arrays are sampled along the first axis."""
+    arr = np.arange(3000).reshape(1000, 3)
+    with statistics_budget(max_rows=11):
+        statistics = compute_array_statistics(arr)
+
+    sample = arr[np.linspace(0, 999, 11).astype(int)]
+    assert statistics["min"] == 0
+    assert statistics["max"] == 2999
+    assert statistics["mean"] == pytest.approx(np.mean(sample))
+    assert statistics["std"] == pytest.approx(np.std(sample))
+
+
+def test_statistics_respect_time_budget(mocker):
+    """Tests that statistics are skipped once the time budget is exceeded."""
+    mock_time = mocker.patch(
+        "zenml.utils.statistics_utils.time.monotonic", return_value=0
+    )
+    with statistics_budget(time_budget=10):
+        mock_time.return_value = 11
+        assert compute_array_statistics(np.arange(10)) is None
+        assert compute_dataframe_statistics(pd.DataFrame({"a": [1]})) is None
+
+    assert compute_array_statistics(np.arange(10)) is not None
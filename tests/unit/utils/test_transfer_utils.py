@@ -0,0 +1,96 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+import threading
+
+import pytest
+
+from zenml.utils import transfer_utils
+
+
+def test_split_into_parts():
+    """Tests splitting a file into parts."""
+    assert transfer_utils.split_into_parts(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert transfer_utils.split_into_parts(0, 4) == []
+    assert transfer_utils.get_part_size(100, part_size=10, max_parts=5) == 20
+    assert transfer_utils.get_part_size(10, part_size=10, max_parts=5) == 10
+    with pytest.raises(ValueError):
+        transfer_utils.get_part_size(
+            100, part_size=10, max_parts=5, min_part_size=20
+        )
+
+
+def test_download_in_parts(tmp_path):
+    """Tests downloading a file using concurrent ranged reads."""
+    content = os.urandom(1000)
+    ranges = []
+    lock = threading.Lock()
+
+    def _read_range(start, end):
+        with lock:
+            ranges.append((start, end))
+        return content[start:end]
+
+    local_path = str(tmp_path / "file")
+    transfer_utils.download_in_parts(
+        _read_range,
+        size=len(content),
+        local_path=local_path,
+        part_size=300,
+        max_concurrency=3,
+    )
+
+    with open(local_path, "rb") as f:
+        assert f.read() == content
+    assert sorted(ranges) == [(0, 300), (300, 600), (600, 900), (900, 1000)]
+
+    with pytest.raises(IOError):
+        transfer_utils.download_in_parts(
+            lambda start, end: b"",
+            size=len(content),
+            local_path=local_path,
+            part_size=300,
+            max_concurrency=3,
+        )
+
+
+def test_upload_in_parts(tmp_path):
+    """Tests uploading a file in concurrently uploaded parts."""
+    content = os.urandom(1000)
+    local_path = tmp_path / "file"
+    local_path.write_bytes(content)
+    uploaded = {}
+
+    def _upload_part(part_number, data):
+        uploaded[part_number] = data
+        return part_number
+
+    part_numbers = transfer_utils.upload_in_parts(
+        str(local_path),
+        upload_part=_upload_part,
+        part_size=300,
+        max_concurrency=4,
+    )
+
+    assert part_numbers == [1, 2, 3, 4]
+    assert b"".join(uploaded[i] for i in part_numbers) == content
+
+    (tmp_path / "empty").write_bytes(b"")
+    assert transfer_utils.upload_in_parts(
+        str(tmp_path / "empty"),
+        upload_part=_upload_part,
+        part_size=300,
+        max_concurrency=4,
+    ) == [1]
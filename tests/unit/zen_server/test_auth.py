@@ -0,0 +1,160 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import SecurityScopes
+
+from zenml.models.user_models import JWTToken, JWTTokenType
+from zenml.zen_server import auth
+from zenml.zen_stores.zen_store_cache import CachedEntityType, ZenStoreCache
+
+
+@pytest.fixture
+def mock_store(mocker):
+    """Mocks the store of the server."""
+    mock_store = mocker.MagicMock()
+    mocker.patch.object(auth, "zen_store", return_value=mock_store)
+    return mock_store
+
+
+@pytest.fixture
+def mock_authenticate(mocker, sample_user_model, mock_store):
+    """Mocks the store lookups of the authentication and clears the cache."""
+    mocker.patch.object(
+        auth,
+        "auth_cache",
+        ZenStoreCache(ttls={CachedEntityType.AUTH_CONTEXT: 30}),
+    )
+    return mocker.patch.object(
+        auth,
+        "authenticate_credentials",
+        return_value=auth.AuthContext(user=sample_user_model),
+    )
+
+
+def _create_token(expire_minutes=None) -> str:
+    return JWTToken(
+        token_type=JWTTokenType.ACCESS_TOKEN,
+        user_id=uuid4(),
+        permissions=["read"],
+    ).encode(expire_minutes=expire_minutes)
+
+
+def _authenticate(token: str) -> auth.AuthContext:
+    return auth.oauth2_password_bearer_authentication(
+        security_scopes=SecurityScopes(["read"]), token=token
+    )
+
+
+def test_authentication_contexts_are_cached(mock_authenticate):
+    """Tests that access tokens are only authenticated once."""
+    token = _create_token()
+
+    first_context = _authenticate(token)
+    second_context = _authenticate(token)
+
+    assert first_context == second_context
+    assert mock_authenticate.call_count == 1
+
+    _authenticate(_create_token())
+    assert mock_authenticate.call_count == 2
+
+    statistics = auth.get_auth_statistics()
+    assert statistics.cache.hits == 1
+    assert statistics.cache.misses == 2
+    assert statistics.num_authentications >= 3
+    assert statistics.max_latency >= statistics.average_latency > 0
+
+
+def test_invalid_authentications_are_not_cached(mock_authenticate):
+    """Tests that failed authentications are repeated for each request."""
+    mock_authenticate.return_value = None
+    token = _create_token()
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            _authenticate(token)
+
+    assert mock_authenticate.call_count == 2
+
+
+def test_endpoints_invalidate_the_auth_cache(mock_authenticate):
+    """Tests that modifying users, roles or teams invalidates the cache."""
+    token = _create_token()
+
+    @auth.invalidates_auth_cache
+    def update_role() -> str:
+        return "updated"
+
+    _authenticate(token)
+    assert update_role() == "updated"
+    _authenticate(token)
+
+    assert mock_authenticate.call_count == 2
+
+
+def test_cached_authentications_expire(mocker, mock_authenticate, mock_store):
+    """Tests that cached authentications are served until they expire."""
+    token = _create_token()
+    _authenticate(token)
+    _authenticate(token)
+    assert mock_authenticate.call_count == 1
+
+    # Changes made by other server workers are picked up after the TTL
+    mocker.patch(
+        "zenml.zen_stores.zen_store_cache.time.monotonic",
+        return_value=auth.time.monotonic() + 31,
+    )
+    _authenticate(token)
+    assert mock_authenticate.call_count == 2
+
+
+def test_cached_authentications_of_inactive_users_are_rejected(
+    mock_authenticate, mock_store
+):
+    """Tests that deactivated or deleted users can't use cached tokens."""
+    token = _create_token()
+    _authenticate(token)
+
+    mock_store.get_auth_user.return_value.active = False
+    mock_authenticate.return_value = None
+    with pytest.raises(HTTPException) as e:
+        _authenticate(token)
+    assert e.value.status_code == 401
+
+    mock_store.get_auth_user.side_effect = KeyError("No user found.")
+    with pytest.raises(HTTPException):
+        _authenticate(token)
+    assert mock_authenticate.call_count == 3
+
+
+def test_expired_tokens_are_not_served_from_the_cache(
+    mocker, mock_authenticate
+):
+    """Tests that cached authentications expire with their token."""
+    token = _create_token(expire_minutes=1)
+    _authenticate(token)
+
+    mocker.patch.object(auth.time, "time", return_value=auth.time.time() + 120)
+    mocker.patch.object(
+        JWTToken,
+        "decode",
+        side_effect=auth.AuthorizationException("expired"),
+    )
+    with pytest.raises(HTTPException) as e:
+        _authenticate(token)
+    assert e.value.status_code == 401
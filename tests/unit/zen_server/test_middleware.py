@@ -0,0 +1,170 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+import json
+from typing import Any, Dict
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from zenml.zen_server.middleware import (
+    CompressedResponseMiddleware,
+    GzipRequestMiddleware,
+)
+
+
+def _get_test_client(**middleware_kwargs: Any) -> TestClient:
+    """Creates a test client for an app that echoes the request body."""
+    app = FastAPI()
+    app.add_middleware(GzipRequestMiddleware, **middleware_kwargs)
+
+    @app.post("/echo")
+    def echo(body: Dict[str, Any]) -> Dict[str, Any]:
+        return body
+
+    return TestClient(app)
+
+
+def test_gzip_request_bodies_get_decompressed():
+    """Tests that gzip-encoded request bodies are decompressed."""
+    client = _get_test_client()
+    body = {"key": "value" * 100}
+
+    response = client.post(
+        "/echo",
+        data=gzip.compress(json.dumps(body).encode()),
+        headers={
+            "Content-Encoding": "gzip",
+            "Content-Type": "application/json",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == body
+
+    response = client.post("/echo", json=body)
+    assert response.status_code == 200
+    assert response.json() == body
+
+
+def test_invalid_gzip_request_bodies_get_rejected():
+    """Tests that invalid gzip-encoded request bodies are rejected."""
+    client = _get_test_client()
+
+    response = client.post(
+        "/echo",
+        data=b"not gzip",
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"][0] == "ValueError"
+
+
+def test_oversized_gzip_request_bodies_get_rejected():
+    """Tests that bodies are only decompressed up to the maximum size."""
+    client = _get_test_client(max_size=1000)
+    body = {"key": "0" * 10000}
+
+    response = client.post(
+        "/echo",
+        data=gzip.compress(json.dumps(body).encode()),
+        headers={
+            "Content-Encoding": "gzip",
+            "Content-Type": "application/json",
+        },
+    )
+    assert response.status_code == 413
+
+    # Truncated bodies are invalid even if they are small enough
+    response = client.post(
+        "/echo",
+        data=gzip.compress(json.dumps({"key": "value"}).encode())[:-10],
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 400
+
+
+def _get_compressing_test_client() -> TestClient:
+    """Creates a test client for an app that compresses its responses."""
+    app = FastAPI()
+    app.add_middleware(CompressedResponseMiddleware, minimum_size=100)
+
+    @app.get("/items")
+    def items(count: int) -> Dict[str, Any]:
+        return {"items": ["item"] * count}
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(
+            (b"chunk" * 100 for _ in range(3)), media_type="text/plain"
+        )
+
+    return TestClient(app)
+
+
+def test_large_responses_get_gzip_compressed():
+    """Tests that large responses are compressed if the client accepts it."""
+    client = _get_compressing_test_client()
+
+    response = client.get(
+        "/items", params={"count": 100}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(response.content)
+    assert response.json() == {"items": ["item"] * 100}
+
+    response = client.get(
+        "/stream", headers={"Accept-Encoding": "gzip, deflate"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.content == b"chunk" * 300
+
+
+def test_responses_are_not_compressed_if_small_or_not_accepted():
+    """Tests that small responses or unsupported clients get raw responses."""
+    client = _get_compressing_test_client()
+
+    response = client.get(
+        "/items", params={"count": 1}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+
+    for accept_encoding in ["identity", "gzip;q=0"]:
+        response = client.get(
+            "/items",
+            params={"count": 100},
+            headers={"Accept-Encoding": accept_encoding},
+        )
+        assert "Content-Encoding" not in response.headers
+        assert response.json() == {"items": ["item"] * 100}
+
+
+def test_large_responses_get_brotli_compressed():
+    """Tests that brotli is preferred if it is available."""
+    brotli = pytest.importorskip("brotli")
+    client = _get_compressing_test_client()
+
+    response = client.get(
+        "/items",
+        params={"count": 100},
+        headers={"Accept-Encoding": "gzip, br"},
+        stream=True,
+    )
+    assert response.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(response.raw.read())) == {
+        "items": ["item"] * 100
+    }
@@ -0,0 +1,219 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from zenml.config.step_configurations import StepConfiguration
+from zenml.constants import API, GRAPH, RUNS, STATUS, VERSION_1
+from zenml.enums import ExecutionStatus
+from zenml.models.page_model import Page
+from zenml.post_execution.lineage.lineage_graph import LineageGraph
+from zenml.zen_server.auth import authorize
+from zenml.zen_server.routers import runs_endpoints
+from zenml.zen_stores.zen_store_cache import ZenStoreCache
+
+
+@pytest.fixture
+def mock_store(mocker):
+    """Mocks the zen store of the server and clears the run DAG cache."""
+    mocker.patch.object(runs_endpoints, "run_dag_cache", ZenStoreCache())
+    store = mocker.MagicMock()
+    store.get_run_dag.return_value = LineageGraph(root_step_id="step_1")
+    mocker.patch.object(runs_endpoints, "zen_store", return_value=store)
+
+    # The hot read endpoints use the async store, which forwards the calls
+    # to the same mock.
+    async_store = mocker.MagicMock()
+    for method in ["get_run", "list_runs"]:
+        setattr(
+            async_store,
+            method,
+            mocker.AsyncMock(side_effect=getattr(store, method)),
+        )
+    mocker.patch.object(
+        runs_endpoints, "async_zen_store", return_value=async_store
+    )
+    return store
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Creates a test client for the runs endpoints without authorization."""
+    app = FastAPI()
+    app.include_router(runs_endpoints.router)
+    app.dependency_overrides[authorize] = lambda: None
+    return TestClient(app)
+
+
+def _get_dag(client: TestClient, run_id, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(
+        f"{API}{VERSION_1}{RUNS}/{run_id}{GRAPH}", headers=headers
+    )
+
+
+def test_dags_of_finished_runs_are_cached(client, mock_store):
+    """Tests that the DAG of a finished run is only built once."""
+    mock_store.get_run.return_value.status = ExecutionStatus.COMPLETED
+    run_id = uuid4()
+
+    first_response = _get_dag(client, run_id)
+    second_response = _get_dag(client, run_id)
+
+    assert first_response.status_code == 200
+    assert first_response.json()["root_step_id"] == "step_1"
+    assert second_response.content == first_response.content
+    assert second_response.headers["ETag"] == first_response.headers["ETag"]
+    assert mock_store.get_run_dag.call_count == 1
+
+
+def test_dags_of_running_runs_are_not_cached(client, mock_store):
+    """Tests that the DAG of a running run is built for each request."""
+    mock_store.get_run.return_value.status = ExecutionStatus.RUNNING
+    run_id = uuid4()
+
+    _get_dag(client, run_id)
+    _get_dag(client, run_id)
+
+    assert mock_store.get_run_dag.call_count == 2
+
+
+def test_dags_of_failed_runs_with_running_steps_are_not_cached(
+    client, mock_store
+):
+    """Tests that the DAG is not cached while steps are still running."""
+    dag = LineageGraph()
+    dag.add_step_node(
+        step_run_id=uuid4(),
+        name="step",
+        status=ExecutionStatus.RUNNING,
+        config=StepConfiguration(name="step"),
+        inputs={},
+        outputs={},
+        metadata=[],
+    )
+    mock_store.get_run_dag.return_value = dag
+    mock_store.get_run.return_value.status = ExecutionStatus.FAILED
+    run_id = uuid4()
+
+    _get_dag(client, run_id)
+    _get_dag(client, run_id)
+
+    assert mock_store.get_run_dag.call_count == 2
+
+
+def test_dag_is_not_returned_if_etag_matches(client, mock_store):
+    """Tests that the DAG is only returned if the client has no copy."""
+    mock_store.get_run.return_value.status = ExecutionStatus.RUNNING
+    run_id = uuid4()
+
+    etag = _get_dag(client, run_id).headers["ETag"]
+
+    response = _get_dag(client, run_id, etag=etag)
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = _get_dag(client, run_id, etag='"outdated"')
+    assert response.status_code == 200
+
+
+def test_run_status_gets_updated_from_steps(
+    client, mock_store, sample_pipeline_run_model
+):
+    """Tests that the run status is updated with a single request."""
+    mock_store.update_run_status_from_steps.return_value = (
+        sample_pipeline_run_model
+    )
+    run_id = sample_pipeline_run_model.id
+
+    response = client.put(f"{API}{VERSION_1}{RUNS}/{run_id}{STATUS}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(run_id)
+    mock_store.update_run_status_from_steps.assert_called_once_with(
+        run_id=run_id
+    )
+
+
+def test_runs_can_be_listed_with_a_subset_of_fields(
+    client, mock_store, sample_pipeline_run_model
+):
+    """Tests that only the requested fields of listed runs are returned."""
+    mock_store.list_runs.return_value = Page(
+        total=1,
+        total_pages=1,
+        items=[sample_pipeline_run_model],
+        page=1,
+        size=50,
+    )
+
+    response = client.get(
+        f"{API}{VERSION_1}{RUNS}", params={"fields": "name,status"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+    assert response.json()["items"] == [
+        {
+            "id": str(sample_pipeline_run_model.id),
+            "name": sample_pipeline_run_model.name,
+            "status": sample_pipeline_run_model.status.value,
+        }
+    ]
+    filter_model = mock_store.list_runs.call_args.kwargs["runs_filter_model"]
+    assert filter_model.fields == "name,status"
+
+
+def test_fields_can_be_excluded_from_a_run(
+    client, mock_store, sample_pipeline_run_model
+):
+    """Tests that excluded fields are not part of the returned run."""
+    mock_store.get_run.return_value = sample_pipeline_run_model
+    run_id = sample_pipeline_run_model.id
+
+    response = client.get(
+        f"{API}{VERSION_1}{RUNS}/{run_id}",
+        params={"exclude": "pipeline_configuration,client_environment"},
+    )
+    assert response.status_code == 200
+    run = response.json()
+    assert run["id"] == str(run_id)
+    assert "status" in run
+    assert "pipeline_configuration" not in run
+    assert "client_environment" not in run
+
+    response = client.get(
+        f"{API}{VERSION_1}{RUNS}/{run_id}", params={"exclude": "not_a_field"}
+    )
+    assert response.status_code == 422
+
+
+def test_run_status_is_read_with_the_async_store(
+    client, mock_store, sample_pipeline_run_model
+):
+    """Tests the status endpoint and its errors for missing runs."""
+    mock_store.get_run.return_value = sample_pipeline_run_model
+    run_id = sample_pipeline_run_model.id
+
+    response = client.get(f"{API}{VERSION_1}{RUNS}/{run_id}{STATUS}")
+    assert response.status_code == 200
+    assert response.json() == sample_pipeline_run_model.status.value
+
+    mock_store.get_run.side_effect = KeyError("No run with this ID found.")
+    response = client.get(f"{API}{VERSION_1}{RUNS}/{uuid4()}{STATUS}")
+    assert response.status_code == 404
@@ -0,0 +1,142 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import asyncio
+import json
+
+import pytest
+
+from zenml.exceptions import AuthorizationException
+from zenml.models import ArtifactFilterModel
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+httpx = pytest.importorskip("httpx")
+
+from zenml.zen_stores.async_rest_zen_store import (  # noqa: E402
+    AsyncRestZenStore,
+)
+
+
+def _get_async_store(handler) -> AsyncRestZenStore:
+    """Creates an async store that sends requests to a mock handler."""
+    config = RestZenStoreConfiguration(
+        url="http://localhost:8080", api_token="token"
+    )
+    store = AsyncRestZenStore(RestZenStore.construct(config=config))
+    store._client = httpx.AsyncClient(
+        base_url=store.url + "/api/v1", transport=httpx.MockTransport(handler)
+    )
+    return store
+
+
+def test_async_store_requires_rest_store(clean_client):
+    """Tests that the async store can only wrap a REST store."""
+    with pytest.raises(TypeError):
+        AsyncRestZenStore(clean_client.zen_store)
+
+
+def test_async_store_get_artifact(sample_artifact_model):
+    """Tests getting a single resource with the async store."""
+    requests = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, content=sample_artifact_model.json().encode()
+        )
+
+    async def _get_artifact():
+        async with _get_async_store(_handler) as store:
+            return await store.get_artifact(sample_artifact_model.id)
+
+    artifact = asyncio.run(_get_artifact())
+    assert artifact == sample_artifact_model
+    assert requests[0].url.path == (
+        f"/api/v1/artifacts/{sample_artifact_model.id}"
+    )
+    assert requests[0].headers["Authorization"] == "Bearer token"
+
+
+def test_async_store_raises_store_exceptions():
+    """Tests that error responses are translated like in the sync store."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"detail": "Not authenticated"})
+
+    async def _list_artifacts():
+        async with _get_async_store(_handler) as store:
+            return await store.list_artifacts(ArtifactFilterModel())
+
+    with pytest.raises(AuthorizationException):
+        asyncio.run(_list_artifacts())
+
+
+def test_async_store_retries_unauthorized_requests(sample_artifact_model):
+    """Tests that requests are retried once with new authentication headers."""
+    status_codes = [401, 200]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_codes.pop(0), content=sample_artifact_model.json().encode()
+        )
+
+    async def _get_artifact():
+        async with _get_async_store(_handler) as store:
+            store._auth_headers = {"Authorization": "Bearer expired"}
+            artifact = await store.get_artifact(sample_artifact_model.id)
+            return artifact, store._auth_headers
+
+    artifact, auth_headers = asyncio.run(_get_artifact())
+    assert artifact == sample_artifact_model
+    assert auth_headers == {"Authorization": "Bearer token"}
+    assert not status_codes
+
+
+def test_async_store_depaginates_concurrently(sample_artifact_model):
+    """Tests that all pages after the first one are fetched concurrently."""
+    total_pages = 5
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+        page = int(request.url.params["page"])
+        body = {
+            "page": page,
+            "size": 1,
+            "total_pages": total_pages,
+            "total": total_pages,
+            "items": [json.loads(sample_artifact_model.json())],
+        }
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    async def _depaginate():
+        async with _get_async_store(_handler) as store:
+            return await store.depaginate(
+                store.list_artifacts,
+                ArtifactFilterModel(size=1),
+                max_concurrency=2,
+            )
+
+    artifacts = asyncio.run(_depaginate())
+    assert len(artifacts) == total_pages
+    assert max_in_flight == 2
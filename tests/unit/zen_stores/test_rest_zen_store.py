@@ -0,0 +1,125 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from zenml.enums import ExecutionStatus
+from zenml.models import StepRunFilterModel, StepRunResponseModel
+from zenml.post_execution.lineage.lineage_graph import LineageGraph
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+def _get_rest_store(**config_kwargs) -> RestZenStore:
+    """Creates a REST store without connecting to a server."""
+    config = RestZenStoreConfiguration(
+        url="http://localhost:8080", api_token="token", **config_kwargs
+    )
+    return RestZenStore.construct(config=config)
+
+
+def test_rest_store_session_uses_configured_pool_and_retries():
+    """Tests that the session is configured from the store configuration."""
+    store = _get_rest_store(http_pool_maxsize=5, http_max_retries=7)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(lambda _: store.session, range(8)))
+    assert all(session is sessions[0] for session in sessions)
+
+    session = sessions[0]
+    assert session.headers["Authorization"] == "Bearer token"
+    adapter = session.get_adapter(store.url)
+    assert adapter._pool_maxsize == 5
+    assert adapter.max_retries.total == 7
+    assert "GET" in adapter.max_retries.allowed_methods
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+    store._reset_session(session)
+    assert store.session is not session
+
+
+def test_rest_store_compresses_large_request_bodies():
+    """Tests that only large request bodies are compressed."""
+    store = _get_rest_store(http_compression_threshold=100)
+
+    small_body = json.dumps({"key": "value"})
+    data, headers = store._encode_request_body(small_body)
+    assert data == small_body.encode()
+    assert "Content-Encoding" not in headers
+
+    large_body = json.dumps({"key": "value" * 100})
+    data, headers = store._encode_request_body(large_body)
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(data) == large_body.encode()
+
+    # Older servers can't decompress requests, so compression is opt-in
+    store = _get_rest_store()
+    data, headers = store._encode_request_body(large_body)
+    assert data == large_body.encode()
+    assert "Content-Encoding" not in headers
+
+
+def test_rest_store_parses_pages_with_excluded_fields():
+    """Tests that items without the excluded fields can be parsed."""
+    step_run_id = uuid4()
+    body = {
+        "page": 1,
+        "size": 50,
+        "total": 1,
+        "total_pages": 1,
+        "items": [{"id": str(step_run_id), "status": "completed"}],
+    }
+
+    page = RestZenStore._parse_page(
+        body,
+        response_model=StepRunResponseModel,
+        filter_model=StepRunFilterModel(fields="status"),
+    )
+
+    assert page.total == 1
+    step_run = page.items[0]
+    assert isinstance(step_run, StepRunResponseModel)
+    assert step_run.id == step_run_id
+    assert step_run.status == ExecutionStatus.COMPLETED
+    assert step_run.step is None
+
+
+def test_rest_store_revalidates_cached_run_dags(mocker):
+    """Tests that cached run DAGs are only downloaded again if they changed."""
+    store = _get_rest_store()
+    dag = LineageGraph(root_step_id="step_1")
+    send_request = mocker.patch.object(
+        RestZenStore,
+        "_send_request",
+        return_value=mocker.Mock(
+            status_code=200, headers={"ETag": '"1"'}, json=dag.dict
+        ),
+    )
+    run_id = uuid4()
+
+    assert store.get_run_dag(run_id) == dag
+    assert send_request.call_args.kwargs["headers"] == {}
+
+    send_request.return_value = mocker.Mock(status_code=304, headers={})
+    assert store.get_run_dag(run_id) == dag
+    assert send_request.call_args.kwargs["headers"] == {"If-None-Match": '"1"'}
+
+    # Callers get copies of the cached DAG
+    store.get_run_dag(run_id).root_step_id = "other_step"
+    assert store.get_run_dag(run_id) == dag
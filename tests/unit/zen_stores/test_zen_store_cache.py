@@ -0,0 +1,164 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from zenml.enums import ExecutionStatus
+from zenml.zen_stores.zen_store_cache import (
+    CachedEntityType,
+    ZenStoreCache,
+    cached,
+    invalidates_cache,
+)
+
+
+class _Store:
+    """Minimal store that counts how often its methods get called."""
+
+    def __init__(self, cache: Optional[ZenStoreCache]) -> None:
+        self.cache = cache
+        self.calls = 0
+        self.status = ExecutionStatus.COMPLETED
+
+    @cached(CachedEntityType.STACK)
+    def get_stack(self, stack_id):
+        self.calls += 1
+        return {"id": stack_id, "calls": self.calls}
+
+    @invalidates_cache(CachedEntityType.STACK)
+    def update_stack(self, stack_id):
+        pass
+
+    @cached(CachedEntityType.STEP_RUN)
+    def get_run_step(self, step_run_id):
+        self.calls += 1
+
+        class _StepRun:
+            status = self.status
+
+        return _StepRun()
+
+
+def test_cached_store_method_returns_copies_of_cached_values():
+    """Tests that cached methods only call the store once per argument."""
+    store = _Store(cache=ZenStoreCache())
+    stack_id = uuid4()
+
+    first = store.get_stack(stack_id)
+    first["calls"] = 42
+    assert store.get_stack(stack_id) == {"id": stack_id, "calls": 1}
+    assert store.calls == 1
+
+    store.get_stack(uuid4())
+    assert store.calls == 2
+
+    statistics = store.cache.get_statistics()["stack"]
+    assert statistics.hits == 1
+    assert statistics.misses == 2
+    assert statistics.size == 2
+
+
+def test_store_methods_are_not_cached_without_cache():
+    """Tests that methods are called directly if caching is disabled."""
+    store = _Store(cache=None)
+    stack_id = uuid4()
+
+    store.get_stack(stack_id)
+    store.get_stack(stack_id)
+    assert store.calls == 2
+
+
+def test_writes_invalidate_cached_entities():
+    """Tests that write methods invalidate the cached entities."""
+    store = _Store(cache=ZenStoreCache())
+    stack_id = uuid4()
+
+    store.get_stack(stack_id)
+    store.update_stack(stack_id)
+    assert store.get_stack(stack_id)["calls"] == 2
+    assert store.cache.get_statistics()["stack"].size == 1
+
+
+def test_values_fetched_before_an_invalidation_are_not_cached():
+    """Tests that outdated values don't get cached after an invalidation."""
+    cache = ZenStoreCache()
+    generation = cache.get_generation(CachedEntityType.ARTIFACT)
+    # Metadata gets published while the artifact is being fetched
+    cache.invalidate(CachedEntityType.ARTIFACT)
+    cache.set(CachedEntityType.ARTIFACT, "key", "value", generation=generation)
+    assert cache.get(CachedEntityType.ARTIFACT, "key") == (False, None)
+
+    generation = cache.get_generation(CachedEntityType.ARTIFACT)
+    cache.set(CachedEntityType.ARTIFACT, "key", "value", generation=generation)
+    assert cache.get(CachedEntityType.ARTIFACT, "key") == (True, "value")
+
+
+def test_only_finished_step_runs_are_cached():
+    """Tests that step runs are only cached once they are finished."""
+    store = _Store(cache=ZenStoreCache())
+    step_run_id = uuid4()
+
+    store.status = ExecutionStatus.RUNNING
+    store.get_run_step(step_run_id)
+    store.get_run_step(step_run_id)
+    assert store.calls == 2
+
+    store.status = ExecutionStatus.COMPLETED
+    store.get_run_step(step_run_id)
+    store.get_run_step(step_run_id)
+    assert store.calls == 3
+
+
+def test_cache_entries_expire(mocker):
+    """Tests that cache entries expire after their time to live."""
+    mock_time = mocker.patch(
+        "zenml.zen_stores.zen_store_cache.time.monotonic", return_value=0
+    )
+    cache = ZenStoreCache(ttls={"stack": 10})
+    cache.set(CachedEntityType.STACK, "key", "value")
+    cache.set(CachedEntityType.DEPLOYMENT, "key", "value")
+
+    mock_time.return_value = 5
+    assert cache.get(CachedEntityType.STACK, "key") == (True, "value")
+
+    mock_time.return_value = 11
+    assert cache.get(CachedEntityType.STACK, "key") == (False, None)
+    # Deployments are immutable and never expire
+    assert cache.get(CachedEntityType.DEPLOYMENT, "key") == (True, "value")
+
+
+def test_least_recently_used_entries_get_evicted():
+    """Tests that the cache evicts the least recently used entries."""
+    cache = ZenStoreCache(max_size=2)
+    cache.set(CachedEntityType.STACK, 1, "first")
+    cache.set(CachedEntityType.STACK, 2, "second")
+    cache.get(CachedEntityType.STACK, 1)
+    cache.set(CachedEntityType.FLAVOR, 3, "third")
+
+    assert cache.get(CachedEntityType.STACK, 1) == (True, "first")
+    assert cache.get(CachedEntityType.STACK, 2) == (False, None)
+    assert cache.get(CachedEntityType.FLAVOR, 3) == (True, "third")
+
+    statistics = cache.get_statistics()
+    assert statistics["stack"].evictions == 1
+    assert statistics["stack"].size == 1
+
+
+def test_cache_fails_with_invalid_size():
+    """Tests that the cache size needs to be positive."""
+    with pytest.raises(ValueError):
+        ZenStoreCache(max_size=0)